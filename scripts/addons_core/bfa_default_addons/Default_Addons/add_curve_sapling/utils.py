@@ -6,6 +6,7 @@ import bpy
 
 import time
 import copy
+import numpy as np
 
 from mathutils import (
         Euler,
@@ -25,6 +26,22 @@ zAxis = Vector((0, 0, 1))
 yAxis = Vector((0, 1, 0))
 xAxis = Vector((1, 0, 0))
 
+# Verts and faces of a single leaf for each leaf shape, before it is scaled and rotated into place
+leafShapes = {
+    'hex': (
+        ((0, 0, 0), (0.5, 0, 1 / 3), (0.5, 0, 2 / 3), (0, 0, 1), (-0.5, 0, 2 / 3), (-0.5, 0, 1 / 3)),
+        ((0, 1, 2, 3), (0, 3, 4, 5)),
+        ),
+    'rect': (((.5, 0, 0), (.5, 0, 1), (-.5, 0, 1), (-.5, 0, 0)), ((0, 1, 2, 3),)),
+    'dFace': (((.5, .5, 0), (.5, -.5, 0), (-.5, -.5, 0), (-.5, .5, 0)), ((0, 3, 2, 1),)),
+    'dVert': (((0, 0, 1),), ()),
+    }
+
+# Stems grown for the last trees, keyed on every parameter the growth depends on,
+# so changing only the leaves, the mesh or the armature doesn't grow them again
+stemCache = OrderedDict()
+stemCacheSize = 4
+
 
 # This class will contain a part of the tree which needs to be extended and the required tree parameters
 class stemSpline:
@@ -563,32 +580,11 @@ def growSpline(n, stem, numSplit, splitAng, splitAngV, splineList,
     # return splineList
 
 
-def genLeafMesh(leafScale, leafScaleX, leafScaleT, leafScaleV, loc, quat,
-                offset, index, downAngle, downAngleV, rotate, rotateV, oldRot,
-                bend, leaves, leafShape, leafangle, horzLeaves):
-    if leafShape == 'hex':
-        verts = [
-            Vector((0, 0, 0)), Vector((0.5, 0, 1 / 3)), Vector((0.5, 0, 2 / 3)),
-            Vector((0, 0, 1)), Vector((-0.5, 0, 2 / 3)), Vector((-0.5, 0, 1 / 3))
-            ]
-        edges = [[0, 1], [1, 2], [2, 3], [3, 4], [4, 5], [5, 0], [0, 3]]
-        faces = [[0, 1, 2, 3], [0, 3, 4, 5]]
-    elif leafShape == 'rect':
-        # verts = [Vector((1, 0, 0)), Vector((1, 0, 1)), Vector((-1, 0, 1)), Vector((-1, 0, 0))]
-        verts = [Vector((.5, 0, 0)), Vector((.5, 0, 1)), Vector((-.5, 0, 1)), Vector((-.5, 0, 0))]
-        edges = [[0, 1], [1, 2], [2, 3], [3, 0]]
-        faces = [[0, 1, 2, 3]]
-    elif leafShape == 'dFace':
-        verts = [Vector((.5, .5, 0)), Vector((.5, -.5, 0)), Vector((-.5, -.5, 0)), Vector((-.5, .5, 0))]
-        edges = [[0, 1], [1, 2], [2, 3], [3, 0]]
-        faces = [[0, 3, 2, 1]]
-    elif leafShape == 'dVert':
-        verts = [Vector((0, 0, 1))]
-        edges = []
-        faces = []
-
-    vertsList = []
-    facesList = []
+# Returns the matrix that scales and rotates the verts of a leaf into place,
+# the leaf is then moved to loc. All the leaves are transformed at once by addTree.
+def genLeafMatrix(leafScale, leafScaleX, leafScaleT, leafScaleV, loc, quat,
+                  offset, downAngle, downAngleV, rotate, rotateV, oldRot,
+                  bend, leaves, leafShape, leafangle, horzLeaves):
     normal = Vector((0, 0, 1))
 
     if leaves < 0:
@@ -662,52 +658,37 @@ def genLeafMesh(leafScale, leafScaleX, leafScaleT, leafScaleV, loc, quat,
 
         rotateZOrien2 = Matrix.Rotation(-orientation, 3, 'X')
 
-    # For each of the verts we now rotate and scale them, then append them to the list to be added to the mesh
-    for v in verts:
-        v.z *= leafScale
-        v.y *= leafScale
-        v.x *= leafScaleX * leafScale
+    # Compose the scale and rotations applied to each of the verts, in the same order
+    leafMat = Matrix.Diagonal((leafScaleX * leafScale, leafScale, leafScale))
 
-        v.rotate(Euler((0, 0, radians(180))))
+    leafMat = Euler((0, 0, radians(180))).to_matrix() @ leafMat
 
-        # leafangle
-        v.rotate(Matrix.Rotation(radians(-leafangle), 3, 'X'))
+    # leafangle
+    leafMat = Matrix.Rotation(radians(-leafangle), 3, 'X') @ leafMat
 
-        if rotate < 0:
-            v.rotate(Euler((0, 0, radians(90))))
-            if oldRot < 0:
-                v.rotate(Euler((0, 0, radians(180))))
+    if rotate < 0:
+        leafMat = Euler((0, 0, radians(90))).to_matrix() @ leafMat
+        if oldRot < 0:
+            leafMat = Euler((0, 0, radians(180))).to_matrix() @ leafMat
 
-        if (leaves > 0) and (rotate > 0) and horzLeaves:
-            nRotMat = Matrix.Rotation(-oldRot + rotate, 3, 'Z')
-            v.rotate(nRotMat)
+    if (leaves > 0) and (rotate > 0) and horzLeaves:
+        nRotMat = Matrix.Rotation(-oldRot + rotate, 3, 'Z')
+        leafMat = nRotMat @ leafMat
 
-        if leaves > 0:
-            v.rotate(downRotMat)
+    if leaves > 0:
+        leafMat = downRotMat @ leafMat
 
-        v.rotate(rotMat)
-        v.rotate(quat)
+    leafMat = quat.to_matrix() @ rotMat @ leafMat
 
-        if (bend != 0.0) and (leaves > 0):
-            # Correct the rotation
-            v.rotate(rotateZ)
-            v.rotate(rotateZOrien)
-            v.rotate(rotateX)
-            v.rotate(rotateZOrien2)
+    if (bend != 0.0) and (leaves > 0):
+        # Correct the rotation
+        leafMat = rotateZOrien2 @ rotateX @ rotateZOrien @ rotateZ @ leafMat
 
     if leafShape == 'dVert':
-        normal = verts[0]
+        normal = leafMat @ Vector(leafShapes['dVert'][0][0])
         normal.normalize()
-        v = loc
-        vertsList.append([v.x, v.y, v.z])
-    else:
-        for v in verts:
-            v += loc
-            vertsList.append([v.x, v.y, v.z])
-        for f in faces:
-            facesList.append([f[0] + index, f[1] + index, f[2] + index, f[3] + index])
 
-    return vertsList, facesList, normal, oldRot
+    return leafMat, normal, oldRot
 
 
 def create_armature(armAnim, leafP, cu, frameRate, leafMesh, leafObj, leafVertSize, leaves,
@@ -1453,6 +1434,56 @@ def findtaper(length, taper, shape, shapeS, levels, customShape):
     return taperT
 
 
+# Returns a hashable key made of the given parameters, the array properties
+# and the lists made from them are turned into tuples
+def paramKey(*params):
+    return tuple(
+            tuple(p) if hasattr(p, '__len__') and not isinstance(p, str) else p
+            for p in params
+            )
+
+
+# Copy the grown stems, the child points where the leaves go and what is needed
+# to build the armature and the mesh, along with the random state after growing
+def storeStems(cu, childP, levelCount, splineToBone, n):
+    splines = []
+    for spline in cu.splines:
+        points = spline.bezier_points
+        pointData = []
+        for attr, size in (('co', 3), ('handle_left', 3), ('handle_right', 3), ('radius', 1)):
+            values = np.empty(len(points) * size, dtype=np.float32)
+            points.foreach_get(attr, values)
+            pointData.append((attr, values))
+        handleTypes = [(p.handle_left_type, p.handle_right_type) for p in points]
+        splines.append((len(points), pointData, handleTypes))
+
+    # The child point locations can be the points of the curve itself, which is freed on redo
+    childP = [
+        childPoint(cp.co.copy(), cp.quat.copy(), cp.radiusPar, cp.offset,
+                   cp.stemOffset, cp.lengthPar, cp.parBone)
+        for cp in childP
+        ]
+    return (splines, childP, list(levelCount), copy.copy(splineToBone), n, getstate())
+
+
+# Rebuild the stems stored by storeStems in the curve and
+# carry on from the random state they were grown with
+def restoreStems(cu, stems, resU):
+    (splines, childP, levelCount, splineToBone, n, randState) = stems
+    if splines:
+        cu.resolution_u = resU
+    for numPoints, pointData, handleTypes in splines:
+        newSpline = cu.splines.new('BEZIER')
+        points = newSpline.bezier_points
+        points.add(numPoints - 1)
+        for point, (leftType, rightType) in zip(points, handleTypes):
+            (point.handle_left_type, point.handle_right_type) = (leftType, rightType)
+        for attr, values in pointData:
+            points.foreach_set(attr, values)
+    setstate(randState)
+    return (list(childP), list(levelCount), copy.copy(splineToBone), n)
+
+
 def addTree(props):
     global splitError
     # startTime = time.time()
@@ -1643,90 +1674,113 @@ def addTree(props):
                         )
             (newPoint.handle_right_type, newPoint.handle_left_type) = (enHandle, enHandle)
 
-    childP = []
-    stemList = []
-
-    levelCount = []
-    splineToBone = deque([''])
-    addsplinetobone = splineToBone.append
-
-    # Each of the levels needed by the user we grow all the splines
-    for n in range(levels):
-        storeN = n
-        stemList = deque()
-        addstem = stemList.append
-        # If n is used as an index to access parameters for the tree
-        # it must be at most 3 or it will reference outside the array index
-        n = min(3, n)
-        splitError = 0.0
-
-        # closeTip only on last level
-        closeTipp = all([(n == levels - 1), closeTip])
-
-        # If this is the first level of growth (the trunk) then we need some special work to begin the tree
-        if n == 0:
-            kickstart_trunk(addstem, levels, leaves, branches, cu, curve, curveRes,
-                            curveV, attractUp, length, lengthV, ratio, ratioPower, resU,
-                            scale0, scaleV0, scaleVal, taper, minRadius, rootFlare)
-        # If this isn't the trunk then we may have multiple stem to initialise
-        else:
-            # For each of the points defined in the list of stem starting points we need to grow a stem.
-            fabricate_stems(addsplinetobone, addstem, baseSize, branches, childP, cu, curve, curveBack,
-                            curveRes, curveV, attractUp, downAngle, downAngleV, leafDist, leaves, length, lengthV,
-                            levels, n, ratioPower, resU, rotate, rotateV, scaleVal, shape, storeN,
-                            taper, shapeS, minRadius, radiusTweak, customShape, rMode, segSplits,
-                            useOldDownAngle, useParentAngle, boneStep)
-
-        # change base size for each level
-        if n > 0:
-            baseSize *= baseSize_s  # decrease at each level
-        if (n == levels - 1):
-            baseSize = 0
+    # The stems only depend on these parameters, if they didn't change since one
+    # of the last trees the stems are copied from it instead of being grown again
+    stemKey = paramKey(
+                props.seed, levels, length, lengthV, taperCrown, branches, curveRes, curve,
+                curveV, curveBack, baseSplits, segSplits, splitByLen, rMode, splitAngle,
+                splitAngleV, scaleVal, attractUp, attractOut, shape, shapeS, customShape,
+                branchDist, nrings, baseSize, baseSize_s, splitHeight, splitBias, ratio,
+                minRadius, closeTip, rootFlare, taper, radiusTweak, ratioPower, downAngle,
+                downAngleV, rotate, rotateV, scale0, scaleV0, prune, pruneWidth, pruneBase,
+                pruneWidthPeak, prunePowerLow, prunePowerHigh, pruneRatio, leaves, leafDist,
+                resU, handles, boneStep, useOldDownAngle, useParentAngle
+                )
+    stems = stemCache.pop(stemKey, None)
 
+    if stems is not None:
+        (childP, levelCount, splineToBone, n) = restoreStems(cu, stems, resU)
+    else:
         childP = []
-        # Now grow each of the stems in the list of those to be extended
-        for st in stemList:
-            # When using pruning, we need to ensure that the random effects
-            # will be the same for each iteration to make sure the problem is linear
-            randState = getstate()
-            startPrune = True
-            lengthTest = 0.0
-            # Store all the original values for the stem to make sure
-            # we have access after it has been modified by pruning
-            originalLength = st.segL
-            originalCurv = st.curv
-            originalCurvV = st.curvV
-            originalSeg = st.seg
-            originalHandleR = st.p.handle_right.copy()
-            originalHandleL = st.p.handle_left.copy()
-            originalCo = st.p.co.copy()
-            currentMax = 1.0
-            currentMin = 0.0
-            currentScale = 1.0
-            oldMax = 1.0
-            deleteSpline = False
-            originalSplineToBone = copy.copy(splineToBone)
-            forceSprout = False
-            # Now do the iterative pruning, this uses a binary search and halts once the difference
-            # between upper and lower bounds of the search are less than 0.005
-            ratio, splineToBone = perform_pruning(
-                                        baseSize, baseSplits, childP, cu, currentMax, currentMin,
-                                        currentScale, curve, curveBack, curveRes, deleteSpline, forceSprout,
-                                        handles, n, oldMax, originalSplineToBone, originalCo, originalCurv,
-                                        originalCurvV, originalHandleL, originalHandleR, originalLength,
-                                        originalSeg, prune, prunePowerHigh, prunePowerLow, pruneRatio,
-                                        pruneWidth, pruneBase, pruneWidthPeak, randState, ratio, scaleVal,
-                                        segSplits, splineToBone, splitAngle, splitAngleV, st, startPrune,
-                                        branchDist, length, splitByLen, closeTipp, nrings, splitBias,
-                                        splitHeight, attractOut, rMode, lengthV, taperCrown, boneStep,
-                                        rotate, rotateV
-                                        )
+        stemList = []
+
+        levelCount = []
+        splineToBone = deque([''])
+        addsplinetobone = splineToBone.append
+
+        # Each of the levels needed by the user we grow all the splines
+        for n in range(levels):
+            storeN = n
+            stemList = deque()
+            addstem = stemList.append
+            # If n is used as an index to access parameters for the tree
+            # it must be at most 3 or it will reference outside the array index
+            n = min(3, n)
+            splitError = 0.0
+
+            # closeTip only on last level
+            closeTipp = all([(n == levels - 1), closeTip])
+
+            # If this is the first level of growth (the trunk) then we need some special work to begin the tree
+            if n == 0:
+                kickstart_trunk(addstem, levels, leaves, branches, cu, curve, curveRes,
+                                curveV, attractUp, length, lengthV, ratio, ratioPower, resU,
+                                scale0, scaleV0, scaleVal, taper, minRadius, rootFlare)
+            # If this isn't the trunk then we may have multiple stem to initialise
+            else:
+                # For each of the points defined in the list of stem starting points we need to grow a stem.
+                fabricate_stems(addsplinetobone, addstem, baseSize, branches, childP, cu, curve, curveBack,
+                                curveRes, curveV, attractUp, downAngle, downAngleV, leafDist, leaves, length, lengthV,
+                                levels, n, ratioPower, resU, rotate, rotateV, scaleVal, shape, storeN,
+                                taper, shapeS, minRadius, radiusTweak, customShape, rMode, segSplits,
+                                useOldDownAngle, useParentAngle, boneStep)
+
+            # change base size for each level
+            if n > 0:
+                baseSize *= baseSize_s  # decrease at each level
+            if (n == levels - 1):
+                baseSize = 0
+
+            childP = []
+            # Now grow each of the stems in the list of those to be extended
+            for st in stemList:
+                # When using pruning, we need to ensure that the random effects
+                # will be the same for each iteration to make sure the problem is linear
+                randState = getstate()
+                startPrune = True
+                lengthTest = 0.0
+                # Store all the original values for the stem to make sure
+                # we have access after it has been modified by pruning
+                originalLength = st.segL
+                originalCurv = st.curv
+                originalCurvV = st.curvV
+                originalSeg = st.seg
+                originalHandleR = st.p.handle_right.copy()
+                originalHandleL = st.p.handle_left.copy()
+                originalCo = st.p.co.copy()
+                currentMax = 1.0
+                currentMin = 0.0
+                currentScale = 1.0
+                oldMax = 1.0
+                deleteSpline = False
+                originalSplineToBone = copy.copy(splineToBone)
+                forceSprout = False
+                # Now do the iterative pruning, this uses a binary search and halts once the difference
+                # between upper and lower bounds of the search are less than 0.005
+                ratio, splineToBone = perform_pruning(
+                                            baseSize, baseSplits, childP, cu, currentMax, currentMin,
+                                            currentScale, curve, curveBack, curveRes, deleteSpline, forceSprout,
+                                            handles, n, oldMax, originalSplineToBone, originalCo, originalCurv,
+                                            originalCurvV, originalHandleL, originalHandleR, originalLength,
+                                            originalSeg, prune, prunePowerHigh, prunePowerLow, pruneRatio,
+                                            pruneWidth, pruneBase, pruneWidthPeak, randState, ratio, scaleVal,
+                                            segSplits, splineToBone, splitAngle, splitAngleV, st, startPrune,
+                                            branchDist, length, splitByLen, closeTipp, nrings, splitBias,
+                                            splitHeight, attractOut, rMode, lengthV, taperCrown, boneStep,
+                                            rotate, rotateV
+                                            )
 
-        levelCount.append(len(cu.splines))
+            levelCount.append(len(cu.splines))
+
+        stems = storeStems(cu, childP, levelCount, splineToBone, n)
+
+    stemCache[stemKey] = stems
+    while len(stemCache) > stemCacheSize:
+        stemCache.popitem(last=False)
 
     # If we need to add leaves, we do it here
-    leafVerts = []
-    leafFaces = []
+    leafMats = []
+    leafLocs = []
     leafNormals = []
 
     leafMesh = None  # in case we aren't creating leaves, we'll still have the variable
@@ -1741,39 +1795,58 @@ def addTree(props):
             if leaves < 0:
                 oldRot = -leafRotate / 2
                 for g in range(abs(leaves)):
-                    (vertTemp, faceTemp, normal, oldRot) = genLeafMesh(
-                                                                leafScale, leafScaleX, leafScaleT,
-                                                                leafScaleV, cp.co, cp.quat, cp.offset,
-                                                                len(leafVerts), leafDownAngle, leafDownAngleV,
-                                                                leafRotate, leafRotateV,
-                                                                oldRot, bend, leaves, leafShape,
-                                                                leafangle, horzLeaves
-                                                                )
-                    leafVerts.extend(vertTemp)
-                    leafFaces.extend(faceTemp)
+                    (leafMat, normal, oldRot) = genLeafMatrix(
+                                                    leafScale, leafScaleX, leafScaleT,
+                                                    leafScaleV, cp.co, cp.quat, cp.offset,
+                                                    leafDownAngle, leafDownAngleV,
+                                                    leafRotate, leafRotateV,
+                                                    oldRot, bend, leaves, leafShape,
+                                                    leafangle, horzLeaves
+                                                    )
+                    leafMats.append(leafMat)
+                    leafLocs.append(cp.co[:])
                     leafNormals.extend(normal)
                     leafP.append(cp)
             # Otherwise just add the leaves like splines
             else:
-                (vertTemp, faceTemp, normal, oldRot) = genLeafMesh(
-                                                            leafScale, leafScaleX, leafScaleT, leafScaleV,
-                                                            cp.co, cp.quat, cp.offset, len(leafVerts),
-                                                            leafDownAngle, leafDownAngleV, leafRotate,
-                                                            leafRotateV, oldRot, bend, leaves, leafShape,
-                                                            leafangle, horzLeaves
-                                                            )
-                leafVerts.extend(vertTemp)
-                leafFaces.extend(faceTemp)
+                (leafMat, normal, oldRot) = genLeafMatrix(
+                                                leafScale, leafScaleX, leafScaleT, leafScaleV,
+                                                cp.co, cp.quat, cp.offset,
+                                                leafDownAngle, leafDownAngleV, leafRotate,
+                                                leafRotateV, oldRot, bend, leaves, leafShape,
+                                                leafangle, horzLeaves
+                                                )
+                leafMats.append(leafMat)
+                leafLocs.append(cp.co[:])
                 leafNormals.extend(normal)
                 leafP.append(cp)
 
-        # Create the leaf mesh and object, add geometry using from_pydata,
-        # edges are currently added by validating the mesh which isn't great
+        # Transform the verts of all the leaves at once
+        shapeVerts, shapeFaces = leafShapes[leafShape]
+        leafMats = np.reshape(leafMats, (-1, 3, 3))
+        leafLocs = np.reshape(leafLocs, (-1, 3))
+        if leafShape == 'dVert':
+            leafVerts = leafLocs
+        else:
+            leafVerts = np.einsum('nij,vj->nvi', leafMats, shapeVerts) + leafLocs[:, None]
+            leafVerts = leafVerts.reshape(-1, 3)
+        leafFaces = np.reshape(shapeFaces, (1, -1, 4)) + \
+                    (np.arange(len(leafLocs)) * len(shapeVerts))[:, None, None]
+        leafFaces = leafFaces.reshape(-1, 4)
+
+        # Create the leaf mesh and object, the geometry is written in bulk
         leafMesh = bpy.data.meshes.new('leaves')
         leafObj = bpy.data.objects.new('leaves', leafMesh)
         bpy.context.scene.collection.objects.link(leafObj)
         leafObj.parent = treeOb
-        leafMesh.from_pydata(leafVerts, (), leafFaces)
+        leafMesh.vertices.add(len(leafVerts))
+        leafMesh.loops.add(leafFaces.size)
+        leafMesh.polygons.add(len(leafFaces))
+        leafMesh.vertices.foreach_set('co', leafVerts.astype(np.float32).reshape(-1))
+        leafMesh.loops.foreach_set('vertex_index', leafFaces.astype(np.int32).reshape(-1))
+        leafMesh.polygons.foreach_set('loop_start', np.arange(0, leafFaces.size, 4, dtype=np.int32))
+        leafMesh.shade_flat()
+        leafMesh.update(calc_edges=True)
 
         # set vertex normals for dupliVerts
         if leafShape == 'dVert':
@@ -1798,39 +1871,24 @@ def addTree(props):
             except KeyError:
                 pass
 
-        # add leaf UVs
-        if leafShape == 'rect':
-            leafMesh.uv_layers.new(name='leafUV')
-            uvlayer = leafMesh.uv_layers.active.data
-
-            u1 = .5 * (1 - leafScaleX)
-            u2 = 1 - u1
-
-            for i in range(0, len(leafFaces)):
-                uvlayer[i * 4 + 0].uv = Vector((u2, 0))
-                uvlayer[i * 4 + 1].uv = Vector((u2, 1))
-                uvlayer[i * 4 + 2].uv = Vector((u1, 1))
-                uvlayer[i * 4 + 3].uv = Vector((u1, 0))
+        # add leaf UVs, the same UVs are repeated for every leaf
+        u1 = .5 * (1 - leafScaleX)
+        u2 = 1 - u1
 
+        if leafShape == 'rect':
+            leafUV = ((u2, 0), (u2, 1), (u1, 1), (u1, 0))
         elif leafShape == 'hex':
+            leafUV = (
+                (.5, 0), (u1, 1 / 3), (u1, 2 / 3), (.5, 1),
+                (.5, 0), (.5, 1), (u2, 2 / 3), (u2, 1 / 3)
+                )
+        else:
+            leafUV = None
+
+        if leafUV is not None:
             leafMesh.uv_layers.new(name='leafUV')
             uvlayer = leafMesh.uv_layers.active.data
-
-            u1 = .5 * (1 - leafScaleX)
-            u2 = 1 - u1
-
-            for i in range(0, int(len(leafFaces) / 2)):
-                uvlayer[i * 8 + 0].uv = Vector((.5, 0))
-                uvlayer[i * 8 + 1].uv = Vector((u1, 1 / 3))
-                uvlayer[i * 8 + 2].uv = Vector((u1, 2 / 3))
-                uvlayer[i * 8 + 3].uv = Vector((.5, 1))
-
-                uvlayer[i * 8 + 4].uv = Vector((.5, 0))
-                uvlayer[i * 8 + 5].uv = Vector((.5, 1))
-                uvlayer[i * 8 + 6].uv = Vector((u2, 2 / 3))
-                uvlayer[i * 8 + 7].uv = Vector((u2, 1 / 3))
-
-        leafMesh.validate()
+            uvlayer.foreach_set('uv', np.tile(np.ravel(leafUV).astype(np.float32), len(leafP)))
 
     leafVertSize = {'hex': 6, 'rect': 4, 'dFace': 4, 'dVert': 1}[leafShape]
 
@@ -1863,12 +1921,18 @@ def addTree(props):
         treeObj = bpy.data.objects.new('treemesh', treeMesh)
         bpy.context.scene.collection.objects.link(treeObj)
 
-        treeVerts = []
-        treeEdges = []
-        root_vert = []
-        vert_radius = []
+        # Verts, edges and skin data are gathered as one array per spline
+        treeVerts = [np.empty((0, 3))]
+        treeEdges = [np.empty((0, 2), dtype=np.int64)]
+        root_vert = [np.empty(0, dtype=bool)]
+        vert_radius = [np.empty(0)]
         vertexGroups = OrderedDict()
         lastVerts = []
+        numVerts = 0
+
+        # Bezier weights of the resU verts added along each segment
+        pos = np.arange(1, resU + 1) / resU
+        bezWeights = np.stack(((1 - pos)**3, 3 * pos * (1 - pos)**2, 3 * (pos**2) * (1 - pos), pos**3))
 
         for i, curve in enumerate(cu.splines):
             points = curve.bezier_points
@@ -1882,7 +1946,7 @@ def addTree(props):
             level = min(level, 3)
 
             step = boneStep[level]
-            vindex = len(treeVerts)
+            vindex = numVerts
 
             p1 = points[0]
 
@@ -1893,21 +1957,23 @@ def addTree(props):
                 p_1 = cu.splines[pb].bezier_points[pn]
                 p_2 = cu.splines[pb].bezier_points[pn + 1]
                 p = evalBez(p_1.co, p_1.handle_right, p_2.handle_left, p_2.co, 1 - 1 / (resU + 1))
-                treeVerts.append(p)
+                treeVerts.append(np.reshape(p, (1, 3)))
 
-                root_vert.append(False)
-                vert_radius.append((p1.radius * .75, p1.radius * .75))
-                treeEdges.append([vindex, vindex + 1])
+                root_vert.append((False,))
+                vert_radius.append((p1.radius * .75,))
+                treeEdges.append(((vindex, vindex + 1),))
                 vindex += 1
+                numVerts += 1
 
             if isend[i]:
                 parent = lastVerts[int(splineToBone[i][4:-4])]
                 vindex -= 1
             else:
                 # add first point
-                treeVerts.append(p1.co)
-                root_vert.append(True)
-                vert_radius.append((p1.radius, p1.radius))
+                treeVerts.append(np.reshape(p1.co, (1, 3)))
+                root_vert.append((True,))
+                vert_radius.append((p1.radius,))
+                numVerts += 1
             """
             # add extra vertex for splits
             if issplit[i]:
@@ -1932,7 +1998,7 @@ def addTree(props):
             else:
                 g = False
 
-            for n, p2 in enumerate(points[1:]):
+            for n in range(len(points) - 1):
                 if not g:
                     groupName = 'bone' + (str(i)).rjust(3, '0') + '.' + (str(n)).rjust(3, '0')
                     groupName = roundBone(groupName, step)
@@ -1946,30 +2012,52 @@ def addTree(props):
                     else:
                         vertexGroups[splineToBone[i]].append(vindex - 1)
 
-                for f in range(1, resU + 1):
-                    pos = f / resU
-                    p = evalBez(p1.co, p1.handle_right, p2.handle_left, p2.co, pos)
-                    radius = p1.radius + (p2.radius - p1.radius) * pos
-
-                    treeVerts.append(p)
-                    root_vert.append(False)
-                    vert_radius.append((radius, radius))
-
-                    if (isend[i]) and (n == 0) and (f == 1):
-                        edge = [parent, n * resU + f + vindex]
-                    else:
-                        edge = [n * resU + f + vindex - 1, n * resU + f + vindex]
-                        # add vert to group
-                        vertexGroups[groupName].append(n * resU + f + vindex - 1)
-                    treeEdges.append(edge)
-
-                vertexGroups[groupName].append(n * resU + resU + vindex)
-
-                p1 = p2
-
-            lastVerts.append(len(treeVerts) - 1)
-
-        treeMesh.from_pydata(treeVerts, treeEdges, ())
+                # add the verts of the segment to the group, but the first
+                # vert of a stem continuing its parent which has the parent's vert
+                groupStart = n * resU + vindex
+                if (isend[i]) and (n == 0):
+                    groupStart += 1
+                vertexGroups[groupName].extend(range(groupStart, n * resU + resU + vindex + 1))
+
+            # Evaluate all the segments of the spline at once
+            numPoints = len(points)
+            co = np.empty(numPoints * 3, dtype=np.float32)
+            handleLeft = np.empty(numPoints * 3, dtype=np.float32)
+            handleRight = np.empty(numPoints * 3, dtype=np.float32)
+            radius = np.empty(numPoints, dtype=np.float32)
+            points.foreach_get('co', co)
+            points.foreach_get('handle_left', handleLeft)
+            points.foreach_get('handle_right', handleRight)
+            points.foreach_get('radius', radius)
+            co = co.reshape(-1, 3)
+            handleLeft = handleLeft.reshape(-1, 3)
+            handleRight = handleRight.reshape(-1, 3)
+
+            segments = np.stack((co[:-1], handleRight[:-1], handleLeft[1:], co[1:]), axis=1)
+            treeVerts.append(np.einsum('kf,nkj->nfj', bezWeights, segments).reshape(-1, 3))
+            segRadius = radius[:-1, None] + (radius[1:] - radius[:-1])[:, None] * pos
+            vert_radius.append(segRadius.reshape(-1))
+            root_vert.append(np.zeros(segRadius.size, dtype=bool))
+
+            segVerts = np.arange(1, segRadius.size + 1) + vindex
+            edges = np.column_stack((segVerts - 1, segVerts))
+            if (isend[i]) and len(edges):
+                edges[0, 0] = parent
+            treeEdges.append(edges)
+            numVerts += segRadius.size
+
+            lastVerts.append(numVerts - 1)
+
+        treeVerts = np.concatenate(treeVerts)
+        treeEdges = np.concatenate(treeEdges)
+        root_vert = np.concatenate(root_vert)
+        vert_radius = np.concatenate(vert_radius)
+
+        treeMesh.vertices.add(len(treeVerts))
+        treeMesh.edges.add(len(treeEdges))
+        treeMesh.vertices.foreach_set('co', treeVerts.astype(np.float32).reshape(-1))
+        treeMesh.edges.foreach_set('vertices', treeEdges.astype(np.int32).reshape(-1))
+        treeMesh.update()
 
         for group in vertexGroups:
             treeObj.vertex_groups.new(name=group)
@@ -1992,8 +2080,7 @@ def addTree(props):
         if previewArm:
             skinMod.show_viewport = False
         skindata = treeObj.data.skin_vertices[0].data
-        for i, radius in enumerate(vert_radius):
-            skindata[i].radius = radius
-            skindata[i].use_root = root_vert[i]
+        skindata.foreach_set('radius', np.repeat(vert_radius, 2).astype(np.float32))
+        skindata.foreach_set('use_root', root_vert)
 
         print("mesh time", time.time() - t1)
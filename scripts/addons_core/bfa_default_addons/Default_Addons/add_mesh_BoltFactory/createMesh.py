@@ -3,6 +3,8 @@
 # SPDX-License-Identifier: GPL-2.0-or-later
 
 import bpy
+import numpy as np
+from itertools import chain
 from mathutils import (
         Matrix,
         Vector,
@@ -20,6 +22,11 @@ MAX_INPUT_NUMBER = 50
 
 GLOBAL_SCALE = 1       # 1 blender unit = X mm
 
+# Heads, bits and threads already built, keyed on the builder and its arguments,
+# so only the parts whose parameters changed are rebuilt on redo
+bolt_parts_cache = {}
+bolt_parts_cache_size = 32
+
 
 # next two utility functions are stolen from import_obj.py
 
@@ -51,7 +58,7 @@ def unpack_face_list(list_of_tuples):
 
 
 """
-Remove Doubles takes a list on Verts and a list of Faces and
+Remove Doubles takes an array of Verts and the arrays of Faces and
 removes the doubles, much like Blender does in edit mode.
 It doesn't have the range function  but it will round the coordinates
 and remove verts that are very close together.  The function
@@ -61,40 +68,86 @@ disadvantage of not being able to interactively change the properties.
 """
 
 
-def RemoveDoubles(verts, faces, Decimal_Places=4):
-
-    new_verts = []
-    new_faces = []
-    dict_verts = {}
-    Rounded_Verts = []
-
-    for v in verts:
-        Rounded_Verts.append([round(v[0], Decimal_Places),
-                              round(v[1], Decimal_Places),
-                              round(v[2], Decimal_Places)])
-
-    for face in faces:
-        new_face = []
-        for vert_index in face:
-            Real_co = tuple(verts[vert_index])
-            Rounded_co = tuple(Rounded_Verts[vert_index])
-
-            if Rounded_co not in dict_verts:
-                dict_verts[Rounded_co] = len(dict_verts)
-                new_verts.append(Real_co)
-            if dict_verts[Rounded_co] not in new_face:
-                new_face.append(dict_verts[Rounded_co])
-        if len(new_face) == 3 or len(new_face) == 4:
-            new_faces.append(new_face)
-
-    return new_verts, new_faces
-
-
-def Scale_Mesh_Verts(verts, scale_factor):
-    Ret_verts = []
-    for v in verts:
-        Ret_verts.append([v[0] * scale_factor, v[1] * scale_factor, v[2] * scale_factor])
-    return Ret_verts
+def RemoveDoubles(verts, loops, sizes, Decimal_Places=4):
+
+    # Faces are given as the flat array of their vertex indices and the number of
+    # vertices of each face. Verts are numbered in the order they are first used
+    # by the faces and keep the coordinates of their first use.
+    Rounded_Verts = np.round(verts, Decimal_Places) + 0.0  # -0.0 and 0.0 are the same vert
+
+    # Give the verts that round to the same coordinates the same key, then
+    # number the keys in the order the faces use them
+    Sort = np.lexsort(Rounded_Verts.T[::-1])
+    Sorted_Verts = Rounded_Verts[Sort]
+    New_Key = np.ones(len(Sort), dtype=bool)
+    New_Key[1:] = (Sorted_Verts[1:] != Sorted_Verts[:-1]).any(axis=1)
+    Vert_Key = np.empty(len(Sort), dtype=np.int64)
+    Vert_Key[Sort] = np.cumsum(New_Key) - 1
+
+    _, First, Inverse = np.unique(Vert_Key[loops], return_index=True, return_inverse=True)
+    Order = np.argsort(First, kind='stable')
+    New_Index = np.empty(len(Order), dtype=np.int64)
+    New_Index[Order] = np.arange(len(Order))
+    new_verts = verts[loops[First[Order]]]
+    new_loops = New_Index[Inverse.reshape(-1)]
+
+    if len(sizes) == 0:
+        return new_verts, new_loops, sizes
+
+    # Drop the verts used twice in the same face, only triangles and quads are kept
+    Column = np.arange(sizes.max())
+    Valid = Column < sizes[:, None]
+    Faces = np.full(Valid.shape, -1, dtype=np.int64)
+    Faces[Valid] = new_loops
+    Keep = Valid.copy()
+    for j in Column[1:]:
+        Keep[:, j] &= (Faces[:, :j] != Faces[:, j:j + 1]).all(axis=1)
+    New_Sizes = Keep.sum(axis=1)
+    Keep_Face = (New_Sizes == 3) | (New_Sizes == 4)
+    Keep &= Keep_Face[:, None]
+
+    return new_verts, Faces[Keep], New_Sizes[Keep_Face]
+
+
+def Faces_To_Arrays(faces):
+    sizes = np.fromiter(map(len, faces), dtype=np.int64, count=len(faces))
+    loops = np.fromiter(chain.from_iterable(faces), dtype=np.int64, count=int(sizes.sum()))
+    return loops, sizes
+
+
+# Returns the part built by BUILDER from the given arguments as a vertex array,
+# the flat vertex indices of its faces and the size of each face, with whatever
+# else the builder returned (the head height, the bit diameter...).
+# Parts are cached so changing the thread leaves the head alone and vice versa.
+def Cached_Part(BUILDER, *ARGS):
+    key = (BUILDER.__name__, ARGS)
+    part = bolt_parts_cache.pop(key, None)
+    if part is None:
+        verts, faces, extra = BUILDER(*ARGS)
+        verts = np.array(verts, dtype=np.float64).reshape(-1, 3)
+        loops, sizes = Faces_To_Arrays(faces)
+        for array in (verts, loops, sizes):
+            array.flags.writeable = False
+        part = (verts, loops, sizes), extra
+        while len(bolt_parts_cache) >= bolt_parts_cache_size:
+            del bolt_parts_cache[next(iter(bolt_parts_cache))]
+    bolt_parts_cache[key] = part
+    return part
+
+
+# Joins (part, z) pairs into one vertex array and face arrays, every part is moved
+# up the z axis by its z and then all of them by Z_OFFSET
+def Join_Parts(PARTS, Z_OFFSET=0.0):
+    verts = []
+    loops = []
+    sizes = []
+    Vert_Start = 0
+    for (part_verts, part_loops, part_sizes), z in PARTS:
+        verts.append(part_verts + (0.0, 0.0, z) + (0.0, 0.0, Z_OFFSET))
+        loops.append(part_loops + Vert_Start)
+        sizes.append(part_sizes)
+        Vert_Start += len(part_verts)
+    return np.concatenate(verts), np.concatenate(loops), np.concatenate(sizes)
 
 
 # Create a matrix representing a rotation.
@@ -151,12 +204,6 @@ def Get_Phillips_Bit_Height(Bit_Dia):
 #                    Miscellaneous Utilities
 # ####################################################################
 
-# Returns a list of verts rotated by the given matrix. Used by SpinDup
-def Rot_Mesh(verts, matrix):
-    from mathutils import Vector
-    return [(matrix @ Vector(v))[:] for v in verts]
-
-
 # Returns a list of faces that has there index incremented by offset
 def Copy_Faces(faces, offset):
     return [[(i + offset) for i in f] for f in faces]
@@ -164,7 +211,6 @@ def Copy_Faces(faces, offset):
 
 # Much like Blenders built in SpinDup
 def SpinDup(VERTS, FACES, DEGREE, DIVISIONS, AXIS):
-    verts = []
     faces = []
 
     if DIVISIONS == 0:
@@ -172,12 +218,12 @@ def SpinDup(VERTS, FACES, DEGREE, DIVISIONS, AXIS):
 
     step = DEGREE / DIVISIONS  # set step so pieces * step = degrees in arc
 
+    # All the copies are rotated at once, one 3x3 rotation matrix per copy
+    rotmats = np.array([Simple_RotationMatrix(step * i, 4, AXIS).to_3x3() for i in range(int(DIVISIONS))])
+    Rot = np.reshape(VERTS, (-1, 3)) @ rotmats.transpose(0, 2, 1)
     for i in range(int(DIVISIONS)):
-        rotmat = Simple_RotationMatrix(step * i, 4, AXIS)  # 4x4 rotation matrix, 30d about the x axis.
-        Rot = Rot_Mesh(VERTS, rotmat)
-        faces.extend(Copy_Faces(FACES, len(verts)))
-        verts.extend(Rot)
-    return verts, faces
+        faces.extend(Copy_Faces(FACES, len(VERTS) * i))
+    return Rot.reshape(-1, 3).tolist(), faces
 
 
 # Returns a list of verts that have been moved up the z axis by DISTANCE
@@ -219,20 +265,16 @@ def Mirror_Verts_Faces(VERTS, FACES, AXIS, FLIP_POINT=0):
 # Returns a list of faces that
 # make up an array of 4 point polygon.
 def Build_Face_List_Quads(OFFSET, COLUMN, ROW, FLIP=0):
-    Ret = []
-    RowStart = 0
-    for j in range(ROW):
-        for i in range(COLUMN):
-            Res1 = RowStart + i
-            Res2 = RowStart + i + (COLUMN + 1)
-            Res3 = RowStart + i + (COLUMN + 1) + 1
-            Res4 = RowStart + i + 1
-            if FLIP:
-                Ret.append([OFFSET + Res1, OFFSET + Res2, OFFSET + Res3, OFFSET + Res4])
-            else:
-                Ret.append([OFFSET + Res4, OFFSET + Res3, OFFSET + Res2, OFFSET + Res1])
-        RowStart += COLUMN + 1
-    return Ret
+    RowStart = np.arange(ROW)[:, None] * (COLUMN + 1)
+    Res1 = (RowStart + np.arange(COLUMN)).reshape(-1) + OFFSET
+    Res2 = Res1 + (COLUMN + 1)
+    Res3 = Res2 + 1
+    Res4 = Res1 + 1
+    if FLIP:
+        Ret = np.column_stack((Res1, Res2, Res3, Res4))
+    else:
+        Ret = np.column_stack((Res4, Res3, Res2, Res1))
+    return Ret.tolist()
 
 
 # Returns a list of faces that makes up a fill pattern for a
@@ -1590,8 +1632,6 @@ def Create_Thread_Start_Verts(INNER_DIA, OUTTER_DIA, PITCH, CREST_PERCENT,
 def Create_Thread_Verts(INNER_DIA, OUTTER_DIA, PITCH, HEIGHT,
                         CREST_PERCENT, ROOT_PERCENT, Z_LOCATION, DIV_COUNT):
 
-    verts = []
-
     INNER_RADIUS = INNER_DIA / 2
     OUTTER_RADIUS = OUTTER_DIA / 2
 
@@ -1601,56 +1641,29 @@ def Create_Thread_Verts(INNER_DIA, OUTTER_DIA, PITCH, HEIGHT,
     NUM_OF_START_THREADS = 4.0
     NUM_OF_END_THREADS = 3.0
     Num = int((HEIGHT - ((NUM_OF_START_THREADS * PITCH) + (NUM_OF_END_THREADS * PITCH))) / PITCH)
-    Row = 0
+    Num = max(Num, 0)
+    Row = 4 * Num
 
     Crest_Height = float(PITCH) * float(CREST_PERCENT) / float(100)
     Root_Height = float(PITCH) * float(ROOT_PERCENT) / float(100)
     Root_to_Crest_Height = Crest_to_Root_Height = \
                         (float(PITCH) - (Crest_Height + Root_Height)) / 2.0
 
-    Height_Offset = Z_LOCATION
+    # Every turn of the thread is four rings: crest, crest, root, root.
+    # All the rings are built at once, the ring heights are accumulated in the
+    # same order as before so the verts land exactly where they used to.
+    Ring_Radius = np.tile((OUTTER_RADIUS, OUTTER_RADIUS, INNER_RADIUS, INNER_RADIUS), Num)
+    Ring_Drop = np.tile((Crest_Height, Crest_to_Root_Height, Root_Height, Root_to_Crest_Height), Num)
+    Ring_Height = np.subtract.accumulate(np.concatenate(((Z_LOCATION,), Ring_Drop)))
+    Height_Offset = float(Ring_Height[-1])
 
-    Lowest_Z_Vert = 0
+    Angle = np.radians(np.arange(DIV_COUNT + 1) * Deg_Step)
+    verts = np.empty((Row, DIV_COUNT + 1, 3))
+    verts[..., 0] = np.sin(Angle) * Ring_Radius[:, None]
+    verts[..., 1] = np.cos(Angle) * Ring_Radius[:, None]
+    verts[..., 2] = Ring_Height[:-1, None] - (Height_Step * np.arange(DIV_COUNT + 1))
 
-    for j in range(Num):
-
-        for i in range(DIV_COUNT + 1):
-            x = sin(radians(i * Deg_Step)) * OUTTER_RADIUS
-            y = cos(radians(i * Deg_Step)) * OUTTER_RADIUS
-            z = Height_Offset - (Height_Step * i)
-            verts.append([x, y, z])
-            Lowest_Z_Vert = min(Lowest_Z_Vert, z)
-        Height_Offset -= Crest_Height
-        Row += 1
-
-        for i in range(DIV_COUNT + 1):
-            x = sin(radians(i * Deg_Step)) * OUTTER_RADIUS
-            y = cos(radians(i * Deg_Step)) * OUTTER_RADIUS
-            z = Height_Offset - (Height_Step * i)
-            verts.append([x, y, z])
-            Lowest_Z_Vert = min(Lowest_Z_Vert, z)
-        Height_Offset -= Crest_to_Root_Height
-        Row += 1
-
-        for i in range(DIV_COUNT + 1):
-            x = sin(radians(i * Deg_Step)) * INNER_RADIUS
-            y = cos(radians(i * Deg_Step)) * INNER_RADIUS
-            z = Height_Offset - (Height_Step * i)
-            verts.append([x, y, z])
-            Lowest_Z_Vert = min(Lowest_Z_Vert, z)
-        Height_Offset -= Root_Height
-        Row += 1
-
-        for i in range(DIV_COUNT + 1):
-            x = sin(radians(i * Deg_Step)) * INNER_RADIUS
-            y = cos(radians(i * Deg_Step)) * INNER_RADIUS
-            z = Height_Offset - (Height_Step * i)
-            verts.append([x, y, z])
-            Lowest_Z_Vert = min(Lowest_Z_Vert, z)
-        Height_Offset -= Root_to_Crest_Height
-        Row += 1
-
-    return verts, Row, Height_Offset
+    return verts.reshape(-1, 3), Row, Height_Offset
 
 
 def Create_Thread_End_Verts(INNER_DIA, OUTTER_DIA, PITCH, CREST_PERCENT,
@@ -1772,10 +1785,12 @@ def Create_External_Thread(SHANK_DIA, SHANK_LENGTH, INNER_DIA, OUTTER_DIA,
                                                     )
     Total_Row += Thread_End_Row
 
-    verts.extend(Shank_Verts)
-    verts.extend(Thread_Start_Verts)
-    verts.extend(Thread_Verts)
-    verts.extend(Thread_End_Verts)
+    verts = np.concatenate((
+                np.reshape(Shank_Verts, (-1, 3)),
+                np.reshape(Thread_Start_Verts, (-1, 3)),
+                Thread_Verts,
+                np.reshape(Thread_End_Verts, (-1, 3)),
+                ))
 
     faces.extend(Build_Face_List_Quads(Face_Start, DIV_COUNT, Total_Row - 1, 0))
     faces.extend(Fill_Ring_Face(len(verts) - DIV_COUNT, DIV_COUNT, 1))
@@ -2267,66 +2282,56 @@ def Create_Internal_Thread(INNER_DIA, OUTTER_DIA, PITCH, HEIGHT,
 
 def Nut_Mesh(props, context):
 
-    verts = []
-    faces = []
-    Head_Verts = []
-    Head_Faces = []
-
-
-    Face_Start = len(verts)
-
+    parts = []
 
     if props.bf_Nut_Type == 'bf_Nut_12Pnt':
         Nut_Height = props.bf_12_Point_Nut_Height
     else:
         Nut_Height = props.bf_Hex_Nut_Height
 
-    Thread_Verts, Thread_Faces, New_Nut_Height = Create_Internal_Thread(
-                                                    props.bf_Minor_Dia, props.bf_Major_Dia,
-                                                    props.bf_Pitch, Nut_Height,
-                                                    props.bf_Crest_Percent, props.bf_Root_Percent,
-                                                    1, props.bf_Div_Count
-                                                    )
-    verts.extend(Thread_Verts)
-    faces.extend(Copy_Faces(Thread_Faces, Face_Start))
-
-    Face_Start = len(verts)
+    Thread, New_Nut_Height = Cached_Part(
+                                Create_Internal_Thread,
+                                props.bf_Minor_Dia, props.bf_Major_Dia,
+                                props.bf_Pitch, Nut_Height,
+                                props.bf_Crest_Percent, props.bf_Root_Percent,
+                                1, props.bf_Div_Count
+                                )
+    parts.append((Thread, 0.0))
 
     if props.bf_Nut_Type == 'bf_Nut_12Pnt':
-        Head_Verts, Head_Faces, Lock_Nut_Rad = add_12_Point_Nut(
-                                                props.bf_12_Point_Nut_Flat_Distance,
-                                                props.bf_Major_Dia, New_Nut_Height,
-                                                #Limit the size of the Flange to avoid calculation error
-                                                max(props.bf_12_Point_Nut_Flange_Dia,props.bf_12_Point_Nut_Flat_Distance)
-                                                )
+        Head, Lock_Nut_Rad = Cached_Part(
+                                add_12_Point_Nut,
+                                props.bf_12_Point_Nut_Flat_Distance,
+                                props.bf_Major_Dia, New_Nut_Height,
+                                #Limit the size of the Flange to avoid calculation error
+                                max(props.bf_12_Point_Nut_Flange_Dia,props.bf_12_Point_Nut_Flat_Distance)
+                                )
     else:
-        Head_Verts, Head_Faces, Lock_Nut_Rad = add_Hex_Nut(
-                                                props.bf_Hex_Nut_Flat_Distance,
-                                                props.bf_Major_Dia, New_Nut_Height
-                                                )
-    verts.extend((Head_Verts))
-    faces.extend(Copy_Faces(Head_Faces, Face_Start))
+        Head, Lock_Nut_Rad = Cached_Part(
+                                add_Hex_Nut,
+                                props.bf_Hex_Nut_Flat_Distance,
+                                props.bf_Major_Dia, New_Nut_Height
+                                )
+    parts.append((Head, 0.0))
 
     LowZ = 0 - New_Nut_Height
 
     if props.bf_Nut_Type == 'bf_Nut_Lock':
-        Face_Start = len(verts)
-        Nylon_Head_Verts, Nylon_Head_faces, LowZ = add_Nylon_Head(
-                                                        Lock_Nut_Rad, 0 - New_Nut_Height,
-                                                        props.bf_Div_Count
-                                                        )
-        verts.extend((Nylon_Head_Verts))
-        faces.extend(Copy_Faces(Nylon_Head_faces, Face_Start))
+        Nylon_Head, LowZ = Cached_Part(
+                                add_Nylon_Head,
+                                Lock_Nut_Rad, 0 - New_Nut_Height,
+                                props.bf_Div_Count
+                                )
+        parts.append((Nylon_Head, 0.0))
 
-        Face_Start = len(verts)
-        Nylon_Verts, Nylon_faces, Temp_LowZ = add_Nylon_Part(
-                                                        Lock_Nut_Rad, 0 - New_Nut_Height,
-                                                        props.bf_Div_Count
-                                                        )
-        verts.extend((Nylon_Verts))
-        faces.extend(Copy_Faces(Nylon_faces, Face_Start))
+        Nylon, Temp_LowZ = Cached_Part(
+                                add_Nylon_Part,
+                                Lock_Nut_Rad, 0 - New_Nut_Height,
+                                props.bf_Div_Count
+                                )
+        parts.append((Nylon, 0.0))
 
-    return Move_Verts_Up_Z(verts, 0 - LowZ), faces
+    return Join_Parts(parts, 0 - LowZ)
 
 
 # ####################################################################
@@ -2335,13 +2340,10 @@ def Nut_Mesh(props, context):
 
 def Bolt_Mesh(props, context):
 
-    verts = []
-    faces = []
-    Bit_Verts = []
-    Bit_Faces = []
+    parts = []
+    Bit = None
     Bit_Dia = 0.001
-    Head_Verts = []
-    Head_Faces = []
+    Head = None
     Head_Height = 0.0
 
     ReSized_Allen_Bit_Flat_Distance = props.bf_Allen_Bit_Flat_Distance  # set default
@@ -2359,40 +2361,46 @@ def Bolt_Mesh(props, context):
 
     # Bit Mesh
     if props.bf_Bit_Type == 'bf_Bit_Allen':
-        Bit_Verts, Bit_Faces, Bit_Dia = Create_Allen_Bit(
+        Bit, Bit_Dia = Cached_Part(
+                                                Create_Allen_Bit,
                                                 ReSized_Allen_Bit_Flat_Distance,
                                                 props.bf_Allen_Bit_Depth
                                                 )
 
     if props.bf_Bit_Type == 'bf_Bit_Torx':
-        Bit_Verts, Bit_Faces, Bit_Dia = Create_Torx_Bit(
+        Bit, Bit_Dia = Cached_Part(
+                                                Create_Torx_Bit,
                                                 Torx_Bit_Size_To_Point_Distance(props.bf_Torx_Size_Type),
                                                 props.bf_Torx_Bit_Depth
                                                 )
 
 
     if props.bf_Bit_Type == 'bf_Bit_Philips':
-        Bit_Verts, Bit_Faces, Bit_Dia = Create_Phillips_Bit(
+        Bit, Bit_Dia = Cached_Part(
+                                                Create_Phillips_Bit,
                                                 props.bf_Philips_Bit_Dia,
                                                 props.bf_Philips_Bit_Dia * (0.5 / 1.82),
                                                 props.bf_Phillips_Bit_Depth
                                                 )
     # Head Mesh
     if props.bf_Head_Type == 'bf_Head_Hex':
-        Head_Verts, Head_Faces, Head_Height = Create_Hex_Head(
+        Head, Head_Height = Cached_Part(
+                                                Create_Hex_Head,
                                                 props.bf_Hex_Head_Flat_Distance, Bit_Dia,
                                                 props.bf_Shank_Dia, props.bf_Hex_Head_Height
                                                 )
 
     elif props.bf_Head_Type == 'bf_Head_12Pnt':
-        Head_Verts, Head_Faces, Head_Height = Create_12_Point_Head(
+        Head, Head_Height = Cached_Part(
+                                                Create_12_Point_Head,
                                                 props.bf_12_Point_Head_Flat_Distance, Bit_Dia,
                                                 props.bf_Shank_Dia, props.bf_12_Point_Head_Height,
                                                 #Limit the size of the Flange to avoid calculation error
                                                 max(props.bf_12_Point_Head_Flange_Dia,props.bf_12_Point_Head_Flat_Distance)
                                                 )
     elif props.bf_Head_Type == 'bf_Head_Cap':
-        Head_Verts, Head_Faces, Head_Height = Create_Cap_Head(
+        Head, Head_Height = Cached_Part(
+                                                Create_Cap_Head,
                                                 Bit_Dia, props.bf_Cap_Head_Dia,
                                                 props.bf_Shank_Dia, props.bf_Cap_Head_Height,
                                                 props.bf_Cap_Head_Dia * (1.0 / 19.0),
@@ -2400,48 +2408,47 @@ def Bolt_Mesh(props, context):
                                                 props.bf_Div_Count
                                                 )
     elif props.bf_Head_Type == 'bf_Head_Dome':
-        Head_Verts, Head_Faces, Head_Height = Create_Dome_Head(
+        Head, Head_Height = Cached_Part(
+                                                Create_Dome_Head,
                                                 Bit_Dia, props.bf_Dome_Head_Dia,
                                                 props.bf_Shank_Dia, props.bf_Hex_Head_Height,
                                                 1, 1, 0, props.bf_Div_Count
                                                 )
 
     elif props.bf_Head_Type == 'bf_Head_Pan':
-        Head_Verts, Head_Faces, Head_Height = Create_Pan_Head(
+        Head, Head_Height = Cached_Part(
+                                                Create_Pan_Head,
                                                 Bit_Dia, props.bf_Pan_Head_Dia,
                                                 props.bf_Shank_Dia,
                                                 props.bf_Hex_Head_Height, 1, 1, 0,
                                                 props.bf_Div_Count
                                                 )
     elif props.bf_Head_Type == 'bf_Head_CounterSink':
-        Head_Verts, Head_Faces, Head_Height = Create_CounterSink_Head(
+        Head, Head_Height = Cached_Part(
+                                                Create_CounterSink_Head,
                                                 Bit_Dia, props.bf_CounterSink_Head_Dia,
                                                 props.bf_Shank_Dia, props.bf_CounterSink_Head_Dia,
                                                 props.bf_CounterSink_Head_Dia * (0.09 / 6.31),
                                                 props.bf_Div_Count
                                                 )
 
-    Face_Start = len(verts)
-    verts.extend(Move_Verts_Up_Z(Bit_Verts, Head_Height))
-    faces.extend(Copy_Faces(Bit_Faces, Face_Start))
-
-    Face_Start = len(verts)
-    verts.extend(Move_Verts_Up_Z(Head_Verts, Head_Height))
-    faces.extend(Copy_Faces(Head_Faces, Face_Start))
+    if Bit is not None:
+        parts.append((Bit, Head_Height))
 
-    Face_Start = len(verts)
-    Thread_Verts, Thread_Faces, Thread_Height = Create_External_Thread(
-                                                    props.bf_Shank_Dia, props.bf_Shank_Length,
-                                                    props.bf_Minor_Dia, props.bf_Major_Dia,
-                                                    props.bf_Pitch, props.bf_Thread_Length,
-                                                    props.bf_Crest_Percent,
-                                                    props.bf_Root_Percent, props.bf_Div_Count
-                                                    )
+    if Head is not None:
+        parts.append((Head, Head_Height))
 
-    verts.extend(Move_Verts_Up_Z(Thread_Verts, 0))
-    faces.extend(Copy_Faces(Thread_Faces, Face_Start))
+    Thread, Thread_Height = Cached_Part(
+                                Create_External_Thread,
+                                props.bf_Shank_Dia, props.bf_Shank_Length,
+                                props.bf_Minor_Dia, props.bf_Major_Dia,
+                                props.bf_Pitch, props.bf_Thread_Length,
+                                props.bf_Crest_Percent,
+                                props.bf_Root_Percent, props.bf_Div_Count
+                                )
+    parts.append((Thread, 0.0))
 
-    return Move_Verts_Up_Z(verts, Thread_Height), faces
+    return Join_Parts(parts, Thread_Height)
 
 
 
@@ -2452,27 +2459,32 @@ def Bolt_Mesh(props, context):
 
 def Create_New_Mesh(props, context):
 
-    verts = []
-    faces = []
-    edges = []
     sObjName = ''
 
     if props.bf_Model_Type == 'bf_Model_Bolt':
         # print('Create Bolt')
-        verts, faces = Bolt_Mesh(props, context)
+        verts, loops, sizes = Bolt_Mesh(props, context)
         sObjName = 'Bolt'
 
     if props.bf_Model_Type == 'bf_Model_Nut':
         # print('Create Nut')
-        verts, faces = Nut_Mesh(props, context)
+        verts, loops, sizes = Nut_Mesh(props, context)
         sObjName = 'Nut'
 
-    verts, faces = RemoveDoubles(verts, faces)
+    verts, loops, sizes = RemoveDoubles(verts, loops, sizes)
 
-    verts = Scale_Mesh_Verts(verts, GLOBAL_SCALE)
+    verts *= GLOBAL_SCALE
 
+    # Write the arrays straight into the mesh, like from_pydata without the Python lists
     mesh = bpy.data.meshes.new(name=sObjName)
-    mesh.from_pydata(verts, edges, faces)
+    mesh.vertices.add(len(verts))
+    mesh.loops.add(len(loops))
+    mesh.polygons.add(len(sizes))
+    mesh.vertices.foreach_set("co", verts.astype(np.float32).reshape(-1))
+    mesh.loops.foreach_set("vertex_index", loops.astype(np.int32))
+    mesh.polygons.foreach_set("loop_start", (np.cumsum(sizes) - sizes).astype(np.int32))
+    mesh.shade_flat()
+    mesh.update(calc_edges=True)
 
     # useful for development when the mesh may be invalid.
     # Fix T51338 : Validate the mesh (the internal thread generator for the Nut
@@ -32,15 +32,38 @@ import mathutils
 from bpy_extras.io_utils import ExportHelper
 
 from os import remove
+import os
 import time
 import math
 import struct
+import numpy as np
 
 
 def get_sampled_frames(start, end, sampling):
     return [math.modf(start + x * sampling) for x in range(int((end - start) / sampling) + 1)]
 
 
+def get_filepaths(filepath, objects):
+    """One file per object, suffixed with the object name when exporting several objects."""
+    if len(objects) == 1:
+        return [filepath]
+    base, ext = os.path.splitext(filepath)
+    return [base + "_" + bpy.path.clean_name(ob.name) + ext for ob in objects]
+
+
+def export_failed(files):
+    for file in files:
+        file.close()
+        try:
+            remove(file.name)
+        except:
+            empty = open(file.name, 'w')
+            empty.write('DUMMIFILE - export failed\n')
+            empty.close()
+    print('Export failed. Vertexcount of Object is not constant')
+    return False
+
+
 def do_export(context, props, filepath):
     mat_x90 = mathutils.Matrix.Rotation(-math.pi/2, 4, 'X')
     ob = context.active_object
@@ -49,62 +72,70 @@ def do_export(context, props, filepath):
     end = props.range_end
     sampling = float(props.sampling)
     apply_modifiers = props.apply_modifiers
+    if props.use_selection:
+        objects = [o for o in context.selected_objects if o.type in {'MESH', 'CURVE', 'SURFACE', 'FONT'}] or [ob]
+    else:
+        objects = [ob]
     depsgraph = None
     if apply_modifiers:
         depsgraph = context.evaluated_depsgraph_get()
-        me = ob.evaluated_get(depsgraph).to_mesh()
-    else:
-        me = ob.to_mesh()
-    vertCount = len(me.vertices)
+
+    def to_mesh(ob):
+        return ob.evaluated_get(depsgraph).to_mesh() if apply_modifiers else ob.to_mesh()
+
+    def to_mesh_clear(ob):
+        if apply_modifiers:
+            ob.evaluated_get(depsgraph).to_mesh_clear()
+        else:
+            ob.to_mesh_clear()
+
     sampletimes = get_sampled_frames(start, end, sampling)
     sampleCount = len(sampletimes)
 
-    # Create the header
-    headerFormat = '<12siiffi'
-    headerStr = struct.pack(headerFormat, b'POINTCACHE2\0',
-                            1, vertCount, start, sampling, sampleCount)
+    files = []
+    buffers = []
+    for o, path in zip(objects, get_filepaths(filepath, objects)):
+        vertCount = len(to_mesh(o).vertices)
+        to_mesh_clear(o)
+
+        # Create the header
+        headerFormat = '<12siiffi'
+        headerStr = struct.pack(headerFormat, b'POINTCACHE2\0',
+                                1, vertCount, start, sampling, sampleCount)
 
-    file = open(filepath, "wb")
-    file.write(headerStr)
+        file = open(path, "wb")
+        file.write(headerStr)
+        files.append(file)
+        # One sample of coordinates, reused for all the samples. PC2 is little-endian.
+        buffers.append((np.empty(vertCount * 3, dtype=np.float32), np.empty(vertCount * 3, dtype='<f4')))
 
+    # Evaluate each sample once for all the objects.
     for frame in sampletimes:
         # stupid modf() gives decimal part first!
         sc.frame_set(int(frame[1]), subframe=frame[0])
         if apply_modifiers:
-            me = ob.evaluated_get(depsgraph).to_mesh()
-        else:
-            me = ob.to_mesh()
-
-        if len(me.vertices) != vertCount:
-            bpy.data.meshes.remove(me, do_unlink=True)
-            file.close()
-            try:
-                remove(filepath)
-            except:
-                empty = open(filepath, 'w')
-                empty.write('DUMMIFILE - export failed\n')
-                empty.close()
-            print('Export failed. Vertexcount of Object is not constant')
-            return False
-
-        if props.world_space:
-            me.transform(ob.matrix_world)
-        if props.rot_x90:
-            me.transform(mat_x90)
-
-        for v in me.vertices:
-            thisVertex = struct.pack('<fff', float(v.co[0]),
-                                     float(v.co[1]),
-                                     float(v.co[2]))
-            file.write(thisVertex)
+            depsgraph = context.evaluated_depsgraph_get()
 
-    if apply_modifiers:
-        ob.evaluated_get(depsgraph).to_mesh_clear()
-    else:
-        me = ob.to_mesh_clear()
+        for o, file, (co, co_le) in zip(objects, files, buffers):
+            me = to_mesh(o)
 
-    file.flush()
-    file.close()
+            if len(me.vertices) * 3 != len(co):
+                to_mesh_clear(o)
+                return export_failed(files)
+
+            if props.world_space:
+                me.transform(o.matrix_world)
+            if props.rot_x90:
+                me.transform(mat_x90)
+
+            me.vertices.foreach_get("co", co)
+            co_le[:] = co
+            co_le.tofile(file)
+            to_mesh_clear(o)
+
+    for file in files:
+        file.flush()
+        file.close()
     return True
 
 
@@ -128,6 +159,10 @@ class Export_pc2(bpy.types.Operator, ExportHelper):
         name="Apply Modifiers",
         description="Applies the Modifiers",
         default=True,)
+    use_selection: BoolProperty(
+        name="Selected Objects",
+        description="Export each selected object to its own file, suffixed with the object name",
+        default=False,)
     range_start: IntProperty(
         name='Start Frame',
         description='First frame to use for Export',
@@ -84,6 +84,7 @@ T_Recenter = False
 T_ThicknessBevel = True
 T_import_atts = True
 T_Collection = False
+T_StreamEntities = False
 
 RELEASE_TEST = False
 DEBUG = False
@@ -95,11 +96,11 @@ def is_ref_scene(scene):
 
 def read(report, filename, obj_merge=BY_LAYER, import_text=True, import_light=True, export_acis=True, merge_lines=True,
          do_bbox=True, block_rep=LINKED_OBJECTS, new_scene=None, new_collection=None, recenter=False, projDXF=None, projSCN=None,
-         thicknessWidth=True, but_group_by_att=True, dxf_unit_scale=1.0):
+         thicknessWidth=True, but_group_by_att=True, dxf_unit_scale=1.0, stream_entities=False):
     # import dxf and export nurbs types to sat/sab files
     # because that's how autocad stores nurbs types in a dxf...
     do = Do(filename, obj_merge, import_text, import_light, export_acis, merge_lines, do_bbox, block_rep, recenter,
-            projDXF, projSCN, thicknessWidth, but_group_by_att, dxf_unit_scale)
+            projDXF, projSCN, thicknessWidth, but_group_by_att, dxf_unit_scale, stream_entities)
 
     errors = do.entities(Path(filename.name).stem, new_scene, new_collection)
 
@@ -236,6 +237,13 @@ class IMPORT_OT_dxf(bpy.types.Operator):
             default=T_MergeLines
             )
 
+    stream_entities: BoolProperty(
+            name="Stream Entities",
+            description="Read the entities from the file while building the objects instead of loading them all "
+                        "first, uses less memory on large files (merging by layer or by layer and type only)",
+            default=T_StreamEntities
+            )
+
     import_text: BoolProperty(
             name="Import Text",
             description="Import DXF Text Entities MTEXT and TEXT",
@@ -399,6 +407,7 @@ class IMPORT_OT_dxf(bpy.types.Operator):
         box = layout.box()
         box.prop(self, "scene_options")
         box.prop(self, "collection_options")
+        box.prop(self, "stream_entities")
 
         # merge options
         layout.label(text="Merge Options:")
@@ -579,7 +588,8 @@ class IMPORT_OT_dxf(bpy.types.Operator):
             else:
                 read(self.report, Path(self.directory, file.name), merge_options, self.import_text, self.import_light, self.export_acis,
                  self.merge_lines, self.do_bbox, block_map[self.block_options], scene, collection, self.recenter,
-                 proj_dxf, proj_scn, self.represent_thickness_and_width, self.import_atts, dxf_unit_scale)
+                 proj_dxf, proj_scn, self.represent_thickness_and_width, self.import_atts, dxf_unit_scale,
+                 self.stream_entities)
 
         if self.outliner_groups:
             display_groups_in_outliner()
@@ -35,6 +35,8 @@ from .color import aci_to_true_color
 def read(stream, options=None):
     if hasattr(stream, 'readline'):
         from .drawing import Drawing
+        if options is not None and options.get('stream_entities', False):
+            options = dict(options, stream_entities=False)  # stream can not be read again
         return Drawing(stream, options)
     else:
         raise AttributeError('stream object requires a readline() method.')
@@ -62,8 +64,11 @@ def readfile_as_asc(filename, options=None):
 
 def _read_encoded_file(filename, options=None, encoding='utf-8', errors='strict'):
     from .drawing import Drawing
+    from .entitysection import EntityStream
 
     with io.open(filename, encoding=encoding, errors=errors) as fp:
         dwg = Drawing(fp, options)
     dwg.filename = filename
+    if dwg.stream_entities:
+        dwg.entities = EntityStream(dwg, lambda: io.open(filename, encoding=encoding, errors=errors))
     return dwg
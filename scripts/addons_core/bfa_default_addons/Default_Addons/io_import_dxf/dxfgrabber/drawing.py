@@ -7,13 +7,14 @@
 
 __author__ = "mozman <mozman@gmx.at>"
 
-from .tags import stream_tagger
+from .tags import chunk_tagger
 from .sections import Sections
 
 DEFAULT_OPTIONS = {
     "grab_blocks": True,  # import block definitions True=yes, False=No
     "assure_3d_coords": False,  # guarantees (x, y, z) tuples for ALL coordinates
     "resolve_text_styles": True,  # Text, Attrib, Attdef and MText attributes will be set by the associated text style if necessary
+    "stream_entities": False,  # entities are read from the file on each iteration, readfile() only
 }
 
 
@@ -24,8 +25,11 @@ class Drawing(object):
         self.grab_blocks = options.get('grab_blocks', True)
         self.assure_3d_coords = options.get('assure_3d_coords', False)
         self.resolve_text_styles = options.get('resolve_text_styles', True)
+        # entities are set by readfile() as EntityStream, OBJECTS are not used by an EntityStream
+        self.stream_entities = options.get('stream_entities', False)
+        skip_sections = ('ENTITIES', 'OBJECTS') if self.stream_entities else ()
 
-        tagreader = stream_tagger(stream, self.assure_3d_coords)
+        tagreader = chunk_tagger(stream, self.assure_3d_coords, skip_sections)
         self.dxfversion = 'AC1009'
         self.encoding = 'cp1252'
         self.filename = None
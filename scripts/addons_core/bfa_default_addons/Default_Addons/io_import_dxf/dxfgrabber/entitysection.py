@@ -10,8 +10,8 @@ __author__ = "mozman <mozman@gmx.at>"
 from itertools import islice
 
 from .tags import TagGroups, DXFStructureError
-from .tags import Tags
-from .dxfentities import entity_factory
+from .tags import Tags, raw_tagger, raw_groups, cast_tags, SECTION_TAG, ENDSEC_TAG
+from .dxfentities import entity_factory, EntityTable
 
 
 class EntitySection(object):
@@ -53,15 +53,58 @@ class ObjectsSection(EntitySection):
     name = 'objects'
 
 
+class EntityStream(object):
+    """ Entities section of a DXF file, read from the file on each iteration instead of being kept in memory.
+    Only supported entity types are cast and built.
+    """
+    name = 'entities'
+
+    def __init__(self, drawing, open_stream):
+        self._drawing = drawing
+        self._open_stream = open_stream  # returns a new text stream of the DXF file
+
+    def __iter__(self):
+        drawing = self._drawing
+        sab_data = drawing.acdsdata.sab_data if drawing.dxfversion >= 'AC1027' and hasattr(drawing, 'acdsdata') \
+            else None
+        with self._open_stream() as stream:
+            groups = raw_groups(raw_tagger(stream))
+            for group in groups:
+                if len(group) > 1 and group[0] == SECTION_TAG and group[1].value == 'ENTITIES':
+                    break
+            else:
+                return
+            for entity in iter_entities(entity_groups(groups, drawing.assure_3d_coords)):
+                if sab_data is not None and hasattr(entity, 'set_sab_data'):
+                    entity.set_sab_data(sab_data[entity.handle])
+                if drawing.resolve_text_styles and hasattr(entity, 'resolve_text_style'):
+                    entity.resolve_text_style(drawing.styles)
+                yield entity
+
+
+def entity_groups(groups, assure_3d_coords=False):
+    """ Cast Tags() of the supported entities in uncast tag groups, up to the end of the section.
+    """
+    for group in groups:
+        dxftype = group[0].value
+        if dxftype == ENDSEC_TAG.value:
+            return
+        if dxftype in EntityTable:
+            yield cast_tags(group, assure_3d_coords, plain=True)
+
+
 def build_entities(tag_groups):
+    return list(iter_entities(tag_groups))
+
+
+def iter_entities(tag_groups):
     def build_entity(group):
         try:
-            entity = entity_factory(Tags(group))
+            entity = entity_factory(group if isinstance(group, Tags) else Tags(group))
         except KeyError:
             entity = None  # ignore unsupported entities
         return entity
 
-    entities = list()
     collector = None
     for group in tag_groups:
         entity = build_entity(group)
@@ -69,7 +112,7 @@ def build_entities(tag_groups):
             if collector:
                 if entity.dxftype == 'SEQEND':
                     collector.stop()
-                    entities.append(collector.entity)
+                    yield collector.entity
                     collector = None
                 else:
                     collector.append(entity)
@@ -78,8 +121,7 @@ def build_entities(tag_groups):
             elif entity.dxftype == 'INSERT' and entity.attribsfollow:
                 collector = _Collector(entity)
             else:
-                entities.append(entity)
-    return entities
+                yield entity
 
 
 class _Collector:
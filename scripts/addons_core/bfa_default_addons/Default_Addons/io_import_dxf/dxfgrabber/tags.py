@@ -24,6 +24,8 @@ NONE_TAG = DXFTag(999999, 'NONE')
 APP_DATA_MARKER = 102
 SUBCLASS_MARKER = 100
 XDATA_MARKER = 1001
+SECTION_TAG = DXFTag(0, 'SECTION')
+ENDSEC_TAG = DXFTag(0, 'ENDSEC')
 
 
 class DXFStructureError(Exception):
@@ -189,6 +191,134 @@ def string_tagger(s):
     return stream_tagger(StringIO(s))
 
 
+CHUNK_SIZE = 1 << 20  # characters read from the stream at once by raw_tagger()
+
+
+def raw_tagger(stream, chunk_size=CHUNK_SIZE):
+    """ Generates uncast DXFTag() from a stream, read in blocks of chunk_size characters instead of line by line.
+    Values are strings without line endings, point coordinates are not merged. Skips comment tags 999.
+    """
+    line = 0
+    rest = ''  # incomplete last line of a block
+    pending = []  # code line of a tag whose value line is in the next block
+    while True:
+        block = stream.read(chunk_size)
+        if not block:
+            break
+        lines = (rest + block).split('\n')
+        rest = lines.pop()
+        if pending:
+            lines = pending + lines
+        count = len(lines) - len(lines) % 2
+        pending = lines[count:]
+        try:
+            tags = [DXFTag(int(code), value.rstrip('\r')) for code, value in zip(lines[0:count:2], lines[1:count:2])]
+        except ValueError:
+            for index in range(0, count, 2):
+                try:
+                    int(lines[index])
+                except ValueError:
+                    raise DXFStructureError("Invalid group code near line: {}.".format(line + index + 1))
+        line += count
+        for tag in tags:
+            if tag.code != 999:  # skip comments
+                yield tag
+
+    if rest:  # last line without line ending
+        pending.append(rest)
+    if len(pending) == 2:
+        try:
+            tag = DXFTag(int(pending[0]), pending[1].rstrip('\r'))
+        except ValueError:
+            raise DXFStructureError("Invalid group code near line: {}.".format(line + 1))
+        if tag.code != 999:
+            yield tag
+
+
+def raw_groups(raw_tags):
+    """ Groups uncast DXFTag() into lists starting with a structure tag (code == 0).
+    """
+    group = []
+    for tag in raw_tags:
+        if tag.code == 0 and group:
+            yield group
+            group = []
+        group.append(tag)
+    if group:
+        yield group
+
+
+def cast_tags(tags, assure_3d_coords=False, plain=False):
+    """ Returns Tags() from a list of uncast DXFTag(), like the ones of raw_groups(), with point coordinates merged
+    into tuples and values cast by group code. If plain is True, app data and xdata are skipped without being cast,
+    entities are set up from the remaining tags only.
+    """
+    result = Tags()
+    append = result.append
+    casters = _TagCaster._cast
+    index = 0
+    count = len(tags)
+    while index < count:
+        code, value = tags[index]
+        index += 1
+        if plain:
+            if code >= 1000:  # skip xdata
+                continue
+            if code == APP_DATA_MARKER and value.startswith('{'):  # skip app data up to DXFTag(102, '}')
+                while index < count and tags[index].code != APP_DATA_MARKER:
+                    index += 1
+                index += 1
+                continue
+        if code in POINT_CODES:
+            if index == count or tags[index].code != code + 10:  # y coordinate is mandatory
+                raise DXFStructureError("Missing required y coordinate for group code {}.".format(code))
+            y = tags[index].value
+            index += 1
+            try:
+                if index < count and tags[index].code == code + 20:  # z coordinate just for 3d points
+                    point = (float(value), float(y), float(tags[index].value))
+                    index += 1
+                elif assure_3d_coords:
+                    point = (float(value), float(y), 0.)
+                else:
+                    point = (float(value), float(y))
+            except ValueError:
+                raise DXFStructureError("Invalid floating point values for group code {}.".format(code))
+            append(DXFTag(code, point))
+        else:
+            typecaster = casters.get(code, tostr)
+            try:
+                value = typecaster(value)
+            except ValueError:
+                if typecaster is int:  # convert float to int
+                    try:
+                        value = int(float(value))
+                    except ValueError:
+                        typecaster = None
+                else:
+                    typecaster = None
+            if typecaster is None:
+                raise DXFStructureError('Invalid tag (code={code}, value="{value}").'.format(code=code, value=value))
+            append(DXFTag(code, value))
+    return result
+
+
+def chunk_tagger(stream, assure_3d_coords=False, skip_sections=(), chunk_size=CHUNK_SIZE):
+    """ Generates DXFTag() from a stream like stream_tagger(), but reads the stream in blocks and casts the tags
+    group by group. Sections named in skip_sections are passed over without casting their tags and are generated
+    as empty sections.
+    """
+    groups = raw_groups(raw_tagger(stream, chunk_size))
+    for group in groups:
+        for tag in cast_tags(group, assure_3d_coords):
+            yield tag
+        if len(group) > 1 and group[0] == SECTION_TAG and group[1].value in skip_sections:
+            for group in groups:
+                if group[0] == ENDSEC_TAG:
+                    break
+            yield ENDSEC_TAG
+
+
 class Tags(list):
     """ DXFTag() chunk as flat list. """
     def find_all(self, code):
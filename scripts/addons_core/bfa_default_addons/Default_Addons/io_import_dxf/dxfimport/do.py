@@ -79,13 +79,13 @@ class Do:
         "dwg", "combination", "known_blocks", "import_text", "import_light", "export_acis", "merge_lines",
         "do_bounding_boxes", "acis_files", "errors", "block_representation", "recenter", "did_group_instance",
         "objects_before", "pDXF", "pScene", "thickness_and_width", "but_group_by_att", "current_scene", "current_collection",
-        "dxf_unit_scale"
+        "dxf_unit_scale", "stream"
     )
 
     def __init__(self, dxf_filename, c=BY_LAYER, import_text=True, import_light=True, export_acis=True,
                  merge_lines=True, do_bbox=True, block_rep=LINKED_OBJECTS, recenter=False, pDXF=None, pScene=None,
-                 thicknessWidth=True, but_group_by_att=True, dxf_unit_scale=1.0):
-        self.dwg = dxfgrabber.readfile(dxf_filename, {"assure_3d_coords": True})
+                 thicknessWidth=True, but_group_by_att=True, dxf_unit_scale=1.0, stream=False):
+        self.dwg = dxfgrabber.readfile(dxf_filename, {"assure_3d_coords": True, "stream_entities": stream})
         self.combination = c
         self.known_blocks = {}
         self.import_text = import_text
@@ -106,6 +106,7 @@ class Do:
         self.current_scene = None
         self.current_collection = None
         self.dxf_unit_scale = dxf_unit_scale
+        self.stream = stream
 
     def proj(self, co, elevation=0):
         """
@@ -1227,34 +1228,49 @@ class Do:
         name: name of the returned Blender object (String)
         Accumulates all entities into a Blender bmesh and returns a Blender object containing it.
         """
-        d = bpy.data.meshes.new(name)
         bm = bmesh.new()
 
-        i = 0
+        en = None
         for en in entities:
-            i += 1
-            if en.dxftype == "3DFACE":
-                self.the3dface(en, bm)
-            else:
-                dxftype = getattr(self, en.dxftype.lower(), None)
-                if dxftype is not None:
-                    dxftype(en, bm)
-                else:
-                    self.errors.add(en.dxftype.lower() + " - unknown dxftype")
-        if i > 0:
-            if hasattr(en, "thickness"):
-                if en.thickness != 0:
-                    self._thickness(bm, en.thickness)
-            bm.to_mesh(d)
-            o = bpy.data.objects.new(name, d)
-            # for POLYFACE
-            if hasattr(en, "extrusion"):
-                self._extrusion(o, en)
-            if hasattr(en, "subdivision_levels"):
-                self._subdivision(o, en)
-            return o
+            self._mesh_entity(en, bm)
+        if en is not None:
+            return self._mesh_object(bm, en, name)
         return None
 
+    def _mesh_entity(self, en, bm):
+        """
+        en: DXF entity of a mesh type
+        bm: Blender bmesh the entity is added to
+        """
+        if en.dxftype == "3DFACE":
+            self.the3dface(en, bm)
+        else:
+            dxftype = getattr(self, en.dxftype.lower(), None)
+            if dxftype is not None:
+                dxftype(en, bm)
+            else:
+                self.errors.add(en.dxftype.lower() + " - unknown dxftype")
+
+    def _mesh_object(self, bm, en, name):
+        """
+        bm: Blender bmesh with the geometry of the entities
+        en: last DXF entity added to bm, its attributes are used for the object
+        Returns a new Blender object containing the geometry.
+        """
+        if hasattr(en, "thickness"):
+            if en.thickness != 0:
+                self._thickness(bm, en.thickness)
+        d = bpy.data.meshes.new(name)
+        bm.to_mesh(d)
+        bm.free()
+        o = bpy.data.objects.new(name, d)
+        # for POLYFACE
+        if hasattr(en, "extrusion"):
+            self._extrusion(o, en)
+        if hasattr(en, "subdivision_levels"):
+            self._subdivision(o, en)
+        return o
+
     def object_curve(self, entities, scene, name):
         """
         entities: list of DXF entities
@@ -1263,32 +1279,48 @@ class Do:
         """
         d = bpy.data.curves.new(name, "CURVE")
 
-        i = 0
+        en = None
         lines = []
         for en in entities:
-            i += 1
-            TYPE = en.dxftype
-            if TYPE == "LINE" and self.merge_lines:
-                lines.append(en)
-                continue
-            typefunc = getattr(self, TYPE.lower(), None)
-            if typefunc is not None:
-                typefunc(en, d)
-            else:
-                self.errors.add(en.dxftype.lower() + " - unknown dxftype")
-
-        if len(lines) > 0:
-            self._merge_lines(lines, d)
+            self._curve_entity(en, d, lines)
 
-        if i > 0:
-            self._check3D_object(d)
-            o = bpy.data.objects.new(name, d)
-            self._thickness_and_width(o, en, scene)
-            self._extrusion(o, en)
-            return o
+        if en is not None:
+            return self._curve_object(d, lines, en, scene, name)
 
         return None
 
+    def _curve_entity(self, en, curve, lines):
+        """
+        en: DXF entity of a curve type
+        curve: Blender curve data the entity is added to
+        lines: list collecting the LINE entities to merge, if merge_lines is set
+        """
+        TYPE = en.dxftype
+        if TYPE == "LINE" and self.merge_lines:
+            lines.append(en)
+            return
+        typefunc = getattr(self, TYPE.lower(), None)
+        if typefunc is not None:
+            typefunc(en, curve)
+        else:
+            self.errors.add(en.dxftype.lower() + " - unknown dxftype")
+
+    def _curve_object(self, curve, lines, en, scene, name):
+        """
+        curve: Blender curve data with the geometry of the entities
+        lines: LINE entities to merge and add to the curve
+        en: last DXF entity, its attributes are used for the object
+        Returns a new Blender object containing the curve.
+        """
+        if len(lines) > 0:
+            self._merge_lines(lines, curve)
+
+        self._check3D_object(curve)
+        o = bpy.data.objects.new(name, curve)
+        self._thickness_and_width(o, en, scene)
+        self._extrusion(o, en)
+        return o
+
     def object_surface(self, entities, scene, name):
         """
         entities: list of DXF entities
@@ -1373,13 +1405,16 @@ class Do:
                     self.errors.add("DXF-import: Unsupported dxftype: %s" % TYPE)
                 raise
 
+        self._link_object(o, group, scene)
+        return o
+
+    def _link_object(self, o, group, scene):
         if type(o) == bpy.types.Object:
             if o.name not in scene.objects:
                 self.current_collection.objects.link(o)
 
             if o.name not in group.objects:
                 group.objects.link(o)
-        return o
 
     def _recenter(self, scene, name):
         bpy.context.window.scene = scene
@@ -1470,6 +1505,25 @@ class Do:
                 #o.location = e.location
                 o.parent = e
 
+    def _attributes_name(self, layer_name, TYPE, atts):
+        """
+        atts: attributes as returned by groupsort.attributes()
+        Returns the name of the object merging the entities of a layer, type and attributes.
+        """
+        thickness, subd, width, extrusion = atts
+        if extrusion is None:  # unset extrusion defaults to (0, 0, 1)
+            extrusion = (0, 0, 1)
+        att = ""
+        if thickness != 0:
+            att += "thickness" + str(thickness) + ", "
+        if subd > 0:
+            att += "subd" + str(subd) + ", "
+        if width != [(0, 0)]:
+            att += "width" + str(width) + ", "
+        if extrusion != (0, 0, 1):
+            att += "extrusion" + str([str(round(c, 1)) + ".." + str(c)[-1:] for c in extrusion]) + ", "
+        return layer_name + "_" + TYPE.replace("object_", "") + "_" + att
+
     def combined_objects(self, entities, scene, override_name=None, override_group=None):
         """
         entities: list of dxf entities
@@ -1499,19 +1553,7 @@ class Do:
             for TYPE, grouped_entities in group_sorted:
                 if self.but_group_by_att and self.combination != BY_CLOSED_NO_BULGE_POLY and self.combination != BY_BLOCK:
                     for atts, by_att in groupsort.by_attributes(grouped_entities):
-                        thickness, subd, width, extrusion = atts
-                        if extrusion is None:  # unset extrusion defaults to (0, 0, 1)
-                            extrusion = (0, 0, 1)
-                        att = ""
-                        if thickness != 0:
-                            att += "thickness" + str(thickness) + ", "
-                        if subd > 0:
-                            att += "subd" + str(subd) + ", "
-                        if width != [(0, 0)]:
-                            att += "width" + str(width) + ", "
-                        if extrusion != (0, 0, 1):
-                            att += "extrusion" + str([str(round(c, 1)) + ".." + str(c)[-1:] for c in extrusion]) + ", "
-                        name = layer_name + "_" + TYPE.replace("object_", "") + "_" + att
+                        name = self._attributes_name(layer_name, TYPE, atts)
 
                         o = self._call_object_types(TYPE, by_att, group, name, scene, False)
                         if o is not None:
@@ -1553,6 +1595,59 @@ class Do:
                                 objects.append(o)
         return objects
 
+    def streamed_objects(self, entities, scene):
+        """
+        entities: iterable of dxf entities, iterated once
+        Adds the dxf entities to Blender objects like combined_objects() does for BY_LAYER and BY_DXFTYPE, without
+        keeping the entities: each one is added to the bmesh or curve of its layer, type and attributes right away.
+        Separated entities are added as soon as they are read.
+        """
+        builders = {}
+        for en in entities:
+            if en.dxftype == "ATTDEF":
+                continue
+            if is_.separated_entity(en):
+                self.separated_entities((en,), scene)
+                continue
+
+            kind = groupsort.map_dxf_to_blender_type(en.dxftype)
+            TYPE = kind if self.combination == BY_LAYER else en.dxftype
+            if kind == "object_surface":
+                self._call_object_types(TYPE, (en,), self._get_group(en.layer),
+                                        en.layer + "_" + TYPE.replace("object_", ""), scene)
+                continue
+            if kind == "not_mergeable":
+                self.errors.add("DXF-Import: Not mergeable dxf type '%s' should not be called in merge-mode" % TYPE)
+                continue
+
+            atts = groupsort.attributes(en) if self.but_group_by_att else None
+            key = (en.layer, TYPE) if atts is None else \
+                (en.layer, TYPE, atts[0], atts[1], tuple(tuple(w) for w in atts[2]), tuple(atts[3]))
+            builder = builders.get(key)
+            if builder is None:
+                if atts is None:
+                    name = en.layer + "_" + TYPE.replace("object_", "")
+                else:
+                    name = self._attributes_name(en.layer, TYPE, atts)
+                data = bmesh.new() if kind == "object_mesh" else bpy.data.curves.new(name, "CURVE")
+                builder = builders[key] = [kind, name, data, [], en]
+            if kind == "object_mesh":
+                self._mesh_entity(en, builder[2])
+            else:
+                self._curve_entity(en, builder[2], builder[3])
+            builder[4] = en
+
+        objects = []
+        for key in sorted(builders, key=lambda k: (k[0], k[1])):
+            kind, name, data, lines, en = builders[key]
+            if kind == "object_mesh":
+                o = self._mesh_object(data, en, name)
+            else:
+                o = self._curve_object(data, lines, en, scene, name)
+            self._link_object(o, self._get_group(key[0]), scene)
+            objects.append(o)
+        return objects
+
     def separated_entities(self, entities, scene, override_name=None, override_group=None):
         """
         entities: list of dxf entities
@@ -1612,6 +1707,8 @@ class Do:
 
         if self.combination == BY_BLOCK:
             self.combined_objects((en for en in self.dwg.modelspace()), scene)
+        elif self.stream and self.combination in (BY_LAYER, BY_DXFTYPE):
+            self.streamed_objects(self.dwg.modelspace(), scene)
         elif self.combination != SEPARATED:
             self.combined_objects((en for en in self.dwg.modelspace() if is_.combined_entity(en)), scene)
             self.separated_entities((en for en in self.dwg.modelspace() if is_.separated_entity(en)), scene)
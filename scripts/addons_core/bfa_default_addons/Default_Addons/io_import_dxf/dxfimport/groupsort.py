@@ -53,28 +53,33 @@ def by_dxftype(entities):
     return itertools.groupby(sorted(entities, key=keyf), key=keyf)
 
 
-def by_attributes(entities):
+def attributes(entity):
     """
-    entities: list of DXF entities
+    entity: DXF entity
     attributes: thickness and width occurring in curve types; subdivision_levels occurring in MESH dxf types
     """
-    def attributes(entity):
-        width = [(0, 0)]
-        subd = -1
-        extrusion = entity.extrusion
-        if hasattr(entity, "width"):
-            if any((w != 0 for ww in entity.width for w in ww)):
-                width = entity.width
-        if hasattr(entity, "subdivision_levels"):
-            subd = entity.subdivision_levels
-        if entity.dxftype in {"LINE", "POINT"}:
-            extrusion = (0.0, 0.0, 1.0)
-        if extrusion is None:
-            # This can happen for entities of type "SPLINE" for example.
-            # But the sort comparison does not work between 'tuple' and 'NoneType'.
-            extrusion = ()
-        return entity.thickness, subd, width, extrusion
+    width = [(0, 0)]
+    subd = -1
+    extrusion = entity.extrusion
+    if hasattr(entity, "width"):
+        if any((w != 0 for ww in entity.width for w in ww)):
+            width = entity.width
+    if hasattr(entity, "subdivision_levels"):
+        subd = entity.subdivision_levels
+    if entity.dxftype in {"LINE", "POINT"}:
+        extrusion = (0.0, 0.0, 1.0)
+    if extrusion is None:
+        # This can happen for entities of type "SPLINE" for example.
+        # But the sort comparison does not work between 'tuple' and 'NoneType'.
+        extrusion = ()
+    return entity.thickness, subd, width, extrusion
 
+
+def by_attributes(entities):
+    """
+    entities: list of DXF entities
+    attributes: see attributes()
+    """
     return itertools.groupby(sorted(entities, key=attributes), key=attributes)
 
 def by_insert_block_name(inserts):
@@ -103,9 +103,19 @@ class IMPORT_OT_pdb(Operator, ImportHelper):
     use_sticks_one_object: BoolProperty(
         name="One object", default=False,
         description="All sticks are one object")
+    # Deprecated: sticks are no longer grouped, kept so that existing scripts
+    # passing it still work.
     use_sticks_one_object_nr: IntProperty(
-        name = "No.", default=200, min=10,
-        description="Number of sticks to be grouped at once")
+        name = "No.", default=200, min=10, options={'HIDDEN'},
+        description="Deprecated, has no effect")
+    use_sticks_distance: BoolProperty(
+        name="From distances", default=False,
+        description="Find the sticks from the distances of the atoms "
+                    "instead of the 'CONECT' records")
+    use_trajectory: BoolProperty(
+        name="Trajectory", default=False,
+        description="Read all models of the file into point caches "
+                    "(one PC2 file per element next to the PDB file)")
     datafile: StringProperty(
         name = "", description="Path to your custom data file",
         maxlen = 256, default = "", subtype='FILE_PATH')
@@ -124,6 +134,7 @@ class IMPORT_OT_pdb(Operator, ImportHelper):
         row.prop(self, "use_light")
         row = layout.row()
         row.prop(self, "use_center")
+        row.prop(self, "use_trajectory")
         # Balls
         box = layout.box()
         row = box.row()
@@ -155,6 +166,9 @@ class IMPORT_OT_pdb(Operator, ImportHelper):
         row.prop(self, "use_sticks_type")
         row = box.row()
         row.active = self.use_sticks
+        row.prop(self, "use_sticks_distance")
+        row = box.row()
+        row.active = self.use_sticks
         col = row.column()
         if self.use_sticks_type == '0' or self.use_sticks_type == '2':
             col.prop(self, "sticks_sectors")
@@ -181,11 +195,7 @@ class IMPORT_OT_pdb(Operator, ImportHelper):
             row.prop(self, "sticks_dist")
         if self.use_sticks_type == '2':
             row.active = self.use_sticks
-            col = row.column()
-            col.prop(self, "use_sticks_one_object")
-            col = row.column()
-            col.active = self.use_sticks_one_object
-            col.prop(self, "use_sticks_one_object_nr")
+            row.prop(self, "use_sticks_one_object")
             row = box.row()
             row.active = self.use_sticks and self.use_sticks_bonds
             row.label(text="Distance")
@@ -214,7 +224,6 @@ class IMPORT_OT_pdb(Operator, ImportHelper):
                    self.use_sticks_smooth,
                    self.use_sticks_bonds,
                    self.use_sticks_one_object,
-                   self.use_sticks_one_object_nr,
                    self.sticks_unit_length,
                    self.sticks_dist,
                    self.sticks_sectors,
@@ -222,7 +231,9 @@ class IMPORT_OT_pdb(Operator, ImportHelper):
                    self.use_center,
                    self.use_camera,
                    self.use_light,
-                   filepath_pdb)
+                   filepath_pdb,
+                   self.use_sticks_distance,
+                   self.use_trajectory)
 
         return {'FINISHED'}
 
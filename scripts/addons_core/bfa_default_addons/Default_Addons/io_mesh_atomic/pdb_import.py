@@ -3,10 +3,13 @@
 # SPDX-License-Identifier: GPL-2.0-or-later
 
 import os
+import struct
 import bpy
 import bmesh
+import numpy as np
 from math import pi, cos, sin, sqrt, ceil
 from mathutils import Vector, Matrix
+from mathutils.kdtree import KDTree
 from copy import copy
 
 # -----------------------------------------------------------------------------
@@ -195,18 +198,30 @@ def read_elements():
         ELEMENTS.append(li)
 
 
+# The elements by their upper case short name, for looking up the element of
+# an atom without going through the whole list.
+def element_table():
+    table = {}
+    for element in ELEMENTS:
+        table.setdefault(str.upper(element.short_name), element)
+    return table
+
+
 # The function, which reads the x,y,z positions of all atoms in a PDB
 # file.
 #
-# filepath_pdb: path to pdb file
-# radiustype  : '0' default
-#               '1' atomic radii
-#               '2' van der Waals
-def read_pdb_file(filepath_pdb, radiustype):
+# filepath_pdb    : path to pdb file
+# radiustype      : '0' default
+#                   '1' atomic radii
+#                   '2' van der Waals
+# first_model_only: stop reading at the end of the first model (ENDMDL)
+def read_pdb_file(filepath_pdb, radiustype, first_model_only=False):
 
     # The list of all atoms as read from the PDB file.
     all_atoms  = []
 
+    elements = element_table()
+
     # Open the pdb file ...
     filepath_pdb_p = open(filepath_pdb, "r")
 
@@ -272,29 +287,23 @@ def read_pdb_file(filepath_pdb, radiustype):
                     short_name2 = line[76:78]
 
                 if short_name2.isalpha() == True:
-                    FOUND = False
-                    for element in ELEMENTS:
-                        if str.upper(short_name2) == str.upper(element.short_name):
-                            FOUND = True
-                            break
-                    if FOUND == False:
+                    if str.upper(short_name2) not in elements:
                         short_name = short_name2
 
             # ....................................................... to here.
 
-            # Go through all elements and find the element of the current atom.
+            # Find the element of the current atom.
             FLAG_FOUND = False
-            for element in ELEMENTS:
-                if str.upper(short_name) == str.upper(element.short_name):
-                    # Give the atom its proper names, color and radius:
-                    short_name = str.upper(element.short_name)
-                    name = element.name
-                    # int(radiustype) => type of radius:
-                    # pre-defined (0), atomic (1) or van der Waals (2)
-                    radius = float(element.radii[int(radiustype)])
-                    color = element.color
-                    FLAG_FOUND = True
-                    break
+            element = elements.get(str.upper(short_name))
+            if element is not None:
+                # Give the atom its proper names, color and radius:
+                short_name = str.upper(element.short_name)
+                name = element.name
+                # int(radiustype) => type of radius:
+                # pre-defined (0), atomic (1) or van der Waals (2)
+                radius = float(element.radii[int(radiustype)])
+                color = element.color
+                FLAG_FOUND = True
 
             # Is it a vacancy or an 'unknown atom' ?
             if FLAG_FOUND == False:
@@ -330,6 +339,10 @@ def read_pdb_file(filepath_pdb, radiustype):
                                       radius,
                                       color,[]))
 
+        # Only the first model of a file with several models (trajectory).
+        elif first_model_only and line.startswith("ENDMDL"):
+            break
+
         line = filepath_pdb_p.readline()
         line = line[:-1]
 
@@ -362,6 +375,8 @@ def read_pdb_file_sticks(filepath_pdb, use_sticks_bonds, all_atoms):
 
     Number_of_sticks = 0
     sticks_double = 0
+    # The atom pairs of the registered sticks, in both orders.
+    registered_sticks = set()
     j = 0
     # This is in fact an endless while loop, ...
     while j > -1:
@@ -445,19 +460,16 @@ def read_pdb_file_sticks(filepath_pdb, use_sticks_bonds, all_atoms):
             # Note that in a PDB file, sticks of one atom pair can appear a
             # couple of times. (Only god knows why ...)
             # So, does a stick between the considered atoms already exist?
-            FLAG_BAR = False
-            for k in range(Number_of_sticks):
-                if ((all_sticks[k].atom1 == atom1 and all_sticks[k].atom2 == atom2) or
-                    (all_sticks[k].atom2 == atom1 and all_sticks[k].atom1 == atom2)):
-                    sticks_double += 1
-                    # If yes, then FLAG on 'True'.
-                    FLAG_BAR       = True
-                    break
+            FLAG_BAR = (atom1, atom2) in registered_sticks
+            if FLAG_BAR == True:
+                sticks_double += 1
 
             # If the stick is not yet registered (FLAG_BAR == False), then
             # register it!
             if FLAG_BAR == False:
                 all_sticks.append(StickProp(atom1,atom2,number,dist_n))
+                registered_sticks.add((atom1, atom2))
+                registered_sticks.add((atom2, atom1))
                 Number_of_sticks += 1
                 j += 1
 
@@ -469,6 +481,122 @@ def read_pdb_file_sticks(filepath_pdb, use_sticks_bonds, all_atoms):
     return all_sticks
 
 
+# The function, which finds the sticks from the distances of the atoms, for
+# PDB files without (complete) 'CONECT' records. Two atoms are bonded if their
+# distance is at most the sum of their covalent radii times 'tolerance'. A
+# KD-tree gives the neighbours of each atom, instead of testing all pairs.
+def find_sticks_by_distance(all_atoms, tolerance=1.2):
+
+    elements = element_table()
+
+    # The covalent radius of each atom, 'TER' entries are left out.
+    atoms = []
+    for i, atom in enumerate(all_atoms):
+        if atom.name == "TER":
+            continue
+        element = elements.get(str.upper(atom.element))
+        radius = element.radii[1] if element is not None else ELEMENTS[-2].radii[1]
+        atoms.append((i, radius))
+
+    if not atoms:
+        return []
+
+    kd = KDTree(len(atoms))
+    for k, (i, radius) in enumerate(atoms):
+        kd.insert(all_atoms[i].location, k)
+    kd.balance()
+
+    max_radius = max(radius for i, radius in atoms)
+
+    all_sticks = []
+    for k, (i, radius) in enumerate(atoms):
+        for (co, l, dist) in kd.find_range(all_atoms[i].location,
+                                          (radius + max_radius) * tolerance):
+            # Each pair once, atoms at the same place are not bonded.
+            if l <= k or dist == 0.0:
+                continue
+            if dist <= (radius + atoms[l][1]) * tolerance:
+                # Atom numbers start at 1, like in the 'CONECT' records.
+                all_sticks.append(StickProp(i+1, atoms[l][0]+1, 1, None))
+
+    return all_sticks
+
+
+# The function, which reads all models of a PDB file with several models
+# (trajectory, e.g. from a molecular dynamics simulation). The models are read
+# one after the other and the coordinates of the atoms are directly written
+# into one point cache file (PC2) per element, next to the PDB file. A
+# 'Mesh Cache' modifier on the mesh of each element plays the cache. The
+# first model is the structure, which has been drawn.
+def read_pdb_trajectory(filepath_pdb,
+                        all_atoms,
+                        atom_meshes,
+                        center_offset,
+                        Ball_distance_factor,
+                        object_center_vec):
+
+    # The atoms of each element, as indices into the list of atoms of a model.
+    # The order is the one of the vertices in the mesh of the element.
+    names = np.array([atom.name for atom in all_atoms if atom.name != "TER"])
+    if len(names) == 0:
+        return 0
+    element_atoms = {name: np.flatnonzero(names == name)
+                     for name in atom_meshes}
+
+    offset = np.array(center_offset, dtype=np.float64)
+    center = np.array(object_center_vec, dtype=np.float64)
+
+    # The PC2 files. The number of frames is written at the end, when all
+    # models have been read.
+    header_format = '<12siiffi'
+    files = {}
+    for name, indices in element_atoms.items():
+        filepath_pc2 = (os.path.splitext(filepath_pdb)[0] + "_" +
+                        bpy.path.clean_name(name) + ".pc2")
+        file = open(filepath_pc2, "wb")
+        file.write(struct.pack(header_format, b'POINTCACHE2\0', 1,
+                               len(indices), 0.0, 1.0, 0))
+        files[name] = (filepath_pc2, file)
+
+    frames = 0
+    model = []
+    with open(filepath_pdb, "r") as filepath_pdb_p:
+        for line in filepath_pdb_p:
+            if line.startswith("ATOM") or line.startswith("HETATM"):
+                model.append((line[30:38], line[38:46], line[46:54]))
+            elif line.startswith("ENDMDL") or line.startswith("END"):
+                if model == []:
+                    continue
+                # A model with another number of atoms does not fit the
+                # meshes. The trajectory ends here.
+                if len(model) != len(names):
+                    print("Atomic Blender: Model %d has %d instead of %d atoms, "
+                          "the trajectory ends here." %
+                          (frames+1, len(model), len(names)))
+                    break
+                co = np.array(model, dtype=np.float64)
+                co = (co - offset) * Ball_distance_factor - center
+                co = co.astype('<f4')
+                for name, indices in element_atoms.items():
+                    files[name][1].write(co[indices].tobytes())
+                frames += 1
+                model = []
+
+    for name, (filepath_pc2, file) in files.items():
+        file.seek(0)
+        file.write(struct.pack(header_format, b'POINTCACHE2\0', 1,
+                               len(element_atoms[name]), 0.0, 1.0, frames))
+        file.close()
+
+        modifier = atom_meshes[name].modifiers.new(name="Trajectory",
+                                                   type='MESH_CACHE')
+        modifier.cache_format = 'PC2'
+        modifier.filepath = filepath_pc2
+        modifier.frame_start = bpy.context.scene.frame_start
+
+    return frames
+
+
 # Function, which produces a cylinder. All is somewhat easy to understand.
 def build_stick(radius, length, sectors, element_name):
 
@@ -531,6 +659,88 @@ def build_stick(radius, length, sectors, element_name):
     return new_cylinder, new_cups
 
 
+# The two end points of one stick. For double and tripple bonds, the sticks
+# are shifted to the left and right of the middle connection.
+def stick_segment(all_atoms, stick, repeat, center, dist):
+
+    atom1 = copy(all_atoms[stick.atom1-1].location)-center
+    atom2 = copy(all_atoms[stick.atom2-1].location)-center
+
+    if stick.number == 2:
+        if repeat == 0:
+            atom1 += (stick.dist * dist)
+            atom2 += (stick.dist * dist)
+        if repeat == 1:
+            atom1 -= (stick.dist * dist)
+            atom2 -= (stick.dist * dist)
+
+    if stick.number == 3:
+        if repeat == 0:
+            atom1 += (stick.dist * dist)
+            atom2 += (stick.dist * dist)
+        if repeat == 2:
+            atom1 -= (stick.dist * dist)
+            atom2 -= (stick.dist * dist)
+
+    return atom1, atom2
+
+
+# Function, which builds one mesh with a closed cylinder for each segment
+# (pair of end points). All vertices and faces are computed at once with
+# NumPy and written into the mesh with 'foreach_set'.
+def build_sticks_mesh(segments, radius, sectors, name):
+
+    mesh = bpy.data.meshes.new(name)
+
+    # Segments of length zero have no direction and are left out.
+    p = np.array(segments, dtype=np.float64).reshape(-1, 2, 3)
+    dv = p[:, 0] - p[:, 1]
+    length = np.linalg.norm(dv, axis=1)
+    p, dv, length = p[length > 0.0], dv[length > 0.0], length[length > 0.0]
+    nr = len(p)
+    if nr == 0:
+        return mesh
+    n = dv / length[:, None]
+
+    # Two vectors perpendicular to the stick direction: cross with the axis
+    # along which the direction is the smallest.
+    helper = np.zeros_like(n)
+    helper[np.arange(nr), np.argmin(np.abs(n), axis=1)] = 1.0
+    u = np.cross(n, helper)
+    u /= np.linalg.norm(u, axis=1)[:, None]
+    v = np.cross(n, u)
+
+    # The two rings of each cylinder.
+    phi = np.linspace(0.0, 2.0 * pi, sectors, endpoint=False)
+    ring = radius * (np.cos(phi)[None, :, None] * u[:, None, :] +
+                     np.sin(phi)[None, :, None] * v[:, None, :])
+    co = np.empty((nr, 2, sectors, 3))
+    co[:, 0] = p[:, 0, None, :] + ring
+    co[:, 1] = p[:, 1, None, :] + ring
+
+    # Side quads and the two caps, as vertex indices.
+    k = np.arange(sectors)
+    k_next = np.roll(k, -1)
+    quads = np.stack((k, sectors + k, sectors + k_next, k_next), axis=1)
+    cylinder = np.concatenate((quads.ravel(), k, sectors + k[::-1]))
+    offset = (np.arange(nr) * 2 * sectors)[:, None]
+    vertex_index = (cylinder[None, :] + offset).ravel()
+
+    face_sizes = np.concatenate((np.full(sectors, 4), (sectors, sectors)))
+    loop_start = (np.concatenate(((0,), np.cumsum(face_sizes)[:-1]))[None, :] +
+                  (np.arange(nr) * len(cylinder))[:, None]).ravel()
+
+    mesh.vertices.add(nr * 2 * sectors)
+    mesh.loops.add(len(vertex_index))
+    mesh.polygons.add(len(loop_start))
+    mesh.vertices.foreach_set("co", co.astype(np.float32).ravel())
+    mesh.loops.foreach_set("vertex_index", vertex_index.astype(np.int32))
+    mesh.polygons.foreach_set("loop_start", loop_start.astype(np.int32))
+    mesh.update(calc_edges=True)
+
+    return mesh
+
+
 # Rotate an object.
 def rotate_object(rot_mat, obj):
 
@@ -643,12 +853,13 @@ def draw_atoms_one_type(draw_all_atoms_type,
                         collection_molecule):
 
     # Create the vertices composed of the coordinates of all atoms of one type
-    atom_vertices = []
-    for atom in draw_all_atoms_type:
-        # In fact, the object is created in the World's origin.
-        # This is why 'object_center_vec' is subtracted. At the end
-        # the whole object is translated back to 'object_center_vec'.
-        atom_vertices.append(atom[2] - object_center_vec)
+    # In fact, the object is created in the World's origin.
+    # This is why 'object_center_vec' is subtracted. At the end
+    # the whole object is translated back to 'object_center_vec'.
+    atom_vertices = np.array([atom[2] for atom in draw_all_atoms_type],
+                             dtype=np.float32).reshape(-1, 3)
+    atom_vertices -= np.array(object_center_vec, dtype=np.float32)
+    atom = draw_all_atoms_type[-1]
 
     # IMPORTANT: First, we create a collection of the element, which contains
     # the atoms (balls + mesh) AND the sticks! The definition dealing with the
@@ -669,9 +880,14 @@ def draw_atoms_one_type(draw_all_atoms_type,
     # element (ball and mesh).
     coll_element.children.link(coll_atom)
 
-    # Build the mesh
+    # Build the mesh: one point per atom, with the radius of the atom as
+    # attribute.
     atom_mesh = bpy.data.meshes.new("Mesh_"+atom[0])
-    atom_mesh.from_pydata(atom_vertices, [], [])
+    atom_mesh.vertices.add(len(atom_vertices))
+    atom_mesh.vertices.foreach_set("co", atom_vertices.ravel())
+    radii = atom_mesh.attributes.new("radius", 'FLOAT', 'POINT')
+    radii.data.foreach_set("value", np.array([atom[3] for atom in draw_all_atoms_type],
+                                             dtype=np.float32))
     atom_mesh.update()
     new_atom_mesh = bpy.data.objects.new(atom[0] + "_mesh", atom_mesh)
 
@@ -953,83 +1169,29 @@ def draw_sticks_skin(all_atoms,
                      sticks_subdiv_render,
                      coll_molecule):
 
-    # These counters are for the edges, in the shape [i,i+1].
-    i = 0
-
     # This is the list of vertices, containing the atom position
     # (vectors)).
     stick_vertices = []
-    # This is the 'same' list, which contains not vector position of
-    # the atoms but their numbers. It is used to handle the edges.
-    stick_vertices_nr = []
+    # The vertex of each atom already in the vertex list, by the number of
+    # the atom. It is used to handle the edges.
+    stick_vertices_nr = {}
     # This is the list of edges.
     stick_edges = []
 
     # Go through the list of all sticks. For each stick do:
     for stick in all_sticks:
 
-        # Each stick has two atoms = two vertices.
-
-        """
-        [ 0,1 ,  3,4 ,  0,8 ,  7,3]
-        [[0,1], [2,3], [4,5], [6,7]]
-
-        [ 0,1 ,  3,4 ,  x,8 ,   7,x]    x:deleted
-        [[0,1], [2,3], [0,5], [6,2]]
-        """
-
-        # Check, if the vertex (atom) is already in the vertex list.
-        # edge: [s1,s2]
-        FLAG_s1 = False
-        s1 = 0
-        for stick2 in stick_vertices_nr:
-            if stick2 == stick.atom1-1:
-                FLAG_s1 = True
-                break
-            s1 += 1
-        FLAG_s2 = False
-        s2 = 0
-        for stick2 in stick_vertices_nr:
-            if stick2 == stick.atom2-1:
-                FLAG_s2 = True
-                break
-            s2 += 1
-
-        # If the vertex (atom) is not yet in the vertex list:
-        # append the number of atom and the vertex to the two lists.
-        # For the first atom:
-        if FLAG_s1 == False:
-            atom1 = copy(all_atoms[stick.atom1-1].location)
-            stick_vertices.append(atom1)
-            stick_vertices_nr.append(stick.atom1-1)
-        # For the second atom:
-        if FLAG_s2 == False:
-            atom2 = copy(all_atoms[stick.atom2-1].location)
-            stick_vertices.append(atom2)
-            stick_vertices_nr.append(stick.atom2-1)
-
-        # Build the edges:
-
-        # If both vertices (atoms) were not in the lists, then
-        # the edge is simply [i,i+1]. These are two new vertices
-        # (atoms), so increase i by 2.
-        if FLAG_s1 == False and FLAG_s2 == False:
-            stick_edges.append([i,i+1])
-            i += 2
-        # Both vertices (atoms) were already in the list, so then
-        # use the vertices (atoms), which already exist. They are
-        # at positions s1 and s2.
-        if FLAG_s1 == True and FLAG_s2 == True:
-            stick_edges.append([s1,s2])
-        # The following two if cases describe the situation that
-        # only one vertex (atom) was in the list. Since only ONE
-        # new vertex was added, increase i by one.
-        if FLAG_s1 == True and FLAG_s2 == False:
-            stick_edges.append([s1,i])
-            i += 1
-        if FLAG_s1 == False and FLAG_s2 == True:
-            stick_edges.append([i,s2])
-            i += 1
+        # Each stick has two atoms = two vertices. If the vertex (atom) is not
+        # yet in the vertex list, append it and note its index.
+        edge = []
+        for atom_nr in (stick.atom1-1, stick.atom2-1):
+            s_i = stick_vertices_nr.get(atom_nr)
+            if s_i is None:
+                s_i = stick_vertices_nr[atom_nr] = len(stick_vertices)
+                stick_vertices.append(copy(all_atoms[atom_nr].location))
+            edge.append(s_i)
+        if edge[0] != edge[1]:
+            stick_edges.append(edge)
 
     # Build the mesh of the sticks
     stick_mesh = bpy.data.meshes.new("Mesh_sticks")
@@ -1105,7 +1267,6 @@ def draw_sticks_normal(all_atoms,
                        Stick_dist,
                        use_sticks_smooth,
                        use_sticks_one_object,
-                       use_sticks_one_object_nr,
                        coll_molecule):
 
     stick_material = bpy.data.materials.new(ELEMENTS[-1].name)
@@ -1116,37 +1277,44 @@ def draw_sticks_normal(all_atoms,
 
     up_axis = Vector([0.0, 0.0, 1.0])
 
+    # All sticks in one object: the cylinders are directly built into one
+    # mesh, instead of adding and joining one object per cylinder.
+    if use_sticks_one_object == True:
+        segments = []
+        for stick in all_sticks:
+            for repeat in range(stick.number):
+                segments.append(stick_segment(all_atoms, stick, repeat, center,
+                                              Stick_diameter * Stick_dist))
+
+        mesh = build_sticks_mesh(segments, Stick_diameter, Stick_sectors,
+                                 "Sticks_Cylinder")
+        if use_sticks_smooth == False:
+            mesh.shade_flat()
+
+        # The origin is the median of the geometry.
+        median = Vector(np.array(segments).reshape(-1, 3).mean(axis=0))
+        mesh.transform(Matrix.Translation(-median))
+
+        sticks = bpy.data.objects.new("Stick_Cylinder", mesh)
+        sticks.active_material = stick_material
+        sticks.location = median + center
+
+        # Link the sticks with the collection of the molecule.
+        coll_molecule.objects.link(sticks)
+        bpy.context.view_layer.objects.active = sticks
+
+        return sticks
+
     # For all sticks, do ...
-    list_group = []
     list_group_sub = []
-    counter = 0
     for i, stick in enumerate(all_sticks):
 
         # We treat here single, double and tripple bonds: stick.number <= 3
         for repeat in range(stick.number):
 
             # The vectors of the two atoms
-            atom1 = copy(all_atoms[stick.atom1-1].location)-center
-            atom2 = copy(all_atoms[stick.atom2-1].location)-center
-
-            dist =  Stick_diameter * Stick_dist
-
-            # The two sticks are on the left and right of the middle connection.
-            if stick.number == 2:
-                if repeat == 0:
-                    atom1 += (stick.dist * dist)
-                    atom2 += (stick.dist * dist)
-                if repeat == 1:
-                    atom1 -= (stick.dist * dist)
-                    atom2 -= (stick.dist * dist)
-
-            if stick.number == 3:
-                if repeat == 0:
-                    atom1 += (stick.dist * dist)
-                    atom2 += (stick.dist * dist)
-                if repeat == 2:
-                    atom1 -= (stick.dist * dist)
-                    atom2 -= (stick.dist * dist)
+            atom1, atom2 = stick_segment(all_atoms, stick, repeat, center,
+                                         Stick_diameter * Stick_dist)
 
             # Vector pointing along the stick direction
             dv = atom1 - atom2
@@ -1195,7 +1363,6 @@ def draw_sticks_normal(all_atoms,
             # Never occurs:
             else:
                 stick_obj.name = "Stick_Cylinder"
-            counter += 1
 
             # Smooth the cylinder.
             if use_sticks_smooth == True:
@@ -1205,105 +1372,60 @@ def draw_sticks_normal(all_atoms,
 
             list_group_sub.append(stick_obj)
 
-            if use_sticks_one_object == True:
-                if counter == use_sticks_one_object_nr:
-                    bpy.ops.object.select_all(action='DESELECT')
-                    for stick_select in list_group_sub:
-                        stick_select.select_set(True)
-                    bpy.ops.object.join()
-                    list_group.append(bpy.context.view_layer.objects.active)
-                    bpy.ops.object.select_all(action='DESELECT')
-                    list_group_sub = []
-                    counter = 0
-            else:
-                # Material ...
-                stick_obj.active_material = stick_material
-
-    if use_sticks_one_object == True:
-        bpy.ops.object.select_all(action='DESELECT')
-        for stick in list_group_sub:
-            stick.select_set(True)
-        bpy.ops.object.join()
-        list_group.append(bpy.context.view_layer.objects.active)
-        bpy.ops.object.select_all(action='DESELECT')
-
-        for group in list_group:
-            group.select_set(True)
-        bpy.ops.object.join()
-        bpy.ops.object.origin_set(type='ORIGIN_GEOMETRY',
-                                  center='MEDIAN')
-        sticks = bpy.context.view_layer.objects.active
-        sticks.active_material = stick_material
-
-        sticks.location += center
-
-        # Collections
-        # ===========
-        # Note the collection where the sticks were placed into.
-        coll_all = sticks.users_collection
-        if len(coll_all) > 0:
-            coll_past = coll_all[0]
-        else:
-            coll_past = bpy.context.scene.collection
-
-        # Link the sticks with the collection of the molecule ...
-        coll_molecule.objects.link(sticks)
-        # ... and unlink them from the collection it has been before.
-        coll_past.objects.unlink(sticks)
+            # Material ...
+            stick_obj.active_material = stick_material
+
+    # Here we use an empty ...
+    bpy.ops.object.empty_add(type='ARROWS',
+                              align='WORLD',
+                              location=(0, 0, 0),
+                              rotation=(0, 0, 0))
+    sticks_empty = bpy.context.view_layer.objects.active
+    sticks_empty.name = "A_sticks_empty"
+    # ... that is parent to all sticks. With this, we can better move
+    # all sticks if necessary.
+    for stick in list_group_sub:
+        stick.parent = sticks_empty
+
+    sticks_empty.location += center
+
+    # Collections
+    # ===========
+    # Create a collection that will contain all sticks + the empty and ...
+    coll = bpy.data.collections.new("Sticks")
+    # ... link it to the collection, which contains all parts of the
+    # molecule.
+    coll_molecule.children.link(coll)
+    # Now, create a collection that only contains the sticks and ...
+    coll_cylinder = bpy.data.collections.new("Sticks_cylinders")
+    # ... link it to the collection, which contains the sticks and empty.
+    coll.children.link(coll_cylinder)
+
+    # Note the collection where the empty was placed into, ...
+    coll_all = sticks_empty.users_collection
+    if len(coll_all) > 0:
+        coll_past = coll_all[0]
+    else:
+        coll_past = bpy.context.scene.collection
+    # ... link the empty with the new collection  ...
+    coll.objects.link(sticks_empty)
+    # ... and unlink it from the old collection where it has been before.
+    coll_past.objects.unlink(sticks_empty)
 
-        return sticks
+    # Note the collection where the cylinders were placed into, ...
+    coll_all = list_group_sub[0].users_collection
+    if len(coll_all) > 0:
+        coll_past = coll_all[0]
     else:
-        # Here we use an empty ...
-        bpy.ops.object.empty_add(type='ARROWS',
-                                  align='WORLD',
-                                  location=(0, 0, 0),
-                                  rotation=(0, 0, 0))
-        sticks_empty = bpy.context.view_layer.objects.active
-        sticks_empty.name = "A_sticks_empty"
-        # ... that is parent to all sticks. With this, we can better move
-        # all sticks if necessary.
-        for stick in list_group_sub:
-            stick.parent = sticks_empty
-
-        sticks_empty.location += center
-
-        # Collections
-        # ===========
-        # Create a collection that will contain all sticks + the empty and ...
-        coll = bpy.data.collections.new("Sticks")
-        # ... link it to the collection, which contains all parts of the
-        # molecule.
-        coll_molecule.children.link(coll)
-        # Now, create a collection that only contains the sticks and ...
-        coll_cylinder = bpy.data.collections.new("Sticks_cylinders")
-        # ... link it to the collection, which contains the sticks and empty.
-        coll.children.link(coll_cylinder)
-
-        # Note the collection where the empty was placed into, ...
-        coll_all = sticks_empty.users_collection
-        if len(coll_all) > 0:
-            coll_past = coll_all[0]
-        else:
-            coll_past = bpy.context.scene.collection
-        # ... link the empty with the new collection  ...
-        coll.objects.link(sticks_empty)
-        # ... and unlink it from the old collection where it has been before.
-        coll_past.objects.unlink(sticks_empty)
-
-        # Note the collection where the cylinders were placed into, ...
-        coll_all = list_group_sub[0].users_collection
-        if len(coll_all) > 0:
-            coll_past = coll_all[0]
-        else:
-            coll_past = bpy.context.scene.collection
+        coll_past = bpy.context.scene.collection
 
-        for stick in list_group_sub:
-            # ... link each stick with the new collection  ...
-            coll_cylinder.objects.link(stick)
-            # ... and unlink it from the old collection.
-            coll_past.objects.unlink(stick)
+    for stick in list_group_sub:
+        # ... link each stick with the new collection  ...
+        coll_cylinder.objects.link(stick)
+        # ... and unlink it from the old collection.
+        coll_past.objects.unlink(stick)
 
-        return sticks_empty
+    return sticks_empty
 
 
 # -----------------------------------------------------------------------------
@@ -1323,14 +1445,15 @@ def import_pdb(Ball_type,
                use_sticks_smooth,
                use_sticks_bonds,
                use_sticks_one_object,
-               use_sticks_one_object_nr,
                Stick_unit, Stick_dist,
                Stick_sectors,
                Stick_diameter,
                put_to_center,
                use_camera,
                use_light,
-               filepath_pdb):
+               filepath_pdb,
+               use_sticks_distance=False,
+               use_trajectory=False):
 
     # List of materials
     atom_material_list = []
@@ -1347,7 +1470,10 @@ def import_pdb(Ball_type,
     # ------------------------------------------------------------------------
     # READING DATA OF ATOMS
 
-    (Number_of_total_atoms, all_atoms) = read_pdb_file(filepath_pdb, radiustype)
+    # For a trajectory, the atoms are taken from the first model. The other
+    # models are only read at the end, into the point caches.
+    (Number_of_total_atoms, all_atoms) = read_pdb_file(filepath_pdb, radiustype,
+                                                       use_trajectory)
 
     # ------------------------------------------------------------------------
     # MATERIAL PROPERTIES FOR ATOMS
@@ -1356,19 +1482,17 @@ def import_pdb(Ball_type,
     # here. It is used for building the material properties for
     # instance (see below).
     atom_all_types_list = []
+    # The atom name (e.g. 'Sodium') is the key, for finding quickly the type
+    # of an atom.
+    atom_types = {}
 
     for atom in all_atoms:
-        FLAG_FOUND = False
-        for atom_type in atom_all_types_list:
-            # If the atom name is already in the list, FLAG on 'True'.
-            if atom_type[0] == atom.name:
-                FLAG_FOUND = True
-                break
         # No name in the current list has been found? => New entry.
-        if FLAG_FOUND == False:
+        if atom.name not in atom_types:
             # Stored are: Atom label (e.g. 'Na'), the corresponding atom
             # name (e.g. 'Sodium') and its color.
-            atom_all_types_list.append([atom.name, atom.element, atom.color])
+            atom_types[atom.name] = [atom.name, atom.element, atom.color]
+            atom_all_types_list.append(atom_types[atom.name])
 
     # The list of materials is built.
     # Note that all atoms of one type (e.g. all hydrogens) get only ONE
@@ -1378,6 +1502,7 @@ def import_pdb(Ball_type,
 
     # Create first a new list of materials for each type of atom
     # (e.g. hydrogen)
+    atom_materials = {}
     for atom_type in atom_all_types_list:
         material = bpy.data.materials.new(atom_type[1])
         material.diffuse_color = atom_type[2]
@@ -1386,36 +1511,27 @@ def import_pdb(Ball_type,
                           if n.type == "BSDF_PRINCIPLED")
         mat_P_BSDF.inputs['Base Color'].default_value = atom_type[2]
         material.name = atom_type[0]
+        # Before we continue we check if it is a vacancy. The vacancy is
+        # represented by a transparent cube.
+        if atom_type[0] == "Vacancy":
+            # For cycles and eevee.
+            mat_P_BSDF.inputs['Metallic'].default_value = 0.1
+            mat_P_BSDF.inputs['Specular IOR Level'].default_value = 0.15
+            mat_P_BSDF.inputs['Roughness'].default_value = 0.05
+            mat_P_BSDF.inputs['Coat Roughness'].default_value = 0.37
+            mat_P_BSDF.inputs['IOR'].default_value = 0.8
+            mat_P_BSDF.inputs['Transmission Weight'].default_value = 0.6
+            mat_P_BSDF.inputs['Alpha'].default_value = 0.5
+            # Some additional stuff for eevee.
+            material.blend_method = 'HASHED'
+            material.shadow_method = 'HASHED'
+            material.use_backface_culling = False
         atom_material_list.append(material)
+        atom_materials[atom_type[0]] = material
 
-    # Now, we go through all atoms and give them a material. For all atoms ...
+    # Now, we go through all atoms and give them their material.
     for atom in all_atoms:
-        # ... and all materials ...
-        for material in atom_material_list:
-            # ... select the correct material for the current atom via
-            # comparison of names ...
-            if atom.name in material.name:
-                # ... and give the atom its material properties.
-                # However, before we check if it is a vacancy.
-                # The vacancy is represented by a transparent cube.
-                if atom.name == "Vacancy":
-                    # For cycles and eevee.
-                    material.use_nodes = True
-                    mat_P_BSDF = next(n for n in material.node_tree.nodes
-                                      if n.type == "BSDF_PRINCIPLED")
-                    mat_P_BSDF.inputs['Metallic'].default_value = 0.1
-                    mat_P_BSDF.inputs['Specular IOR Level'].default_value = 0.15
-                    mat_P_BSDF.inputs['Roughness'].default_value = 0.05
-                    mat_P_BSDF.inputs['Coat Roughness'].default_value = 0.37
-                    mat_P_BSDF.inputs['IOR'].default_value = 0.8
-                    mat_P_BSDF.inputs['Transmission Weight'].default_value = 0.6
-                    mat_P_BSDF.inputs['Alpha'].default_value = 0.5
-                    # Some additional stuff for eevee.
-                    material.blend_method = 'HASHED'
-                    material.shadow_method = 'HASHED'
-                    material.use_backface_culling = False
-                # The atom gets its properties.
-                atom.material = material
+        atom.material = atom_materials[atom.name]
 
     # ------------------------------------------------------------------------
     # READING DATA OF STICKS
@@ -1423,6 +1539,11 @@ def import_pdb(Ball_type,
     all_sticks = read_pdb_file_sticks(filepath_pdb,
                                       use_sticks_bonds,
                                       all_atoms)
+
+    # Without 'CONECT' records, or if chosen, the sticks are found from the
+    # distances of the atoms.
+    if use_sticks == True and (use_sticks_distance == True or all_sticks == []):
+        all_sticks = find_sticks_by_distance(all_atoms)
     #
     # So far, all atoms, sticks and materials have been registered.
     #
@@ -1434,6 +1555,7 @@ def import_pdb(Ball_type,
     # If chosen, the structure is first put into the center of the scene
     # (the offset is subtracted).
 
+    center_offset = Vector((0.0,0.0,0.0))
     if put_to_center == True:
         sum_vec = Vector((0.0,0.0,0.0))
         # Sum of all atom coordinates
@@ -1443,6 +1565,7 @@ def import_pdb(Ball_type,
         # After, for each atom the center of gravity is subtracted
         for atom in all_atoms:
             atom.location -= sum_vec
+        center_offset = sum_vec
 
     # ------------------------------------------------------------------------
     # SCALING
@@ -1480,29 +1603,23 @@ def import_pdb(Ball_type,
     # Go through the list which contains all types of atoms. It is the list,
     # which has been created on the top during reading the PDB file.
     # Example: atom_all_types_list = ["hydrogen", "carbon", ...]
-    draw_all_atoms = []
-    for atom_type in atom_all_types_list:
-
+    draw_all_atoms_types = {}
+    for atom in all_atoms:
         # Don't draw 'TER atoms'.
-        if atom_type[0] == "TER":
+        if atom.name == "TER":
             continue
-
         # This is the draw list, which contains all atoms of one type (e.g.
-        # all hydrogens) ...
-        draw_all_atoms_type = []
-
-        # Go through all atoms ...
-        for atom in all_atoms:
-            # ... select the atoms of the considered type via comparison ...
-            if atom.name == atom_type[0]:
-                # ... and append them to the list 'draw_all_atoms_type'.
-                draw_all_atoms_type.append([atom.name,
-                                            atom.material,
-                                            atom.location,
-                                            atom.radius])
-
-        # Now append the atom list to the list of all types of atoms
-        draw_all_atoms.append(draw_all_atoms_type)
+        # all hydrogens).
+        draw_all_atoms_types.setdefault(atom.name, []).append([atom.name,
+                                                               atom.material,
+                                                               atom.location,
+                                                               atom.radius])
+
+    # Now put the atom lists into the list of all types of atoms, in the
+    # order of the types.
+    draw_all_atoms = [draw_all_atoms_types[atom_type[0]]
+                      for atom_type in atom_all_types_list
+                      if atom_type[0] in draw_all_atoms_types]
 
     # ------------------------------------------------------------------------
     # COLLECTION
@@ -1521,6 +1638,7 @@ def import_pdb(Ball_type,
     bpy.ops.object.select_all(action='DESELECT')
 
     list_coll_elements = []
+    atom_meshes = {}
     # For each list of atoms of ONE type (e.g. Hydrogen)
     for draw_all_atoms_type in draw_all_atoms:
 
@@ -1533,6 +1651,18 @@ def import_pdb(Ball_type,
                                                       coll_molecule)
         atom_object_list.append(atom_mesh)
         list_coll_elements.append(coll_element)
+        atom_meshes[draw_all_atoms_type[0][0]] = atom_mesh
+
+    # ------------------------------------------------------------------------
+    # TRAJECTORY: the other models are put into point caches
+
+    if use_trajectory == True:
+        read_pdb_trajectory(filepath_pdb,
+                            all_atoms,
+                            atom_meshes,
+                            center_offset,
+                            Ball_distance_factor,
+                            object_center_vec)
 
     # ------------------------------------------------------------------------
     # DRAWING THE STICKS: cylinders in a dupliverts structure
@@ -1580,7 +1710,6 @@ def import_pdb(Ball_type,
                                     Stick_dist,
                                     use_sticks_smooth,
                                     use_sticks_one_object,
-                                    use_sticks_one_object_nr,
                                     coll_molecule)
         atom_object_list.append(sticks)
 
@@ -4,6 +4,7 @@
 
 import os
 import bpy
+import numpy as np
 from math import pi, sqrt
 from mathutils import Vector, Matrix
 
@@ -757,12 +758,22 @@ def build_frames(frame_delta, frame_skip):
 
                 key = elements_structure.shape_key_add()
 
-                for atom_frame, atom_structure in zip(elements_frame, key.data):
-
-                    atom_structure.co = (atom_frame.location
-                                       - elements_structure.location)
-
-                key.name = atom_frame.name + "_frame_" + str(i)
+                # All coordinates of the key are written at once.
+                co = np.empty(len(key.data) * 3, dtype=np.float32)
+                key.data.foreach_get("co", co)
+                co = co.reshape(-1, 3)
+                nr = min(len(elements_frame), len(co))
+                co[:nr] = (np.array([atom_frame.location
+                                     for atom_frame in elements_frame[:nr]],
+                                    dtype=np.float32).reshape(-1, 3)
+                           - np.array(elements_structure.location, dtype=np.float32))
+                key.data.foreach_set("co", co.ravel())
+
+                # A frame may not contain any atom of this element.
+                if elements_frame:
+                    key.name = elements_frame[-1].name + "_frame_" + str(i)
+                else:
+                    key.name = elements_structure.name + "_frame_" + str(i)
 
             i += 1
 
@@ -26,6 +26,7 @@ if "bpy" in locals():
 import bpy
 from bpy.props import (
         BoolProperty,
+        EnumProperty,
         FloatProperty,
         IntProperty,
         StringProperty,
@@ -56,6 +57,13 @@ class ImportMDD(bpy.types.Operator, ImportHelper):
             min=1, max=1000,
             default=1,
             )
+    mode: EnumProperty(
+            name="Mode",
+            items=(('SHAPE_KEYS', "Shape Keys", "Create one keyframed shape key per frame"),
+                   ('STREAM', "Stream", "Create a single shape key, loaded from the file on frame change"),
+                   ),
+            default='SHAPE_KEYS',
+            )
 
     @classmethod
     def poll(cls, context):
@@ -115,6 +123,11 @@ class ExportMDD(bpy.types.Operator, ExportHelper):
             description="Write the rest state at the first frame",
             default=False,
             )
+    use_selection: BoolProperty(
+            name="Selected Objects",
+            description="Export each selected mesh to its own file, suffixed with the object name",
+            default=False,
+            )
 
     @classmethod
     def poll(cls, context):
@@ -154,19 +167,26 @@ classes = (
 )
 
 def register():
+    from . import import_mdd
+
     for cls in classes:
         bpy.utils.register_class(cls)
 
     bpy.types.TOPBAR_MT_file_import.append(menu_func_import)
     bpy.types.TOPBAR_MT_file_export.append(menu_func_export)
+    bpy.app.handlers.frame_change_pre.append(import_mdd.stream_frame_change)
 
 
 def unregister():
+    from . import import_mdd
+
     for cls in classes:
         bpy.utils.unregister_class(cls)
 
     bpy.types.TOPBAR_MT_file_import.remove(menu_func_import)
     bpy.types.TOPBAR_MT_file_export.remove(menu_func_export)
+    if import_mdd.stream_frame_change in bpy.app.handlers.frame_change_pre:
+        bpy.app.handlers.frame_change_pre.remove(import_mdd.stream_frame_change)
 
 if __name__ == "__main__":
     register()
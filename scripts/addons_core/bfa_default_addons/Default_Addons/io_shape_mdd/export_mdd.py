@@ -13,8 +13,10 @@ for moving animations from package to package.
 Be sure not to use modifiers that change the number or order of verts in the mesh
 """
 
+import os
 import bpy
 import mathutils
+import numpy as np
 from struct import pack
 
 
@@ -35,7 +37,28 @@ def check_vertcount(mesh, vertcount):
         raise Exception('Error, number of verts has changed during animation, cannot export')
 
 
-def save(context, filepath="", frame_start=1, frame_end=300, fps=25.0, use_rest_frame=False):
+def object_filepaths(filepath, objects):
+    """
+    One file per object, suffixed with the object name when exporting several objects
+    """
+    if len(objects) == 1:
+        return [filepath]
+    base, ext = os.path.splitext(filepath)
+    return [base + "_" + bpy.path.clean_name(obj.name) + ext for obj in objects]
+
+
+def write_frame(file, me, matrix, co, co_be):
+    """
+    Write the vertex coordinates of the mesh transformed by matrix, co and co_be being
+    preallocated native and big-endian buffers
+    """
+    me.transform(matrix)
+    me.vertices.foreach_get("co", co)
+    co_be[:] = co
+    co_be.tofile(file)
+
+
+def save(context, filepath="", frame_start=1, frame_end=300, fps=25.0, use_rest_frame=False, use_selection=False):
     """
     Blender.Window.WaitCursor(1)
 
@@ -45,6 +68,10 @@ def save(context, filepath="", frame_start=1, frame_end=300, fps=25.0, use_rest_
 
     scene = context.scene
     obj = context.object
+    if use_selection:
+        objects = [ob for ob in context.selected_objects if ob.type == 'MESH'] or [obj]
+    else:
+        objects = [obj]
 
     if bpy.ops.object.mode_set.poll():
         bpy.ops.object.mode_set(mode='OBJECT')
@@ -52,8 +79,6 @@ def save(context, filepath="", frame_start=1, frame_end=300, fps=25.0, use_rest_
     orig_frame = scene.frame_current
     scene.frame_set(frame_start)
     depsgraph = context.evaluated_depsgraph_get()
-    obj_eval = obj.evaluated_get(depsgraph)
-    me = obj_eval.to_mesh()
 
     #Flip y and z
     '''
@@ -65,43 +90,56 @@ def save(context, filepath="", frame_start=1, frame_end=300, fps=25.0, use_rest_
     '''
     mat_flip = mathutils.Matrix()
 
-    numverts = len(me.vertices)
-
     numframes = frame_end - frame_start + 1
     if use_rest_frame:
         numframes += 1
 
-    f = open(filepath, 'wb')  # no Errors yet:Safe to create file
+    files = []
+    buffers = []
+    try:
+        for ob, path in zip(objects, object_filepaths(filepath, objects)):
+            ob_eval = ob.evaluated_get(depsgraph)
+            me = ob_eval.to_mesh()
+            numverts = len(me.vertices)
 
-    # Write the header
-    f.write(pack(">2i", numframes, numverts))
+            f = open(path, 'wb')  # no Errors yet:Safe to create file
+            files.append(f)
 
-    # Write the frame times (should we use the time IPO??)
-    f.write(pack(">%df" % (numframes), *[frame / fps for frame in range(numframes)]))  # seconds
+            # Write the header
+            f.write(pack(">2i", numframes, numverts))
 
-    if use_rest_frame:
-        check_vertcount(me, numverts)
-        me.transform(mat_flip @ obj.matrix_world)
-        f.write(pack(">%df" % (numverts * 3), *[axis for v in me.vertices for axis in v.co]))
+            # Write the frame times (should we use the time IPO??)
+            f.write(pack(">%df" % (numframes), *[frame / fps for frame in range(numframes)]))  # seconds
+
+            # One frame of coordinates, reused for the whole frame range.
+            co = np.empty(numverts * 3, dtype=np.float32)
+            co_be = np.empty(numverts * 3, dtype='>f4')
+            buffers.append((co, co_be))
 
-    obj_eval.to_mesh_clear()
+            if use_rest_frame:
+                write_frame(f, me, mat_flip @ ob.matrix_world, co, co_be)
 
-    for frame in range(frame_start, frame_end + 1):  # in order to start at desired frame
-        scene.frame_set(frame)
-        depsgraph = context.evaluated_depsgraph_get()
-        obj_eval = obj.evaluated_get(depsgraph)
-        me = obj_eval.to_mesh()
-        check_vertcount(me, numverts)
-        me.transform(mat_flip @ obj.matrix_world)
+            ob_eval.to_mesh_clear()
 
-        # Write the vertex data
-        f.write(pack(">%df" % (numverts * 3), *[axis for v in me.vertices for axis in v.co]))
+        # Evaluate each frame once for all the objects.
+        for frame in range(frame_start, frame_end + 1):  # in order to start at desired frame
+            scene.frame_set(frame)
+            depsgraph = context.evaluated_depsgraph_get()
+            for ob, f, (co, co_be) in zip(objects, files, buffers):
+                ob_eval = ob.evaluated_get(depsgraph)
+                me = ob_eval.to_mesh()
+                check_vertcount(me, len(co) // 3)
 
-        obj_eval.to_mesh_clear()
+                # Write the vertex data
+                write_frame(f, me, mat_flip @ ob.matrix_world, co, co_be)
 
-    f.close()
+                ob_eval.to_mesh_clear()
+    finally:
+        for f in files:
+            f.close()
 
-    print('MDD Exported: %r frames:%d\n' % (filepath, numframes - 1))
+    for f in files:
+        print('MDD Exported: %r frames:%d\n' % (f.name, numframes - 1))
     scene.frame_set(orig_frame)
 
     return {'FINISHED'}
@@ -15,56 +15,98 @@
 # Please send any fixes,updates,bugs to Slow67_at_Gmail.com
 # Bill Niewuendorp
 
+import os
 import bpy
+import numpy as np
 from struct import unpack
+from bpy.app.handlers import persistent
 
-def set_linear_interpolation(obj, shapekey):
-    anim_data = obj.data.shape_keys.animation_data
-    data_path = "key_blocks[\"" + shapekey.name + "\"].value"
+LINEAR_INTERPOLATION_VALUE = bpy.types.Keyframe.bl_rna.properties['interpolation'].enum_items['LINEAR'].value
 
-    for fcu in anim_data.action.fcurves:
-        if fcu.data_path == data_path:
-            for keyframe in fcu.keyframe_points:
-                keyframe.interpolation = 'LINEAR'
+# Object property holding the settings of objects streaming their shape from an mdd file.
+STREAM_PROP = "mdd_stream"
 
 
-def obj_update_frame(file, scene, obj, start, fr, step):
-
-    # Insert new shape key
-    new_shapekey = obj.shape_key_add()
-    new_shapekey.name = ("frame_%.4d" % fr)
-    new_shapekey_index = len(obj.data.shape_keys.key_blocks) - 1
-
-    obj.active_shape_key_index = new_shapekey_index
-    obj.show_only_shape_key = True
-
-    verts = new_shapekey.data
-
-    for v in verts:  # 12 is the size of 3 floats
-        v.co[:] = unpack('>3f', file.read(12))
-
-    # me.update()
-    obj.show_only_shape_key = False
-
-    # insert keyframes
-    new_shapekey = obj.data.shape_keys.key_blocks[new_shapekey_index]
-    frame = start + fr*step
-
-    new_shapekey.value = 0.0
-    new_shapekey.keyframe_insert("value", frame=frame - step)
-
-    new_shapekey.value = 1.0
-    new_shapekey.keyframe_insert("value", frame=frame)
-
-    new_shapekey.value = 0.0
-    new_shapekey.keyframe_insert("value", frame=frame + step)
+def read_header(file):
+    """Reads the mdd header, returns the number of frames and points, and the frame times."""
+    frames, points = unpack(">2i", file.read(8))
+    time = unpack((">%df" % frames), file.read(frames * 4))
+    return frames, points, time
+
+
+def read_frames(file, points, count=1):
+    """Reads the coordinates of count frames from the current file position, as native floats."""
+    co = np.fromfile(file, dtype='>f4', count=points * 3 * count)
+    return co.astype(np.single)
+
+
+def shape_keys_keyframes_set(obj, shapekeys, start, step):
+    """Keys each shape key to 1.0 on its frame and 0.0 on the neighboring ones, all linear."""
+    key = obj.data.shape_keys
+    anim_data = key.animation_data_create()
+    action = anim_data.action
+    if action is None:
+        action = bpy.data.actions.new(name=key.name + "Action")
+        action_slot = action.slots.new(key.id_type, key.name)
+        anim_data.action = action
+        anim_data.action_slot = action_slot
+
+    # The keyframe_points 'co' are accessed as flattened pairs of (frame, value).
+    keyframe_points_co = np.array((0.0, 0.0, 0.0, 1.0, 0.0, 0.0), dtype=np.single)
+    interpolation_array = np.full(3, LINEAR_INTERPOLATION_VALUE, dtype=np.ubyte)
+
+    for fr, shapekey in enumerate(shapekeys):
+        frame = start + fr * step
+        keyframe_points_co[0::2] = (frame - step, frame, frame + step)
+
+        data_path = "key_blocks[\"" + bpy.utils.escape_identifier(shapekey.name) + "\"].value"
+        keyframe_points = action.fcurves.new(data_path=data_path).keyframe_points
+        keyframe_points.add(3)
+        keyframe_points.foreach_set("co", keyframe_points_co)
+        keyframe_points.foreach_set("interpolation", interpolation_array)
+
+
+def stream_frame_update(obj, frame):
+    """Loads the coordinates of the given (possibly fractional) frame into the stream shape key of obj."""
+    settings = obj[STREAM_PROP]
+    key = obj.data.shape_keys
+    shapekey = key.key_blocks.get(settings["shape_key"]) if key else None
+    if shapekey is None:
+        return
+
+    try:
+        with open(bpy.path.abspath(settings["filepath"]), 'rb') as file:
+            frames, points = unpack(">2i", file.read(8))
+            if frames <= 0 or points != len(shapekey.data):
+                return
+            # Hold the first and last frames outside of the cached range.
+            pos = (frame - settings["frame_start"]) / settings["frame_step"]
+            pos = min(max(pos, 0.0), frames - 1.0)
+            index = int(pos)
+            fac = pos - index
+            file.seek(8 + frames * 4 + index * points * 12)
+            co = read_frames(file, points, 2 if fac > 0.0 else 1)
+    except OSError:
+        return
+
+    size = points * 3
+    if len(co) < size:
+        return
+    if len(co) == size * 2:
+        # Blend between the two frames around the current one, like the shape keys do.
+        co = co[:size] * (1.0 - fac) + co[size:] * fac
+    shapekey.data.foreach_set("co", co[:size])
+    obj.data.update()
 
-    set_linear_interpolation(obj, new_shapekey)
 
-    obj.data.update()
+@persistent
+def stream_frame_change(scene, _depsgraph=None):
+    for obj in scene.objects:
+        if obj.type == 'MESH' and STREAM_PROP in obj:
+            stream_frame_update(obj, scene.frame_current_final)
 
 
-def load(context, filepath, frame_start=0, frame_step=1):
+def load(context, filepath, frame_start=0, frame_step=1, mode='SHAPE_KEYS'):
 
     scene = context.scene
     obj = context.object
@@ -74,20 +116,48 @@ def load(context, filepath, frame_start=0, frame_step=1):
     if bpy.ops.object.mode_set.poll():
         bpy.ops.object.mode_set(mode='OBJECT')
 
-    file = open(filepath, 'rb')
-    frames, points = unpack(">2i", file.read(8))
-    time = unpack((">%df" % frames), file.read(frames * 4))
-
-    print('\tpoints:%d frames:%d' % (points, frames))
-    print('\tstart frame:%d step:%d' % (frame_start, frame_step))
-
-    # If target object doesn't have Basis shape key, create it.
-    if not obj.data.shape_keys:
-        basis = obj.shape_key_add()
-        basis.name = "Basis"
-        obj.data.update()
-
-    for i in range(frames):
-        obj_update_frame(file, scene, obj, frame_start, i, frame_step)
+    with open(filepath, 'rb') as file:
+        frames, points, time = read_header(file)
+
+        print('\tpoints:%d frames:%d' % (points, frames))
+        print('\tstart frame:%d step:%d' % (frame_start, frame_step))
+
+        if points != len(obj.data.vertices):
+            print('\tpoint count does not match the %d vertices of %r, aborting' % (len(obj.data.vertices), obj.name))
+            return {'CANCELLED'}
+
+        # If target object doesn't have Basis shape key, create it.
+        if not obj.data.shape_keys:
+            basis = obj.shape_key_add()
+            basis.name = "Basis"
+            obj.data.update()
+
+        if mode == 'STREAM':
+            # A single shape key, refreshed from the file on frame change.
+            shapekey = obj.shape_key_add(name=os.path.basename(filepath), from_mix=False)
+            shapekey.value = 1.0
+            obj[STREAM_PROP] = {
+                "filepath": filepath,
+                "shape_key": shapekey.name,
+                "frame_start": frame_start,
+                "frame_step": frame_step,
+            }
+            obj.active_shape_key_index = len(obj.data.shape_keys.key_blocks) - 1
+            stream_frame_update(obj, scene.frame_current_final)
+            return {'FINISHED'}
+
+        shapekeys = []
+        for fr in range(frames):
+            co = read_frames(file, points)
+            if len(co) != points * 3:
+                print('\tfile is truncated after %d frames' % fr)
+                break
+            shapekey = obj.shape_key_add(name="frame_%.4d" % fr, from_mix=False)
+            shapekey.data.foreach_set("co", co)
+            shapekeys.append(shapekey)
+
+    shape_keys_keyframes_set(obj, shapekeys, frame_start, frame_step)
+    obj.active_shape_key_index = len(obj.data.shape_keys.key_blocks) - 1
+    obj.data.update()
 
     return {'FINISHED'}
@@ -7,14 +7,15 @@ __status__ = "production"
 __version__ = "6.6"
 __date__ = "22 Apr 2022"
 
-from collections import defaultdict
 from pprint import pprint
 from math import fabs, sqrt
+import hashlib
 import os
 
 import bpy
 from mathutils import Vector
 import bmesh
+import numpy as np
 
 from .utils import compatibility as compat
 from .utils.graph import Graph, Node
@@ -181,102 +182,145 @@ def create_new_uv_map(obj, name=None):
     return new
 
 
-def __get_island_info(uv_layer, islands):
+class IslandArrays:
     """
-    get information about each island
+    UV islands of a list of faces, as arrays indexed by the position of the
+    faces in the list (islands are in the order of their first face).
+    Shared through the island cache, so must not be modified.
+
+    face_island: island of each face
+    islands: face positions of each island
+    face_min, face_max, face_ave: UV bounds and average of each face
+    island_min, island_max, island_ave: UV bounds and average of each island
+    island_num_uv: number of UVs of each island
+    island_area: UV area of each island
     """
 
-    island_info = []
-    for isl in islands:
-        info = {}
-        max_uv = Vector((-10000000.0, -10000000.0))
-        min_uv = Vector((10000000.0, 10000000.0))
-        ave_uv = Vector((0.0, 0.0))
-        num_uv = 0
-        for face in isl:
-            n = 0
-            a = Vector((0.0, 0.0))
-            ma = Vector((-10000000.0, -10000000.0))
-            mi = Vector((10000000.0, 10000000.0))
-            for l in face['face'].loops:
-                uv = l[uv_layer].uv
-                ma.x = max(uv.x, ma.x)
-                ma.y = max(uv.y, ma.y)
-                mi.x = min(uv.x, mi.x)
-                mi.y = min(uv.y, mi.y)
-                a = a + uv
-                n = n + 1
-            ave_uv = ave_uv + a
-            num_uv = num_uv + n
-            a = a / n
-            max_uv.x = max(ma.x, max_uv.x)
-            max_uv.y = max(ma.y, max_uv.y)
-            min_uv.x = min(mi.x, min_uv.x)
-            min_uv.y = min(mi.y, min_uv.y)
-            face['max_uv'] = ma
-            face['min_uv'] = mi
-            face['ave_uv'] = a
-        ave_uv = ave_uv / num_uv
-
-        info['center'] = ave_uv
-        info['size'] = max_uv - min_uv
-        info['num_uv'] = num_uv
-        info['group'] = -1
-        info['faces'] = isl
-        info['max'] = max_uv
-        info['min'] = min_uv
+    def __init__(self, loop_verts, uvs, face_sizes):
+        num_faces = len(face_sizes)
+        face_start = np.cumsum(face_sizes) - face_sizes
+        loop_face = np.repeat(np.arange(num_faces), face_sizes)
+
+        # UVs of the same vertex are connected when they match to 5 digits
+        keys = np.column_stack((loop_verts, np.round(uvs, 5)))
+        _, loop_key = np.unique(keys, axis=0, return_inverse=True)
+        loop_key = loop_key.ravel()
+
+        self.face_island = self.__union_find(loop_face, loop_key, num_faces)
+        order = np.argsort(self.face_island, kind='stable')
+        island_sizes = np.bincount(self.face_island)
+        island_start = np.cumsum(island_sizes) - island_sizes
+        self.islands = np.split(order, island_start[1:])
+
+        self.face_min = np.minimum.reduceat(uvs, face_start, axis=0)
+        self.face_max = np.maximum.reduceat(uvs, face_start, axis=0)
+        face_sum = np.add.reduceat(uvs, face_start, axis=0)
+        self.face_ave = face_sum / face_sizes[:, np.newaxis]
+
+        # shoelace formula, with the next loop of the last loop of each face being its first one
+        loop_next = np.arange(1, len(uvs) + 1)
+        loop_next[face_start + face_sizes - 1] = face_start
+        cross = uvs[:, 0] * uvs[loop_next, 1] - uvs[loop_next, 0] * uvs[:, 1]
+        face_area = 0.5 * np.abs(np.add.reduceat(cross, face_start))
+
+        self.island_min = np.minimum.reduceat(self.face_min[order], island_start, axis=0)
+        self.island_max = np.maximum.reduceat(self.face_max[order], island_start, axis=0)
+        self.island_num_uv = np.add.reduceat(face_sizes[order], island_start)
+        self.island_ave = np.add.reduceat(face_sum[order], island_start, axis=0) / \
+            self.island_num_uv[:, np.newaxis]
+        self.island_area = np.add.reduceat(face_area[order], island_start)
+
+    @staticmethod
+    def __union_find(loop_face, loop_key, num_faces):
+        """
+        Island of each face, faces being connected when their loops share a key.
+        Each face is hooked to the smallest root found through its keys, then the
+        paths are compressed, until nothing changes.
+        """
+
+        parent = np.arange(num_faces)
+        while True:
+            key_min = np.full(loop_key.max() + 1, num_faces)
+            np.minimum.at(key_min, loop_key, parent[loop_face])
+            hooked = parent.copy()
+            np.minimum.at(hooked, parent[loop_face], key_min[loop_key])
+            while True:
+                compressed = hooked[hooked]
+                if np.array_equal(compressed, hooked):
+                    break
+                hooked = compressed
+            if np.array_equal(hooked, parent):
+                break
+            parent = hooked
 
-        island_info.append(info)
+        # roots are the smallest face of each island, number islands in this order
+        _, face_island = np.unique(parent, return_inverse=True)
+        return face_island.ravel()
 
-    return island_info
 
+__island_cache = {}
+__ISLAND_CACHE_SIZE = 8
 
-def __parse_island(bm, face_idx, faces_left, island,
-                   face_to_verts, vert_to_faces):
+
+def get_island_arrays(faces, uv_layer):
     """
-    Parse island
+    Get UV islands of faces as IslandArrays, cached per content of the faces
+    (vertices, UVs, selection given by the list of faces) until they change
     """
 
-    faces_to_parse = [face_idx]
-    while faces_to_parse:
-        fidx = faces_to_parse.pop(0)
-        if fidx in faces_left:
-            faces_left.remove(fidx)
-            island.append({'face': bm.faces[fidx]})
-            for v in face_to_verts[fidx]:
-                connected_faces = vert_to_faces[v]
-                for cf in connected_faces:
-                    faces_to_parse.append(cf)
+    face_sizes = np.fromiter((len(f.loops) for f in faces), dtype=np.int64, count=len(faces))
+    loop_verts = np.fromiter((l.vert.index for f in faces for l in f.loops), dtype=np.int64,
+                             count=int(face_sizes.sum()))
+    uvs = np.array([l[uv_layer].uv.to_tuple() for f in faces for l in f.loops],
+                   dtype=np.float64).reshape(-1, 2)
+
+    digest = hashlib.blake2b(face_sizes.tobytes() + loop_verts.tobytes() + uvs.tobytes(),
+                             digest_size=16).digest()
+    arrays = __island_cache.get(digest)
+    if arrays is None:
+        arrays = IslandArrays(loop_verts, uvs, face_sizes)
+        if len(__island_cache) >= __ISLAND_CACHE_SIZE:
+            __island_cache.pop(next(iter(__island_cache)))
+        __island_cache[digest] = arrays
+
+    return arrays
 
 
-def __get_island(bm, face_to_verts, vert_to_faces):
+def __get_island_info(faces, arrays):
     """
-    Get island list
+    get information about each island
     """
 
-    uv_island_lists = []
-    faces_left = set(face_to_verts.keys())
-    while faces_left:
-        current_island = []
-        face_idx = list(faces_left)[0]
-        __parse_island(bm, face_idx, faces_left, current_island,
-                       face_to_verts, vert_to_faces)
-        uv_island_lists.append(current_island)
+    face_min = arrays.face_min.tolist()
+    face_max = arrays.face_max.tolist()
+    face_ave = arrays.face_ave.tolist()
 
-    return uv_island_lists
+    island_info = []
+    for i, isl in enumerate(arrays.islands):
+        info = {}
+        max_uv = Vector(arrays.island_max[i])
+        min_uv = Vector(arrays.island_min[i])
 
+        info['center'] = Vector(arrays.island_ave[i])
+        info['size'] = max_uv - min_uv
+        info['num_uv'] = int(arrays.island_num_uv[i])
+        info['group'] = -1
+        info['faces'] = [
+            {
+                'face': faces[fidx],
+                'max_uv': Vector(face_max[fidx]),
+                'min_uv': Vector(face_min[fidx]),
+                'ave_uv': Vector(face_ave[fidx]),
+            }
+            for fidx in isl.tolist()
+        ]
+        info['max'] = max_uv
+        info['min'] = min_uv
+        info['area'] = float(arrays.island_area[i])
 
-def __create_vert_face_db(faces, uv_layer):
-    # create mesh database for all faces
-    face_to_verts = defaultdict(set)
-    vert_to_faces = defaultdict(set)
-    for f in faces:
-        for l in f.loops:
-            id_ = l[uv_layer].uv.to_tuple(5), l.vert.index
-            face_to_verts[f.index].add(id_)
-            vert_to_faces[id_].add(f.index)
+        island_info.append(info)
 
-    return (face_to_verts, vert_to_faces)
+    return island_info
 
 
 def get_island_info(obj, only_selected=True):
@@ -308,6 +352,7 @@ def get_island_info(obj, only_selected=True):
 #     group: int
 #     max: Vector (2D)
 #     min: Vector (2D)
+#     area: float
 #   },
 #   ...
 # ]
@@ -326,13 +371,11 @@ def get_island_info_from_bmesh(bm, only_selected=True):
 
 
 def get_island_info_from_faces(bm, faces, uv_layer):
-    ftv, vtf = __create_vert_face_db(faces, uv_layer)
+    if not faces:
+        return []
 
     # Get island information
-    uv_island_lists = __get_island(bm, ftv, vtf)
-    island_info = __get_island_info(uv_layer, uv_island_lists)
-
-    return island_info
+    return __get_island_info(faces, get_island_arrays(faces, uv_layer))
 
 
 def get_uvimg_editor_board_size(area):
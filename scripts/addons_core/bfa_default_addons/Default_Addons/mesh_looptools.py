@@ -21,8 +21,10 @@ bl_info = {
 import bmesh
 import bpy
 import collections
+import hashlib
 import mathutils
 import math
+import numpy as np
 from bpy_extras import view3d_utils
 from bpy.types import (
         Operator,
@@ -45,7 +47,13 @@ from bpy.props import (
 # ########################################
 
 # used by all tools to improve speed on reruns Unlink
+# per tool, the entries are keyed on object, input and mesh topology
 looptools_cache = {}
+# number of cache entries kept per tool
+looptools_cache_size = 8
+
+# topology of the last meshes, keyed on their topology hash
+looptools_topology = collections.OrderedDict()
 
 
 def get_strokes(self, context):
@@ -73,31 +81,34 @@ def cache_delete(tool):
         del looptools_cache[tool]
 
 
+# key of the cache entry for the current object, input and mesh topology
+def cache_key(object, bm, input_method, boundaries):
+    modifiers = tuple(mod.name for mod in object.modifiers if mod.show_viewport
+                      and mod.type == 'MIRROR')
+    input = np.fromiter((v.select and not v.hide for v in bm.verts),
+                        dtype=bool, count=len(bm.verts))
+    input = hashlib.blake2b(np.flatnonzero(input).tobytes(),
+                            digest_size=16).hexdigest()
+
+    return((object.name, input_method, boundaries, modifiers,
+            get_topology(bm).hash, input))
+
+
 # check cache for stored information
 def cache_read(tool, object, bm, input_method, boundaries):
     # current tool not cached yet
     if tool not in looptools_cache:
         return(False, False, False, False, False)
-    # check if selected object didn't change
-    if object.name != looptools_cache[tool]["object"]:
-        return(False, False, False, False, False)
-    # check if input didn't change
-    if input_method != looptools_cache[tool]["input_method"]:
-        return(False, False, False, False, False)
-    if boundaries != looptools_cache[tool]["boundaries"]:
-        return(False, False, False, False, False)
-    modifiers = [mod.name for mod in object.modifiers if mod.show_viewport and
-                 mod.type == 'MIRROR']
-    if modifiers != looptools_cache[tool]["modifiers"]:
-        return(False, False, False, False, False)
-    input = [v.index for v in bm.verts if v.select and not v.hide]
-    if input != looptools_cache[tool]["input"]:
+    # check if object, input and topology match a stored entry
+    key = cache_key(object, bm, input_method, boundaries)
+    if key not in looptools_cache[tool]:
         return(False, False, False, False, False)
+    looptools_cache[tool].move_to_end(key)
     # reading values
-    single_loops = looptools_cache[tool]["single_loops"]
-    loops = looptools_cache[tool]["loops"]
-    derived = looptools_cache[tool]["derived"]
-    mapping = looptools_cache[tool]["mapping"]
+    single_loops = looptools_cache[tool][key]["single_loops"]
+    loops = looptools_cache[tool][key]["loops"]
+    derived = looptools_cache[tool][key]["derived"]
+    mapping = looptools_cache[tool][key]["mapping"]
 
     return(True, single_loops, loops, derived, mapping)
 
@@ -105,19 +116,125 @@ def cache_read(tool, object, bm, input_method, boundaries):
 # store information in the cache
 def cache_write(tool, object, bm, input_method, boundaries, single_loops,
 loops, derived, mapping):
-    # clear cache of current tool
-    if tool in looptools_cache:
-        del looptools_cache[tool]
-    # prepare values to be saved to cache
-    input = [v.index for v in bm.verts if v.select and not v.hide]
-    modifiers = [mod.name for mod in object.modifiers if mod.show_viewport
-    and mod.type == 'MIRROR']
-    # update cache
-    looptools_cache[tool] = {
-        "input": input, "object": object.name,
-        "input_method": input_method, "boundaries": boundaries,
+    entries = looptools_cache.setdefault(tool, collections.OrderedDict())
+    key = cache_key(object, bm, input_method, boundaries)
+    # update cache, the least recently used entry makes room
+    entries[key] = {
         "single_loops": single_loops, "loops": loops,
-        "derived": derived, "mapping": mapping, "modifiers": modifiers}
+        "derived": derived, "mapping": mapping}
+    entries.move_to_end(key)
+    while len(entries) > looptools_cache_size:
+        entries.popitem(last=False)
+
+
+# array based topology of a bmesh, shared by the dict_* functions
+# the returned dicts are shared between calls, they shouldn't be modified
+class MeshTopology:
+    def __init__(self, bm, edge_verts, face_sizes, face_verts, face_edges,
+    vert_hide, edge_hide, face_hide, hash):
+        self.bm_verts = len(bm.verts)
+        # edge-keys: vertex indices of each edge, sorted
+        self.edge_keys = np.sort(edge_verts, axis=1)
+        self.vert_hide = vert_hide
+        self.edge_hide = edge_hide
+        self.face_hide = face_hide
+        self.face_sizes = face_sizes
+        # vertex and edge indices of the loops of each face, face after face
+        self.face_verts = face_verts
+        self.face_edges = face_edges
+        self.face_index = np.repeat(np.arange(len(face_sizes)), face_sizes)
+        self.hash = hash
+        self.dicts = {}
+
+    # the loops decide which vertices and edges each face uses, two meshes
+    # with the same edges and face sizes can still differ there
+    @staticmethod
+    def calculate_hash(*arrays):
+        hash = hashlib.blake2b(digest_size=16)
+        for array in arrays:
+            hash.update(np.int64(len(array)).tobytes())
+            hash.update(array.tobytes())
+        return(hash.hexdigest())
+
+    # compressed sparse row adjacency: the values of key i are
+    # values[offsets[i]:offsets[i + 1]], in their original order
+    @staticmethod
+    def csr(keys, values, count):
+        order = np.argsort(keys, kind='stable')
+        offsets = np.zeros(count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(keys, minlength=count), out=offsets[1:])
+        return(offsets, values[order])
+
+    def edge_key_list(self):
+        return(list(map(tuple, self.edge_keys.tolist())))
+
+    def edge_faces(self):
+        if "edge_faces" not in self.dicts:
+            visible = ~self.face_hide[self.face_index]
+            offsets, faces = MeshTopology.csr(self.face_edges[visible],
+                self.face_index[visible], len(self.edge_keys))
+            keys = self.edge_key_list()
+            faces = faces.tolist()
+            self.dicts["edge_faces"] = dict(
+                [[keys[e], faces[offsets[e]:offsets[e + 1]]] for e in
+                np.flatnonzero(~self.edge_hide).tolist()])
+        return(self.dicts["edge_faces"])
+
+    def vert_edges(self):
+        if "vert_edges" not in self.dicts:
+            visible = np.flatnonzero(~self.edge_hide)
+            offsets, edges = MeshTopology.csr(self.edge_keys[visible].ravel(),
+                np.repeat(visible, 2), self.bm_verts)
+            keys = self.edge_key_list()
+            edges = edges.tolist()
+            self.dicts["vert_edges"] = dict(
+                [[v, [keys[e] for e in edges[offsets[v]:offsets[v + 1]]]]
+                for v in np.flatnonzero(~self.vert_hide).tolist()])
+        return(self.dicts["vert_edges"])
+
+    def vert_faces(self):
+        if "vert_faces" not in self.dicts:
+            visible = ~self.face_hide[self.face_index]
+            offsets, faces = MeshTopology.csr(self.face_verts[visible],
+                self.face_index[visible], self.bm_verts)
+            faces = faces.tolist()
+            self.dicts["vert_faces"] = dict(
+                [[v, faces[offsets[v]:offsets[v + 1]]] for v in
+                np.flatnonzero(~self.vert_hide).tolist()])
+        return(self.dicts["vert_faces"])
+
+
+# return the topology of a bmesh, reusing the arrays of an unchanged topology
+def get_topology(bm):
+    edge_verts = np.fromiter((v.index for e in bm.edges for v in e.verts),
+        dtype=np.int64, count=2 * len(bm.edges)).reshape(-1, 2)
+    face_sizes = np.fromiter((len(f.loops) for f in bm.faces), dtype=np.int64,
+        count=len(bm.faces))
+    loop_count = int(face_sizes.sum())
+    face_verts = np.fromiter((l.vert.index for f in bm.faces for l in f.loops),
+        dtype=np.int64, count=loop_count)
+    face_edges = np.fromiter((l.edge.index for f in bm.faces for l in f.loops),
+        dtype=np.int64, count=loop_count)
+    vert_hide = np.fromiter((v.hide for v in bm.verts), dtype=bool,
+        count=len(bm.verts))
+    edge_hide = np.fromiter((e.hide for e in bm.edges), dtype=bool,
+        count=len(bm.edges))
+    face_hide = np.fromiter((f.hide for f in bm.faces), dtype=bool,
+        count=len(bm.faces))
+    hash = MeshTopology.calculate_hash(edge_verts, face_sizes, face_verts,
+        face_edges, vert_hide, edge_hide, face_hide)
+
+    if hash in looptools_topology:
+        looptools_topology.move_to_end(hash)
+        return(looptools_topology[hash])
+
+    topology = MeshTopology(bm, edge_verts, face_sizes, face_verts,
+        face_edges, vert_hide, edge_hide, face_hide, hash)
+    looptools_topology[hash] = topology
+    while len(looptools_topology) > looptools_cache_size:
+        looptools_topology.popitem(last=False)
+
+    return(topology)
 
 
 # calculates natural cubic splines through all given knots
@@ -164,46 +281,36 @@ def calculate_cubic_splines(bm_mod, tknots, knots):
     n = len(knots)
     if n < 2:
         return False
-    x = tknots[:]
-    locs = [bm_mod.verts[k].co[:] for k in knots]
-    result = []
-    for j in range(3):
-        a = []
-        for i in locs:
-            a.append(i[j])
-        h = []
-        for i in range(n - 1):
-            if x[i + 1] - x[i] == 0:
-                h.append(1e-8)
-            else:
-                h.append(x[i + 1] - x[i])
-        q = [False]
-        for i in range(1, n - 1):
-            q.append(3 / h[i] * (a[i + 1] - a[i]) - 3 / h[i - 1] * (a[i] - a[i - 1]))
-        l = [1.0]
-        u = [0.0]
-        z = [0.0]
-        for i in range(1, n - 1):
-            l.append(2 * (x[i + 1] - x[i - 1]) - h[i - 1] * u[i - 1])
-            if l[i] == 0:
-                l[i] = 1e-8
-            u.append(h[i] / l[i])
-            z.append((q[i] - h[i - 1] * z[i - 1]) / l[i])
-        l.append(1.0)
-        z.append(0.0)
-        b = [False for i in range(n - 1)]
-        c = [False for i in range(n)]
-        d = [False for i in range(n - 1)]
-        c[n - 1] = 0.0
-        for i in range(n - 2, -1, -1):
-            c[i] = z[i] - u[i] * c[i + 1]
-            b[i] = (a[i + 1] - a[i]) / h[i] - h[i] * (c[i + 1] + 2 * c[i]) / 3
-            d[i] = (c[i + 1] - c[i]) / (3 * h[i])
-        for i in range(n - 1):
-            result.append([a[i], b[i], c[i], d[i], x[i]])
-    splines = []
-    for i in range(len(knots) - 1):
-        splines.append([result[i], result[i + n - 1], result[i + (n - 1) * 2]])
+    x = np.array(tknots, dtype=np.float64)
+    # one column per axis, all three axes are solved at once
+    a = np.array([bm_mod.verts[k].co[:] for k in knots], dtype=np.float64)
+    h = np.diff(x)
+    h[h == 0] = 1e-8
+    q = np.zeros((n, 3))
+    q[1:-1] = 3 / h[1:, None] * (a[2:] - a[1:-1]) - \
+        3 / h[:-1, None] * (a[1:-1] - a[:-2])
+    # tridiagonal system, the sweeps are sequential so they run on floats
+    xl = x.tolist()
+    hl = h.tolist()
+    ql = q.tolist()
+    u = [0.0] * n
+    z = [[0.0, 0.0, 0.0] for i in range(n)]
+    for i in range(1, n - 1):
+        l = 2 * (xl[i + 1] - xl[i - 1]) - hl[i - 1] * u[i - 1]
+        if l == 0:
+            l = 1e-8
+        u[i] = hl[i] / l
+        z[i] = [(ql[i][j] - hl[i - 1] * z[i - 1][j]) / l for j in range(3)]
+    c = [[0.0, 0.0, 0.0] for i in range(n)]
+    for i in range(n - 2, -1, -1):
+        c[i] = [z[i][j] - u[i] * c[i + 1][j] for j in range(3)]
+    c = np.array(c)
+    b = (a[1:] - a[:-1]) / h[:, None] - h[:, None] * (c[1:] + 2 * c[:-1]) / 3
+    d = (c[1:] - c[:-1]) / (3 * h[:, None])
+    # [a, b, c, d, x] per segment and axis
+    coefficients = np.stack((a[:-1], b, c[:-1], d,
+        np.repeat(x[:-1, None], 3, axis=1)), axis=2)
+    splines = coefficients.tolist()
     if circular:  # cleaning up after hack
         knots = knots[4:-4]
         tknots = tknots[4:-4]
@@ -228,37 +335,18 @@ def calculate_linear_splines(bm_mod, tknots, knots):
 # calculate a best-fit plane to the given vertices
 def calculate_plane(bm_mod, loop, method="best_fit", object=False):
     # getting the vertex locations
-    locs = [bm_mod.verts[v].co.copy() for v in loop[0]]
+    locs = np.array([bm_mod.verts[v].co[:] for v in loop[0]], dtype=np.float64)
 
     # calculating the center of masss
-    com = mathutils.Vector()
-    for loc in locs:
-        com += loc
-    com /= len(locs)
-    x, y, z = com
+    com = mathutils.Vector(locs.mean(axis=0))
 
     if method == 'best_fit':
         # creating the covariance matrix
-        mat = mathutils.Matrix(((0.0, 0.0, 0.0),
-                                (0.0, 0.0, 0.0),
-                                (0.0, 0.0, 0.0),
-                                ))
-        for loc in locs:
-            mat[0][0] += (loc[0] - x) ** 2
-            mat[1][0] += (loc[0] - x) * (loc[1] - y)
-            mat[2][0] += (loc[0] - x) * (loc[2] - z)
-            mat[0][1] += (loc[1] - y) * (loc[0] - x)
-            mat[1][1] += (loc[1] - y) ** 2
-            mat[2][1] += (loc[1] - y) * (loc[2] - z)
-            mat[0][2] += (loc[2] - z) * (loc[0] - x)
-            mat[1][2] += (loc[2] - z) * (loc[1] - y)
-            mat[2][2] += (loc[2] - z) ** 2
+        dlocs = locs - locs.mean(axis=0)
+        mat = dlocs.T @ dlocs
 
         # calculating the normal to the plane
-        normal = False
-        try:
-            mat = matrix_invert(mat)
-        except:
+        if matrix_determinant(mat) == 0:
             ax = 2
             if math.fabs(sum(mat[0])) < math.fabs(sum(mat[1])):
                 if math.fabs(sum(mat[0])) < math.fabs(sum(mat[2])):
@@ -271,22 +359,14 @@ def calculate_plane(bm_mod, loop, method="best_fit", object=False):
                 normal = mathutils.Vector((0.0, 1.0, 0.0))
             else:
                 normal = mathutils.Vector((0.0, 0.0, 1.0))
-        if not normal:
-            # warning! this is different from .normalize()
-            itermax = 500
-            vec2 = mathutils.Vector((1.0, 1.0, 1.0))
-            for i in range(itermax):
-                vec = vec2
-                vec2 = mat @ vec
-                # Calculate length with double precision to avoid problems with `inf`
-                vec2_length = math.sqrt(vec2[0] ** 2 + vec2[1] ** 2 + vec2[2] ** 2)
-                if vec2_length != 0:
-                    vec2 /= vec2_length
-                if vec2 == vec:
-                    break
-            if vec2.length == 0:
-                vec2 = mathutils.Vector((1.0, 1.0, 1.0))
-            normal = vec2
+        else:
+            # the eigenvector of the smallest eigenvalue, pointing to the same
+            # side as (1, 1, 1) like the inverse iteration that it replaces
+            values, vectors = np.linalg.eigh(mat)
+            vec = vectors[:, 0]
+            if vec.sum() < 0:
+                vec = -vec
+            normal = mathutils.Vector(vec)
 
     elif method == 'normal':
         # averaging the vertex normals
@@ -319,6 +399,33 @@ def calculate_splines(interpolation, bm_mod, tknots, knots):
     return(splines)
 
 
+# evaluate the splines at the given t-values, all points at once
+def calculate_spline_locations(interpolation, splines, tknots, tpoints):
+    tknots = np.array(tknots, dtype=np.float64)
+    m = np.array(tpoints, dtype=np.float64)
+    # index of the spline: the knot at m, or the last knot before m
+    n = np.searchsorted(tknots, m)
+    exact = n < len(tknots)
+    exact[exact] = tknots[n[exact]] == m[exact]
+    n = np.clip(np.where(exact, n, n - 1), 0, len(splines) - 1)
+
+    if interpolation == 'cubic':
+        # coefficients per spline: [a, b, c, d, t] for x, y and z
+        coefficients = np.array(splines, dtype=np.float64)[n]
+        a, b, c, d, t = np.moveaxis(coefficients, 2, 0)
+        dt = m[:, None] - t
+        locs = a + b * dt + c * dt ** 2 + d * dt ** 3
+    else:  # interpolation == 'linear'
+        a = np.array([spline[0][:] for spline in splines], dtype=np.float64)[n]
+        d = np.array([spline[1][:] for spline in splines], dtype=np.float64)[n]
+        t = np.array([spline[2] for spline in splines], dtype=np.float64)[n]
+        u = np.array([spline[3] for spline in splines], dtype=np.float64)[n]
+        u[u == 0] = 1e-8
+        locs = ((m - t) / u)[:, None] * d + a
+
+    return([mathutils.Vector(loc) for loc in locs.tolist()])
+
+
 # check loops and only return valid ones
 def check_loops(loops, mapping, bm_mod):
     valid_loops = []
@@ -351,12 +458,7 @@ def check_loops(loops, mapping, bm_mod):
 
 # input: bmesh, output: dict with the edge-key as key and face-index as value
 def dict_edge_faces(bm):
-    edge_faces = dict([[edgekey(edge), []] for edge in bm.edges if not edge.hide])
-    for face in bm.faces:
-        if face.hide:
-            continue
-        for key in face_edgekeys(face):
-            edge_faces[key].append(face.index)
+    edge_faces = get_topology(bm).edge_faces()
 
     return(edge_faces)
 
@@ -381,24 +483,14 @@ def dict_face_faces(bm, edge_faces=False):
 
 # input: bmesh, output: dict with the vert index as key and edge-keys as value
 def dict_vert_edges(bm):
-    vert_edges = dict([[v.index, []] for v in bm.verts if not v.hide])
-    for edge in bm.edges:
-        if edge.hide:
-            continue
-        ek = edgekey(edge)
-        for vert in ek:
-            vert_edges[vert].append(ek)
+    vert_edges = get_topology(bm).vert_edges()
 
     return(vert_edges)
 
 
 # input: bmesh, output: dict with the vert index as key and face index as value
 def dict_vert_faces(bm):
-    vert_faces = dict([[v.index, []] for v in bm.verts if not v.hide])
-    for face in bm.faces:
-        if not face.hide:
-            for vert in face.verts:
-                vert_faces[vert.index].append(face.index)
+    vert_faces = get_topology(bm).vert_faces()
 
     return(vert_faces)
 
@@ -1811,35 +1903,16 @@ def circle_calculate_best_fit(locs_2d):
     y0 = 0.0
     r = 1.0
 
+    locs = np.array([[v[0], v[1]] for v in locs_2d], dtype=np.float64)
+
     # calculate center and radius (non-linear least squares solution)
     for iter in range(500):
-        jmat = []
-        k = []
-        for v in locs_2d:
-            d = (v[0] ** 2 - 2.0 * x0 * v[0] + v[1] ** 2 - 2.0 * y0 * v[1] + x0 ** 2 + y0 ** 2) ** 0.5
-            jmat.append([(x0 - v[0]) / d, (y0 - v[1]) / d, -1.0])
-            k.append(-(((v[0] - x0) ** 2 + (v[1] - y0) ** 2) ** 0.5 - r))
-        jmat2 = mathutils.Matrix(((0.0, 0.0, 0.0),
-                                  (0.0, 0.0, 0.0),
-                                  (0.0, 0.0, 0.0),
-                                  ))
-        k2 = mathutils.Vector((0.0, 0.0, 0.0))
-        for i in range(len(jmat)):
-            k2 += mathutils.Vector(jmat[i]) * k[i]
-            jmat2[0][0] += jmat[i][0] ** 2
-            jmat2[1][0] += jmat[i][0] * jmat[i][1]
-            jmat2[2][0] += jmat[i][0] * jmat[i][2]
-            jmat2[1][1] += jmat[i][1] ** 2
-            jmat2[2][1] += jmat[i][1] * jmat[i][2]
-            jmat2[2][2] += jmat[i][2] ** 2
-        jmat2[0][1] = jmat2[1][0]
-        jmat2[0][2] = jmat2[2][0]
-        jmat2[1][2] = jmat2[2][1]
-        try:
-            jmat2.invert()
-        except:
-            pass
-        dx0, dy0, dr = jmat2 @ k2
+        dlocs = locs - (x0, y0)
+        d = np.sqrt((dlocs ** 2).sum(axis=1))
+        d[d == 0] = 1e-8
+        jmat = np.column_stack((-dlocs / d[:, None], np.full(len(d), -1.0)))
+        k = -(d - r)
+        dx0, dy0, dr = np.linalg.lstsq(jmat, k, rcond=None)[0].tolist()
         x0 += dx0
         y0 += dy0
         r += dr
@@ -2244,9 +2317,17 @@ def curve_calculate_t(bm_mod, knots, points, pknots, regular, circular):
     loc_prev = False
     len_total = 0
 
+    # first occurrence of each knot and point
+    knot_index = {}
+    for i, k in enumerate(knots):
+        knot_index.setdefault(k, i)
+    point_index = {}
+    for i, p in enumerate(points):
+        point_index.setdefault(p, i)
+
     for p in points:
-        if p in knots:
-            loc = pknots[knots.index(p)]  # use projected knot location
+        if p in knot_index:
+            loc = pknots[knot_index[p]]  # use projected knot location
         else:
             loc = mathutils.Vector(bm_mod.verts[p].co[:])
         if not loc_prev:
@@ -2256,8 +2337,8 @@ def curve_calculate_t(bm_mod, knots, points, pknots, regular, circular):
         loc_prev = loc
     tknots = []
     for p in points:
-        if p in knots:
-            tknots.append(tpoints[points.index(p)])
+        if p in knot_index:
+            tknots.append(tpoints[point_index[p]])
     if circular:
         tknots[-1] = tpoints[-1]
 
@@ -2267,7 +2348,7 @@ def curve_calculate_t(bm_mod, knots, points, pknots, regular, circular):
         for i in range(1, len(tpoints) - 1):
             tpoints[i] = i * tpoints_average
         for i in range(len(knots)):
-            tknots[i] = tpoints[points.index(knots[i])]
+            tknots[i] = tpoints[point_index[knots[i]]]
         if circular:
             tknots[-1] = tpoints[-1]
 
@@ -2280,34 +2361,16 @@ interpolation, restriction):
     newlocs = {}
     move = []
 
-    for p in points:
-        if p in knots:
-            continue
-        m = tpoints[points.index(p)]
-        if m in tknots:
-            n = tknots.index(m)
-        else:
-            t = tknots[:]
-            t.append(m)
-            t.sort()
-            n = t.index(m) - 1
-        if n > len(splines) - 1:
-            n = len(splines) - 1
-        elif n < 0:
-            n = 0
-
-        if interpolation == 'cubic':
-            ax, bx, cx, dx, tx = splines[n][0]
-            x = ax + bx * (m - tx) + cx * (m - tx) ** 2 + dx * (m - tx) ** 3
-            ay, by, cy, dy, ty = splines[n][1]
-            y = ay + by * (m - ty) + cy * (m - ty) ** 2 + dy * (m - ty) ** 3
-            az, bz, cz, dz, tz = splines[n][2]
-            z = az + bz * (m - tz) + cz * (m - tz) ** 2 + dz * (m - tz) ** 3
-            newloc = mathutils.Vector([x, y, z])
-        else:  # interpolation == 'linear'
-            a, d, t, u = splines[n]
-            newloc = ((m - t) / u) * d + a
+    # t-value of the first occurrence of each point
+    point_t = {}
+    for p, m in zip(points, tpoints):
+        point_t.setdefault(p, m)
+    knots_set = set(knots)
+    moved = [p for p in points if p not in knots_set]
+    locs = calculate_spline_locations(interpolation, splines, tknots,
+        [point_t[p] for p in moved])
 
+    for p, newloc in zip(moved, locs):
         if restriction != 'none':  # vertex movement is restricted
             newlocs[p] = newloc
         else:  # set the vertex to its new location
@@ -2521,7 +2584,7 @@ def curve_project_knots(bm_mod, verts_selected, knots, points, circular):
 
 # find all loops through a given vertex
 def curve_vertex_loops(bm_mod, start_vert, vert_edges, edge_faces):
-    edges_used = []
+    edges_used = set()
     loops = []
 
     for edge in vert_edges[start_vert]:
@@ -2538,7 +2601,7 @@ def curve_vertex_loops(bm_mod, start_vert, vert_edges, edge_faces):
                 new_edges = vert_edges[new_vert]
                 loop.append(new_vert)
                 if len(loop) > 1:
-                    edges_used.append(tuple(sorted([loop[-1], loop[-2]])))
+                    edges_used.add(tuple(sorted([loop[-1], loop[-2]])))
                 if len(new_edges) < 3 or len(new_edges) > 4:
                     # pole
                     break
@@ -3140,33 +3203,9 @@ points, splines):
     change = []
     move = []
     for i in range(len(knots)):
-        for p in points[i]:
-            m = tpoints[i][points[i].index(p)]
-            if m in tknots[i]:
-                n = tknots[i].index(m)
-            else:
-                t = tknots[i][:]
-                t.append(m)
-                t.sort()
-                n = t.index(m) - 1
-            if n > len(splines[i]) - 1:
-                n = len(splines[i]) - 1
-            elif n < 0:
-                n = 0
-
-            if interpolation == 'cubic':
-                ax, bx, cx, dx, tx = splines[i][n][0]
-                x = ax + bx * (m - tx) + cx * (m - tx) ** 2 + dx * (m - tx) ** 3
-                ay, by, cy, dy, ty = splines[i][n][1]
-                y = ay + by * (m - ty) + cy * (m - ty) ** 2 + dy * (m - ty) ** 3
-                az, bz, cz, dz, tz = splines[i][n][2]
-                z = az + bz * (m - tz) + cz * (m - tz) ** 2 + dz * (m - tz) ** 3
-                change.append([p, mathutils.Vector([x, y, z])])
-            else:  # interpolation == 'linear'
-                a, d, t, u = splines[i][n]
-                if u == 0:
-                    u = 1e-8
-                change.append([p, ((m - t) / u) * d + a])
+        locs = calculate_spline_locations(interpolation, splines[i],
+            tknots[i], tpoints[i])
+        change += [[p, loc] for p, loc in zip(points[i], locs)]
     for c in change:
         move.append([c[0], (bm_mod.verts[c[0]].co + c[1]) / 2])
 
@@ -3199,32 +3238,8 @@ def space_calculate_t(bm_mod, knots):
 # change the location of the points to their place on the spline
 def space_calculate_verts(bm_mod, interpolation, tknots, tpoints, points,
 splines):
-    move = []
-    for p in points:
-        m = tpoints[points.index(p)]
-        if m in tknots:
-            n = tknots.index(m)
-        else:
-            t = tknots[:]
-            t.append(m)
-            t.sort()
-            n = t.index(m) - 1
-        if n > len(splines) - 1:
-            n = len(splines) - 1
-        elif n < 0:
-            n = 0
-
-        if interpolation == 'cubic':
-            ax, bx, cx, dx, tx = splines[n][0]
-            x = ax + bx * (m - tx) + cx * (m - tx) ** 2 + dx * (m - tx) ** 3
-            ay, by, cy, dy, ty = splines[n][1]
-            y = ay + by * (m - ty) + cy * (m - ty) ** 2 + dy * (m - ty) ** 3
-            az, bz, cz, dz, tz = splines[n][2]
-            z = az + bz * (m - tz) + cz * (m - tz) ** 2 + dz * (m - tz) ** 3
-            move.append([p, mathutils.Vector([x, y, z])])
-        else:  # interpolation == 'linear'
-            a, d, t, u = splines[n]
-            move.append([p, ((m - t) / u) * d + a])
+    locs = calculate_spline_locations(interpolation, splines, tknots, tpoints)
+    move = [[p, loc] for p, loc in zip(points, locs)]
 
     return(move)
 
@@ -4056,9 +4071,9 @@ class GStretch(Operator):
             col.operator("remove.gp", text="Delete GPencil strokes")
 
     def invoke(self, context, event):
-        # flush cached strokes
-        if 'Gstretch' in looptools_cache:
-            looptools_cache['Gstretch']['single_loops'] = []
+        # flush cached strokes of every entry
+        for entry in looptools_cache.get('Gstretch', {}).values():
+            entry['single_loops'] = []
         # load custom settings
         settings_load(self)
         return self.execute(context)
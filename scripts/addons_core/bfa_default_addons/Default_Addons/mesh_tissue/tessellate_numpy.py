@@ -65,6 +65,33 @@ def tessellated(ob):
                     return True
     return False
 
+def grid_coordinates(co, step, sides, clamp):
+    '''
+    Grid cell (u, v, u1, v1) and factor coordinates inside the cell of the
+    component's vertices, for all the vertices at once
+    '''
+    u = (co[:,0]//step).astype('int')
+    v = (co[:,1]//step).astype('int')
+    u1 = np.minimum(u+1, sides)
+    v1 = np.minimum(v+1, sides)
+    if clamp:
+        over = u > sides-1
+        u[over] = sides-1
+        u1[over] = sides
+        under = u < 0
+        u[under] = 0
+        u1[under] = 1
+        over = v > sides-1
+        v[over] = sides-1
+        v1[over] = sides
+        under = v < 0
+        v[under] = 0
+        v1[under] = 1
+    uv_quads = np.stack((u,v,u1,v1), axis=1)
+    # factor coordinates
+    uv = np.stack(((co[:,0]-u*step)/step, (co[:,1]-v*step)/step, co[:,2]), axis=1)
+    return uv_quads, uv
+
 def tessellate_patch(props):
     tt = time.time()
 
@@ -636,7 +663,7 @@ def tessellate_patch(props):
         except: pass
 
         me1 = ob1.data
-        verts1 = [v.co for v in me1.vertices]
+        verts1 = get_vertices_numpy(me1)
         n_verts1 = len(verts1)
         if n_verts1 == 0:
             bpy.data.objects.remove(ob1)
@@ -646,34 +673,7 @@ def tessellate_patch(props):
 
         # find relative UV component's vertices
         if fill_mode == 'PATCH':
-            verts1_uv_quads = [0]*n_verts1
-            verts1_uv = [0]*n_verts1
-            for i, vert in enumerate(verts1):
-                # grid coordinates
-                u = int(vert[0]//step)
-                v = int(vert[1]//step)
-                u1 = min(u+1, sides)
-                v1 = min(v+1, sides)
-                if mode != 'BOUNDS':
-                    if u > sides-1:
-                        u = sides-1
-                        u1 = sides
-                    if u < 0:
-                        u = 0
-                        u1 = 1
-                    if v > sides-1:
-                        v = sides-1
-                        v1 = sides
-                    if v < 0:
-                        v = 0
-                        v1 = 1
-                verts1_uv_quads[i] = (u,v,u1,v1)
-                # factor coordinates
-                fu = (vert[0]-u*step)/step
-                fv = (vert[1]-v*step)/step
-                fw = vert.z
-                # interpolate Z scaling factor
-                verts1_uv[i] = Vector((fu,fv,fw))
+            verts1_uv_quads, verts1_uv = grid_coordinates(verts1, step, sides, mode != 'BOUNDS')
         else:
             verts1_uv = verts1
 
@@ -681,36 +681,9 @@ def tessellate_patch(props):
             sk_uv_quads = []
             sk_uv = []
             for sk in ob1.data.shape_keys.key_blocks[1:]:
-                source = sk.data
-                _sk_uv_quads = [0]*n_verts1
-                _sk_uv = [0]*n_verts1
-                for i, sk_v in enumerate(source):
-                    sk_vert = sk_v.co
-
-                    # grid coordinates
-                    u = int(sk_vert[0]//step)
-                    v = int(sk_vert[1]//step)
-                    u1 = min(u+1, sides)
-                    v1 = min(v+1, sides)
-                    if mode != 'BOUNDS':
-                        if u > sides-1:
-                            u = sides-1
-                            u1 = sides
-                        if u < 0:
-                            u = 0
-                            u1 = 1
-                        if v > sides-1:
-                            v = sides-1
-                            v1 = sides
-                        if v < 0:
-                            v = 0
-                            v1 = 1
-                    _sk_uv_quads[i] = (u,v,u1,v1)
-                    # factor coordinates
-                    fu = (sk_vert[0]-u*step)/step
-                    fv = (sk_vert[1]-v*step)/step
-                    fw = sk_vert.z
-                    _sk_uv[i] = Vector((fu,fv,fw))
+                sk_co = np.empty(n_verts1*3)
+                sk.data.foreach_get('co', sk_co)
+                _sk_uv_quads, _sk_uv = grid_coordinates(sk_co.reshape((n_verts1,3)), step, sides, mode != 'BOUNDS')
                 sk_uv_quads.append(_sk_uv_quads)
                 sk_uv.append(_sk_uv)
             store_sk_coordinates = [[] for t in ob1.data.shape_keys.key_blocks[1:]]
@@ -971,13 +944,14 @@ def tessellate_patch(props):
 
         tt = tissue_time(tt, "Compute Coordinates", levels=2)
 
-        new_me = array_mesh(ob1, len(masked_verts))
+        new_me = array_mesh_numpy(ob1, len(masked_verts))
         tt = tissue_time(tt, "Repeat component", levels=2)
 
         new_patch = bpy.data.objects.new("_tissue_tmp_patch", new_me)
         bpy.context.collection.objects.link(new_patch)
+        array_vertex_groups(ob1, new_patch, len(masked_verts))
 
-        store_coordinates = np.concatenate(store_coordinates, axis=0).reshape((-1)).tolist()
+        store_coordinates = np.concatenate(store_coordinates, axis=0).reshape((-1)).astype(np.float32)
         new_me.vertices.foreach_set('co',store_coordinates)
 
         for area in bpy.context.screen.areas:
@@ -1013,7 +987,7 @@ def tessellate_patch(props):
                 new_patch.data.shape_keys.key_blocks[sk.name].value = val
             for i in range(n_sk):
                 coordinates = np.concatenate(store_sk_coordinates[:,i], axis=0)
-                coordinates = coordinates.flatten().tolist()
+                coordinates = coordinates.flatten().astype(np.float32)
                 new_patch.data.shape_keys.key_blocks[i+1].data.foreach_set('co', coordinates)
 
             # set original values and combine Shape Keys and Vertex Groups
@@ -3791,7 +3765,7 @@ def merge_components(ob, props, use_bmesh):
         if(props.bridge_edges_crease>0 or props.open_edges_crease>0):
             ob.data.edge_creases_ensure()
         bm = bmesh.new()
-        bm.from_mesh(ob.data.copy())
+        bm.from_mesh(ob.data)
         if props.merge_open_edges_only:
             boundary_verts = [v for v in bm.verts if v.is_boundary or v.is_wire]
         else:
@@ -472,6 +472,121 @@ def array_mesh_object(ob, n):
         bpy.ops.object.modifier_apply(modifier=arr.name)
     return ob
 
+# foreach_get/foreach_set property, number of values and dtype for each
+# attribute data type
+attribute_arrays_types = {
+    'FLOAT': ('value', 1, np.float32),
+    'INT': ('value', 1, np.int32),
+    'INT8': ('value', 1, np.int32),
+    'BOOLEAN': ('value', 1, bool),
+    'FLOAT2': ('vector', 2, np.float32),
+    'INT32_2D': ('value', 2, np.int32),
+    'FLOAT_VECTOR': ('vector', 3, np.float32),
+    'FLOAT_COLOR': ('color', 4, np.float32),
+    'BYTE_COLOR': ('color', 4, np.float32),
+    'QUATERNION': ('value', 4, np.float32),
+    }
+
+def get_component_topology(me):
+    '''
+    Return the topology of a mesh as numpy arrays: edges vertices, loops
+    vertices, loops edges and polygons loop start
+    '''
+    edges = np.empty(len(me.edges)*2, dtype=np.int32)
+    me.edges.foreach_get('vertices', edges)
+    loops_verts = np.empty(len(me.loops), dtype=np.int32)
+    me.loops.foreach_get('vertex_index', loops_verts)
+    loops_edges = np.empty(len(me.loops), dtype=np.int32)
+    me.loops.foreach_get('edge_index', loops_edges)
+    loop_start = np.empty(len(me.polygons), dtype=np.int32)
+    me.polygons.foreach_get('loop_start', loop_start)
+    return edges, loops_verts, loops_edges, loop_start
+
+def get_attributes_numpy(me):
+    '''
+    Return the generic attributes of a mesh as numpy arrays, as a list of
+    (name, domain, data_type, values). Positions and internal attributes
+    are skipped.
+    '''
+    attributes = []
+    for attr in me.attributes:
+        if attr.name == 'position' or attr.name.startswith('.'): continue
+        if attr.data_type not in attribute_arrays_types: continue
+        if attr.domain not in ('POINT', 'EDGE', 'FACE', 'CORNER'): continue
+        prop, size, dtype = attribute_arrays_types[attr.data_type]
+        values = np.empty(len(attr.data)*size, dtype=dtype)
+        attr.data.foreach_get(prop, values)
+        attributes.append((attr.name, attr.domain, attr.data_type, values.reshape((len(attr.data), -1))))
+    return attributes
+
+def array_mesh_numpy(ob, n):
+    '''
+    Return Mesh data repeating n times the mesh of the object without offset,
+    like array_mesh(). All the copies are written at once with foreach_set.
+    '''
+    me = ob.data
+    n_verts = len(me.vertices)
+    n_edges = len(me.edges)
+    n_loops = len(me.loops)
+    n_polys = len(me.polygons)
+
+    edges, loops_verts, loops_edges, loop_start = get_component_topology(me)
+    # offset of the indices for each copy
+    copies = np.arange(n, dtype=np.int32)[:,None]
+
+    new_me = bpy.data.meshes.new(me.name)
+    new_me.vertices.add(n_verts*n)
+    new_me.edges.add(n_edges*n)
+    new_me.loops.add(n_loops*n)
+    new_me.polygons.add(n_polys*n)
+    co = np.empty(n_verts*3, dtype=np.float32)
+    me.vertices.foreach_get('co', co)
+    new_me.vertices.foreach_set('co', np.tile(co, n))
+    new_me.edges.foreach_set('vertices', (edges[None,:] + copies*n_verts).reshape(-1))
+    new_me.loops.foreach_set('vertex_index', (loops_verts[None,:] + copies*n_verts).reshape(-1))
+    new_me.loops.foreach_set('edge_index', (loops_edges[None,:] + copies*n_edges).reshape(-1))
+    new_me.polygons.foreach_set('loop_start', (loop_start[None,:] + copies*n_loops).reshape(-1))
+
+    # attributes (UV, materials, smooth, creases...)
+    for name, domain, data_type, values in get_attributes_numpy(me):
+        prop = attribute_arrays_types[data_type][0]
+        attr = new_me.attributes.get(name)
+        if attr == None:
+            attr = new_me.attributes.new(name, data_type, domain)
+        attr.data.foreach_set(prop, np.tile(values, (n,1)).reshape(-1))
+    if me.uv_layers.active:
+        new_me.uv_layers.active = new_me.uv_layers[me.uv_layers.active.name]
+    for mat in me.materials: new_me.materials.append(mat)
+
+    new_me.update()
+    return new_me
+
+def array_vertex_groups(ob, new_ob, n):
+    '''
+    Copy the Vertex Groups of the object to the n copies of its mesh in the
+    new object (see array_mesh_numpy())
+    '''
+    if len(ob.vertex_groups) == 0: return
+    n_verts = len(ob.data.vertices)
+    # (group, vertex, weight) of the original assignments
+    assignments = [(g.group, v.index, g.weight) for v in ob.data.vertices for g in v.groups]
+    if len(assignments) == 0:
+        for vg in ob.vertex_groups: new_ob.vertex_groups.new(name=vg.name)
+        return
+    assignments = np.array(assignments)
+    groups = assignments[:,0].astype('int')
+    verts = assignments[:,1].astype('int')
+    weights = assignments[:,2]
+    copies = np.arange(n)[:,None]*n_verts
+    for vg in ob.vertex_groups:
+        new_vg = new_ob.vertex_groups.new(name=vg.name)
+        mask = groups == vg.index
+        if not np.any(mask): continue
+        # vertices with the same weight are added at once
+        for w in np.unique(weights[mask]):
+            ids = verts[mask][weights[mask] == w]
+            new_vg.add((ids[None,:] + copies).reshape(-1).tolist(), w, 'REPLACE')
+
 
 def get_mesh_before_subs(ob):
     not_allowed  = ('FLUID_SIMULATION', 'ARRAY', 'BEVEL', 'BOOLEAN', 'BUILD',
@@ -666,82 +781,61 @@ def tessellate_prepare_component(ob1, props):
     n_verts = len(me1.vertices)
 
     # Component bounding box
-    min_c = Vector((0, 0, 0))
-    max_c = Vector((0, 0, 0))
-    first = True
-    for v in me1.vertices:
-        vert = v.co
-        if vert[0] < min_c[0] or first:
-            min_c[0] = vert[0]
-        if vert[1] < min_c[1] or first:
-            min_c[1] = vert[1]
-        if vert[2] < min_c[2] or first:
-            min_c[2] = vert[2]
-        if vert[0] > max_c[0] or first:
-            max_c[0] = vert[0]
-        if vert[1] > max_c[1] or first:
-            max_c[1] = vert[1]
-        if vert[2] > max_c[2] or first:
-            max_c[2] = vert[2]
-        first = False
+    co = np.empty(n_verts*3, dtype=np.float64)
+    me1.vertices.foreach_get('co', co)
+    co = co.reshape((n_verts, 3))
+    if n_verts > 0:
+        min_c = Vector(co.min(axis=0))
+        max_c = Vector(co.max(axis=0))
+    else:
+        min_c = Vector((0, 0, 0))
+        max_c = Vector((0, 0, 0))
     bb = max_c - min_c
 
-    # adaptive XY
-    verts1 = []
-    for v in me1.vertices:
+    def adaptive_xy(co, z_bounds_zero):
+        # all the vertices at once
         if mode == 'BOUNDS':
-            vert = v.co - min_c  # (ob1.matrix_world * v.co) - min_c
-            if use_origin_offset: vert[2] = v.co[2]
-            vert[0] = vert[0] / bb[0] if bb[0] != 0 else 0.5
-            vert[1] = vert[1] / bb[1] if bb[1] != 0 else 0.5
+            vert = co - np.array(min_c)
+            if use_origin_offset: vert[:,2] = co[:,2]
+            vert[:,0] = vert[:,0] / bb[0] if bb[0] != 0 else 0.5
+            vert[:,1] = vert[:,1] / bb[1] if bb[1] != 0 else 0.5
             if scale_mode == 'CONSTANT' or normals_mode in ('OBJECT', 'SHAPEKEYS'):
                 if not use_origin_offset:
-                    vert[2] = vert[2] / bb[2] if bb[2] != 0 else 0
-                    vert[2] = vert[2] - 0.5 + offset * 0.5
+                    if bb[2] != 0: vert[:,2] = vert[:,2] / bb[2]
+                    elif z_bounds_zero: vert[:,2] = 0
+                    vert[:,2] = vert[:,2] - 0.5 + offset * 0.5
             else:
                 if not use_origin_offset:
-                    vert[2] = vert[2] + (-0.5 + offset * 0.5) * bb[2]
-            vert[2] *= zscale
-        elif mode == 'LOCAL':
-            vert = v.co.xyz
-            vert[2] *= zscale
-            #vert[2] = (vert[2] - min_c[2] + (-0.5 + offset * 0.5) * bb[2]) * zscale
-        elif mode == 'GLOBAL':
-            vert = ob1.matrix_world @ v.co
-            vert[2] *= zscale
-            try:
-                for sk in me1.shape_keys.key_blocks:
-                    sk.data[v.index].co = ob1.matrix_world @ sk.data[v.index].co
-            except: pass
-        v.co = vert
+                    vert[:,2] = vert[:,2] + (-0.5 + offset * 0.5) * bb[2]
+        else:
+            vert = co.copy()
+        vert[:,2] *= zscale
+        return vert
+
+    # adaptive XY
+    if mode == 'GLOBAL':
+        matrix = np.array(ob1.matrix_world)
+        co = co @ matrix[:3,:3].T + matrix[:3,3]
+        try:
+            for sk in me1.shape_keys.key_blocks:
+                sk_co = np.empty(n_verts*3, dtype=np.float64)
+                sk.data.foreach_get('co', sk_co)
+                sk_co = sk_co.reshape((n_verts, 3)) @ matrix[:3,:3].T + matrix[:3,3]
+                sk.data.foreach_set('co', sk_co.reshape(-1))
+        except: pass
+    me1.vertices.foreach_set('co', adaptive_xy(co, True).reshape(-1))
 
     # ShapeKeys
     if bool_shapekeys and ob1.data.shape_keys:
         for sk in ob1.data.shape_keys.key_blocks:
-            source = sk.data
-            _sk_uv_quads = [0]*len(verts1)
-            _sk_uv = [0]*len(verts1)
-            for i, sk_v in enumerate(source):
-                if mode == 'BOUNDS':
-                    sk_vert = sk_v.co - min_c
-                    if use_origin_offset: sk_vert[2] = sk_v.co[2]
-                    sk_vert[0] = (sk_vert[0] / bb[0] if bb[0] != 0 else 0.5)
-                    sk_vert[1] = (sk_vert[1] / bb[1] if bb[1] != 0 else 0.5)
-                    if scale_mode == 'CONSTANT' or normals_mode in ('OBJECT', 'SHAPEKEYS'):
-                        if not use_origin_offset:
-                            sk_vert[2] = (sk_vert[2] / bb[2] if bb[2] != 0 else sk_vert[2])
-                            sk_vert[2] = sk_vert[2] - 0.5 + offset * 0.5
-                    else:
-                        if not use_origin_offset:
-                            sk_vert[2] = sk_vert[2] + (- 0.5 + offset * 0.5) * bb[2]
-                    sk_vert[2] *= zscale
-                elif mode == 'LOCAL':
-                    sk_vert = sk_v.co
-                    sk_vert[2] *= zscale
-                elif mode == 'GLOBAL':
-                    sk_vert = sk_v.co
-                    sk_vert[2] *= zscale
-                sk_v.co = sk_vert
+            sk_co = np.empty(len(sk.data)*3, dtype=np.float64)
+            sk.data.foreach_get('co', sk_co)
+            sk_co = sk_co.reshape((-1, 3))
+            if mode == 'BOUNDS':
+                sk_co = adaptive_xy(sk_co, False)
+            else:
+                sk_co[:,2] *= zscale
+            sk.data.foreach_set('co', sk_co.reshape(-1))
 
     if mode != 'BOUNDS' and (bounds_x != 'EXTEND' or bounds_y != 'EXTEND'):
         ob1.active_shape_key_index = 0
@@ -1544,8 +1638,13 @@ def bmesh_set_weight_numpy(bm, group_index, weight):
     return bm
 
 def set_weight_numpy(vg, weight):
-    for i, w in enumerate(weight):
-        vg.add([i], w, 'REPLACE')
+    # vertices with the same weight are added at once
+    weight = np.asarray(weight)
+    values, inverse = np.unique(weight, return_inverse=True)
+    order = np.argsort(inverse, kind='stable')
+    ids = np.split(order, np.cumsum(np.bincount(inverse.reshape(-1), minlength=len(values)))[:-1])
+    for w, i in zip(values.tolist(), ids):
+        vg.add(i.tolist(), w, 'REPLACE')
     return vg
 
 def uv_from_bmesh(bm, uv_index=None):
@@ -31,6 +31,7 @@ else:
         StringProperty,
         BoolProperty,
         FloatProperty,
+        IntProperty,
         EnumProperty,
         PointerProperty,
     )
@@ -91,6 +92,12 @@ class SceneProperties(PropertyGroup):
         min=0.0,
         max=10.0,
     )
+    error_limit: IntProperty(
+        name="Error Limit",
+        description="Stop the thickness check once this many faces are found (zero for no limit)",
+        default=0,
+        min=0,
+    )
     threshold_zero: FloatProperty(
         name="Threshold",
         description="Limit for checking zero area/length",
@@ -93,34 +93,29 @@ def bmesh_check_self_intersect_object(obj):
     return array.array('i', faces_error)
 
 
-def bmesh_face_points_random(f, num_points=1, margin=0.05):
-    import random
-    from random import uniform
+def bmesh_face_points_random(tris, num_points=1, margin=0.05):
+    """Random points on an (N, 3, 3) array of triangles, returns an (N, num_points, 3) array."""
+    import numpy as np
 
     # for pradictable results
-    random.seed(f.index)
+    rng = np.random.default_rng(0)
 
-    uniform_args = 0.0 + margin, 1.0 - margin
-    vecs = [v.co for v in f.verts]
+    u = rng.uniform(0.0 + margin, 1.0 - margin, (len(tris), num_points, 2))
+    flip = u.sum(axis=2) > 1.0
+    u[flip] = 1.0 - u[flip]
 
-    for _ in range(num_points):
-        u1 = uniform(*uniform_args)
-        u2 = uniform(*uniform_args)
-        u_tot = u1 + u2
+    side1 = tris[:, 1] - tris[:, 0]
+    side2 = tris[:, 2] - tris[:, 0]
 
-        if u_tot > 1.0:
-            u1 = 1.0 - u1
-            u2 = 1.0 - u2
+    return tris[:, np.newaxis, 0] + u[..., 0:1] * side1[:, np.newaxis] + u[..., 1:2] * side2[:, np.newaxis]
 
-        side1 = vecs[1] - vecs[0]
-        side2 = vecs[2] - vecs[0]
 
-        yield vecs[0] + u1 * side1 + u2 * side2
-
-
-def bmesh_check_thick_object(obj, thickness):
+def bmesh_check_thick_object(obj, thickness, error_limit=0):
+    """Check faces are at least thickness apart from the faces behind them,
+    stops once error_limit faces are found (unless zero), returns an array of face index values."""
     import array
-    import bpy
+    import numpy as np
+    from mathutils.bvhtree import BVHTree
 
     # Triangulate
     bm = bmesh_copy_from_object(obj, transform=True, triangulate=False)
@@ -130,55 +125,43 @@ def bmesh_check_thick_object(obj, thickness):
     ret = bmesh.ops.triangulate(bm, faces=bm.faces)
     face_map = ret["face_map"]
     del ret
-    # old edge -> new mapping
-
-    # Convert new/old map to index dict.
 
-    # Create a real mesh (lame!)
-    context = bpy.context
-    layer = context.view_layer
-    scene_collection = context.layer_collection.collection
+    # Index of the original face of each triangle,
+    # if the face wasn't triangulated, just use existing.
+    bm_faces_new = bm.faces[:]
+    faces_org_index = [face_index_map_org[face_map.get(f, f)] for f in bm_faces_new]
 
-    me_tmp = bpy.data.meshes.new(name="~temp~")
-    bm.to_mesh(me_tmp)
-    obj_tmp = bpy.data.objects.new(name=me_tmp.name, object_data=me_tmp)
-    scene_collection.objects.link(obj_tmp)
+    tris = np.array([[v.co[:] for v in f.verts] for f in bm_faces_new]).reshape(-1, 3, 3)
+    normals = np.array([f.normal[:] for f in bm_faces_new]).reshape(-1, 3)
 
-    layer.update()
-    ray_cast = obj_tmp.ray_cast
+    # Ray cast against a BVH tree of the triangles, rather than a temporary object linked to the scene.
+    tree = BVHTree.FromBMesh(bm)
+    ray_cast = tree.ray_cast
+    del bm_faces_new, face_index_map_org, face_map
+    bm.free()
 
     EPS_BIAS = 0.0001
 
-    faces_error = set()
-    bm_faces_new = bm.faces[:]
+    # Cast the rays backwards, from slightly behind sample points of each face.
+    points = bmesh_face_points_random(tris, num_points=6) - normals[:, np.newaxis] * EPS_BIAS
+    rays_dir = normals * (EPS_BIAS - thickness)
+    rays_len = np.linalg.norm(rays_dir, axis=1)
 
-    for f in bm_faces_new:
-        no = f.normal
-        no_sta = no * EPS_BIAS
-        no_end = no * thickness
-        for p in bmesh_face_points_random(f, num_points=6):
-            # Cast the ray backwards
-            p_a = p - no_sta
-            p_b = p - no_end
-            p_dir = p_b - p_a
+    faces_error = set()
 
-            ok, _co, no, index = ray_cast(p_a, p_dir, distance=p_dir.length)
+    for i, (p_dir, p_len, face_points) in enumerate(zip(rays_dir.tolist(), rays_len.tolist(), points.tolist())):
+        if p_len == 0.0:
+            continue
+        for p in face_points:
+            _co, _no, index, _dist = ray_cast(p, p_dir, p_len)
 
-            if ok:
+            if index is not None:
                 # Add the face we hit
-                for f_iter in (f, bm_faces_new[index]):
-                    # if the face wasn't triangulated, just use existing
-                    f_org = face_map.get(f_iter, f_iter)
-                    f_org_index = face_index_map_org[f_org]
-                    faces_error.add(f_org_index)
-
-    bm.free()
-
-    scene_collection.objects.unlink(obj_tmp)
-    bpy.data.objects.remove(obj_tmp)
-    bpy.data.meshes.remove(me_tmp)
+                faces_error.add(faces_org_index[i])
+                faces_error.add(faces_org_index[index])
 
-    layer.update()
+        if error_limit and len(faces_error) >= error_limit:
+            break
 
     return array.array('i', faces_error)
 
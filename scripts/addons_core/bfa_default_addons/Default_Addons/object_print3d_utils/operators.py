@@ -133,20 +133,41 @@ class MESH_OT_print3d_info_area(Operator):
 # Geometry Checks
 
 def execute_check(self, context):
-    obj = context.active_object
+    report.update(*check_objects(context, (self,)))
 
-    info = []
-    self.main_check(obj, info)
-    report.update(*info)
+    return {'FINISHED'}
 
-    multiple_obj_warning(self, context)
 
-    return {'FINISHED'}
+def check_objects(context, checks):
+    """
+    Run the checks on the active object, then on the other selected meshes.
+    With several objects, results are prefixed with the object name
+    and only those of the active object can be selected.
+    """
+    obj_act = context.active_object
+    objects = [obj_act] + [obj for obj in context.selected_objects if obj.type == 'MESH' and obj != obj_act]
+
+    wm = context.window_manager
+    wm.progress_begin(0, len(objects) * len(checks))
+
+    info = []
+    for i, obj in enumerate(objects):
+        info_obj = []
+        for j, check in enumerate(checks):
+            check.main_check(obj, info_obj)
+            wm.progress_update(i * len(checks) + j + 1)
+
+        if len(objects) == 1:
+            info.extend(info_obj)
+        else:
+            info.extend(
+                ("{}: {}".format(obj.name, text), data if obj == obj_act else ())
+                for text, data in info_obj
+            )
 
+    wm.progress_end()
 
-def multiple_obj_warning(self, context):
-    if len(context.selected_objects) > 1:
-        self.report({"INFO"}, "Multiple selected objects. Only the active one will be evaluated")
+    return info
 
 
 class MESH_OT_print3d_check_solid(Operator):
@@ -272,7 +293,7 @@ class MESH_OT_print3d_check_thick(Operator):
         scene = bpy.context.scene
         print_3d = scene.print_3d
 
-        faces_error = mesh_helpers.bmesh_check_thick_object(obj, print_3d.thickness_min)
+        faces_error = mesh_helpers.bmesh_check_thick_object(obj, print_3d.thickness_min, print_3d.error_limit)
         info.append((tip_("Thin Faces: {}").format(len(faces_error)), (bmesh.types.BMFace, faces_error)))
 
     def execute(self, context):
@@ -360,15 +381,7 @@ class MESH_OT_print3d_check_all(Operator):
     )
 
     def execute(self, context):
-        obj = context.active_object
-
-        info = []
-        for cls in self.check_cls:
-            cls.main_check(obj, info)
-
-        report.update(*info)
-
-        multiple_obj_warning(self, context)
+        report.update(*check_objects(context, self.check_cls))
 
         return {'FINISHED'}
 
@@ -74,6 +74,7 @@ class VIEW3D_PT_print3d_analyze(View3DPrintPanel, Panel):
         row = col.row(align=True)
         row.operator("mesh.print3d_check_thick", text="Thickness")
         row.prop(print_3d, "thickness_min", text="")
+        row.prop(print_3d, "error_limit", text="Limit")
         row = col.row(align=True)
         row.operator("mesh.print3d_check_sharp", text="Edge Sharp")
         row.prop(print_3d, "angle_sharp", text="")
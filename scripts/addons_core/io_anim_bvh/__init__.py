@@ -264,6 +264,14 @@ class ExportBVH(bpy.types.Operator, ExportHelper):
         description="Only write out translation channels for the root bone",
         default=False,
     )
+    use_batch: BoolProperty(
+        name="Batch Evaluation",
+        description=(
+            "Read the pose of all frames at once and write the motion in one go, "
+            "rigs without constraints, drivers or NLA are evaluated from their action without updating the scene"
+        ),
+        default=False,
+    )
 
     @classmethod
     def poll(cls, context):
@@ -355,6 +363,8 @@ class BVH_PT_export_animation(bpy.types.Panel):
         col.prop(operator, "frame_start", text="Frame Start")
         col.prop(operator, "frame_end", text="End")
 
+        layout.prop(operator, "use_batch")
+
 
 def menu_func_import(self, context):
     self.layout.operator(ImportBVH.bl_idname, text="Motion Capture (.bvh)", icon='LOAD_BVH') # BFA - Icon Added
@@ -4,6 +4,178 @@
 
 import bpy
 
+import numpy as np
+
+KEYFRAME_INTERPOLATION_CONSTANT = bpy.types.Keyframe.bl_rna.properties['interpolation'].enum_items['CONSTANT'].value
+KEYFRAME_INTERPOLATION_LINEAR = bpy.types.Keyframe.bl_rna.properties['interpolation'].enum_items['LINEAR'].value
+
+
+def _pose_matrices_from_depsgraph(scene, obj, frames):
+    """
+    Evaluate the scene for each frame, reading all pose bone matrices at once.
+
+    :return: A (frames, bones, 4, 4) array of pose-space matrices, bones in ``obj.pose.bones`` order.
+    """
+    pose_bones = obj.pose.bones
+    pose_mats = np.empty((len(frames), len(pose_bones) * 16), dtype=np.float32)
+    for frame_i, frame in enumerate(frames):
+        scene.frame_set(frame)
+        pose_bones.foreach_get("matrix", pose_mats[frame_i])
+    # Matrices are accessed in column major order.
+    return pose_mats.reshape(len(frames), len(pose_bones), 4, 4).transpose(0, 1, 3, 2).astype(np.float64)
+
+
+def _quaternion_to_matrix_array(quat):
+    """
+    Convert (N, 4) quaternions (WXYZ, normalized here) to (N, 3, 3) rotation matrices.
+    """
+    quat_len = np.linalg.norm(quat, axis=1)
+    quat = np.where(quat_len[:, np.newaxis] > 0.0, quat / np.maximum(quat_len, 1e-12)[:, np.newaxis], (1, 0, 0, 0))
+    w, x, y, z = quat.T
+    mat = np.empty((len(quat), 3, 3))
+    mat[:, 0, 0] = 1.0 - 2.0 * (y * y + z * z)
+    mat[:, 0, 1] = 2.0 * (x * y - w * z)
+    mat[:, 0, 2] = 2.0 * (x * z + w * y)
+    mat[:, 1, 0] = 2.0 * (x * y + w * z)
+    mat[:, 1, 1] = 1.0 - 2.0 * (x * x + z * z)
+    mat[:, 1, 2] = 2.0 * (y * z - w * x)
+    mat[:, 2, 0] = 2.0 * (x * z - w * y)
+    mat[:, 2, 1] = 2.0 * (y * z + w * x)
+    mat[:, 2, 2] = 1.0 - 2.0 * (x * x + y * y)
+    return mat
+
+
+def _axis_angle_to_matrix_array(axis_angle):
+    """
+    Convert (N, 4) axis angles (angle, X, Y, Z) to (N, 3, 3) rotation matrices.
+    """
+    angle = axis_angle[:, 0]
+    axis_len = np.linalg.norm(axis_angle[:, 1:], axis=1)
+    # A zero length axis is no rotation.
+    half_sin = np.where(axis_len > 0.0, np.sin(angle / 2.0) / np.maximum(axis_len, 1e-12), 0.0)
+    quat = np.empty((len(axis_angle), 4))
+    quat[:, 0] = np.where(axis_len > 0.0, np.cos(angle / 2.0), 1.0)
+    quat[:, 1:] = axis_angle[:, 1:] * half_sin[:, np.newaxis]
+    return _quaternion_to_matrix_array(quat)
+
+
+def _fcurve_evaluate_array(fcu, frames):
+    """
+    Evaluate an F-curve at all ``frames`` (an array) at once.
+
+    Curves with only linear or constant keys, constant extrapolation and no modifiers (such as imported motion)
+    are interpolated with array operations, others fall back to :meth:`bpy.types.FCurve.evaluate` for each frame.
+    """
+    keyframe_points = fcu.keyframe_points
+    num_keys = len(keyframe_points)
+    if num_keys == 0 or fcu.modifiers or fcu.extrapolation != 'CONSTANT':
+        return [fcu.evaluate(frame) for frame in frames]
+
+    interpolation = np.empty(num_keys, dtype=np.ubyte)
+    keyframe_points.foreach_get("interpolation", interpolation)
+    # The interpolation of the last key is never used.
+    interpolation = interpolation[:-1]
+    use_linear = interpolation == KEYFRAME_INTERPOLATION_LINEAR
+    use_constant = interpolation == KEYFRAME_INTERPOLATION_CONSTANT
+    if not np.all(use_linear | use_constant):
+        return [fcu.evaluate(frame) for frame in frames]
+
+    co = np.empty(num_keys * 2, dtype=np.float32)
+    keyframe_points.foreach_get("co", co)
+    key_time = co[0::2].astype(np.float64)
+    key_value = co[1::2].astype(np.float64)
+
+    values = np.interp(frames, key_time, key_value)
+    if np.any(use_constant):
+        # Hold the value of the key before each frame for constant segments.
+        key_index = np.clip(np.searchsorted(key_time, frames, side='right') - 1, 0, num_keys - 1)
+        segment_index = np.minimum(key_index, num_keys - 2)
+        hold = (key_index < num_keys - 1) & use_constant[segment_index]
+        values[hold] = key_value[key_index[hold]]
+    return values
+
+
+def _pose_matrices_from_fcurves(obj, frames):
+    """
+    Evaluate the armature's action directly (without updating the scene) for each frame.
+
+    :return: A (frames, bones, 4, 4) array of pose-space matrices, bones in ``obj.pose.bones`` order
+       or None when the pose depends on more than the action (constraints, drivers, NLA, custom bone inheritance).
+    """
+    from bpy_extras import anim_utils
+    from .import_bvh import euler_to_matrix_array
+
+    adt = obj.animation_data
+    if adt is not None:
+        if adt.drivers or adt.use_tweak_mode or adt.action_influence != 1.0:
+            return None
+        if any((not track.mute) and track.strips for track in adt.nla_tracks):
+            return None
+    if obj.data.animation_data is not None:
+        return None
+
+    pose_bones = obj.pose.bones
+    for pose_bone in pose_bones:
+        bone = pose_bone.bone
+        if pose_bone.constraints:
+            return None
+        if not (bone.use_inherit_rotation and bone.inherit_scale == 'FULL' and bone.use_local_location):
+            return None
+        if bone.use_relative_parent:
+            return None
+
+    fcurves = {}
+    if adt is not None:
+        channelbag = anim_utils.action_get_channelbag_for_slot(adt.action, adt.action_slot)
+        if channelbag is not None:
+            fcurves = {(fcu.data_path, fcu.array_index): fcu for fcu in channelbag.fcurves if not fcu.mute}
+
+    frames_array = np.array(frames, dtype=np.float64)
+
+    def channel_values(pose_bone, prop_name):
+        value_default = getattr(pose_bone, prop_name)
+        data_path = pose_bone.path_from_id(prop_name)
+        values = np.empty((len(frames), len(value_default)))
+        for index, value in enumerate(value_default):
+            fcu = fcurves.get((data_path, index))
+            if fcu is None:
+                # Channels that aren't animated keep their value.
+                values[:, index] = value
+            else:
+                values[:, index] = _fcurve_evaluate_array(fcu, frames_array)
+        return values
+
+    pose_mats = np.empty((len(frames), len(pose_bones), 4, 4))
+    pose_bone_index = {}
+    for pose_bone in pose_bones:
+        matrix_basis = np.zeros((len(frames), 4, 4))
+        rotation_mode = pose_bone.rotation_mode
+        if rotation_mode == 'QUATERNION':
+            matrix_basis[:, :3, :3] = _quaternion_to_matrix_array(channel_values(pose_bone, "rotation_quaternion"))
+        elif rotation_mode == 'AXIS_ANGLE':
+            matrix_basis[:, :3, :3] = _axis_angle_to_matrix_array(channel_values(pose_bone, "rotation_axis_angle"))
+        else:
+            matrix_basis[:, :3, :3] = euler_to_matrix_array(channel_values(pose_bone, "rotation_euler"), rotation_mode)
+        matrix_basis[:, :3, :3] *= channel_values(pose_bone, "scale")[:, np.newaxis, :]
+        matrix_basis[:, :3, 3] = channel_values(pose_bone, "location")
+        matrix_basis[:, 3, 3] = 1.0
+
+        bone = pose_bone.bone
+        rest_arm_mat = np.array(bone.matrix_local)
+        # Parents are always ordered before their children.
+        parent = bone.parent
+        if parent is None:
+            pose_mat = rest_arm_mat @ matrix_basis
+        else:
+            parent_index = pose_bone_index[parent.name]
+            pose_mat = pose_mats[:, parent_index] @ (np.linalg.inv(np.array(parent.matrix_local)) @ rest_arm_mat)
+            pose_mat = pose_mat @ matrix_basis
+
+        pose_bone_index[pose_bone.name] = len(pose_bone_index)
+        pose_mats[:, pose_bone_index[pose_bone.name]] = pose_mat
+
+    return pose_mats
+
 
 def write_armature(
         context,
@@ -13,6 +185,7 @@ def write_armature(
         global_scale=1.0,
         rotate_mode='NATIVE',
         root_transform_only=False,
+        use_batch=False,
 ):
 
     def ensure_rot_order(rot_order_str):
@@ -230,7 +403,13 @@ def write_armature(
     file.write("Frames: %d\n" % (frame_end - frame_start + 1))
     file.write("Frame Time: %.6f\n" % (1.0 / (scene.render.fps / scene.render.fps_base)))
 
-    for frame in range(frame_start, frame_end + 1):
+    if use_batch:
+        _write_motion_batch(file, scene, obj, bones_decorated, frame_start, frame_end, global_scale)
+        frame_range = ()
+    else:
+        frame_range = range(frame_start, frame_end + 1)
+
+    for frame in frame_range:
         scene.frame_set(frame)
 
         for dbone in bones_decorated:
@@ -274,6 +453,52 @@ def write_armature(
     print("BVH Exported: %s frames:%d\n" % (filepath, frame_end - frame_start + 1))
 
 
+def _write_motion_batch(file, scene, obj, bones_decorated, frame_start, frame_end, global_scale):
+    """
+    Write the motion of all frames at once, reading the pose of every frame into arrays first
+    and converting them to BVH channels with array operations.
+    """
+    from .import_bvh import matrix_to_compatible_euler_array
+
+    frames = range(frame_start, frame_end + 1)
+    pose_mats = _pose_matrices_from_fcurves(obj, frames)
+    if pose_mats is None:
+        pose_mats = _pose_matrices_from_depsgraph(scene, obj, frames)
+
+    pose_bone_index = {pose_bone.name: i for i, pose_bone in enumerate(obj.pose.bones)}
+
+    motion_channels = []
+    for dbone in bones_decorated:
+        head_local = np.array(dbone.rest_bone.head_local)
+        pose_mat = pose_mats[:, pose_bone_index[dbone.name]]
+
+        if dbone.parent:
+            parent_pose_imat = np.linalg.inv(pose_mats[:, pose_bone_index[dbone.parent.name]])
+            mat_final = np.array(dbone.parent.rest_arm_mat) @ parent_pose_imat @ pose_mat
+            loc_offset = head_local - np.array(dbone.parent.rest_bone.head_local)
+        else:
+            mat_final = pose_mat
+            loc_offset = np.array(dbone.rest_bone.head)
+        mat_final = mat_final @ np.array(dbone.rest_arm_imat)
+
+        if not dbone.skip_position:
+            # Same as the translation of: `Matrix.Translation(-head_local) @ mat_final @ Matrix.Translation(head_local)`.
+            loc = (mat_final[:, :3, :3] @ head_local) + mat_final[:, :3, 3] - head_local + loc_offset
+            motion_channels.append(loc * global_scale)
+
+        # Normalize the columns (removing scale), as `Matrix.to_euler` does.
+        rot_mat = mat_final[:, :3, :3]
+        rot_mat = rot_mat / np.linalg.norm(rot_mat, axis=1)[:, np.newaxis, :]
+        # Keep eulers compatible, no jumping on interpolation.
+        rot = matrix_to_compatible_euler_array(rot_mat, dbone.rot_order_str_reverse, np.zeros(3))
+        motion_channels.append(np.degrees(rot[:, dbone.rot_order]))
+
+    if motion_channels:
+        np.savetxt(file, np.hstack(motion_channels), fmt="%.6f", delimiter=" ")
+    else:
+        file.write("\n" * len(frames))
+
+
 def save(
         context, filepath="",
         frame_start=-1,
@@ -281,6 +506,7 @@ def save(
         global_scale=1.0,
         rotate_mode="NATIVE",
         root_transform_only=False,
+        use_batch=False,
 ):
     write_armature(
         context, filepath,
@@ -289,6 +515,7 @@ def save(
         global_scale=global_scale,
         rotate_mode=rotate_mode,
         root_transform_only=root_transform_only,
+        use_batch=use_batch,
     )
 
     return {'FINISHED'}
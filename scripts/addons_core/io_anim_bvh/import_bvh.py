@@ -2,11 +2,25 @@
 #
 # SPDX-License-Identifier: GPL-2.0-or-later
 
-from math import radians, ceil
+from math import ceil, floor, pi
 
 import bpy
 from bpy.app.translations import pgettext_tip as tip_
-from mathutils import Vector, Euler, Matrix
+from mathutils import Vector, Matrix
+
+import numpy as np
+
+LINEAR_INTERPOLATION_VALUE = bpy.types.Keyframe.bl_rna.properties['interpolation'].enum_items['LINEAR'].value
+
+# Axis indices and parity of each euler rotation order, matching `rotOrders` in Blender's `math_rotation.cc`.
+EULER_ORDER_INFO = {
+    'XYZ': ((0, 1, 2), False),
+    'XZY': ((0, 2, 1), True),
+    'YXZ': ((1, 0, 2), True),
+    'YZX': ((1, 2, 0), False),
+    'ZXY': ((2, 0, 1), False),
+    'ZYX': ((2, 1, 0), True),
+}
 
 
 class BVH_Node:
@@ -34,7 +48,7 @@ class BVH_Node:
         'rot_order',
         # Same as above but a string 'XYZ' format..
         'rot_order_str',
-        # A list one tuple's one for each frame: (locx, locy, locz, rotx, roty, rotz),
+        # A (frames, 6) array, one row for each frame: (locx, locy, locz, rotx, roty, rotz),
         # euler rotation ALWAYS stored xyz order, even when native used.
         'anim_data',
         # Convenience function, bool, same as: (channels[0] != -1 or channels[1] != -1 or channels[2] != -1).
@@ -75,9 +89,9 @@ class BVH_Node:
 
         self.children = []
 
-        # List of 6 length tuples: (lx, ly, lz, rx, ry, rz)
+        # Rows of: (lx, ly, lz, rx, ry, rz)
         # even if the channels aren't used they will just be zero.
-        self.anim_data = [(0, 0, 0, 0, 0, 0)]
+        self.anim_data = np.zeros((1, 6))
 
     def __repr__(self):
         return (
@@ -95,16 +109,68 @@ def sorted_nodes(bvh_nodes):
     return bvh_nodes_list
 
 
+def _split_motion_text(file_text):
+    """
+    Split the file into the hierarchy lines (including the ``MOTION`` header lines)
+    and the text of the motion data, which is parsed separately as one array.
+    """
+    import re
+
+    # Non standard carriage returns?
+    if '\r' in file_text:
+        file_text = file_text.replace('\r\n', '\n').replace('\r', '\n')
+
+    motion_match = re.search(r"^[ \t]*motion[ \t]*$", file_text, flags=re.IGNORECASE | re.MULTILINE)
+    if motion_match is None:
+        return file_text.split('\n'), ""
+
+    header_lines = file_text[:motion_match.end()].split('\n')
+    # The frame count & frame time lines follow, (always skipped, even when they're missing).
+    offset = motion_match.end()
+    header_extra = 0
+    while header_extra < 2:
+        offset_next = file_text.find('\n', offset + 1)
+        if offset_next == -1:
+            offset_next = len(file_text)
+        line = file_text[offset:offset_next]
+        offset = offset_next
+        if line.strip():
+            header_lines.append(line.strip())
+            header_extra += 1
+        if offset_next == len(file_text):
+            break
+
+    return header_lines, file_text[offset:]
+
+
+def _read_motion_array(motion_text, channel_total):
+    """
+    Parse the motion data into a (frames, channels) array.
+    """
+    if channel_total == 0:
+        return np.zeros((0, 0))
+
+    motion = np.fromstring(motion_text, dtype=np.float64, sep=' ')
+    if len(motion) % channel_total == 0:
+        return motion.reshape(-1, channel_total)
+
+    # Some lines have trailing values (or the text contains values that couldn't be parsed),
+    # fall back to reading line by line, ignoring values past the last channel.
+    return np.array(
+        [words[:channel_total] for words in (l.split() for l in motion_text.split('\n')) if words],
+        dtype=np.float64,
+    )
+
+
 def read_bvh(context, file_path, rotate_mode='XYZ', global_scale=1.0):
     # File loading stuff
     # Open the file for importing
-    file = open(file_path, 'r')
+    with open(file_path, 'r') as file:
+        file_text = file.read()
 
-    # Separate into a list of lists, each line a list of words.
-    file_lines = file.readlines()
-    # Non standard carriage returns?
-    if len(file_lines) == 1:
-        file_lines = file_lines[0].split('\r')
+    # Only the hierarchy is split into words, the motion is parsed as a single block of numbers.
+    file_lines, motion_text = _split_motion_text(file_text)
+    del file_text
 
     # Split by whitespace.
     file_lines = [ll for ll in [l.split() for l in file_lines] if ll]
@@ -266,31 +332,20 @@ def read_bvh(context, file_path, rotate_mode='XYZ', global_scale=1.0):
     # second life expects it, which isn't to spec.
     bvh_nodes_list = sorted_nodes(bvh_nodes)
 
-    while lineIdx < len(file_lines):
-        line = file_lines[lineIdx]
-        for bvh_node in bvh_nodes_list:
-            # for bvh_node in bvh_nodes_serial:
-            lx = ly = lz = rx = ry = rz = 0.0
-            channels = bvh_node.channels
-            anim_data = bvh_node.anim_data
-            if channels[0] != -1:
-                lx = global_scale * float(line[channels[0]])
-
-            if channels[1] != -1:
-                ly = global_scale * float(line[channels[1]])
-
-            if channels[2] != -1:
-                lz = global_scale * float(line[channels[2]])
-
-            if channels[3] != -1 or channels[4] != -1 or channels[5] != -1:
+    motion = _read_motion_array(motion_text, channelIndex + 1)
+    del motion_text
 
-                rx = radians(float(line[channels[3]]))
-                ry = radians(float(line[channels[4]]))
-                rz = radians(float(line[channels[5]]))
+    for bvh_node in bvh_nodes_list:
+        channels = bvh_node.channels
+        # The first row is the rest pose.
+        anim_data = bvh_node.anim_data = np.zeros((len(motion) + 1, 6))
+        for axis_i in range(3):
+            if channels[axis_i] != -1:
+                anim_data[1:, axis_i] = motion[:, channels[axis_i]] * global_scale
 
-            # Done importing motion data #
-            anim_data.append((lx, ly, lz, rx, ry, rz))
-        lineIdx += 1
+        if bvh_node.has_rot:
+            # NOTE: unused rotation channels are -1, which reads the last channel of the line.
+            anim_data[1:, 3:] = np.radians(motion[:, channels[3:]])
 
     # Assign children
     for bvh_node in bvh_nodes_list:
@@ -333,6 +388,146 @@ def read_bvh(context, file_path, rotate_mode='XYZ', global_scale=1.0):
     return bvh_nodes, bvh_frame_time, bvh_frame_count
 
 
+def euler_to_matrix_array(eul, order):
+    """
+    Convert (N, 3) euler angles (stored XYZ) to (N, 3, 3) rotation matrices,
+    the rotation ``order`` matches :class:`mathutils.Euler`.
+    """
+    cos = np.cos(eul)
+    sin = np.sin(eul)
+    mat = np.broadcast_to(np.identity(3), (len(eul), 3, 3)).copy()
+    for axis in order:
+        axis_i = 'XYZ'.index(axis)
+        i, j = (axis_i + 1) % 3, (axis_i + 2) % 3
+        mat_axis = np.zeros_like(mat)
+        mat_axis[:, axis_i, axis_i] = 1.0
+        mat_axis[:, i, i] = cos[:, axis_i]
+        mat_axis[:, i, j] = -sin[:, axis_i]
+        mat_axis[:, j, i] = sin[:, axis_i]
+        mat_axis[:, j, j] = cos[:, axis_i]
+        mat = mat_axis @ mat
+    return mat
+
+
+def matrix_to_quaternion_array(mat):
+    """
+    Convert (N, 3, 3) rotation matrices to (N, 4) quaternions (WXYZ) with a non-negative W,
+    matching :meth:`mathutils.Matrix.to_quaternion`.
+    """
+    m00, m11, m22 = mat[:, 0, 0], mat[:, 1, 1], mat[:, 2, 2]
+    # Sums and differences of the off-diagonal elements, giving 4 times the product of two components.
+    wx, wy, wz = mat[:, 2, 1] - mat[:, 1, 2], mat[:, 0, 2] - mat[:, 2, 0], mat[:, 1, 0] - mat[:, 0, 1]
+    xy, xz, yz = mat[:, 0, 1] + mat[:, 1, 0], mat[:, 0, 2] + mat[:, 2, 0], mat[:, 1, 2] + mat[:, 2, 1]
+
+    # Each row holds 4 times the squares of W, X, Y & Z, solve for the largest one, as the others are divided by it.
+    quat_sq = np.stack((
+        1.0 + m00 + m11 + m22,
+        1.0 + m00 - m11 - m22,
+        1.0 - m00 + m11 - m22,
+        1.0 - m00 - m11 + m22,
+    ), axis=1)
+    quat_products = np.stack((
+        np.stack((quat_sq[:, 0], wx, wy, wz), axis=1),
+        np.stack((wx, quat_sq[:, 1], xy, xz), axis=1),
+        np.stack((wy, xy, quat_sq[:, 2], yz), axis=1),
+        np.stack((wz, xz, yz, quat_sq[:, 3]), axis=1),
+    ), axis=1)
+
+    frame_range = np.arange(len(mat))
+    largest = np.argmax(quat_sq, axis=1)
+    quat = quat_products[frame_range, largest] / (2.0 * np.sqrt(quat_sq[frame_range, largest]))[:, np.newaxis]
+
+    quat[quat[:, 0] < 0.0] *= -1.0
+    quat /= np.linalg.norm(quat, axis=1)[:, np.newaxis]
+    return quat
+
+
+def matrix_to_compatible_euler_array(mat, order, eul_start):
+    """
+    Convert (N, 3, 3) rotation matrices to (N, 3) euler angles, where each euler is compatible with the previous one,
+    matching :meth:`mathutils.Matrix.to_euler` being passed the previous result (starting with ``eul_start``).
+    """
+    (i, j, k), parity = EULER_ORDER_INFO[order]
+
+    # Blender's matrices are column major, this matches `mat[a][b]` as used by `mat3_normalized_to_eulo2`.
+    def m(a, b):
+        return mat[:, b, a]
+
+    cy = np.hypot(m(i, i), m(i, j))
+    eul1 = np.empty((len(mat), 3))
+    eul2 = np.empty((len(mat), 3))
+    eul1[:, i] = np.arctan2(m(j, k), m(k, k))
+    eul1[:, j] = np.arctan2(-m(i, k), cy)
+    eul1[:, k] = np.arctan2(m(i, j), m(i, i))
+    eul2[:, i] = np.arctan2(-m(j, k), -m(k, k))
+    eul2[:, j] = np.arctan2(-m(i, k), -cy)
+    eul2[:, k] = np.arctan2(-m(i, j), -m(i, i))
+
+    # Gimbal lock, both solutions are the same.
+    degenerate = cy <= 16.0 * np.finfo(np.float32).eps
+    if np.any(degenerate):
+        eul1[degenerate, i] = np.arctan2(-m(k, j), m(j, j))[degenerate]
+        eul1[degenerate, k] = 0.0
+        eul2[degenerate] = eul1[degenerate]
+
+    if parity:
+        eul1 = -eul1
+        eul2 = -eul2
+
+    # Each frame picks the solution closest to the previous frame's result, which depends on the choice made for the
+    # previous frame, so this is a sequential pass (as done by `mat3_normalized_to_compatible_eulO`).
+    # Plain floats are faster than NumPy for such small per-frame operations.
+    pi_x2 = 2.0 * pi
+    eul = np.empty((len(mat), 3))
+    eul_prev = [float(value) for value in eul_start]
+    for frame_i, (eul1_frame, eul2_frame) in enumerate(zip(eul1.tolist(), eul2.tolist())):
+        eul1_compat = _euler_compatible(eul1_frame, eul_prev, pi_x2)
+        eul2_compat = _euler_compatible(eul2_frame, eul_prev, pi_x2)
+        d1 = sum(abs(a - b) for a, b in zip(eul1_compat, eul_prev))
+        d2 = sum(abs(a - b) for a, b in zip(eul2_compat, eul_prev))
+        eul_prev = eul2_compat if d1 > d2 else eul1_compat
+        eul[frame_i] = eul_prev
+    return eul
+
+
+def _euler_compatible(eul, eul_prev, pi_x2):
+    """
+    Wrap each angle by multiples of 360 degrees to be closest to the previous euler, as ``compatible_eul`` does.
+    """
+    eul_compat = []
+    for value, value_prev in zip(eul, eul_prev):
+        delta = value - value_prev
+        if delta > pi:
+            value -= floor(delta / pi_x2 + 0.5) * pi_x2
+        elif delta < -pi:
+            value += floor(-delta / pi_x2 + 0.5) * pi_x2
+        eul_compat.append(value)
+    return eul_compat
+
+
+def _fcurves_keyframes_set(action, data_path, group_name, time, values):
+    """
+    Create an F-curve for each column of ``values`` and fill in its linear keyframes in bulk.
+    """
+    num_keys = len(time)
+    # The keyframe_points 'co' are accessed as flattened pairs of (time, value).
+    keyframe_points_co = np.empty(num_keys * 2, dtype=np.single)
+    keyframe_points_co[0::2] = time
+    interpolation_array = np.full(num_keys, LINEAR_INTERPOLATION_VALUE, dtype=np.ubyte)
+
+    for axis_i in range(values.shape[1]):
+        curve = action.fcurves.new(data_path=data_path, index=axis_i, action_group=group_name)
+        keyframe_points_co[1::2] = values[:, axis_i]
+
+        keyframe_points = curve.keyframe_points
+        keyframe_points.add(num_keys)
+        keyframe_points.foreach_set("co", keyframe_points_co)
+        keyframe_points.foreach_set("interpolation", interpolation_array)
+
+        # There's no need to do curve.update() because the keys are already ordered, have
+        # no duplicates and all handles are Linear.
+
+
 def bvh_node_dict2objects(context, bvh_name, bvh_nodes, rotate_mode='NATIVE', frame_start=1, IMPORT_LOOP=False):
 
     if frame_start < 1:
@@ -550,97 +745,49 @@ def bvh_node_dict2armature(
         num_frame = num_frame - skip_frame
 
     # Create a shared time axis for all animation curves.
-    time = [float(frame_start)] * num_frame
+    time = np.arange(num_frame, dtype=np.float64)
     if use_fps_scale:
-        dt = scene.render.fps * bvh_frame_time
-        for frame_i in range(1, num_frame):
-            time[frame_i] += float(frame_i) * dt
-    else:
-        for frame_i in range(1, num_frame):
-            time[frame_i] += float(frame_i)
+        time *= scene.render.fps * bvh_frame_time
+    time += float(frame_start)
 
     # print("bvh_frame_time = %f, dt = %f, num_frame = %d"
     #      % (bvh_frame_time, dt, num_frame]))
 
     for i, bvh_node in enumerate(bvh_nodes_list):
         pose_bone, bone, bone_rest_matrix, bone_rest_matrix_inv = bvh_node.temp
+        anim_data = bvh_node.anim_data[skip_frame:skip_frame + num_frame]
+        bone_rest_matrix = np.array(bone_rest_matrix.to_3x3())
+        bone_rest_matrix_inv = np.array(bone_rest_matrix_inv.to_3x3())
 
         if bvh_node.has_loc:
             # Not sure if there is a way to query this or access it in the
             # PoseBone structure.
             data_path = 'pose.bones["%s"].location' % escape_identifier(pose_bone.name)
 
-            location = [(0.0, 0.0, 0.0)] * num_frame
-            for frame_i in range(num_frame):
-                bvh_loc = bvh_node.anim_data[frame_i + skip_frame][:3]
-
-                bone_translate_matrix = Matrix.Translation(
-                    Vector(bvh_loc) - bvh_node.rest_head_local)
-                location[frame_i] = (bone_rest_matrix_inv @
-                                     bone_translate_matrix).to_translation()
+            location = (anim_data[:, :3] - np.array(bvh_node.rest_head_local)) @ bone_rest_matrix_inv.T
 
             # For each location x, y, z.
-            for axis_i in range(3):
-                curve = action.fcurves.new(data_path=data_path, index=axis_i, action_group=bvh_node.name)
-                keyframe_points = curve.keyframe_points
-                keyframe_points.add(num_frame)
-
-                for frame_i in range(num_frame):
-                    keyframe_points[frame_i].co = (
-                        time[frame_i],
-                        location[frame_i][axis_i],
-                    )
+            _fcurves_keyframes_set(action, data_path, bvh_node.name, time, location)
 
         if bvh_node.has_rot:
-            data_path = None
-            rotate = None
+            # Apply rotation order and convert to XYZ
+            # note that the rot_order_str is reversed.
+            bone_rotation_matrix = euler_to_matrix_array(anim_data[:, 3:], bvh_node.rot_order_str[::-1])
+            bone_rotation_matrix = bone_rest_matrix_inv @ bone_rotation_matrix @ bone_rest_matrix
 
             if 'QUATERNION' == rotate_mode:
-                rotate = [(1.0, 0.0, 0.0, 0.0)] * num_frame
+                rotate = matrix_to_quaternion_array(bone_rotation_matrix)
                 data_path = ('pose.bones["%s"].rotation_quaternion' % escape_identifier(pose_bone.name))
             else:
-                rotate = [(0.0, 0.0, 0.0)] * num_frame
+                rotate = matrix_to_compatible_euler_array(
+                    bone_rotation_matrix, pose_bone.rotation_mode, np.zeros(3))
                 data_path = ('pose.bones["%s"].rotation_euler' % escape_identifier(pose_bone.name))
 
-            prev_euler = Euler((0.0, 0.0, 0.0))
-            for frame_i in range(num_frame):
-                bvh_rot = bvh_node.anim_data[frame_i + skip_frame][3:]
-
-                # apply rotation order and convert to XYZ
-                # note that the rot_order_str is reversed.
-                euler = Euler(bvh_rot, bvh_node.rot_order_str[::-1])
-                bone_rotation_matrix = euler.to_matrix().to_4x4()
-                bone_rotation_matrix = (
-                    bone_rest_matrix_inv @
-                    bone_rotation_matrix @
-                    bone_rest_matrix
-                )
-
-                if len(rotate[frame_i]) == 4:
-                    rotate[frame_i] = bone_rotation_matrix.to_quaternion()
-                else:
-                    rotate[frame_i] = bone_rotation_matrix.to_euler(
-                        pose_bone.rotation_mode, prev_euler)
-                    prev_euler = rotate[frame_i]
-
             # For each euler angle x, y, z (or quaternion w, x, y, z).
-            for axis_i in range(len(rotate[0])):
-                curve = action.fcurves.new(data_path=data_path, index=axis_i, action_group=bvh_node.name)
-                keyframe_points = curve.keyframe_points
-                keyframe_points.add(num_frame)
-
-                for frame_i in range(num_frame):
-                    keyframe_points[frame_i].co = (
-                        time[frame_i],
-                        rotate[frame_i][axis_i],
-                    )
-
-    for cu in action.fcurves:
-        if IMPORT_LOOP:
-            pass  # 2.5 doenst have cyclic now?
-
-        for bez in cu.keyframe_points:
-            bez.interpolation = 'LINEAR'
+            _fcurves_keyframes_set(action, data_path, bvh_node.name, time, rotate)
+
+    if IMPORT_LOOP:
+        pass  # 2.5 doenst have cyclic now?
 
     # finally apply matrix
     arm_ob.matrix_world = global_matrix
@@ -26,6 +26,7 @@ if "bpy" in locals():
 import os
 import bpy
 from bpy.props import (
+    BoolProperty,
     StringProperty,
     CollectionProperty
 )
@@ -50,6 +51,14 @@ class ImportSVG(bpy.types.Operator, ImportHelper):
         type=bpy.types.OperatorFileListElement,
     )
 
+    use_streaming: BoolProperty(
+        name="Stream File",
+        description="Create curves while reading the file instead of loading the whole document first, "
+        "to reduce memory usage of very large files. "
+        "Elements used before they are defined are created last",
+        default=False,
+    )
+
     def invoke(self, context, event):
         if self.properties.is_property_set("filepath"):
             return self.execute(context)
@@ -63,11 +72,11 @@ class ImportSVG(bpy.types.Operator, ImportHelper):
             ret = {'CANCELLED'}
             for file in self.files:
                 path = os.path.join(self.directory, file.name)
-                if import_svg.load(self, context, filepath=path) == {'FINISHED'}:
+                if import_svg.load(self, context, filepath=path, use_streaming=self.use_streaming) == {'FINISHED'}:
                     ret = {'FINISHED'}
             return ret
         else:
-            return import_svg.load(self, context, filepath=self.filepath)
+            return import_svg.load(self, context, filepath=self.filepath, use_streaming=self.use_streaming)
 
 
 class IO_FH_svg_as_curves(bpy.types.FileHandler):
@@ -5,9 +5,11 @@
 
 import re
 import xml.dom.minidom
+import xml.etree.ElementTree
 from math import cos, sin, tan, atan2, pi, ceil
 
 import bpy
+import numpy as np
 from mathutils import Vector, Matrix
 from bpy.app.translations import pgettext_tip as tip_
 
@@ -16,6 +18,7 @@ from .svg_util import (units,
                        srgb_to_linearrgb,
                        check_points_equal,
                        parse_array_of_floats,
+                       parse_path_data,
                        read_float)
 
 #### Common utilities ####
@@ -23,6 +26,58 @@ from .svg_util import (units,
 SVGEmptyStyles = {'useFill': None,
                   'fill': None}
 
+SVGNamespace = '{http://www.w3.org/2000/svg}'
+XLinkNamespace = '{http://www.w3.org/1999/xlink}'
+
+
+class SVGElementNode:
+    """
+    Wrapper giving an ElementTree element the minidom interface used by geometries
+    """
+
+    __slots__ = ('_element',  # Wrapped ElementTree element
+                 'tagName')  # Tag name without SVG namespace
+
+    def __init__(self, element):
+        """
+        Initialize new element wrapper
+        """
+
+        self._element = element
+
+        tag = element.tag
+        if tag.startswith(SVGNamespace):
+            tag = tag[len(SVGNamespace):]
+
+        self.tagName = tag
+
+    def getAttribute(self, name):
+        """
+        Get attribute value, or an empty string if it's not set
+        """
+
+        if name.startswith('xlink:'):
+            return (self._element.get(XLinkNamespace + name[6:]) or
+                    self._element.get(name[6:], ''))
+
+        return self._element.get(name, '')
+
+    @property
+    def childNodes(self):
+        """
+        Wrapped child elements
+        """
+
+        return [SVGElementNode(child) for child in self._element]
+
+
+def SVGIsElement(node):
+    """
+    Check if node is an element (and not a document, text or comment node)
+    """
+
+    return type(node) in {xml.dom.minidom.Element, SVGElementNode}
+
 
 def SVGCreateCurve(context):
     """
@@ -45,6 +100,47 @@ def SVGFinishCurve():
     pass
 
 
+SVGHandleTypes = {'FREE': 0,
+                  'AUTO': 1,
+                  'VECTOR': 2,
+                  'ALIGNED': 3}
+
+
+def SVGCreateSpline(cu, co, handle_left, handle_right,
+                    handle_left_type, handle_right_type, cyclic):
+    """
+    Create new bezier spline, filling all points at once
+
+    co, handle_left, handle_right - arrays of 3D coordinates, one per point
+    handle_left_type, handle_right_type - handle type of all points, or a list
+                                          with handle type of every point
+    """
+
+    spline = cu.splines.new('BEZIER')
+    spline.use_cyclic_u = cyclic
+
+    points = spline.bezier_points
+    points.add(len(co) - 1)
+
+    for attr, handle_type in (('handle_left_type', handle_left_type),
+                              ('handle_right_type', handle_right_type)):
+        if isinstance(handle_type, str):
+            types = np.full(len(co), SVGHandleTypes[handle_type], dtype=np.ubyte)
+        else:
+            types = np.fromiter((SVGHandleTypes[t] for t in handle_type), dtype=np.ubyte, count=len(co))
+        points.foreach_set(attr, types)
+
+    points.foreach_set('co', np.asarray(co, dtype=np.float32).ravel())
+    points.foreach_set('handle_left', np.asarray(handle_left, dtype=np.float32).ravel())
+    points.foreach_set('handle_right', np.asarray(handle_right, dtype=np.float32).ravel())
+
+    # Bulk assignment doesn't recalculate handles, setting a handle type once
+    # updates VECTOR handles of the whole spline.
+    points[0].handle_left_type = points[0].handle_left_type
+
+    return spline
+
+
 def SVGFlipHandle(x, y, x1, y1):
     """
     Flip handle around base point
@@ -377,7 +473,7 @@ class SVGPathData:
     SVG Path data token supplier
     """
 
-    __slots__ = ('_data',   # List of tokens
+    __slots__ = ('_data',   # List of tokens, commands are strings and numbers are floats
                  '_index',  # Index of current token in tokens list
                  '_len')    # Length of tokens list
 
@@ -388,44 +484,7 @@ class SVGPathData:
         d - the definition of the outline of a shape
         """
 
-        spaces = ' ,\t'
-        commands = {'m', 'l', 'h', 'v', 'c', 's', 'q', '', 't', 'a', 'z'}
-        current_command = ''
-        tokens = []
-
-        i = 0
-        n = len(d)
-        while i < n:
-            c = d[i]
-
-            if c in spaces:
-                pass
-            elif c.lower() in commands:
-                tokens.append(c)
-                current_command = c
-                arg_index = 1
-            elif c in ['-', '.'] or c.isdigit():
-                # Special case for 'a/A' commands.
-                # Arguments 4 and 5 are either 0 or 1 and might not
-                # be separated from the next argument with space or comma.
-                if current_command.lower() == 'a':
-                    if arg_index % 7 in [4, 5]:
-                        token = d[i]
-                        last_char = i + 1
-                    else:
-                        token, last_char = read_float(d, i)
-                else:
-                    token, last_char = read_float(d, i)
-
-                arg_index += 1
-                tokens.append(token)
-
-                # in most cases len(token) and (last_char - i) are the same
-                # but with whitespace or ',' prefix they are not.
-
-                i += (last_char - i) - 1
-
-            i += 1
+        tokens = parse_path_data(d)
 
         self._data = tokens
         self._index = 0
@@ -476,12 +535,7 @@ class SVGPathData:
         Return coordinate created from current token and move to next token
         """
 
-        token = self.next()
-
-        if token is None:
-            return None
-
-        return float(token)
+        return self.next()
 
 
 class SVGPathParser:
@@ -579,7 +633,7 @@ class SVGPathParser:
                 if handle_left_type != 'VECTOR':
                     first['handle_left_type'] = handle_left_type
 
-                if self._data.eof() or self._data.lookupNext().lower() == 'm':
+                if self._data.eof() or self._data.lookupNext() in {'M', 'm'}:
                     self._spline['closed'] = True
 
                 return
@@ -628,7 +682,7 @@ class SVGPathParser:
         self._point = (x, y)
 
         cur = self._data.cur()
-        while cur is not None and not cur.isalpha():
+        while cur is not None and not isinstance(cur, str):
             x, y = self._getCoordPair(relative, self._point)
 
             if self._spline is None:
@@ -649,7 +703,7 @@ class SVGPathParser:
         c = code.lower()
 
         cur = self._data.cur()
-        while cur is not None and not cur.isalpha():
+        while cur is not None and not isinstance(cur, str):
             if c == 'l':
                 x, y = self._getCoordPair(code == 'l', self._point)
             elif c == 'h':
@@ -681,7 +735,7 @@ class SVGPathParser:
 
         c = code.lower()
         cur = self._data.cur()
-        while cur is not None and not cur.isalpha():
+        while cur is not None and not isinstance(cur, str):
             if c == 'c':
                 x1, y1 = self._getCoordPair(code.islower(), self._point)
                 x2, y2 = self._getCoordPair(code.islower(), self._point)
@@ -719,7 +773,7 @@ class SVGPathParser:
         c = code.lower()
         cur = self._data.cur()
 
-        while cur is not None and not cur.isalpha():
+        while cur is not None and not isinstance(cur, str):
             if c == 'q':
                 x1, y1 = self._getCoordPair(code.islower(), self._point)
             else:
@@ -851,7 +905,7 @@ class SVGPathParser:
 
         cur = self._data.cur()
 
-        while cur is not None and not cur.isalpha():
+        while cur is not None and not isinstance(cur, str):
             rx = float(self._data.next())
             ry = float(self._data.next())
             ang = float(self._data.next()) / 180 * pi
@@ -1007,6 +1061,16 @@ class SVGGeometry:
 
         return self._context['matrix'] @ v
 
+    def _transformCoords(self, points):
+        """
+        Transform an array of SVG-file coords
+        """
+
+        matrix = np.array(self._context['matrix'])
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+
+        return points @ matrix[:3, :2].T + matrix[:3, 3]
+
     def getNodeMatrix(self):
         """
         Get transformation matrix of node
@@ -1085,13 +1149,13 @@ class SVGGeometryContainer(SVGGeometry):
         Parse XML node to memory
         """
 
-        if type(self._node) is xml.dom.minidom.Element:
+        if SVGIsElement(self._node):
             self._styles = SVGParseStyles(self._node, self._context)
 
         self._pushStyle(self._styles)
 
         for node in self._node.childNodes:
-            if type(node) is not xml.dom.minidom.Element:
+            if not SVGIsElement(node):
                 continue
 
             ob = parseAbstractNode(node, self._context)
@@ -1115,6 +1179,33 @@ class SVGGeometryContainer(SVGGeometry):
 
         return self._geometries
 
+    def beginStream(self):
+        """
+        Prepare for children being parsed and created one by one while streaming,
+        returns the matrix pushed for the node transform
+        """
+
+        if SVGIsElement(self._node):
+            self._styles = SVGParseStyles(self._node, self._context)
+
+        self._pushStyle(self._styles)
+
+        matrix = self.getTransformMatrix()
+        if matrix is not None:
+            self._pushMatrix(matrix)
+
+        return matrix
+
+    def endStream(self, matrix):
+        """
+        Finish streaming of children
+        """
+
+        if matrix is not None:
+            self._popMatrix()
+
+        self._popStyle()
+
 
 class SVGGeometryPATH(SVGGeometry):
     """
@@ -1166,8 +1257,6 @@ class SVGGeometryPATH(SVGGeometry):
             cu.dimensions = '3D'
 
         for spline in self._splines:
-            act_spline = None
-
             if spline['closed'] and len(spline['points']) >= 2:
                 first = spline['points'][0]
                 last = spline['points'][-1]
@@ -1180,29 +1269,23 @@ class SVGGeometryPATH(SVGGeometry):
                     first['handle_left_type'] = 'FREE'
                     first['handle_left'] = (first['x'], first['y'])
 
-            for point in spline['points']:
-                co = self._transformCoord((point['x'], point['y']))
-
-                if act_spline is None:
-                    cu.splines.new('BEZIER')
-
-                    act_spline = cu.splines[-1]
-                    act_spline.use_cyclic_u = spline['closed']
-                else:
-                    act_spline.bezier_points.add(1)
-
-                bezt = act_spline.bezier_points[-1]
-                bezt.co = co
+            points = spline['points']
+            if not points:
+                continue
 
-                bezt.handle_left_type = point['handle_left_type']
-                if point['handle_left'] is not None:
-                    handle = point['handle_left']
-                    bezt.handle_left = self._transformCoord(handle)
+            # Handles which are not set are calculated from their type,
+            # use the point itself until then.
+            co = [(point['x'], point['y']) for point in points]
+            handle_left = [point['handle_left'] or xy for point, xy in zip(points, co)]
+            handle_right = [point['handle_right'] or xy for point, xy in zip(points, co)]
 
-                bezt.handle_right_type = point['handle_right_type']
-                if point['handle_right'] is not None:
-                    handle = point['handle_right']
-                    bezt.handle_right = self._transformCoord(handle)
+            SVGCreateSpline(cu,
+                            self._transformCoords(co),
+                            self._transformCoords(handle_left),
+                            self._transformCoords(handle_right),
+                            [point['handle_left_type'] for point in points],
+                            [point['handle_right_type'] for point in points],
+                            spline['closed'])
 
         SVGFinishCurve()
 
@@ -1320,39 +1403,6 @@ class SVGGeometryRECT(SVGGeometry):
 
         self._radius = (rx, ry)
 
-    def _appendCorner(self, spline, coord, firstTime, rounded):
-        """
-        Append new corner to rectangle
-        """
-
-        handle = None
-        if len(coord) == 3:
-            handle = self._transformCoord(coord[2])
-            coord = (coord[0], coord[1])
-
-        co = self._transformCoord(coord)
-
-        if not firstTime:
-            spline.bezier_points.add(1)
-
-        bezt = spline.bezier_points[-1]
-        bezt.co = co
-
-        if rounded:
-            if handle:
-                bezt.handle_left_type = 'VECTOR'
-                bezt.handle_right_type = 'FREE'
-
-                bezt.handle_right = handle
-            else:
-                bezt.handle_left_type = 'FREE'
-                bezt.handle_right_type = 'VECTOR'
-                bezt.handle_left = co
-
-        else:
-            bezt.handle_left_type = 'VECTOR'
-            bezt.handle_right_type = 'VECTOR'
-
     def _doCreateGeom(self, instancing):
         """
         Create real geometries
@@ -1396,11 +1446,6 @@ class SVGGeometryRECT(SVGGeometry):
         else:
             cu.dimensions = '3D'
 
-        cu.splines.new('BEZIER')
-
-        spline = cu.splines[-1]
-        spline.use_cyclic_u = True
-
         x, y = rect[0], rect[1]
         w, h = rect[2], rect[3]
         rx, ry = radius[0], radius[1]
@@ -1434,10 +1479,19 @@ class SVGGeometryRECT(SVGGeometry):
         else:
             coords = [(x, y), (x + w, y), (x + w, y + h), (x, y + h)]
 
-        firstTime = True
-        for coord in coords:
-            self._appendCorner(spline, coord, firstTime, rounded)
-            firstTime = False
+        co = self._transformCoords([coord[:2] for coord in coords])
+        handle_right = self._transformCoords([coord[2] if len(coord) == 3 else coord[:2]
+                                              for coord in coords])
+
+        if rounded:
+            # Corners with a right handle are the start of a rounded corner
+            handle_left_type = ['VECTOR' if len(coord) == 3 else 'FREE' for coord in coords]
+            handle_right_type = ['FREE' if len(coord) == 3 else 'VECTOR' for coord in coords]
+        else:
+            handle_left_type = handle_right_type = 'VECTOR'
+
+        SVGCreateSpline(cu, co, co, handle_right,
+                        handle_left_type, handle_right_type, True)
 
         SVGFinishCurve()
 
@@ -1525,25 +1579,9 @@ class SVGGeometryELLIPSE(SVGGeometry):
                    (cx + rx * 0.552, cy + ry),
                    (cx - rx * 0.552, cy + ry))]
 
-        spline = None
-        for coord in coords:
-            co = self._transformCoord(coord[0])
-            handle_left = self._transformCoord(coord[1])
-            handle_right = self._transformCoord(coord[2])
-
-            if spline is None:
-                cu.splines.new('BEZIER')
-                spline = cu.splines[-1]
-                spline.use_cyclic_u = True
-            else:
-                spline.bezier_points.add(1)
+        co, handle_left, handle_right = (self._transformCoords(points) for points in zip(*coords))
 
-            bezt = spline.bezier_points[-1]
-            bezt.co = co
-            bezt.handle_left_type = 'FREE'
-            bezt.handle_right_type = 'FREE'
-            bezt.handle_left = handle_left
-            bezt.handle_right = handle_right
+        SVGCreateSpline(cu, co, handle_left, handle_right, 'FREE', 'FREE', True)
 
         SVGFinishCurve()
 
@@ -1619,23 +1657,9 @@ class SVGGeometryLINE(SVGGeometry):
 
         id_names_from_node(self._node, ob)
 
-        coords = [(x1, y1), (x2, y2)]
-        spline = None
-
-        for coord in coords:
-            co = self._transformCoord(coord)
-
-            if spline is None:
-                cu.splines.new('BEZIER')
-                spline = cu.splines[-1]
-                spline.use_cyclic_u = True
-            else:
-                spline.bezier_points.add(1)
+        co = self._transformCoords([(x1, y1), (x2, y2)])
 
-            bezt = spline.bezier_points[-1]
-            bezt.co = co
-            bezt.handle_left_type = 'VECTOR'
-            bezt.handle_right_type = 'VECTOR'
+        SVGCreateSpline(cu, co, co, co, 'VECTOR', 'VECTOR', True)
 
         SVGFinishCurve()
 
@@ -1697,22 +1721,10 @@ class SVGGeometryPOLY(SVGGeometry):
         else:
             cu.dimensions = '3D'
 
-        spline = None
+        if self._points:
+            co = self._transformCoords(self._points)
 
-        for point in self._points:
-            co = self._transformCoord(point)
-
-            if spline is None:
-                cu.splines.new('BEZIER')
-                spline = cu.splines[-1]
-                spline.use_cyclic_u = self._closed
-            else:
-                spline.bezier_points.add(1)
-
-            bezt = spline.bezier_points[-1]
-            bezt.co = co
-            bezt.handle_left_type = 'VECTOR'
-            bezt.handle_right_type = 'VECTOR'
+            SVGCreateSpline(cu, co, co, co, 'VECTOR', 'VECTOR', self._closed)
 
         SVGFinishCurve()
 
@@ -1745,9 +1757,9 @@ class SVGGeometrySVG(SVGGeometryContainer):
     Main geometry holder
     """
 
-    def _doCreateGeom(self, instancing):
+    def _pushDocument(self):
         """
-        Create real geometries
+        Push display rectangle and matrix of the document
         """
 
         rect = SVGRectFromNode(self._node, self._context)
@@ -1788,11 +1800,43 @@ class SVGGeometrySVG(SVGGeometryContainer):
         self._pushMatrix(matrix)
         self._pushRect(rect)
 
-        super()._doCreateGeom(False)
+    def _popDocument(self):
+        """
+        Pop display rectangle and matrix of the document
+        """
 
         self._popRect()
         self._popMatrix()
 
+    def _doCreateGeom(self, instancing):
+        """
+        Create real geometries
+        """
+
+        self._pushDocument()
+
+        super()._doCreateGeom(False)
+
+        self._popDocument()
+
+    def beginStream(self):
+        """
+        Prepare for children being parsed and created one by one while streaming
+        """
+
+        matrix = super().beginStream()
+        self._pushDocument()
+
+        return matrix
+
+    def endStream(self, matrix):
+        """
+        Finish streaming of children
+        """
+
+        self._popDocument()
+        super().endStream(matrix)
+
 
 class SVGLoader(SVGGeometryContainer):
     """
@@ -1813,33 +1857,193 @@ class SVGLoader(SVGGeometryContainer):
         """
         Initialize SVG loader
         """
-        import os
 
-        svg_name = os.path.basename(filepath)
-        scene = context.scene
-        collection = bpy.data.collections.new(name=svg_name)
-        scene.collection.children.link(collection)
+        self._context = SVGCreateLoaderContext(context, filepath, do_colormanage)
 
         node = xml.dom.minidom.parse(filepath)
 
-        m = Matrix()
-        m = m @ Matrix.Scale(1.0 / 90.0 * 0.3048 / 12.0, 4, Vector((1.0, 0.0, 0.0)))
-        m = m @ Matrix.Scale(-1.0 / 90.0 * 0.3048 / 12.0, 4, Vector((0.0, 1.0, 0.0)))
+        super().__init__(node, self._context)
 
-        rect = (0, 0)
 
-        self._context = {'defines': {},
-                         'rects': [rect],
-                         'rect': rect,
-                         'matrix_stack': [],
-                         'matrix': m,
-                         'materials': {},
-                         'styles': [None],
-                         'style': None,
-                         'do_colormanage': do_colormanage,
-                         'collection': collection}
+class SVGStreamLoader:
+    """
+    SVG file loader which creates geometries while reading the file,
+    without keeping the whole document in memory
+    """
 
-        super().__init__(node, self._context)
+    __slots__ = ('_filepath',  # Path of the file to load
+                 '_context',  # Global SVG context
+                 '_deferred')  # Geometries using elements defined later in the file
+
+    def __init__(self, context, filepath, do_colormanage):
+        """
+        Initialize SVG stream loader
+        """
+
+        self._filepath = filepath
+        self._context = SVGCreateLoaderContext(context, filepath, do_colormanage)
+        self._deferred = []
+
+    def _iterElements(self):
+        """
+        Iterate over (event, element, parent) of the file, so callers can free
+        elements from their parent once they're handled
+        """
+
+        elements = []
+
+        for event, element in xml.etree.ElementTree.iterparse(self._filepath, events=('start', 'end')):
+            if event == 'start':
+                yield event, element, elements[-1] if elements else None
+                elements.append(element)
+            else:
+                elements.pop()
+                yield event, element, elements[-1] if elements else None
+
+    def _findReferencedIds(self):
+        """
+        Collect references of all USE elements of the file
+        """
+
+        referenced = set()
+
+        for event, element, parent in self._iterElements():
+            if event != 'end':
+                continue
+
+            if element.tag in {SVGNamespace + 'use', 'use'}:
+                ref = SVGElementNode(element).getAttribute('xlink:href')
+                if ref:
+                    referenced.add(ref)
+
+            if parent is not None:
+                del parent[:]
+
+        return referenced
+
+    def _hasUnresolvedReference(self, element):
+        """
+        Check if element or its children use elements which are not parsed yet
+        """
+
+        defines = self._context['defines']
+
+        for child in element.iter():
+            if child.tag not in {SVGNamespace + 'use', 'use'}:
+                continue
+
+            ref = SVGElementNode(child).getAttribute('xlink:href')
+            if ref and ref not in defines:
+                return True
+
+        return False
+
+    def _createGeom(self, geom, element):
+        """
+        Create geometry, or defer it until the end when it uses elements defined later
+        """
+
+        if geom is None:
+            return
+
+        if self._hasUnresolvedReference(element):
+            # Keep the inherited transform, display rectangle and styles, the stream
+            # pops them from the context before deferred geometries are created
+            context = self._context
+            self._deferred.append((geom, context['matrix'], context['rects'][:], context['styles'][:]))
+            return
+
+        geom.createGeom(False)
+
+    def _createDeferred(self):
+        """
+        Create geometries using elements which were defined after them
+        """
+
+        context = self._context
+        matrix = context['matrix']
+        rects = context['rects']
+        styles = context['styles']
+
+        for geom, deferred_matrix, deferred_rects, deferred_styles in self._deferred:
+            context['matrix'] = deferred_matrix
+            context['rects'] = deferred_rects
+            context['rect'] = deferred_rects[-1]
+            context['styles'] = deferred_styles
+            context['style'] = deferred_styles[-1]
+
+            geom.createGeom(False)
+
+        context['matrix'] = matrix
+        context['rects'] = rects
+        context['rect'] = rects[-1]
+        context['styles'] = styles
+        context['style'] = styles[-1]
+
+        self._deferred.clear()
+
+    def load(self):
+        """
+        Parse the file and create geometries
+        """
+
+        context = self._context
+        referenced = self._findReferencedIds()
+
+        context['styles'].append(SVGEmptyStyles)
+        context['style'] = SVGEmptyStyles
+
+        # Containers being streamed: (element, geometry, pushed matrix)
+        streamed = []
+
+        # Root of a subtree handled at once: definitions and referenced elements
+        # are parsed into geometries like the whole document is by SVGLoader.
+        tree_root = None
+
+        # Root of a subtree of unsupported elements
+        skip_root = None
+
+        for event, element, parent in self._iterElements():
+            if event == 'start':
+                if tree_root is not None or skip_root is not None:
+                    continue
+
+                node = SVGElementNode(element)
+                name = node.tagName.lower()
+                geomClass = svgGeometryClasses.get(name)
+
+                if geomClass is None:
+                    skip_root = element
+                elif name in {'defs', 'symbol'} or '#' + element.get('id', '') in referenced:
+                    tree_root = element
+                elif issubclass(geomClass, SVGGeometryContainer):
+                    geom = geomClass(node, context)
+                    streamed.append((element, geom, geom.beginStream()))
+
+                continue
+
+            if element is skip_root:
+                skip_root = None
+            elif element is tree_root:
+                tree_root = None
+                self._createGeom(parseAbstractNode(SVGElementNode(element), context), element)
+            elif tree_root is not None or skip_root is not None:
+                # Keep children until the whole subtree is read
+                continue
+            elif streamed and streamed[-1][0] is element:
+                _, geom, matrix = streamed.pop()
+                geom.endStream(matrix)
+            else:
+                self._createGeom(parseAbstractNode(SVGElementNode(element), context), element)
+
+            # Free the elements, geometries keep what they need
+            if parent is not None:
+                del parent[:]
+
+        self._createDeferred()
+
+        context['styles'].pop()
+        context['style'] = context['styles'][-1]
 
 
 svgGeometryClasses = {
@@ -1857,6 +2061,35 @@ svgGeometryClasses = {
     'g': SVGGeometryG}
 
 
+def SVGCreateLoaderContext(context, filepath, do_colormanage):
+    """
+    Create collection for the file, and global SVG context used while loading it
+    """
+    import os
+
+    svg_name = os.path.basename(filepath)
+    scene = context.scene
+    collection = bpy.data.collections.new(name=svg_name)
+    scene.collection.children.link(collection)
+
+    m = Matrix()
+    m = m @ Matrix.Scale(1.0 / 90.0 * 0.3048 / 12.0, 4, Vector((1.0, 0.0, 0.0)))
+    m = m @ Matrix.Scale(-1.0 / 90.0 * 0.3048 / 12.0, 4, Vector((0.0, 1.0, 0.0)))
+
+    rect = (0, 0)
+
+    return {'defines': {},
+            'rects': [rect],
+            'rect': rect,
+            'matrix_stack': [],
+            'matrix': m,
+            'materials': {},
+            'styles': [None],
+            'style': None,
+            'do_colormanage': do_colormanage,
+            'collection': collection}
+
+
 def parseAbstractNode(node, context):
     name = node.tagName.lower()
 
@@ -1874,7 +2107,7 @@ def parseAbstractNode(node, context):
     return None
 
 
-def load_svg(context, filepath, do_colormanage):
+def load_svg(context, filepath, do_colormanage, use_streaming=False):
     """
     Load specified SVG file
     """
@@ -1882,19 +2115,24 @@ def load_svg(context, filepath, do_colormanage):
     if bpy.ops.object.mode_set.poll():
         bpy.ops.object.mode_set(mode='OBJECT')
 
+    if use_streaming:
+        loader = SVGStreamLoader(context, filepath, do_colormanage)
+        loader.load()
+        return
+
     loader = SVGLoader(context, filepath, do_colormanage)
     loader.parse()
     loader.createGeom(False)
 
 
-def load(operator, context, filepath=""):
+def load(operator, context, filepath="", use_streaming=False):
 
     # error in code should raise exceptions but loading
     # non SVG files can give useful messages.
     do_colormanage = context.scene.display_settings.display_device != 'NONE'
     try:
-        load_svg(context, filepath, do_colormanage)
-    except (xml.parsers.expat.ExpatError, UnicodeEncodeError) as e:
+        load_svg(context, filepath, do_colormanage, use_streaming)
+    except (xml.parsers.expat.ExpatError, xml.etree.ElementTree.ParseError, UnicodeEncodeError) as e:
         import traceback
         traceback.print_exc()
 
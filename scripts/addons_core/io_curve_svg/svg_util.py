@@ -67,18 +67,68 @@ def read_float(text: str, start_index: int = 0):
     if start_index == n:
         return "0", start_index
 
-    text_part = text[start_index:]
-    match = re_match_number_optional_parts.match(text_part)
+    match = re_match_number_optional_parts.match(text, start_index)
 
     if match is None:
         raise Exception('Invalid float value near ' + text[start_index:start_index + 10])
 
     token = match.group(0)
-    endptr = start_index + match.end(0)
+    endptr = match.end(0)
 
     return token, endptr
 
 
+path_commands = "MmLlHhVvCcSsQqTtAaZz"
+
+# Skip separators and unknown characters, then match either a command or a number.
+re_path_token = re.compile(f"[^{path_commands}0-9.\\-]*(?:(?P<command>[{path_commands}])|"
+                           f"(?P<number>{match_number_optional_parts}))?")
+
+
+def parse_path_data(d: str):
+    """
+    Split SVG path data into a list of tokens, where commands are kept as strings
+    and numbers are converted to floats.
+    """
+
+    tokens = []
+    current_command = ''
+    arg_index = 0
+
+    i = 0
+    n = len(d)
+    while i < n:
+        match = re_path_token.match(d, i)
+        command = match.group('command')
+
+        if command is not None:
+            tokens.append(command)
+            current_command = command
+            arg_index = 1
+            i = match.end()
+            continue
+
+        start = match.start('number')
+        if start == -1:
+            if match.end() < n:
+                raise Exception('Invalid float value near ' + d[match.end():match.end() + 10])
+            break
+
+        # Special case for 'a/A' commands.
+        # Arguments 4 and 5 are either 0 or 1 and might not
+        # be separated from the next argument with space or comma.
+        if current_command in {'a', 'A'} and arg_index % 7 in {4, 5}:
+            tokens.append(float(d[start]))
+            i = start + 1
+        else:
+            tokens.append(float(match.group('number')))
+            i = match.end()
+
+        arg_index += 1
+
+    return tokens
+
+
 def parse_coord(coord, size):
     """
     Parse coordinate component to common basis
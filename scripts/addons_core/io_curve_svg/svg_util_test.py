@@ -6,9 +6,9 @@
 # XXX Not really nice, but that hack is needed to allow execution of that test
 #     from both automated CTest and by directly running the file manually.
 if __name__ == '__main__':
-    from svg_util import (parse_array_of_floats, read_float, parse_coord,)
+    from svg_util import (parse_array_of_floats, read_float, parse_coord, parse_path_data,)
 else:
-    from .svg_util import (parse_array_of_floats, read_float, parse_coord,)
+    from .svg_util import (parse_array_of_floats, read_float, parse_coord, parse_path_data,)
 import unittest
 
 
@@ -162,5 +162,29 @@ class ParseCoordTest(unittest.TestCase):
         self.assertEqual(parse_coord("1.2%", 200), 2.4)
 
 
+class ParsePathDataTest(unittest.TestCase):
+    def test_empty(self):
+        self.assertEqual(parse_path_data(""), [])
+        self.assertEqual(parse_path_data("  , \t"), [])
+
+    def test_commands_and_numbers(self):
+        self.assertEqual(parse_path_data("M10,20 L30 40z"),
+                         ['M', 10, 20, 'L', 30, 40, 'z'])
+
+    def test_sign_and_decimal_as_separator(self):
+        self.assertEqual(parse_path_data("l1-2.5.5e1+3"),
+                         ['l', 1, -2.5, 5, 3])
+
+    def test_arc_flags(self):
+        self.assertEqual(parse_path_data("a25,25 -30 0,150-25"),
+                         ['a', 25, 25, -30, 0, 1, 50, -25])
+        self.assertEqual(parse_path_data("A1 1 0 00 1 1 2 2 0 11 3 3"),
+                         ['A', 1, 1, 0, 0, 0, 1, 1, 2, 2, 0, 1, 1, 3, 3])
+
+    def test_not_a_number(self):
+        with self.assertRaises(Exception):
+            parse_path_data("M1 -x")
+
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
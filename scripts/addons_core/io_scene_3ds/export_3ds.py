@@ -14,6 +14,7 @@ import math
 import struct
 import mathutils
 import bpy_extras
+import numpy as np
 from bpy_extras import node_shader_utils
 
 ###################
@@ -192,9 +193,6 @@ def sane_name(name):
     return new_name
 
 
-def uv_key(uv):
-    return round(uv[0], 6), round(uv[1], 6)
-
 # Size defines
 SZ_SHORT = 2
 SZ_INT = 4
@@ -306,24 +304,6 @@ class _3ds_point_4d(object):
         return '(%f, %f, %f, %f)' % (self.w, self.x, self.y, self.z)
 
 
-class _3ds_point_uv(object):
-    """Class representing a UV-coordinate for a 3ds file."""
-    __slots__ = ("uv", )
-
-    def __init__(self, point):
-        self.uv = point
-
-    def get_size(self):
-        return 2 * SZ_FLOAT
-
-    def write(self, file):
-        data = struct.pack('<2f', self.uv[0], self.uv[1])
-        file.write(data)
-
-    def __str__(self):
-        return '(%g, %g)' % self.uv
-
-
 class _3ds_float_color(object):
     """Class representing a rgb float color for a 3ds file."""
     __slots__ = "r", "g", "b"
@@ -358,26 +338,6 @@ class _3ds_rgb_color(object):
         return '{%f, %f, %f}' % (self.r, self.g, self.b)
 
 
-class _3ds_face(object):
-    """Class representing a face for a 3ds file."""
-    __slots__ = ("vindex", "flag", )
-
-    def __init__(self, vindex, flag):
-        self.vindex = vindex
-        self.flag = flag
-
-    def get_size(self):
-        return 4 * SZ_SHORT
-
-    # No need to validate every face vert, the oversized array will catch this problem
-    def write(self, file):
-        # The last short is used for face flags
-        file.write(struct.pack('<4H', self.vindex[0], self.vindex[1], self.vindex[2], self.flag))
-
-    def __str__(self):
-        return '[%d %d %d %d]' % (self.vindex[0], self.vindex[1], self.vindex[2], self.flag)
-
-
 class _3ds_array(object):
     """Class representing an array of variables for a 3ds file.
     Consists of a _3ds_ushort to indicate the number of items, followed by the items themselves."""
@@ -409,6 +369,30 @@ class _3ds_array(object):
         return '(%d items)' % len(self.values)
 
 
+class _3ds_numpy_array(object):
+    """Class representing an array of fixed size items for a 3ds file, backed by a numpy array.
+    Optionally starts with a _3ds_ushort to indicate the number of items, like _3ds_array."""
+    __slots__ = "values", "use_count"
+
+    def __init__(self, values, dtype, use_count=True):
+        self.values = np.ascontiguousarray(values, dtype=dtype)
+        self.use_count = use_count
+
+    def get_size(self):
+        return (SZ_SHORT if self.use_count else 0) + self.values.nbytes
+
+    def validate(self):
+        return len(self.values) <= 65535
+
+    def write(self, file):
+        if self.use_count:
+            _3ds_ushort(len(self.values)).write(file)
+        self.values.tofile(file)
+
+    def __str__(self):
+        return '(%d items)' % len(self.values)
+
+
 class _3ds_named_variable(object):
     """Convenience class for named variables."""
     __slots__ = "value", "name"
@@ -812,19 +796,18 @@ def make_material_chunk(material, image):
 #############
 
 class tri_wrapper(object):
-    """Class representing a triangle.
+    """Class representing the triangles of a mesh as arrays.
     Used when converting faces to triangles"""
 
-    __slots__ = "vertex_index", "ma", "image", "faceuvs", "offset", "flag", "group"
+    __slots__ = "vertex_index", "ma", "image", "faceuvs", "flag", "group"
 
-    def __init__(self, vindex=(0, 0, 0), ma=None, image=None, faceuvs=None, flag=0, group=0):
-        self.vertex_index = vindex
-        self.ma = ma
-        self.image = image
-        self.faceuvs = faceuvs
-        self.offset = [0, 0, 0]  # Offset indices
-        self.flag = flag
-        self.group = group
+    def __init__(self, vindex, ma, image=None, faceuvs=None, flag=None, group=None):
+        self.vertex_index = vindex  # (n, 3) vertex indices
+        self.ma = ma  # (n, ) material indices
+        self.image = image  # image name shared by all triangles
+        self.faceuvs = faceuvs  # (n, 3, 2) rounded uv coordinates or None
+        self.flag = flag  # (n, ) edge flags
+        self.group = group  # (n, ) smooth groups
 
 
 def extract_triangles(mesh):
@@ -833,55 +816,58 @@ def extract_triangles(mesh):
     mesh.calc_loop_triangles()
     (polygroup, count) = mesh.calc_smooth_groups(use_bitflags=True)
 
-    tri_list = []
+    tris = mesh.loop_triangles
+    num_tris = len(tris)
     do_uv = bool(mesh.uv_layers)
 
+    tri_verts = np.empty(num_tris * 3, dtype=np.int32)
+    tris.foreach_get("vertices", tri_verts)
+    tri_verts = tri_verts.reshape(-1, 3)
+    tri_loops = np.empty(num_tris * 3, dtype=np.int32)
+    tris.foreach_get("loops", tri_loops)
+    tri_loops = tri_loops.reshape(-1, 3)
+    tri_polys = np.empty(num_tris, dtype=np.int32)
+    tris.foreach_get("polygon_index", tri_polys)
+    tri_ma = np.empty(num_tris, dtype=np.int32)
+    tris.foreach_get("material_index", tri_ma)
+    tri_smooth = np.empty(num_tris, dtype=bool)
+    tris.foreach_get("use_smooth", tri_smooth)
+
     img = None
-    for i, face in enumerate(mesh.loop_triangles):
-        f_v = face.vertices
-        v1, v2, v3 = f_v
-        uf = mesh.uv_layers.active.data if do_uv else None
-
-        if do_uv:
-            f_uv = [uf[lp].uv for lp in face.loops]
-            for ma in mesh.materials:
-                img = get_uv_image(ma) if uf else None
-                if img is not None:
-                    img = img.name
-            uv1, uv2, uv3 = f_uv
-
-        """Flag 0x1 sets CA edge visible, Flag 0x2 sets BC edge visible, Flag 0x4 sets AB edge visible
-        Flag 0x8 indicates a U axis texture wrap seam and Flag 0x10 indicates a V axis texture wrap seam
-        In Blender we use the edge CA, BC, and AB flags for sharp edges flags."""
-        a_b = mesh.edges[mesh.loops[face.loops[0]].edge_index]
-        b_c = mesh.edges[mesh.loops[face.loops[1]].edge_index]
-        c_a = mesh.edges[mesh.loops[face.loops[2]].edge_index]
-
-        if v3 == 0:
-            v1, v2, v3 = v3, v1, v2
-            a_b, b_c, c_a = c_a, a_b, b_c
-            if do_uv:
-                uv1, uv2, uv3 = uv3, uv1, uv2
-
-        faceflag = 0
-        if c_a.use_edge_sharp:
-            faceflag |= 0x1
-        if b_c.use_edge_sharp:
-            faceflag |= 0x2
-        if a_b.use_edge_sharp:
-            faceflag |= 0x4
-
-        smoothgroup = polygroup[face.polygon_index]
-
-        if len(f_v) == 3:
-            new_tri = tri_wrapper((v1, v2, v3), face.material_index, img)
-            if (do_uv):
-                new_tri.faceuvs = uv_key(uv1), uv_key(uv2), uv_key(uv3)
-            new_tri.flag = faceflag
-            new_tri.group = smoothgroup if face.use_smooth else 0
-            tri_list.append(new_tri)
-
-    return tri_list
+    tri_uvs = None
+    if do_uv:
+        uf = mesh.uv_layers.active.data
+        for ma in mesh.materials:
+            img = get_uv_image(ma) if uf else None
+            if img is not None:
+                img = img.name
+
+        loop_uvs = np.empty(len(uf) * 2, dtype=np.float32)
+        uf.foreach_get("uv", loop_uvs)
+        tri_uvs = np.round(loop_uvs.reshape(-1, 2)[tri_loops].astype(np.float64), 6)
+
+    """Flag 0x1 sets CA edge visible, Flag 0x2 sets BC edge visible, Flag 0x4 sets AB edge visible
+    Flag 0x8 indicates a U axis texture wrap seam and Flag 0x10 indicates a V axis texture wrap seam
+    In Blender we use the edge CA, BC, and AB flags for sharp edges flags."""
+    loop_edges = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("edge_index", loop_edges)
+    edge_sharp = np.empty(len(mesh.edges), dtype=bool)
+    mesh.edges.foreach_get("use_edge_sharp", edge_sharp)
+    tri_sharp = edge_sharp[loop_edges[tri_loops]]  # AB, BC, CA
+
+    # Rotate triangles so that the last vertex index is never zero
+    eekadoodle = tri_verts[:, 2] == 0
+    tri_verts[eekadoodle] = tri_verts[eekadoodle][:, (2, 0, 1)]
+    tri_sharp[eekadoodle] = tri_sharp[eekadoodle][:, (2, 0, 1)]
+    if do_uv:
+        tri_uvs[eekadoodle] = tri_uvs[eekadoodle][:, (2, 0, 1)]
+
+    faceflag = (tri_sharp[:, 2] * 0x1) | (tri_sharp[:, 1] * 0x2) | (tri_sharp[:, 0] * 0x4)
+
+    smoothgroup = np.asarray(polygroup, dtype=np.uint32)[tri_polys] if num_tris else np.zeros(0, dtype=np.uint32)
+    smoothgroup[~tri_smooth] = 0
+
+    return tri_wrapper(tri_verts, tri_ma, img, tri_uvs, faceflag.astype(np.uint16), smoothgroup)
 
 
 def remove_face_uv(verts, tri_list):
@@ -890,54 +876,20 @@ def remove_face_uv(verts, tri_list):
     need to be converted to vertex uv coordinates. That means that vertices need to be duplicated when
     there are multiple uv coordinates per vertex."""
 
-    # Initialize a list of UniqueUVs, one per vertex
-    unique_uvs = [{} for i in range(len(verts))]
-
-    # For each face uv coordinate, add it to the UniqueList of the vertex
-    for tri in tri_list:
-        for i in range(3):
-            # Store the index into the UniqueList for future reference
-            # offset.append(uv_list[tri.vertex_index[i]].add(_3ds_point_uv(tri.faceuvs[i])))
-
-            context_uv_vert = unique_uvs[tri.vertex_index[i]]
-            uvkey = tri.faceuvs[i]
-            offset_index__uv_3ds = context_uv_vert.get(uvkey)
-
-            if not offset_index__uv_3ds:
-                offset_index__uv_3ds = context_uv_vert[uvkey] = len(context_uv_vert), _3ds_point_uv(uvkey)
-
-            tri.offset[i] = offset_index__uv_3ds[0]
-
-    # At this point each vertex has a UniqueList containing every uv coord associated with it only once
-    # Now we need to duplicate every vertex as many times as it has uv coordinates and make sure the
-    # faces refer to the new face indices
-    vert_index = 0
-    vert_array = _3ds_array()
-    uv_array = _3ds_array()
-    index_list = []
-    for i, vert in enumerate(verts):
-        index_list.append(vert_index)
-
-        pt = _3ds_point_3d(vert.co)  # reuse, should be ok
-        uvmap = [None] * len(unique_uvs[i])
-        for ii, uv_3ds in unique_uvs[i].values():
-            # Add a vertex duplicate to the vertex_array for every uv associated with this vertex
-            vert_array.add(pt)
-            # Add the uv coordinate to the uv array, this for loop does not give
-            # uv's ordered by ii, so we create a new map and add the uv's later
-            uvmap[ii] = uv_3ds
-
-        # Add uv's in the correct order and add coordinates to the uv array
-        for uv_3ds in uvmap:
-            uv_array.add(uv_3ds)
-
-        vert_index += len(unique_uvs[i])
+    vert_co = np.empty(len(verts) * 3, dtype=np.float32)
+    verts.foreach_get("co", vert_co)
+    vert_co = vert_co.reshape(-1, 3)
+
+    # Every unique (vertex, uv) pair of the face corners becomes a vertex,
+    # vertices not used by any face are dropped
+    corner_keys = np.column_stack((tri_list.vertex_index.reshape(-1), tri_list.faceuvs.reshape(-1, 2)))
+    unique_keys, corner_index = np.unique(corner_keys, axis=0, return_inverse=True)
+
+    vert_array = _3ds_numpy_array(vert_co[unique_keys[:, 0].astype(np.int32)], '<f4')
+    uv_array = _3ds_numpy_array(unique_keys[:, 1:], '<f4')
 
     # Make sure the triangle vertex indices now refer to the new vertex list
-    for tri in tri_list:
-        for i in range(3):
-            tri.offset[i] += index_list[tri.vertex_index[i]]
-        tri.vertex_index = tri.offset
+    tri_list.vertex_index = corner_index.reshape(-1, 3)
 
     return vert_array, uv_array, tri_list
 
@@ -945,72 +897,52 @@ def remove_face_uv(verts, tri_list):
 def make_faces_chunk(tri_list, mesh, materialDict):
     """Make a chunk for the faces.
     Also adds subchunks assigning materials to all faces."""
-    do_smooth = False
-    use_smooth = [poly.use_smooth for poly in mesh.polygons]
-    if True in use_smooth:
-        do_smooth = True
+    use_smooth = np.empty(len(mesh.polygons), dtype=bool)
+    mesh.polygons.foreach_get("use_smooth", use_smooth)
+    do_smooth = bool(use_smooth.any())
 
     materials = mesh.materials
-    if not materials:
-        ma = None
 
     face_chunk = _3ds_chunk(OBJECT_FACES)
-    face_list = _3ds_array()
+    face_list = _3ds_numpy_array(np.column_stack((tri_list.vertex_index, tri_list.flag)), '<u2')
+    face_chunk.add_variable("faces", face_list)
 
     if mesh.uv_layers:
         # Gather materials used in this mesh - mat/image pairs
         unique_mats = {}
-        for i, tri in enumerate(tri_list):
-            face_list.add(_3ds_face(tri.vertex_index, tri.flag))
-
+        mat_indices, first_use = np.unique(tri_list.ma, return_index=True)
+        for ma_index in mat_indices[np.argsort(first_use)]:
+            ma = None
             if materials:
-                ma = materials[tri.ma]
+                ma = materials[ma_index]
                 if ma:
                     ma = ma.name
 
-            img = tri.image
+            unique_mats.setdefault(ma, []).append(ma_index)
 
-            try:
-                context_face_array = unique_mats[ma, img][1]
-            except:
-                name_str = ma if ma else "None"
-                context_face_array = _3ds_array()
-                unique_mats[ma, img] = _3ds_string(sane_name(name_str)), context_face_array
-
-            context_face_array.add(_3ds_ushort(i))
-
-        face_chunk.add_variable("faces", face_list)
-        for ma_name, ma_faces in unique_mats.values():
+        for ma, ma_indices in unique_mats.items():
+            name_str = ma if ma else "None"
+            ma_faces = np.flatnonzero(np.isin(tri_list.ma, ma_indices))
             obj_material_chunk = _3ds_chunk(OBJECT_MATERIAL)
-            obj_material_chunk.add_variable("name", ma_name)
-            obj_material_chunk.add_variable("face_list", ma_faces)
+            obj_material_chunk.add_variable("name", _3ds_string(sane_name(name_str)))
+            obj_material_chunk.add_variable("face_list", _3ds_numpy_array(ma_faces, '<u2'))
             face_chunk.add_subchunk(obj_material_chunk)
 
     else:
-        obj_material_faces = []
         obj_material_names = []
         for m in materials:
             if m:
                 obj_material_names.append(_3ds_string(sane_name(m.name)))
-                obj_material_faces.append(_3ds_array())
-        n_materials = len(obj_material_names)
 
-        for i, tri in enumerate(tri_list):
-            face_list.add(_3ds_face(tri.vertex_index, tri.flag))
-            if (tri.ma < n_materials):
-                obj_material_faces[tri.ma].add(_3ds_ushort(i))
-
-        face_chunk.add_variable("faces", face_list)
-        for i in range(n_materials):
+        for i, ma_name in enumerate(obj_material_names):
             obj_material_chunk = _3ds_chunk(OBJECT_MATERIAL)
-            obj_material_chunk.add_variable("name", obj_material_names[i])
-            obj_material_chunk.add_variable("face_list", obj_material_faces[i])
+            obj_material_chunk.add_variable("name", ma_name)
+            obj_material_chunk.add_variable("face_list", _3ds_numpy_array(np.flatnonzero(tri_list.ma == i), '<u2'))
             face_chunk.add_subchunk(obj_material_chunk)
 
     if do_smooth:
         obj_smooth_chunk = _3ds_chunk(OBJECT_SMOOTH)
-        for i, tri in enumerate(tri_list):
-            obj_smooth_chunk.add_variable("face_" + str(i), _3ds_uint(tri.group))
+        obj_smooth_chunk.add_variable("faces", _3ds_numpy_array(tri_list.group, '<u4', use_count=False))
         face_chunk.add_subchunk(obj_smooth_chunk)
 
     return face_chunk
@@ -1041,9 +973,9 @@ def make_mesh_chunk(ob, mesh, matrix, materialDict, translation):
         vert_array, uv_array, tri_list = remove_face_uv(mesh.vertices, tri_list)
     else:
         # Add the vertices to the vertex array
-        vert_array = _3ds_array()
-        for vert in mesh.vertices:
-            vert_array.add(_3ds_point_3d(vert.co))
+        vert_co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", vert_co)
+        vert_array = _3ds_numpy_array(vert_co.reshape(-1, 3), '<f4')
         # No UV at all
         uv_array = None
 
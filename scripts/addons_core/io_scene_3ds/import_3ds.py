@@ -9,6 +9,7 @@ import time
 import math
 import struct
 import mathutils
+import numpy as np
 from bpy_extras.image_utils import load_image
 from bpy_extras.node_shader_utils import PrincipledBSDFWrapper
 from pathlib import Path
@@ -210,6 +211,49 @@ class Chunk:
         print('bytes_read: ', self.bytes_read)
 
 
+class ChunkReader:
+    """
+    Reads the whole file once and walks it with offsets into a memoryview,
+    avoiding a system call for every small read.
+    """
+    __slots__ = (
+        "data",
+        "view",
+        "offset",
+    )
+
+    def __init__(self, filepath):
+        with open(filepath, 'rb') as file:
+            self.data = file.read()
+        self.view = memoryview(self.data)
+        self.offset = 0
+
+    def read(self, size):
+        start = self.offset
+        self.offset = min(start + size, len(self.data))
+        return self.view[start:self.offset]
+
+    def read_array(self, dtype, count):
+        """Read count items of the (little endian) numpy dtype without copying."""
+        dtype = np.dtype(dtype)
+        data = self.read(dtype.itemsize * count)
+        return np.frombuffer(data, dtype=dtype, count=len(data) // dtype.itemsize)
+
+    def read_cstring(self):
+        """Read up to and including the next null character, returning the bytes before it."""
+        end = self.data.find(b'\x00', self.offset)
+        if end == -1:
+            end = len(self.data)
+        start = self.offset
+        self.offset = min(end + 1, len(self.data))
+        return self.data[start:end]
+
+    def close(self):
+        self.view.release()
+        self.data = b''
+        self.offset = 0
+
+
 def read_chunk(file, chunk):
     temp_data = file.read(struct.calcsize(chunk.binary_format))
     data = struct.unpack(chunk.binary_format, temp_data)
@@ -224,17 +268,11 @@ def read_chunk(file, chunk):
 
 def read_string(file):
     # read in the characters till we get a null character
-    s = []
-    while True:
-        c = file.read(1)
-        if c == b'\x00':
-            break
-        s.append(c)
-        # print('string: ', s)
+    s = file.read_cstring()
 
     # Remove the null character from the string
     # print("read string", s)
-    return str(b''.join(s), "utf-8", "replace"), len(s) + 1
+    return str(s, "utf-8", "replace"), len(s) + 1
 
 
 def skip_to_end(file, skip_chunk):
@@ -401,25 +439,24 @@ def process_next_chunk(context, file, previous_chunk, imported_objects, CONSTRAI
         if ContextMesh_facels is None:
             ContextMesh_facels = []
 
-        if ContextMesh_vertls:
+        ContextMesh_facels = np.asarray(ContextMesh_facels, dtype=np.int32).reshape(-1, 3)
+
+        # eekadoodle, move zero indices away from the last corner
+        eekadoodle = ContextMesh_facels[:, 2] == 0
+        eekadoodle_faces = ContextMesh_facels.copy()
+        eekadoodle_faces[eekadoodle] = eekadoodle_faces[eekadoodle][:, (2, 0, 1)]
+
+        if ContextMesh_vertls is not None and len(ContextMesh_vertls):
             bmesh.vertices.add(len(ContextMesh_vertls) // 3)
             bmesh.vertices.foreach_set("co", ContextMesh_vertls)
 
             nbr_faces = len(ContextMesh_facels)
             bmesh.polygons.add(nbr_faces)
             bmesh.loops.add(nbr_faces * 3)
-            eekadoodle_faces = []
-            for v1, v2, v3 in ContextMesh_facels:
-                eekadoodle_faces.extend((v3, v1, v2) if v3 == 0 else (v1, v2, v3))
-            bmesh.polygons.foreach_set("loop_start", range(0, nbr_faces * 3, 3))
-            bmesh.loops.foreach_set("vertex_index", eekadoodle_faces)
-
-            if bmesh.polygons and contextMeshUV:
-                bmesh.uv_layers.new()
-                uv_faces = bmesh.uv_layers.active.data[:]
-            else:
-                uv_faces = None
+            bmesh.polygons.foreach_set("loop_start", np.arange(0, nbr_faces * 3, 3, dtype=np.int32))
+            bmesh.loops.foreach_set("vertex_index", eekadoodle_faces.ravel())
 
+            material_indices = np.zeros(nbr_faces, dtype=np.int32)
             for mat_idx, (matName, faces) in enumerate(ContextMeshMaterials):
                 if matName is None:
                     bmat = None
@@ -429,25 +466,21 @@ def process_next_chunk(context, file, previous_chunk, imported_objects, CONSTRAI
 
                 bmesh.materials.append(bmat)  # can be None
                 if bmesh.polygons:
-                    for fidx in faces:
-                        bmesh.polygons[fidx].material_index = mat_idx
+                    material_indices[faces] = mat_idx
                 else:
                     print("\tError: Mesh has no faces!")
 
-            if uv_faces:
-                uvl = bmesh.uv_layers.active.data[:]
-                for fidx, pl in enumerate(bmesh.polygons):
-                    face = ContextMesh_facels[fidx]
-                    v1, v2, v3 = face
-
-                    # eekadoodle
-                    if v3 == 0:
-                        v1, v2, v3 = v3, v1, v2
+            if bmesh.polygons and ContextMeshMaterials:
+                bmesh.polygons.foreach_set("material_index", material_indices)
 
-                    uvl[pl.loop_start].uv = contextMeshUV[v1 * 2: (v1 * 2) + 2]
-                    uvl[pl.loop_start + 1].uv = contextMeshUV[v2 * 2: (v2 * 2) + 2]
-                    uvl[pl.loop_start + 2].uv = contextMeshUV[v3 * 2: (v3 * 2) + 2]
+            if bmesh.polygons and contextMeshUV is not None and len(contextMeshUV):
+                uvs = contextMeshUV.reshape(-1, 2)
+                if eekadoodle_faces.max() < len(uvs):
+                    bmesh.uv_layers.new()
+                    bmesh.uv_layers.active.data.foreach_set("uv", uvs[eekadoodle_faces.ravel()].ravel())
                     # always a tri
+                else:
+                    print("\tWarning: Mesh has fewer UVs than vertices!")
 
         bmesh.validate()
         bmesh.update()
@@ -457,30 +490,36 @@ def process_next_chunk(context, file, previous_chunk, imported_objects, CONSTRAI
         context.view_layer.active_layer_collection.collection.objects.link(ob)
         imported_objects.append(ob)
 
-        if ContextMesh_flag:
+        nbr_polys = len(bmesh.polygons)
+
+        if ContextMesh_flag is not None and len(ContextMesh_flag) and nbr_polys:
             """Bit 0 (0x1) sets edge CA visible, Bit 1 (0x2) sets edge BC visible and
                Bit 2 (0x4) sets edge AB visible. In Blender we use sharp edges for those flags."""
-            for f, pl in enumerate(bmesh.polygons):
-                face = ContextMesh_facels[f]
-                faceflag = ContextMesh_flag[f]
-                edge_ab = bmesh.edges[bmesh.loops[pl.loop_start].edge_index]
-                edge_bc = bmesh.edges[bmesh.loops[pl.loop_start + 1].edge_index]
-                edge_ca = bmesh.edges[bmesh.loops[pl.loop_start + 2].edge_index]
-                if face[2] == 0:
-                    edge_ab, edge_bc, edge_ca = edge_ca, edge_ab, edge_bc
-                if faceflag & 0x1:
-                    edge_ca.use_edge_sharp = True
-                if faceflag & 0x2:
-                    edge_bc.use_edge_sharp = True
-                if faceflag & 0x4:
-                    edge_ab.use_edge_sharp = True
-
-        if ContextMesh_smooth:
-            for f, pl in enumerate(bmesh.polygons):
-                smoothface = ContextMesh_smooth[f]
-                bmesh.polygons[f].use_smooth = True if smoothface > 0 else False
+            loop_starts = np.empty(nbr_polys, dtype=np.int32)
+            bmesh.polygons.foreach_get("loop_start", loop_starts)
+            loop_edges = np.empty(len(bmesh.loops), dtype=np.int32)
+            bmesh.loops.foreach_get("edge_index", loop_edges)
+
+            # Columns are the AB, BC and CA edges of each face
+            face_edges = loop_edges[loop_starts[:, None] + np.arange(3)]
+            rotated = eekadoodle[:nbr_polys]
+            face_edges[rotated] = face_edges[rotated][:, (2, 0, 1)]
+
+            faceflag = np.asarray(ContextMesh_flag[:nbr_polys])
+            sharp_edges = np.zeros(len(bmesh.edges), dtype=bool)
+            sharp_edges[face_edges[faceflag & 0x1 != 0, 2]] = True
+            sharp_edges[face_edges[faceflag & 0x2 != 0, 1]] = True
+            sharp_edges[face_edges[faceflag & 0x4 != 0, 0]] = True
+            if sharp_edges.any():
+                bmesh.edges.foreach_set("use_edge_sharp", sharp_edges)
+
+        if ContextMesh_smooth is not None and len(ContextMesh_smooth):
+            smooth = np.zeros(nbr_polys, dtype=bool)
+            smoothfaces = np.asarray(ContextMesh_smooth[:nbr_polys]) > 0
+            smooth[:len(smoothfaces)] = smoothfaces
+            bmesh.polygons.foreach_set("use_smooth", smooth)
         else:
-            bmesh.polygons.foreach_set("use_smooth", [False] * len(bmesh.polygons))
+            bmesh.polygons.foreach_set("use_smooth", np.zeros(nbr_polys, dtype=bool))
 
     # a spare chunk
     new_chunk = Chunk()
@@ -1172,38 +1211,34 @@ def process_next_chunk(context, file, previous_chunk, imported_objects, CONSTRAI
         elif CreateMesh and new_chunk.ID == OBJECT_VERTICES:
             """Worldspace vertex locations"""
             num_verts = read_short(new_chunk)
-            contextMesh_vertls = struct.unpack('<%df' % (num_verts * 3), file.read(SZ_3FLOAT * num_verts))
+            contextMesh_vertls = file.read_array('<f4', num_verts * 3)
             new_chunk.bytes_read += SZ_3FLOAT * num_verts
 
         elif CreateMesh and new_chunk.ID == OBJECT_FACES:
             num_faces = read_short(new_chunk)
-            temp_data = file.read(SZ_4U_SHORT * num_faces)
+            temp_data = file.read_array('<u2', num_faces * 4).reshape(-1, 4)
             new_chunk.bytes_read += SZ_4U_SHORT * num_faces  # 4 short ints x 2 bytes each
-            contextMesh_facels = struct.unpack('<%dH' % (num_faces * 4), temp_data)
-            contextMesh_flag = [contextMesh_facels[i] for i in range(3, (num_faces * 4) + 3, 4)]
-            contextMesh_facels = [contextMesh_facels[i - 3:i] for i in range(3, (num_faces * 4) + 3, 4)]
+            contextMesh_flag = temp_data[:, 3]
+            contextMesh_facels = temp_data[:, :3]
 
         elif CreateMesh and new_chunk.ID == OBJECT_MATERIAL:
             material_name, read_str_len = read_string(file)
             new_chunk.bytes_read += read_str_len  # remove 1 null character.
             num_faces_using_mat = read_short(new_chunk)
-            temp_data = file.read(SZ_U_SHORT * num_faces_using_mat)
+            temp_data = file.read_array('<u2', num_faces_using_mat)
             new_chunk.bytes_read += SZ_U_SHORT * num_faces_using_mat
-            temp_data = struct.unpack('<%dH' % (num_faces_using_mat), temp_data)
             contextMeshMaterials.append((material_name, temp_data))
             # look up the material in all the materials
 
         elif CreateMesh and new_chunk.ID == OBJECT_SMOOTH:
-            temp_data = file.read(SZ_U_INT * num_faces)
-            smoothgroup = struct.unpack('<%dI' % (num_faces), temp_data)
+            smoothgroup = file.read_array('<u4', num_faces)
             new_chunk.bytes_read += SZ_U_INT * num_faces
             contextMesh_smooth = smoothgroup
 
         elif CreateMesh and new_chunk.ID == OBJECT_UV:
             num_uv = read_short(new_chunk)
-            temp_data = file.read(SZ_2FLOAT * num_uv)
+            contextMeshUV = file.read_array('<f4', num_uv * 2)
             new_chunk.bytes_read += SZ_2FLOAT * num_uv
-            contextMeshUV = struct.unpack('<%df' % (num_uv * 2), temp_data)
 
         elif CreateMesh and new_chunk.ID == OBJECT_TRANS_MATRIX:
             # How do we know the matrix size? 54 == 4x4 48 == 4x3
@@ -1738,7 +1773,7 @@ def load_3ds(filepath, context, CONSTRAIN=10.0, UNITS=False, IMAGE_SEARCH=True,
     MEASURE = 1.0
     duration = time.time()
     current_chunk = Chunk()
-    file = open(filepath, 'rb')
+    file = ChunkReader(filepath)
 
     # here we go!
     read_chunk(file, current_chunk)
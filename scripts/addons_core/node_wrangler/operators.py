@@ -31,7 +31,7 @@ from .interface import NWConnectionListInputs, NWConnectionListOutputs
 from .utils.constants import blend_types, geo_combine_operations, operations, navs, get_texture_node_types, rl_outputs
 from .utils.draw import draw_callback_nodeoutline
 from .utils.paths import match_files_to_socket_names, split_into_components
-from .utils.nodes import (node_mid_pt, autolink, node_at_pos, get_nodes_links,
+from .utils.nodes import (node_mid_pt, autolink, node_at_pos, NodeIndex, get_nodes_links,
                           force_update, nw_check,
                           nw_check_not_empty, nw_check_selected, nw_check_active, nw_check_space_type,
                           nw_check_node_type, nw_check_visible_outputs, nw_check_viewer_node, NWBase,
@@ -55,7 +55,7 @@ class NWLazyMix(Operator, NWBase):
 
         node1 = None
         if not context.scene.NWBusyDrawing:
-            node1 = node_at_pos(nodes, context, event)
+            node1 = node_at_pos(nodes, context, event, self.node_index)
             if node1:
                 context.scene.NWBusyDrawing = node1.name
         else:
@@ -63,7 +63,7 @@ class NWLazyMix(Operator, NWBase):
                 node1 = nodes[context.scene.NWBusyDrawing]
 
         context.scene.NWLazySource = node1.name
-        context.scene.NWLazyTarget = node_at_pos(nodes, context, event).name
+        context.scene.NWLazyTarget = node_at_pos(nodes, context, event, self.node_index).name
 
         if event.type == 'MOUSEMOVE':
             self.mouse_path.append((event.mouse_region_x, event.mouse_region_y))
@@ -72,7 +72,7 @@ class NWLazyMix(Operator, NWBase):
             bpy.types.SpaceNodeEditor.draw_handler_remove(self._handle, 'WINDOW')
 
             node2 = None
-            node2 = node_at_pos(nodes, context, event)
+            node2 = node_at_pos(nodes, context, event, self.node_index)
             if node2:
                 context.scene.NWBusyDrawing = node2.name
 
@@ -100,6 +100,9 @@ class NWLazyMix(Operator, NWBase):
 
     def invoke(self, context, event):
         if context.area.type == 'NODE_EDITOR':
+            nodes, links = get_nodes_links(context)
+            self.node_index = NodeIndex(nodes)
+
             # the arguments we pass the the callback
             args = (self, context, 'MIX')
             # Add the region OpenGL drawing callback
@@ -134,7 +137,7 @@ class NWLazyConnect(Operator, NWBase):
 
         node1 = None
         if not context.scene.NWBusyDrawing:
-            node1 = node_at_pos(nodes, context, event)
+            node1 = node_at_pos(nodes, context, event, self.node_index)
             if node1:
                 context.scene.NWBusyDrawing = node1.name
         else:
@@ -142,7 +145,7 @@ class NWLazyConnect(Operator, NWBase):
                 node1 = nodes[context.scene.NWBusyDrawing]
 
         context.scene.NWLazySource = node1.name
-        context.scene.NWLazyTarget = node_at_pos(nodes, context, event).name
+        context.scene.NWLazyTarget = node_at_pos(nodes, context, event, self.node_index).name
 
         if event.type == 'MOUSEMOVE':
             self.mouse_path.append((event.mouse_region_x, event.mouse_region_y))
@@ -151,7 +154,7 @@ class NWLazyConnect(Operator, NWBase):
             bpy.types.SpaceNodeEditor.draw_handler_remove(self._handle, 'WINDOW')
 
             node2 = None
-            node2 = node_at_pos(nodes, context, event)
+            node2 = node_at_pos(nodes, context, event, self.node_index)
             if node2:
                 context.scene.NWBusyDrawing = node2.name
 
@@ -200,7 +203,8 @@ class NWLazyConnect(Operator, NWBase):
     def invoke(self, context, event):
         if context.area.type == 'NODE_EDITOR':
             nodes, links = get_nodes_links(context)
-            node = node_at_pos(nodes, context, event)
+            self.node_index = NodeIndex(nodes)
+            node = node_at_pos(nodes, context, event, self.node_index)
             if node:
                 context.scene.NWBusyDrawing = node.name
 
@@ -4,8 +4,9 @@
 
 import bpy
 from bpy_extras.node_utils import connect_sockets
-from math import hypot, inf
+from math import inf
 from bpy.app.translations import pgettext_tip as tip_
+from .spatial import RectGrid
 
 
 def force_update(context):
@@ -78,53 +79,54 @@ def abs_node_location(node):
     return abs_location + abs_node_location(node.parent)
 
 
-def node_at_pos(nodes, context, event):
-    nodes_under_mouse = []
-    target_node = None
-
+class NodeIndex:
+    """
+    Spatial index of the nodes of a tree (frames excluded), in absolute view coordinates.
+    Nodes can't be moved while it is in use (e.g. during the modal part of an operator),
+    it is rebuilt by node_at_pos() if nodes are added or removed.
+    """
+
+    def __init__(self, nodes):
+        fac = dpi_fac()
+        parent_locations = {}
+
+        def abs_location(node):
+            parent = node.parent
+            if parent is None:
+                return node.location
+            # Frames are shared by all their children, only compute their location once.
+            location = parent_locations.get(parent.name)
+            if location is None:
+                location = parent_locations[parent.name] = abs_location(parent)
+            return node.location + location
+
+        self.num_nodes = len(nodes)
+        self.nodes = [node for node in nodes if node.type != 'FRAME']  # no point trying to link to a frame node
+        self.grid = RectGrid([
+            (*abs_location(node), node.dimensions.x / fac, node.dimensions.y / fac)
+            for node in self.nodes
+        ])
+
+    def is_valid(self, nodes):
+        return len(nodes) == self.num_nodes
+
+    def node_at(self, x, y):
+        """The node under (x, y) if there is one and only one, else the node nearest to it."""
+        nodes_under_mouse = self.grid.items_at(x, y)
+        if len(nodes_under_mouse) == 1:
+            return self.nodes[nodes_under_mouse[0]]
+        nearest = self.grid.nearest(x, y)
+        return None if nearest is None else self.nodes[nearest]
+
+
+def node_at_pos(nodes, context, event, index=None):
     store_mouse_cursor(context, event)
     x, y = context.space_data.cursor_location
 
-    # Make a list of each corner (and middle of border) for each node.
-    # Will be sorted to find nearest point and thus nearest node
-    node_points_with_dist = []
-    for node in nodes:
-        skipnode = False
-        if node.type != 'FRAME':  # no point trying to link to a frame node
-            dimx = node.dimensions.x / dpi_fac()
-            dimy = node.dimensions.y / dpi_fac()
-            locx, locy = abs_node_location(node)
-
-            if not skipnode:
-                node_points_with_dist.append([node, hypot(x - locx, y - locy)])  # Top Left
-                node_points_with_dist.append([node, hypot(x - (locx + dimx), y - locy)])  # Top Right
-                node_points_with_dist.append([node, hypot(x - locx, y - (locy - dimy))])  # Bottom Left
-                node_points_with_dist.append([node, hypot(x - (locx + dimx), y - (locy - dimy))])  # Bottom Right
-
-                node_points_with_dist.append([node, hypot(x - (locx + (dimx / 2)), y - locy)])  # Mid Top
-                node_points_with_dist.append([node, hypot(x - (locx + (dimx / 2)), y - (locy - dimy))])  # Mid Bottom
-                node_points_with_dist.append([node, hypot(x - locx, y - (locy - (dimy / 2)))])  # Mid Left
-                node_points_with_dist.append([node, hypot(x - (locx + dimx), y - (locy - (dimy / 2)))])  # Mid Right
-
-    nearest_node = sorted(node_points_with_dist, key=lambda k: k[1])[0][0]
-
-    for node in nodes:
-        if node.type != 'FRAME' and skipnode == False:
-            locx, locy = abs_node_location(node)
-            dimx = node.dimensions.x / dpi_fac()
-            dimy = node.dimensions.y / dpi_fac()
-            if (locx <= x <= locx + dimx) and \
-               (locy - dimy <= y <= locy):
-                nodes_under_mouse.append(node)
-
-    if len(nodes_under_mouse) == 1:
-        if nodes_under_mouse[0] != nearest_node:
-            target_node = nodes_under_mouse[0]  # use the node under the mouse if there is one and only one
-        else:
-            target_node = nearest_node  # else use the nearest node
-    else:
-        target_node = nearest_node
-    return target_node
+    # Modal operators pass the index they keep, so it isn't rebuilt on every mouse move.
+    if index is None or not index.is_valid(nodes):
+        index = NodeIndex(nodes)
+    return index.node_at(x, y)
 
 
 def store_mouse_cursor(context, event):
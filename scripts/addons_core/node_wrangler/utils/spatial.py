@@ -0,0 +1,102 @@
+# SPDX-FileCopyrightText: 2023 Blender Foundation
+#
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+from math import floor, hypot, inf
+
+
+def rect_points_dist(rect, x, y):
+    """
+    Distance from (x, y) to the nearest corner or border middle of a rectangle,
+    given as (left, top, width, height) like node locations and dimensions
+    """
+    locx, locy, dimx, dimy = rect
+    return min(
+        hypot(x - locx, y - locy),  # Top Left
+        hypot(x - (locx + dimx), y - locy),  # Top Right
+        hypot(x - locx, y - (locy - dimy)),  # Bottom Left
+        hypot(x - (locx + dimx), y - (locy - dimy)),  # Bottom Right
+        hypot(x - (locx + (dimx / 2)), y - locy),  # Mid Top
+        hypot(x - (locx + (dimx / 2)), y - (locy - dimy)),  # Mid Bottom
+        hypot(x - locx, y - (locy - (dimy / 2))),  # Mid Left
+        hypot(x - (locx + dimx), y - (locy - (dimy / 2))),  # Mid Right
+    )
+
+
+class RectGrid:
+    """
+    Uniform grid of rectangles, given as (left, top, width, height) like node locations
+    and dimensions, to find the rectangles under a point or nearest to it without
+    going through all of them. Rectangles are referred to by their index.
+    """
+
+    def __init__(self, rects, cell_size=200.0):
+        self.rects = list(rects)
+        self.cell_size = cell_size
+        self.cells = {}
+        for i, (locx, locy, dimx, dimy) in enumerate(self.rects):
+            x_min, y_max = self._cell(locx, locy)
+            x_max, y_min = self._cell(locx + dimx, locy - dimy)
+            for cx in range(x_min, x_max + 1):
+                for cy in range(y_min, y_max + 1):
+                    self.cells.setdefault((cx, cy), []).append(i)
+
+    def _cell(self, x, y):
+        return floor(x / self.cell_size), floor(y / self.cell_size)
+
+    def _ring(self, cx, cy, radius):
+        """Cells at exactly radius cells (Chebyshev distance) from (cx, cy)."""
+        if radius == 0:
+            yield (cx, cy)
+            return
+        for dx in range(-radius, radius + 1):
+            yield (cx + dx, cy - radius)
+            yield (cx + dx, cy + radius)
+        for dy in range(-radius + 1, radius):
+            yield (cx - radius, cy + dy)
+            yield (cx + radius, cy + dy)
+
+    def items_at(self, x, y):
+        """Indices of the rectangles containing (x, y), in ascending order."""
+        rects = self.rects
+        items = []
+        for i in self.cells.get(self._cell(x, y), ()):
+            locx, locy, dimx, dimy = rects[i]
+            if (locx <= x <= locx + dimx) and (locy - dimy <= y <= locy):
+                items.append(i)
+        return items
+
+    def nearest(self, x, y):
+        """
+        Index of the rectangle whose nearest corner or border middle is the closest to (x, y),
+        the lowest index wins ties. None if there are no rectangles.
+        """
+        rects = self.rects
+        if not rects:
+            return None
+
+        cx, cy = self._cell(x, y)
+        best_dist, best = inf, len(rects)
+        seen = set()
+        radius = 0
+        # Rectangles are stored in every cell they overlap, and all their points lie on their border,
+        # so the points not found in the rings searched so far are at least (radius - 1) * cell_size away.
+        while best_dist >= (radius - 1) * self.cell_size:
+            if len(seen) == len(rects) or 8 * radius > len(rects):
+                # Searching further out costs more than checking the remaining rectangles.
+                for i in range(len(rects)):
+                    if i not in seen:
+                        dist = rect_points_dist(rects[i], x, y)
+                        if (dist, i) < (best_dist, best):
+                            best_dist, best = dist, i
+                break
+            for cell in self._ring(cx, cy, radius):
+                for i in self.cells.get(cell, ()):
+                    if i in seen:
+                        continue
+                    seen.add(i)
+                    dist = rect_points_dist(rects[i], x, y)
+                    if (dist, i) < (best_dist, best):
+                        best_dist, best = dist, i
+            radius += 1
+        return best
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: 2023 Blender Foundation
+#
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+# pylint: disable=missing-function-docstring
+# pylint: disable=missing-class-docstring
+
+import random
+import unittest
+
+# XXX Not really nice, but that hack is needed to allow execution of that test
+#     from both automated CTest and by directly running the file manually.
+if __name__ == "__main__":
+    from spatial import RectGrid, rect_points_dist
+else:
+    from .spatial import RectGrid, rect_points_dist
+
+
+def nearest_brute(rects, x, y):
+    # Same as the sort used by node_at_pos() before the grid: stable, so the first rectangle wins ties.
+    dists = sorted(((rect_points_dist(rect, x, y), i) for i, rect in enumerate(rects)), key=lambda k: k[0])
+    return dists[0][1] if dists else None
+
+
+def items_at_brute(rects, x, y):
+    return [i for i, (locx, locy, dimx, dimy) in enumerate(rects)
+            if (locx <= x <= locx + dimx) and (locy - dimy <= y <= locy)]
+
+
+def random_rects(rng, count, spread):
+    return [(rng.uniform(-spread, spread), rng.uniform(-spread, spread),
+             rng.uniform(40.0, 400.0), rng.uniform(40.0, 600.0)) for _ in range(count)]
+
+
+class TestRectGrid(unittest.TestCase):
+    def test_empty(self):
+        grid = RectGrid(())
+        self.assertIsNone(grid.nearest(0.0, 0.0))
+        self.assertEqual(grid.items_at(0.0, 0.0), [])
+
+    def test_single(self):
+        grid = RectGrid([(0.0, 0.0, 100.0, 50.0)])
+        self.assertEqual(grid.nearest(5000.0, -3000.0), 0)
+        self.assertEqual(grid.items_at(50.0, -25.0), [0])
+        self.assertEqual(grid.items_at(150.0, -25.0), [])
+
+    def test_ties_lowest_index(self):
+        rects = [(0.0, 0.0, 100.0, 100.0)] * 3
+        grid = RectGrid(rects)
+        self.assertEqual(grid.nearest(50.0, -50.0), 0)
+        self.assertEqual(grid.items_at(50.0, -50.0), [0, 1, 2])
+
+    def test_matches_brute_force(self):
+        rng = random.Random(0)
+        for count, spread in ((5, 300.0), (200, 2000.0), (2000, 20000.0)):
+            rects = random_rects(rng, count, spread)
+            grid = RectGrid(rects)
+            for _ in range(200):
+                x = rng.uniform(-spread * 1.5, spread * 1.5)
+                y = rng.uniform(-spread * 1.5, spread * 1.5)
+                self.assertEqual(grid.nearest(x, y), nearest_brute(rects, x, y))
+                self.assertEqual(grid.items_at(x, y), items_at_brute(rects, x, y))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
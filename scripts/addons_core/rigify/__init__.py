@@ -710,6 +710,20 @@ def register():
                     "X scale for the right side, based on bone name symmetry",
         default=True)
 
+    bpy.types.Armature.rigify_share_widget_meshes = BoolProperty(
+        name="Share Widget Meshes",
+        description="Make widgets created with the same shape and parameters share one mesh. "
+                    "Feature set rigs that edit widget meshes after creating them must call "
+                    "ensure_widget_mesh_single_user() first",
+        default=False)
+
+    bpy.types.Armature.rigify_skip_if_unchanged = BoolProperty(
+        name="Skip If Unchanged",
+        description="Skip generation when nothing in the metarig changed since the target rig was last "
+                    "generated. Otherwise the bones of all rigs are regenerated, while the widgets of "
+                    "unchanged rigs are kept and only those of changed rigs are rebuilt",
+        default=False)
+
     bpy.types.Armature.rigify_widgets_collection = PointerProperty(
         type=bpy.types.Collection,
         name="Widgets Collection",
@@ -849,6 +863,8 @@ def unregister():
     del arm_store.rigify_colors_lock
     del arm_store.rigify_theme_to_add
     del arm_store.rigify_force_widget_update
+    del arm_store.rigify_share_widget_meshes
+    del arm_store.rigify_skip_if_unchanged
     del arm_store.rigify_target_rig
     del arm_store.rigify_rig_ui
 
@@ -4,6 +4,7 @@
 
 import bpy
 import sys
+import time
 import traceback
 import collections
 
@@ -202,10 +203,12 @@ class BaseGenerator:
     derived_bones: dict[str, set[str]]
 
     stage: Optional[str]
+    stage_timings: dict[tuple[str, str], float]
     rig_id: str
 
     widget_collection: bpy.types.Collection
     use_mirror_widgets: bool
+    use_shared_widget_meshes: bool
     old_widget_table: dict[str, bpy.types.Object]
     new_widget_table: dict[str, bpy.types.Object]
     widget_mirror_mesh: dict[str, bpy.types.Mesh]
@@ -246,6 +249,22 @@ class BaseGenerator:
         # Table of renamed ORG bones
         self.org_rename_table = dict()
 
+        # Time spent by each rig or plugin in each stage: {(stage, description): seconds}
+        self.stage_timings = collections.defaultdict(float)
+
+    def __invoke_stage_timed(self, rig_or_plugin, method_name: str):
+        """Invoke a stage callback, accumulating the time spent in it."""
+        time_start = time.perf_counter()
+
+        rig_or_plugin.rigify_invoke_stage(method_name)
+
+        if isinstance(rig_or_plugin, base_rig.BaseRig):
+            description = self.describe_rig(rig_or_plugin)
+        else:
+            description = str(rig_or_plugin.__class__)
+
+        self.stage_timings[method_name, description] += time.perf_counter() - time_start
+
     def disable_auto_parent(self, bone_name: str):
         """Prevent automatically parenting the bone to root if parentless."""
         self.noparent_bones.add(bone_name)
@@ -302,7 +321,7 @@ class BaseGenerator:
         self.stage = method_name
 
         for rig in self.rig_list:
-            rig.rigify_invoke_stage(method_name)
+            self.__invoke_stage_timed(rig, method_name)
 
             assert(self.context.active_object == self.obj)
             assert(self.obj.mode == 'OBJECT')
@@ -313,7 +332,7 @@ class BaseGenerator:
             if i >= len(self.plugin_list):
                 break
 
-            self.plugin_list[i].rigify_invoke_stage(method_name)
+            self.__invoke_stage_timed(self.plugin_list[i], method_name)
 
             assert(self.context.active_object == self.obj)
             assert(self.obj.mode == 'OBJECT')
@@ -328,7 +347,7 @@ class BaseGenerator:
         self.stage = method_name
 
         for rig in self.rig_list:
-            rig.rigify_invoke_stage(method_name)
+            self.__invoke_stage_timed(rig, method_name)
 
             assert(self.context.active_object == self.obj)
             assert(self.obj.mode == 'EDIT')
@@ -339,7 +358,7 @@ class BaseGenerator:
             if i >= len(self.plugin_list):
                 break
 
-            self.plugin_list[i].rigify_invoke_stage(method_name)
+            self.__invoke_stage_timed(self.plugin_list[i], method_name)
 
             assert(self.context.active_object == self.obj)
             assert(self.obj.mode == 'EDIT')
@@ -373,7 +392,7 @@ class BaseGenerator:
         self.stage = 'generate_bones'
 
         for rig in self.rig_list:
-            rig.rigify_invoke_stage('generate_bones')
+            self.__invoke_stage_timed(rig, 'generate_bones')
 
             assert(self.context.active_object == self.obj)
             assert(self.obj.mode == 'EDIT')
@@ -385,7 +404,7 @@ class BaseGenerator:
             if i >= len(self.plugin_list):
                 break
 
-            self.plugin_list[i].rigify_invoke_stage('generate_bones')
+            self.__invoke_stage_timed(self.plugin_list[i], 'generate_bones')
 
             assert(self.context.active_object == self.obj)
             assert(self.obj.mode == 'EDIT')
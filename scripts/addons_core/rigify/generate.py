@@ -4,8 +4,10 @@
 
 import bpy
 import re
+import json
 import time
 
+from collections import defaultdict
 from typing import Optional, TYPE_CHECKING
 
 from .utils.errors import MetarigError
@@ -23,7 +25,9 @@ from .utils.collections import (ensure_collection, list_layer_collections,
                                 filter_layer_collections_by_object)
 from .utils.rig import get_rigify_type, get_rigify_target_rig,\
     get_rigify_rig_basename, get_rigify_force_widget_update, get_rigify_finalize_script,\
-    get_rigify_mirror_widgets, get_rigify_colors
+    get_rigify_mirror_widgets, get_rigify_share_widget_meshes, get_rigify_colors,\
+    get_rigify_skip_if_unchanged, compute_rig_fingerprints
+from .utils.misc import property_to_python
 from .utils.action_layers import ActionLayerBuilder
 from .utils.objects import ArtifactManager
 
@@ -41,12 +45,37 @@ RIG_MODULE = "rigs"
 class Timer:
     def __init__(self):
         self.time_val = time.time()
+        self.time_start = self.time_val
+        # List of (label, seconds) for each tick.
+        self.timings = []
 
     def tick(self, string):
         t = time.time()
         print(string + "%.3f" % (t - self.time_val))
+        self.timings.append((string.rstrip(": "), t - self.time_val))
         self.time_val = t
 
+    def report(self, stage_timings: Optional[dict[tuple[str, str], float]] = None, limit=5):
+        """Print the time of each tick, followed by the slowest rigs of each stage."""
+        total = time.time() - self.time_start
+        print("Rigify generation timing report (total %.3f):" % total)
+
+        for label, duration in self.timings:
+            print("  %-30s %8.3f  %5.1f%%" % (label, duration, 100.0 * duration / total if total else 0.0))
+
+        if not stage_timings:
+            return
+
+        by_stage = defaultdict(list)
+        for (stage, description), duration in stage_timings.items():
+            by_stage[stage].append((duration, description))
+
+        for stage, entries in by_stage.items():
+            entries.sort(reverse=True)
+            print("  Slowest in %s:" % stage)
+            for duration, description in entries[:limit]:
+                print("    %8.3f  %s" % (duration, description))
+
 
 class Generator(base_generate.BaseGenerator):
     usable_collections: list[bpy.types.LayerCollection]
@@ -58,6 +87,14 @@ class Generator(base_generate.BaseGenerator):
         self.id_store = context.window_manager
         self.saved_visible_layers = {}
 
+        # Set when generation was skipped because nothing changed since the last time.
+        self.is_up_to_date = False
+
+        # Metarig data hashes of each rig sub-tree, see compute_rig_fingerprints().
+        self.fingerprints = {}
+        # Names of the metarig bones, keyed by their name in the generated rig.
+        self.metarig_bone_names = {}
+
     def find_rig_class(self, rig_type):
         rig_module = rig_lists.rigs[rig_type]["module"]
 
@@ -177,13 +214,21 @@ class Generator(base_generate.BaseGenerator):
         self.metarig.data.rigify_widgets_collection = self.widget_collection
 
         self.use_mirror_widgets = get_rigify_mirror_widgets(self.metarig.data)
+        self.use_shared_widget_meshes = get_rigify_share_widget_meshes(self.metarig.data)
+
+        force_update = get_rigify_force_widget_update(self.metarig.data)
+        changed_bones = self.__find_changed_rig_bones()
 
         # Build tables for existing widgets
         self.old_widget_table = {}
         self.new_widget_table = {}
         self.widget_mirror_mesh = {}
 
-        if get_rigify_force_widget_update(self.metarig.data):
+        # Meshes shared by widgets created by the same generator with the same parameters
+        self.widget_mesh_cache = {}
+        self.widget_mesh_cache_set = set()
+
+        if force_update and changed_bones is None:
             # Remove widgets if force update is set
             for obj in list(self.widget_collection.objects):
                 bpy.data.objects.remove(obj)
@@ -195,6 +240,17 @@ class Generator(base_generate.BaseGenerator):
                 if bone.custom_shape and bone.custom_shape.name in known_widgets:
                     self.old_widget_table[bone.name] = bone.custom_shape
 
+            if changed_bones is not None:
+                # Keep the widgets of unchanged rigs, and rebuild the ones of changed rigs
+                # (or all others if force update is set).
+                changed_widgets = {self.old_widget_table.pop(name) for name in changed_bones
+                                   if name in self.old_widget_table}
+                kept_widgets = set(self.old_widget_table.values())
+
+                for obj in list(self.widget_collection.objects):
+                    if obj in changed_widgets or (force_update and obj not in kept_widgets):
+                        bpy.data.objects.remove(obj)
+
             # Rename widgets in case the rig was renamed
             name_prefix = WGT_PREFIX + self.obj.name + "_"
 
@@ -210,9 +266,12 @@ class Generator(base_generate.BaseGenerator):
 
             # Find meshes for mirroring
             if self.use_mirror_widgets:
+                changed_mid_names = {change_name_side(name, Side.MIDDLE) for name in changed_bones or ()}
+
                 for bone_name, widget in self.old_widget_table.items():
                     mid_name = change_name_side(bone_name, Side.MIDDLE)
-                    if bone_name != mid_name:
+                    # Don't share the old mesh with the rebuilt widget of the other side
+                    if bone_name != mid_name and mid_name not in changed_mid_names:
                         assert isinstance(widget.data, bpy.types.Mesh)
                         self.widget_mirror_mesh[mid_name] = widget.data
 
@@ -255,7 +314,9 @@ class Generator(base_generate.BaseGenerator):
         assert temp_obj and temp_obj != metarig
 
         self.__freeze_driver_vars(temp_obj)
+        metarig_bone_names = [bone.name for bone in temp_obj.data.bones]
         self.__rename_org_bones(temp_obj)
+        self.metarig_bone_names = dict(zip(self.original_bones, metarig_bone_names))
 
         # Select the target rig and join
         select_object(context, obj)
@@ -447,6 +508,81 @@ class Generator(base_generate.BaseGenerator):
             user_visible = self.saved_visible_layers.get(coll.name, coll.is_visible)
             coll.is_visible = user_visible and coll.name in has_ui_buttons
 
+    def __compute_fingerprints(self) -> dict[str, str]:
+        from . import bl_info
+        from .feature_set_list import get_enabled_modules_names
+
+        meta_data = self.metarig.data
+
+        # Settings of the metarig armature that affect the whole rig.
+        extra_data = [
+            bl_info["version"],
+            sorted(get_enabled_modules_names()),
+            [
+                (coll.name, coll.parent.name if coll.parent else None,
+                 property_to_python(dict(coll)))
+                for coll in flatten_children(meta_data.collections)
+            ],
+            property_to_python(dict(meta_data)),
+            get_rigify_finalize_script(meta_data).as_string() if get_rigify_finalize_script(meta_data) else None,
+        ]
+
+        return compute_rig_fingerprints(self.metarig, extra_data)
+
+    def __find_changed_rig_bones(self) -> Optional[set[str]]:
+        """
+        Find the bones of the previously generated rig that belong to rigs whose metarig
+        data changed, using the fingerprints stored by __store_bone_fingerprints().
+        Returns None if widgets of unchanged rigs should not be reused.
+        """
+        if not get_rigify_skip_if_unchanged(self.metarig.data) or not self.obj.pose:
+            return None
+
+        bone_fingerprints = self.obj.data.get("rigify_bone_fingerprints")
+        if not isinstance(bone_fingerprints, str):
+            return None
+
+        current = set(self.fingerprints.values())
+
+        return {name for name, fingerprint in json.loads(bone_fingerprints).items()
+                if fingerprint not in current}
+
+    def __store_bone_fingerprints(self):
+        """Remember the fingerprint of the rig owning each generated bone."""
+        metarig_bones = self.metarig.data.bones
+
+        # Rigs may rename ORG bones while instantiating, including their base bone.
+        org_names = {new_name: old_name for old_name, new_name in self.org_rename_table.items()}
+        rig_fingerprints = {}
+
+        for rig in self.rig_list:
+            # Sub-rigs may be based on bones without a rig type, use the rig owning them.
+            bone = metarig_bones.get(self.metarig_bone_names.get(org_names.get(rig.base_bone, rig.base_bone), ""))
+            while bone and bone.name not in self.fingerprints:
+                bone = bone.parent
+            rig_fingerprints[rig] = self.fingerprints[bone.name if bone else ""]
+
+        # Bones not owned by any rig, e.g. made by plugins, are always considered changed.
+        bone_fingerprints = {name: rig_fingerprints.get(owner) for name, owner in self.bone_owners.items()}
+
+        self.obj.data["rigify_bone_fingerprints"] = json.dumps(bone_fingerprints)
+
+    def __check_up_to_date(self, obj: ArmatureObject, fingerprints: dict[str, str]) -> bool:
+        """Check if the rig was generated from the same metarig data; any change means a full regeneration."""
+        old_fingerprints = obj.data.get("rigify_fingerprints")
+        if not isinstance(old_fingerprints, str):
+            return False
+
+        old_fingerprints = json.loads(old_fingerprints)
+
+        dirty = sorted(name or "<global settings>" for name in fingerprints.keys() | old_fingerprints.keys()
+                       if fingerprints.get(name) != old_fingerprints.get(name))
+        if dirty:
+            print("Changed rigs, regenerating: " + ", ".join(dirty))
+            return False
+
+        return True
+
     def generate(self):
         context = self.context
         metarig = self.metarig
@@ -458,6 +594,21 @@ class Generator(base_generate.BaseGenerator):
 
         bpy.ops.object.mode_set(mode='OBJECT')
 
+        fingerprints = self.fingerprints = self.__compute_fingerprints()
+
+        t.tick("Compute fingerprints: ")
+
+        ###########################################
+        # Skip generation when nothing changed since the rig was generated
+        if get_rigify_skip_if_unchanged(metarig.data):
+            target_rig = get_rigify_target_rig(metarig.data)
+
+            if target_rig and target_rig.data.bones and self.__check_up_to_date(target_rig, fingerprints):
+                print("Rig is up to date, skipping generation.")
+                self.obj = target_rig
+                self.is_up_to_date = True
+                return
+
         ###########################################
         # Create/find the rig object and set it up
         obj_found, obj = self.ensure_rig_object()
@@ -651,12 +802,19 @@ class Generator(base_generate.BaseGenerator):
 
         self.artifacts.generate_cleanup()
 
+        # Remember what the rig was generated from
+        obj.data["rigify_fingerprints"] = json.dumps(fingerprints)
+        self.__store_bone_fingerprints()
+
         ###########################################
         # Restore active collection
         view_layer.active_layer_collection = self.layer_collection
 
+        t.tick("Restore state: ")
+        t.report(self.stage_timings)
 
-def generate_rig(context, metarig):
+
+def generate_rig(context, metarig) -> Generator:
     """ Generates a rig from a metarig.
 
     """
@@ -673,6 +831,8 @@ def generate_rig(context, metarig):
 
         metarig.data.pose_position = rest_backup
 
+        return generator
+
     except Exception as e:
         # Cleanup if something goes wrong
         print("Rigify: failed to generate rig.")
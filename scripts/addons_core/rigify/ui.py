@@ -210,6 +210,8 @@ class DATA_PT_rigify_advanced(bpy.types.Panel):
         col.separator()
         col.row().prop(armature_id_store, "rigify_force_widget_update")
         col.row().prop(armature_id_store, "rigify_mirror_widgets")
+        col.row().prop(armature_id_store, "rigify_share_widget_meshes")
+        col.row().prop(armature_id_store, "rigify_skip_if_unchanged")
         col.separator()
         col.row().prop(armature_id_store, "rigify_finalize_script", text="Run Script")
 
@@ -1075,7 +1077,7 @@ class Generate(bpy.types.Operator):
             return {'CANCELLED'}
 
         try:
-            generate.generate_rig(context, metarig)
+            generator = generate.generate_rig(context, metarig)
         except MetarigError as rig_exception:
             import traceback
             traceback.print_exc()
@@ -1089,7 +1091,10 @@ class Generate(bpy.types.Operator):
             self.report({'ERROR'}, message)
         else:
             target_rig = get_rigify_target_rig(metarig.data)
-            message = rpt_('Successfully generated: "{:s}"').format(target_rig.name)
+            if generator.is_up_to_date:
+                message = rpt_('Rig is up to date: "{:s}"').format(target_rig.name)
+            else:
+                message = rpt_('Successfully generated: "{:s}"').format(target_rig.name)
             self.report({'INFO'}, message)
         finally:
             bpy.ops.object.mode_set(mode='OBJECT')
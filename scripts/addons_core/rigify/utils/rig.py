@@ -16,7 +16,8 @@ from bpy.types import bpy_prop_array, bpy_prop_collection  # noqa
 from idprop.types import IDPropertyArray
 from mathutils import Vector
 
-from .misc import ArmatureObject, wrap_list_to_lines, IdPropSequence, find_index, flatten_children
+from .misc import ArmatureObject, wrap_list_to_lines, IdPropSequence, find_index, flatten_children,\
+    property_to_python
 
 if TYPE_CHECKING:
     from ..base_rig import BaseRig
@@ -79,6 +80,14 @@ def get_rigify_force_widget_update(arm: Armature) -> bool:
     return arm.rigify_force_widget_update  # noqa
 
 
+def get_rigify_share_widget_meshes(arm: Armature) -> bool:
+    return arm.rigify_share_widget_meshes  # noqa
+
+
+def get_rigify_skip_if_unchanged(arm: Armature) -> bool:
+    return arm.rigify_skip_if_unchanged  # noqa
+
+
 def get_rigify_finalize_script(arm: Armature) -> Optional[bpy.types.Text]:
     return arm.rigify_finalize_script  # noqa
 
@@ -398,6 +407,74 @@ def list_bone_names_depth_first_sorted(obj: ArmatureObject):
     return result_list
 
 
+def _bone_fingerprint_data(obj: ArmatureObject, bone_name: str) -> list:
+    """Collect the metarig data of a bone that affects what gets generated from it."""
+    bone = obj.data.bones[bone_name]
+    pose_bone = obj.pose.bones[bone_name]
+
+    return [
+        bone.name,
+        bone.parent.name if bone.parent else None,
+        bone.use_connect,
+        [round(v, 6) for row in bone.matrix_local for v in row],
+        round(bone.length, 6),
+        bone.bbone_segments,
+        bone.use_deform,
+        sorted(coll.name for coll in bone.collections),
+        pose_bone.rotation_mode,
+        tuple(pose_bone.lock_location), tuple(pose_bone.lock_rotation),
+        pose_bone.lock_rotation_w, tuple(pose_bone.lock_scale),
+        pose_bone.custom_shape.name if pose_bone.custom_shape else None,
+        [(con.type, con.name, getattr(con, 'subtarget', None)) for con in pose_bone.constraints],
+        # Includes the rig type and parameters, which are stored as ID properties.
+        property_to_python(dict(pose_bone)),
+    ]
+
+
+def compute_rig_fingerprints(obj: ArmatureObject, extra_data: Any = None) -> dict[str, str]:
+    """
+    Hash the metarig data used by each rig sub-tree, keyed by the base bone of the rig.
+
+    Bones without a rig type belong to the closest parent bone with one. The hash of a rig
+    also covers its parent rigs, because child rigs are generated on top of their output.
+    Bones not belonging to any rig, and ``extra_data``, are hashed under the empty key.
+
+    The generator uses these to skip generation when nothing changed, and otherwise to
+    rebuild only the widgets of changed rigs; bones, constraints and drivers of all rigs
+    are always regenerated, since rigs build on each other's output in every stage.
+    """
+    import hashlib
+    import json
+
+    def hash_data(data) -> str:
+        return hashlib.sha1(json.dumps(data, sort_keys=True, default=repr).encode('utf-8')).hexdigest()
+
+    owners: dict[str, str] = {}
+    owned_data: dict[str, list] = defaultdict(list)
+
+    for name in list_bone_names_depth_first_sorted(obj):
+        bone = obj.data.bones[name]
+        if get_rigify_type(obj.pose.bones[name]):
+            owner = name
+        else:
+            owner = owners[bone.parent.name] if bone.parent else ""
+        owners[name] = owner
+        owned_data[owner].append(_bone_fingerprint_data(obj, name))
+
+    owned_data[""].append(extra_data)
+
+    fingerprints = {"": hash_data(owned_data[""])}
+
+    # Parents are always listed before their children.
+    for name, owner in owners.items():
+        if owner == name:
+            parent = obj.data.bones[name].parent
+            parent_owner = owners[parent.name] if parent else ""
+            fingerprints[name] = hash_data([fingerprints[parent_owner], owned_data[name]])
+
+    return fingerprints
+
+
 def _get_property_value(obj, name: str):
     """Retrieve the attribute value, converting from Blender to python types."""
     value = getattr(obj, name, None)
@@ -6,6 +6,7 @@ import bpy
 import math
 import inspect
 import functools
+import numpy as np
 
 from typing import Optional, Callable, TYPE_CHECKING
 from bpy.types import Mesh, Object, UILayout, WindowManager
@@ -251,6 +252,84 @@ class GeometryData:
         self.edges = []
         self.faces = []
 
+    def to_mesh(self, mesh: Mesh):
+        """Fill an empty mesh with the geometry, using bulk array access."""
+        verts = np.array([tuple(v) for v in self.verts], dtype=np.float32).reshape(-1, 3)
+        edges = np.array(self.edges, dtype=np.int32).reshape(-1, 2)
+        face_lengths = np.fromiter(map(len, self.faces), dtype=np.int32, count=len(self.faces))
+
+        mesh.vertices.add(len(verts))
+        mesh.edges.add(len(edges))
+        mesh.loops.add(int(face_lengths.sum()))
+        mesh.polygons.add(len(face_lengths))
+
+        mesh.vertices.foreach_set("co", verts.ravel())
+        mesh.edges.foreach_set("vertices", edges.ravel())
+
+        if len(face_lengths):
+            loop_starts = np.zeros(len(face_lengths), dtype=np.int32)
+            np.cumsum(face_lengths[:-1], out=loop_starts[1:])
+
+            mesh.polygons.foreach_set("loop_start", loop_starts)
+            mesh.loops.foreach_set("vertex_index", np.fromiter(
+                (i for face in self.faces for i in face), dtype=np.int32, count=len(mesh.loops)))
+            mesh.shade_flat()
+
+        mesh.update(calc_edges=bool(len(face_lengths)), calc_edges_loose=bool(len(edges)))
+
+
+def _make_widget_cache_key(value):
+    """Convert widget generator arguments to a hashable key, or raise TypeError."""
+    if isinstance(value, (Vector, Matrix, Euler, list, tuple, np.ndarray)):
+        return tuple(_make_widget_cache_key(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _make_widget_cache_key(v)) for k, v in value.items()))
+    hash(value)
+    return value
+
+
+def _get_cached_widget_mesh(generator, generate_func, kwargs, obj: MeshObject):
+    """
+    Look up the mesh shared by widgets made by the same generator function with the
+    same parameters. Returns the cache key, and the mesh if it already exists.
+    """
+    if not generator or not generator.use_shared_widget_meshes:
+        return None, None
+
+    # Mirrored widget meshes are already shared between the sides and adjusted per side.
+    if obj.data in generator.widget_mirror_mesh.values():
+        return None, None
+
+    try:
+        key = (generate_func.__module__, generate_func.__qualname__, _make_widget_cache_key(kwargs))
+    except TypeError:
+        return None, None
+
+    return key, generator.widget_mesh_cache.get(key)
+
+
+def ensure_widget_mesh_single_user(obj: Object):
+    """
+    Make sure the widget mesh can be modified without affecting other widgets
+    sharing the same cached mesh.
+    """
+    from ..base_generate import BaseGenerator
+
+    generator = BaseGenerator.instance
+    mesh = obj.data
+
+    if generator and mesh in generator.widget_mesh_cache_set:
+        if mesh.users > 1:
+            obj.data = mesh.copy()
+            obj.data.name = obj.name
+        else:
+            # Sole user: take the mesh out of the cache, rather than leaving it unused.
+            generator.widget_mesh_cache_set.remove(mesh)
+            generator.widget_mesh_cache = {
+                key: cached_mesh for key, cached_mesh in generator.widget_mesh_cache.items()
+                if cached_mesh != mesh
+            }
+
 
 def widget_generator(generate_func=None, *, register=None, subsurf=0) -> Callable:
     """
@@ -259,6 +338,11 @@ def widget_generator(generate_func=None, *, register=None, subsurf=0) -> Callabl
 
     Accepts parameters of create_widget, plus any keyword arguments the
     wrapped function has.
+
+    If the metarig enables Share Widget Meshes, widgets created during generation with
+    the same parameters share one mesh. Use ensure_widget_mesh_single_user before
+    modifying the mesh of the returned object directly; the adjust_widget_* functions
+    do it automatically.
     """
     if generate_func is None:
         return functools.partial(widget_generator, register=register, subsurf=subsurf)
@@ -270,13 +354,28 @@ def widget_generator(generate_func=None, *, register=None, subsurf=0) -> Callabl
                             widget_name=widget_name, widget_force_new=widget_force_new,
                             subsurf=subsurf)
         if obj is not None:
+            from ..base_generate import BaseGenerator
+
+            generator = BaseGenerator.instance
+            key, cached_mesh = _get_cached_widget_mesh(generator, generate_func, kwargs, obj)
+
+            if cached_mesh:
+                # Remove the empty mesh the object was created with, so it isn't left without users.
+                mesh = obj.data
+                obj.data = cached_mesh
+                bpy.data.meshes.remove(mesh)
+                return obj
+
             geom = GeometryData()
 
             generate_func(geom, **kwargs)
 
             mesh: Mesh = obj.data
-            mesh.from_pydata(geom.verts, geom.edges, geom.faces)
-            mesh.update()
+            geom.to_mesh(mesh)
+
+            if key is not None:
+                generator.widget_mesh_cache[key] = mesh
+                generator.widget_mesh_cache_set.add(mesh)
 
             return obj
         else:
@@ -297,17 +396,20 @@ def generate_lines_geometry(geom: GeometryData,
     assert len(points) >= 2
 
     base = len(geom.verts)
+    count_points = len(points)
 
+    coords = np.zeros((count_points, 3))
     for i, raw_point in enumerate(points):
-        point = Vector(raw_point).to_3d()
+        coords[i, :len(raw_point)] = raw_point[:3]
 
-        if matrix:
-            point = matrix @ point
+    if matrix:
+        matrix = np.array(matrix.to_4x4())
+        coords = coords @ matrix[:3, :3].T + matrix[:3, 3]
 
-        geom.verts.append(point)
+    geom.verts.extend(map(Vector, coords))
 
-        if i > 0:
-            geom.edges.append((base + i - 1, base + i))
+    indices = np.arange(base, base + count_points)
+    geom.edges.extend(zip(indices[:-1].tolist(), indices[1:].tolist()))
 
     if closed_loop:
         geom.edges.append((len(geom.verts) - 1, base))
@@ -341,13 +443,11 @@ def generate_circle_geometry(geom: GeometryData, center: AnyVector, radius: floa
         radius_x = radius
 
     center = Vector(center).to_3d()  # allow 2d center
-    points = []
 
-    for i in range(steps):
-        angle = start + delta * i
-        x = math.cos(angle)
-        y = math.sin(angle)
-        points.append(center + Vector((x * radius_x, y * radius, x * x * depth_x)))
+    angles = start + delta * np.arange(steps)
+    x = np.cos(angles)
+    y = np.sin(angles)
+    points = np.column_stack((x * radius_x, y * radius, x * x * depth_x)) + np.array(center)
 
     generate_lines_geometry(geom, points, matrix=matrix, closed_loop=not angle_range)
 
@@ -463,8 +563,8 @@ def adjust_widget_axis(obj: Object, axis='y', offset=0.0):
 
     matrix = trans_matrix @ rot_matrix
 
-    for vert in mesh.vertices:
-        vert.co = matrix @ vert.co
+    ensure_widget_mesh_single_user(obj)
+    obj.data.transform(matrix)
 
 
 def adjust_widget_transform_mesh(obj: Optional[Object], matrix: Matrix,
@@ -475,8 +575,10 @@ def adjust_widget_transform_mesh(obj: Optional[Object], matrix: Matrix,
        If local is a bone, it's in the local space of the bone.
     """
     if obj:
+        assert isinstance(obj.data, Mesh)
+
+        ensure_widget_mesh_single_user(obj)
         mesh = obj.data
-        assert isinstance(mesh, Mesh)
 
         if local is not True:
             if local:
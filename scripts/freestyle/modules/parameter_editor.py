@@ -80,8 +80,6 @@ from freestyle.utils import (
     curvature_from_stroke_vertex,
     getCurrentScene,
     iter_distance_along_stroke,
-    iter_distance_from_camera,
-    iter_distance_from_object,
     iter_material_value,
     iter_t2d_along_stroke,
     normal_at_I0D,
@@ -95,8 +93,11 @@ from _freestyle import (
     evaluateCurveMappingF,
 )
 
+import json
+import os
 import time
 import bpy
+import numpy as np
 
 from mathutils import Vector
 from math import pi, sin, cos, acos, radians
@@ -109,6 +110,42 @@ callbacks_lineset_pre = []
 callbacks_modifiers_post = []
 callbacks_lineset_post = []
 
+# Opt-in profiling of process(): when enabled, the time spent in each stage of every
+# line set and in each stroke shader is recorded, along with view edge, chain, stroke
+# and vertex counts (see profile_enable(), profile_records and profile_dump()).
+# Setting the BLENDER_FREESTYLE_PROFILE environment variable to a file path enables
+# profiling; the records of a view layer are appended to that file once its last line set
+# of the frame has been processed, and then cleared.
+profile_filepath = os.environ.get("BLENDER_FREESTYLE_PROFILE") or None
+profile_enabled = profile_filepath is not None
+profile_records = []
+
+# Number of samples of the lookup tables color ramps and curve mappings are baked into.
+# Modifiers are created once per line set, so baking happens once per line set and stroke
+# vertices are shaded by interpolating the tables. Set to 0 to evaluate the ramps and
+# curves for every stroke vertex instead.
+lookup_table_size = 1024
+
+
+def unzip_stroke_values(pairs):
+    """Splits (StrokeVertex, value) pairs into a tuple of vertices and an array of values."""
+    pairs = tuple(pairs)
+    if not pairs:
+        return (), np.empty(0)
+    sverts, values = zip(*pairs)
+    return sverts, np.array(values, dtype=float)
+
+
+def interpolate_lookup_table(lut, values):
+    """Linearly interpolates a table sampled uniformly over [0, 1] at the given values."""
+    # NaN values would be cast to an invalid index, use the start of the table instead.
+    pos = np.clip(np.nan_to_num(values, nan=0.0), 0.0, 1.0) * (len(lut) - 1)
+    index = np.minimum(pos.astype(int), len(lut) - 2)
+    fac = pos - index
+    if lut.ndim > 1:
+        fac = fac[:, None]
+    return lut[index] * (1.0 - fac) + lut[index + 1] * fac
+
 
 class ColorRampModifier(StrokeShader):
     """Primitive for the color modifiers."""
@@ -118,14 +155,31 @@ class ColorRampModifier(StrokeShader):
         self.blend = blend
         self.influence = influence
         self.ramp = ramp
+        self.lut = None
+        if lookup_table_size > 1:
+            samples = np.linspace(0.0, 1.0, lookup_table_size).tolist()
+            self.lut = np.array([tuple(self.evaluate(t)) for t in samples])
 
     def evaluate(self, t):
         col = evaluateColorRamp(self.ramp, t)
         return col.xyz  # omit alpha
 
+    def evaluate_array(self, values):
+        """Evaluates the ramp at each of the given values, returns an (N, 3) array of colors."""
+        if self.lut is None:
+            return np.array([tuple(self.evaluate(t)) for t in values.tolist()]).reshape(-1, 3)
+        # color ramp stops lie within [0, 1], so clamping the values does not change the result
+        return interpolate_lookup_table(self.lut, values)
+
     def blend_ramp(self, a, b):
         return blendRamp(self.blend, a, self.influence, b)
 
+    def blend_colors(self, pairs):
+        """Blends the color of each (StrokeVertex, value) pair with the ramp evaluated at that value."""
+        sverts, values = unzip_stroke_values(pairs)
+        for svert, b in zip(sverts, self.evaluate_array(values).tolist()):
+            svert.attribute.color = self.blend_ramp(svert.attribute.color, b)
+
 
 class ScalarBlendModifier(StrokeShader):
     """Primitive for alpha and thickness modifiers."""
@@ -158,14 +212,46 @@ class ScalarBlendModifier(StrokeShader):
             raise ValueError("unknown curve blend type: " + self.blend_type)
         return v1
 
+    def blend_array(self, v1, v2):
+        """Same as blend(), for arrays of values."""
+        fac = self.influence
+        facm = 1.0 - fac
+        if self.blend_type == 'MIX':
+            v1 = facm * v1 + fac * v2
+        elif self.blend_type == 'ADD':
+            v1 = v1 + fac * v2
+        elif self.blend_type == 'MULTIPLY':
+            v1 = v1 * (facm + fac * v2)
+        elif self.blend_type == 'SUBTRACT':
+            v1 = v1 - fac * v2
+        elif self.blend_type == 'DIVIDE':
+            nonzero = v2 != 0.0
+            v1 = np.where(nonzero, facm * v1 + fac * v1 / np.where(nonzero, v2, 1.0), v1)
+        elif self.blend_type == 'DIFFERENCE':
+            v1 = facm * v1 + fac * np.abs(v1 - v2)
+        elif self.blend_type == 'MINIMUM':
+            v1 = np.minimum(fac * v2, v1)
+        elif self.blend_type == 'MAXIMUM':
+            v1 = np.maximum(fac * v2, v1)
+        else:
+            raise ValueError("unknown curve blend type: " + self.blend_type)
+        return v1
+
 
 class CurveMappingModifier(ScalarBlendModifier):
     def __init__(self, blend, influence, mapping, invert, curve):
         ScalarBlendModifier.__init__(self, blend, influence)
         assert mapping in {'LINEAR', 'CURVE'}
+        self.mapping = mapping
         self.evaluate = getattr(self, mapping)
         self.invert = invert
         self.curve = curve
+        self.lut = None
+        if mapping == 'CURVE' and lookup_table_size > 1:
+            curve.initialize()
+            samples = np.linspace(0.0, 1.0, lookup_table_size).tolist()
+            lut = np.array([curve.evaluate(curve=curve.curves[0], position=t) for t in samples])
+            self.lut = np.clip(lut, curve.clip_min_y, curve.clip_max_y)
 
     def LINEAR(self, t):
         return (1.0 - t) if self.invert else t
@@ -179,6 +265,26 @@ class CurveMappingModifier(ScalarBlendModifier):
         # therefore, bound the result by the curve's min and max values
         return bound(curve.clip_min_y, result, curve.clip_max_y)
 
+    def evaluate_array(self, values):
+        """Evaluates the mapping at each of the given values, returns an array of the results."""
+        if self.mapping == 'LINEAR':
+            return (1.0 - values) if self.invert else values
+        if self.lut is None:
+            return np.array([self.CURVE(t) for t in values.tolist()], dtype=float)
+        result = interpolate_lookup_table(self.lut, values)
+        # the curve may be extrapolated outside of [0, 1], which the table does not cover
+        outside = (values < 0.0) | (values > 1.0)
+        if outside.any():
+            result[outside] = [self.CURVE(t) for t in values[outside].tolist()]
+        return result
+
+    def blend_alphas(self, pairs):
+        """Blends the alpha of each (StrokeVertex, value) pair with the curve evaluated at that value."""
+        sverts, values = unzip_stroke_values(pairs)
+        alphas = np.fromiter((svert.attribute.alpha for svert in sverts), dtype=float, count=len(sverts))
+        for svert, alpha in zip(sverts, self.blend_array(alphas, self.evaluate_array(values)).tolist()):
+            svert.attribute.alpha = alpha
+
 
 class ThicknessModifierMixIn:
     def __init__(self):
@@ -220,6 +326,14 @@ class ThicknessBlenderMixIn(ThicknessModifierMixIn):
                 thickness = sum(thickness)
             self.blend_thickness_symmetric(svert, thickness)
 
+    def blend_thicknesses(self, pairs, bounds):
+        """Maps the curve evaluated at the value of each (StrokeVertex, value) pair into the given
+        bounds, then blends and sets the thickness of the vertex."""
+        sverts, values = unzip_stroke_values(pairs)
+        thicknesses = bounds.min + self.evaluate_array(values) * bounds.delta
+        for svert, thickness in zip(sverts, thicknesses.tolist()):
+            self.blend_thickness(svert, thickness)
+
     def blend_thickness_symmetric(self, svert, v):
         """Blends and sets the thickness. Thickness is equal on each side of the backbone"""
         outer, inner = svert.attribute.thickness
@@ -292,20 +406,14 @@ class ColorAlongStrokeShader(ColorRampModifier):
     """Maps a ramp to the color of the stroke, using the curvilinear abscissa (t)."""
 
     def shade(self, stroke):
-        for svert, t in zip(stroke, iter_t2d_along_stroke(stroke)):
-            a = svert.attribute.color
-            b = self.evaluate(t)
-            svert.attribute.color = self.blend_ramp(a, b)
+        self.blend_colors(zip(stroke, iter_t2d_along_stroke(stroke)))
 
 
 class AlphaAlongStrokeShader(CurveMappingModifier):
     """Maps a curve to the alpha/transparency of the stroke, using the curvilinear abscissa (t)."""
 
     def shade(self, stroke):
-        for svert, t in zip(stroke, iter_t2d_along_stroke(stroke)):
-            a = svert.attribute.alpha
-            b = self.evaluate(t)
-            svert.attribute.alpha = self.blend(a, b)
+        self.blend_alphas(zip(stroke, iter_t2d_along_stroke(stroke)))
 
 
 class ThicknessAlongStrokeShader(ThicknessBlenderMixIn, CurveMappingModifier):
@@ -318,13 +426,33 @@ class ThicknessAlongStrokeShader(ThicknessBlenderMixIn, CurveMappingModifier):
         self.value = BoundedProperty(value_min, value_max)
 
     def shade(self, stroke):
-        for svert, t in zip(stroke, iter_t2d_along_stroke(stroke)):
-            b = self.value.min + self.evaluate(t) * self.value.delta
-            self.blend_thickness(svert, b)
+        self.blend_thicknesses(zip(stroke, iter_t2d_along_stroke(stroke)), self.value)
 
 
 # -- Distance from Camera modifiers -- #
 
+def iter_distance_from_point(stroke, location, range_min, range_max, normfac):
+    """
+    Yields the distance of every stroke vertex to the given point (in the camera
+    coordinate), mapped into [0, 1] by the given range. Distances are computed for
+    the whole stroke at once.
+    """
+    sverts = tuple(stroke)
+    points = np.array([tuple(svert.point_3d) for svert in sverts]).reshape(-1, 3)
+    distances = np.linalg.norm(points - np.asarray(tuple(location)), axis=1)
+    values = np.where(distances < range_min, 0.0, 1.0)
+    inside = (range_min < distances) & (distances < range_max)
+    values[inside] = (distances[inside] - range_min) / normfac
+    return zip(sverts, values.tolist())
+
+
+def object_location_in_camera(target):
+    """Returns the location of the given object in the camera coordinate."""
+    # construct a model-view matrix
+    matrix = getCurrentScene().camera.matrix_world.inverted()
+    return matrix @ target.location
+
+
 class ColorDistanceFromCameraShader(ColorRampModifier):
     """Picks a color value from a ramp based on the vertex' distance from the camera."""
 
@@ -333,11 +461,7 @@ class ColorDistanceFromCameraShader(ColorRampModifier):
         self.range = BoundedProperty(range_min, range_max)
 
     def shade(self, stroke):
-        it = iter_distance_from_camera(stroke, *self.range)
-        for svert, t in it:
-            a = svert.attribute.color
-            b = self.evaluate(t)
-            svert.attribute.color = self.blend_ramp(a, b)
+        self.blend_colors(iter_distance_from_point(stroke, (0.0, 0.0, 0.0), *self.range))
 
 
 class AlphaDistanceFromCameraShader(CurveMappingModifier):
@@ -348,11 +472,7 @@ class AlphaDistanceFromCameraShader(CurveMappingModifier):
         self.range = BoundedProperty(range_min, range_max)
 
     def shade(self, stroke):
-        it = iter_distance_from_camera(stroke, *self.range)
-        for svert, t in it:
-            a = svert.attribute.alpha
-            b = self.evaluate(t)
-            svert.attribute.alpha = self.blend(a, b)
+        self.blend_alphas(iter_distance_from_point(stroke, (0.0, 0.0, 0.0), *self.range))
 
 
 class ThicknessDistanceFromCameraShader(ThicknessBlenderMixIn, CurveMappingModifier):
@@ -366,9 +486,7 @@ class ThicknessDistanceFromCameraShader(ThicknessBlenderMixIn, CurveMappingModif
         self.value = BoundedProperty(value_min, value_max)
 
     def shade(self, stroke):
-        for (svert, t) in iter_distance_from_camera(stroke, *self.range):
-            b = self.value.min + self.evaluate(t) * self.value.delta
-            self.blend_thickness(svert, b)
+        self.blend_thicknesses(iter_distance_from_point(stroke, (0.0, 0.0, 0.0), *self.range), self.value)
 
 
 # Distance from Object modifiers
@@ -381,17 +499,10 @@ class ColorDistanceFromObjectShader(ColorRampModifier):
         if target is None:
             raise ValueError("ColorDistanceFromObjectShader: target can't be None ")
         self.range = BoundedProperty(range_min, range_max)
-        # construct a model-view matrix
-        matrix = getCurrentScene().camera.matrix_world.inverted()
-        # get the object location in the camera coordinate
-        self.loc = matrix @ target.location
+        self.loc = object_location_in_camera(target)
 
     def shade(self, stroke):
-        it = iter_distance_from_object(stroke, self.loc, *self.range)
-        for svert, t in it:
-            a = svert.attribute.color
-            b = self.evaluate(t)
-            svert.attribute.color = self.blend_ramp(a, b)
+        self.blend_colors(iter_distance_from_point(stroke, self.loc, *self.range))
 
 
 class AlphaDistanceFromObjectShader(CurveMappingModifier):
@@ -402,17 +513,10 @@ class AlphaDistanceFromObjectShader(CurveMappingModifier):
         if target is None:
             raise ValueError("AlphaDistanceFromObjectShader: target can't be None ")
         self.range = BoundedProperty(range_min, range_max)
-        # construct a model-view matrix
-        matrix = getCurrentScene().camera.matrix_world.inverted()
-        # get the object location in the camera coordinate
-        self.loc = matrix @ target.location
+        self.loc = object_location_in_camera(target)
 
     def shade(self, stroke):
-        it = iter_distance_from_object(stroke, self.loc, *self.range)
-        for svert, t in it:
-            a = svert.attribute.alpha
-            b = self.evaluate(t)
-            svert.attribute.alpha = self.blend(a, b)
+        self.blend_alphas(iter_distance_from_point(stroke, self.loc, *self.range))
 
 
 class ThicknessDistanceFromObjectShader(ThicknessBlenderMixIn, CurveMappingModifier):
@@ -426,16 +530,10 @@ class ThicknessDistanceFromObjectShader(ThicknessBlenderMixIn, CurveMappingModif
             raise ValueError("ThicknessDistanceFromObjectShader: target can't be None ")
         self.range = BoundedProperty(range_min, range_max)
         self.value = BoundedProperty(value_min, value_max)
-        # construct a model-view matrix
-        matrix = getCurrentScene().camera.matrix_world.inverted()
-        # get the object location in the camera coordinate
-        self.loc = matrix @ target.location
+        self.loc = object_location_in_camera(target)
 
     def shade(self, stroke):
-        it = iter_distance_from_object(stroke, self.loc, *self.range)
-        for svert, t in it:
-            b = self.value.min + self.evaluate(t) * self.value.delta
-            self.blend_thickness(svert, b)
+        self.blend_thicknesses(iter_distance_from_point(stroke, self.loc, *self.range), self.value)
 
 
 # Material modifiers
@@ -462,10 +560,7 @@ class ColorMaterialShader(ColorRampModifier):
                 a = svert.attribute.color
                 svert.attribute.color = self.blend_ramp(a, b)
         else:
-            for svert, value in iter_material_value(stroke, self.func, self.attribute):
-                a = svert.attribute.color
-                b = self.evaluate(value)
-                svert.attribute.color = self.blend_ramp(a, b)
+            self.blend_colors(iter_material_value(stroke, self.func, self.attribute))
 
 
 class AlphaMaterialShader(CurveMappingModifier):
@@ -477,10 +572,7 @@ class AlphaMaterialShader(CurveMappingModifier):
         self.func = CurveMaterialF0D()
 
     def shade(self, stroke):
-        for svert, value in iter_material_value(stroke, self.func, self.attribute):
-            a = svert.attribute.alpha
-            b = self.evaluate(value)
-            svert.attribute.alpha = self.blend(a, b)
+        self.blend_alphas(iter_material_value(stroke, self.func, self.attribute))
 
 
 class ThicknessMaterialShader(ThicknessBlenderMixIn, CurveMappingModifier):
@@ -495,9 +587,7 @@ class ThicknessMaterialShader(ThicknessBlenderMixIn, CurveMappingModifier):
         self.func = CurveMaterialF0D()
 
     def shade(self, stroke):
-        for svert, value in iter_material_value(stroke, self.func, self.attribute):
-            b = self.value.min + self.evaluate(value) * self.value.delta
-            self.blend_thickness(svert, b)
+        self.blend_thicknesses(iter_material_value(stroke, self.func, self.attribute), self.value)
 
 
 # Calligraphic thickness modifier
@@ -533,11 +623,7 @@ class TangentColorShader(ColorRampModifier):
 
     def shade(self, stroke):
         it = Interface0DIterator(stroke)
-        for svert in it:
-            angle = angle_x_normal(it)
-            fac = self.evaluate(angle / pi)
-            a = svert.attribute.color
-            svert.attribute.color = self.blend_ramp(a, fac)
+        self.blend_colors((svert, angle_x_normal(it) / pi) for svert in it)
 
 
 class TangentAlphaShader(CurveMappingModifier):
@@ -545,11 +631,7 @@ class TangentAlphaShader(CurveMappingModifier):
 
     def shade(self, stroke):
         it = Interface0DIterator(stroke)
-        for svert in it:
-            angle = angle_x_normal(it)
-            fac = self.evaluate(angle / pi)
-            a = svert.attribute.alpha
-            svert.attribute.alpha = self.blend(a, fac)
+        self.blend_alphas((svert, angle_x_normal(it) / pi) for svert in it)
 
 
 class TangentThicknessShader(ThicknessBlenderMixIn, CurveMappingModifier):
@@ -563,10 +645,7 @@ class TangentThicknessShader(ThicknessBlenderMixIn, CurveMappingModifier):
 
     def shade(self, stroke):
         it = Interface0DIterator(stroke)
-        for svert in it:
-            angle = angle_x_normal(it)
-            thickness = self.thickness.min + self.evaluate(angle / pi) * self.thickness.delta
-            self.blend_thickness(svert, thickness)
+        self.blend_thicknesses(((svert, angle_x_normal(it) / pi) for svert in it), self.thickness)
 
 
 # - Noise Modifiers - #
@@ -616,9 +695,8 @@ class ColorNoiseShader(ColorRampModifier, NoiseShader):
         NoiseShader.__init__(self, amplitude, period, seed)
 
     def shade(self, stroke):
-        for svert, noiseval1, noiseval2 in self.noisegen(stroke):
-            position = abs(noiseval1 + noiseval2)
-            svert.attribute.color = self.blend_ramp(svert.attribute.color, self.evaluate(position))
+        self.blend_colors((svert, abs(noiseval1 + noiseval2))
+                          for svert, noiseval1, noiseval2 in self.noisegen(stroke))
 
 
 class AlphaNoiseShader(CurveMappingModifier, NoiseShader):
@@ -629,9 +707,8 @@ class AlphaNoiseShader(CurveMappingModifier, NoiseShader):
         NoiseShader.__init__(self, amplitude, period, seed)
 
     def shade(self, stroke, n1=Noise(), n2=Noise()):
-        for svert, noiseval1, noiseval2 in self.noisegen(stroke):
-            position = abs(noiseval1 + noiseval2)
-            svert.attribute.alpha = self.blend(svert.attribute.alpha, self.evaluate(position))
+        self.blend_alphas((svert, abs(noiseval1 + noiseval2))
+                          for svert, noiseval1, noiseval2 in self.noisegen(stroke))
 
 
 # - Crease Angle Modifiers - #
@@ -646,6 +723,14 @@ def crease_angle(svert):
     return acos(product)
 
 
+def iter_crease_angle(stroke, bounded_angle):
+    """Yields the crease angle of every StrokeVertex that has one, mapped into range [0, 1]"""
+    for svert in stroke:
+        angle = crease_angle(svert)
+        if angle is not None:
+            yield (svert, bounded_angle.interpolate(angle))
+
+
 class CreaseAngleColorShader(ColorRampModifier):
     """Color based on the crease angle between two adjacent faces on the underlying geometry"""
 
@@ -655,12 +740,7 @@ class CreaseAngleColorShader(ColorRampModifier):
         self.angle = BoundedProperty(angle_min, angle_max)
 
     def shade(self, stroke):
-        for svert in stroke:
-            angle = crease_angle(svert)
-            if angle is None:
-                continue
-            t = self.angle.interpolate(angle)
-            svert.attribute.color = self.blend_ramp(svert.attribute.color, self.evaluate(t))
+        self.blend_colors(iter_crease_angle(stroke, self.angle))
 
 
 class CreaseAngleAlphaShader(CurveMappingModifier):
@@ -672,12 +752,7 @@ class CreaseAngleAlphaShader(CurveMappingModifier):
         self.angle = BoundedProperty(angle_min, angle_max)
 
     def shade(self, stroke):
-        for svert in stroke:
-            angle = crease_angle(svert)
-            if angle is None:
-                continue
-            t = self.angle.interpolate(angle)
-            svert.attribute.alpha = self.blend(svert.attribute.alpha, self.evaluate(t))
+        self.blend_alphas(iter_crease_angle(stroke, self.angle))
 
 
 class CreaseAngleThicknessShader(ThicknessBlenderMixIn, CurveMappingModifier):
@@ -692,13 +767,7 @@ class CreaseAngleThicknessShader(ThicknessBlenderMixIn, CurveMappingModifier):
         self.thickness = BoundedProperty(thickness_min, thickness_max)
 
     def shade(self, stroke):
-        for svert in stroke:
-            angle = crease_angle(svert)
-            if angle is None:
-                continue
-            t = self.angle.interpolate(angle)
-            thickness = self.thickness.min + self.evaluate(t) * self.thickness.delta
-            self.blend_thickness(svert, thickness)
+        self.blend_thicknesses(iter_crease_angle(stroke, self.angle), self.thickness)
 
 
 # - Curvature3D Modifiers - #
@@ -725,11 +794,7 @@ class Curvature3DColorShader(ColorRampModifier):
         self.curvature = BoundedProperty(curvature_min, curvature_max)
 
     def shade(self, stroke):
-        for svert in stroke:
-            t = normalized_absolute_curvature(svert, self.curvature)
-            a = svert.attribute.color
-            b = self.evaluate(t)
-            svert.attribute.color = self.blend_ramp(a, b)
+        self.blend_colors((svert, normalized_absolute_curvature(svert, self.curvature)) for svert in stroke)
 
 
 class Curvature3DAlphaShader(CurveMappingModifier):
@@ -740,11 +805,7 @@ class Curvature3DAlphaShader(CurveMappingModifier):
         self.curvature = BoundedProperty(curvature_min, curvature_max)
 
     def shade(self, stroke):
-        for svert in stroke:
-            t = normalized_absolute_curvature(svert, self.curvature)
-            a = svert.attribute.alpha
-            b = self.evaluate(t)
-            svert.attribute.alpha = self.blend(a, b)
+        self.blend_alphas((svert, normalized_absolute_curvature(svert, self.curvature)) for svert in stroke)
 
 
 class Curvature3DThicknessShader(ThicknessBlenderMixIn, CurveMappingModifier):
@@ -758,10 +819,8 @@ class Curvature3DThicknessShader(ThicknessBlenderMixIn, CurveMappingModifier):
         self.thickness = BoundedProperty(thickness_min, thickness_max)
 
     def shade(self, stroke):
-        for svert in stroke:
-            t = normalized_absolute_curvature(svert, self.curvature)
-            thickness = self.thickness.min + self.evaluate(t) * self.thickness.delta
-            self.blend_thickness(svert, thickness)
+        self.blend_thicknesses(((svert, normalized_absolute_curvature(svert, self.curvature)) for svert in stroke),
+                               self.thickness)
 
 
 # Geometry modifiers
@@ -928,7 +987,8 @@ class QuantitativeInvisibilityRangeUP1D(UnaryPredicate1D):
         self.qi_end = qi_end
 
     def __call__(self, inter):
-        qi = self.getQI(inter)
+        # the quantitative invisibility of a view edge is stored with it
+        qi = inter.qi if type(inter) is ViewEdge else self.getQI(inter)
         return self.qi_start <= qi <= self.qi_end
 
 
@@ -943,6 +1003,8 @@ class ObjectNamesUP1D(UnaryPredicate1D):
         UnaryPredicate1D.__init__(self)
         self.names = names
         self.negative = negative
+        # name lookups resolved to view shape ids, so that each shape's name is built only once
+        self.found_ids = {}
 
     def getViewShapeName(self, vs):
         if vs.library_path is not None and len(vs.library_path):
@@ -950,7 +1012,11 @@ class ObjectNamesUP1D(UnaryPredicate1D):
         return vs.name
 
     def __call__(self, viewEdge):
-        found = self.getViewShapeName(viewEdge.viewshape) in self.names
+        vs = viewEdge.viewshape
+        shape_id = vs.id.first
+        found = self.found_ids.get(shape_id)
+        if found is None:
+            found = self.found_ids[shape_id] = self.getViewShapeName(vs) in self.names
         if self.negative:
             return not found
         return found
@@ -1222,16 +1288,102 @@ integration_types = {
     'LAST': IntegrationType.LAST}
 
 
+# -- Profiling -- #
+
+def profile_enable(enable=True, filepath=None):
+    """Enables or disables the profiling of line sets, optionally dumping the records to filepath."""
+    global profile_enabled, profile_filepath
+    profile_enabled = enable
+    profile_filepath = filepath
+
+
+def profile_clear():
+    """Discards all the profiling records gathered so far."""
+    profile_records.clear()
+
+
+def profile_dump(filepath):
+    """Appends the profiling records gathered so far to a JSON Lines file, one record per line."""
+    with open(filepath, 'a', encoding="utf8") as f:
+        for record in profile_records:
+            f.write(json.dumps(record) + "\n")
+
+
+class ProfiledShader(StrokeShader):
+    """Wraps a stroke shader to record the time spent in it, and the strokes and vertices it shaded."""
+
+    def __init__(self, shader):
+        StrokeShader.__init__(self)
+        self.shader = shader
+        self.record = {"name": type(shader).__name__, "time": 0.0, "strokes": 0, "vertices": 0}
+
+    def shade(self, stroke):
+        record = self.record
+        record["strokes"] += 1
+        record["vertices"] += len(stroke)
+        start = time.perf_counter()
+        self.shader.shade(stroke)
+        record["time"] += time.perf_counter() - start
+
+
+class LinesetProfile:
+    """Records the time spent in the successive stages of processing a line set, does nothing unless enabled."""
+
+    def __init__(self, scene, layer, lineset):
+        self.enabled = profile_enabled
+        if not self.enabled:
+            return
+        self.record = {
+            "frame": scene.frame_current,
+            "view_layer": layer.name,
+            "lineset": lineset.name,
+            "linestyle": lineset.linestyle.name,
+            "time": 0.0,
+            "stages": [],
+            "shaders": [],
+        }
+        # Line sets are processed in order, the records are dumped once after the last one.
+        self.is_last = lineset == [ls for ls in layer.freestyle_settings.linesets if ls.show_render][-1]
+        self.start = self.stage_start = time.perf_counter()
+
+    def stage(self, name, **counts):
+        """Ends the current stage, recording its duration under the given name along with the given counts."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.record["stages"].append({"name": name, "time": now - self.stage_start, **counts})
+        self.stage_start = now
+
+    def wrap_shaders(self, shaders):
+        """Returns the shaders wrapped so that each of them is timed individually."""
+        if not self.enabled:
+            return shaders
+        shaders = [ProfiledShader(shader) for shader in shaders]
+        self.record["shaders"] = [shader.record for shader in shaders]
+        return shaders
+
+    def finish(self):
+        if not self.enabled:
+            return
+        self.record["time"] = time.perf_counter() - self.start
+        profile_records.append(self.record)
+        if profile_filepath and self.is_last:
+            profile_dump(profile_filepath)
+            profile_clear()
+
+
 # main function for parameter processing
 def process(layer_name, lineset_name):
     scene = getCurrentScene()
     layer = scene.view_layers[layer_name]
     lineset = layer.freestyle_settings.linesets[lineset_name]
     linestyle = lineset.linestyle
+    profile = LinesetProfile(scene, layer, lineset)
 
     # execute line set pre-processing callback functions
     for fn in callbacks_lineset_pre:
         fn(scene, layer, lineset)
+    profile.stage("pre_callbacks")
 
     selection_criteria = []
     # prepare selection criteria by visibility
@@ -1309,6 +1461,7 @@ def process(layer_name, lineset_name):
     else:
         upred = TrueUP1D()
     Operators.select(upred)
+    profile.stage("selection", view_edges=Operators.get_view_edges_size())
     # join feature edges to form chains
     if linestyle.use_chaining:
         if linestyle.chaining == 'PLAIN':
@@ -1323,6 +1476,7 @@ def process(layer_name, lineset_name):
                 Operators.bidirectional_chain(pySketchyChainingIterator(linestyle.rounds))
     else:
         Operators.chain(ChainPredicateIterator(FalseUP1D(), FalseBP1D()), NotUP1D(upred))
+    profile.stage("chaining", chains=Operators.get_chains_size())
     # split chains
     if linestyle.material_boundary:
         Operators.sequential_split(MaterialBoundaryUP0D())
@@ -1349,6 +1503,7 @@ def process(layer_name, lineset_name):
             Operators.sequential_split(SplitPatternStartingUP0D(controller),
                                        SplitPatternStoppingUP0D(controller),
                                        sampling)
+    profile.stage("splitting", chains=Operators.get_chains_size())
     # sort selected chains
     if linestyle.use_sorting:
         integration = integration_types.get(linestyle.integration_type, IntegrationType.MEAN)
@@ -1363,6 +1518,7 @@ def process(layer_name, lineset_name):
         if linestyle.sort_order == 'REVERSE':
             bpred = NotBP1D(bpred)
         Operators.sort(bpred)
+    profile.stage("sorting")
     # select chains
     if linestyle.use_length_min or linestyle.use_length_max:
         length_min = linestyle.length_min if linestyle.use_length_min else None
@@ -1370,6 +1526,7 @@ def process(layer_name, lineset_name):
         Operators.select(LengthThresholdUP1D(length_min, length_max))
     if linestyle.use_chain_count:
         Operators.select(pyNFirstUP1D(linestyle.chain_count))
+    profile.stage("chain_selection", chains=Operators.get_chains_size())
     # prepare a list of stroke shaders
     shaders_list = []
     for m in linestyle.geometry_modifiers:
@@ -1579,9 +1736,14 @@ def process(layer_name, lineset_name):
         if len(pattern) > 0:
             shaders_list.append(DashedLineShader(pattern))
 
+    profile.stage("shaders_setup")
+
     # create strokes using the shaders list
-    Operators.create(TrueUP1D(), shaders_list)
+    Operators.create(TrueUP1D(), profile.wrap_shaders(shaders_list))
+    profile.stage("stroke_creation", strokes=Operators.get_strokes_size())
 
     # execute line set post-processing callback functions
     for fn in callbacks_lineset_post:
         fn(scene, layer, lineset)
+    profile.stage("post_callbacks")
+    profile.finish()
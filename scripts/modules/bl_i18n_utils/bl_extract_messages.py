@@ -481,10 +481,11 @@ def dump_rna_messages(msgs, reports, settings, verbose=False):
 
 
 ##### Python source code #####
-def dump_py_messages_from_files(msgs, reports, files, settings):
+def dump_py_messages_from_files(msgs, reports, files, settings, cache=None):
     """
     Dump text inlined in the python files given, e.g. "My Name" in:
         ``layout.prop("someprop", text="My Name")``
+    Messages of files which content did not change are taken from the given `utils.I18nExtractCache`, if any.
     """
     import ast
 
@@ -696,13 +697,33 @@ def dump_py_messages_from_files(msgs, reports, files, settings):
             "spell_errors": check_ctxt.get("spell_errors"),
         }
 
+    if cache is None:
+        cache = utils.I18nExtractCache(None, settings=settings)
+    # Extracted contexts also depend on Blender's RNA (operators...), invalidate the cache with each new version.
+    cache_files = cache.files('PY', (
+        bpy.app.version_string,
+        repr(sorted(func_translate_args.items())),
+        tuple(sorted(i18n_ctxt_ids)),
+        root_paths,
+    ))
+
     for fp in files:
         # ~ print("Checking File ", fp)
-        with open(fp, 'r', encoding="utf8") as filedata:
-            root_node = ast.parse(filedata.read(), fp, 'exec')
+        with open(fp, 'rb') as filedata:
+            data = filedata.read()
+        data_hash = cache.hash(data)
+        cached = cache_files.get(fp)
+        if cached is not None and cached[0] == data_hash:
+            for msgctxt, estr, msgsrc in cached[1]:
+                process_msg(msgs, msgctxt, estr, msgsrc, reports, check_ctxt_py, settings)
+                reports["py_messages"].append((msgctxt, estr, msgsrc))
+            continue
+
+        root_node = ast.parse(data.decode("utf8"), fp, 'exec')
 
         fp_rel = make_rel(fp)
         fp_rel = PurePath(fp_rel).as_posix()
+        entries = []
 
         for node in ast.walk(root_node):
             if type(node) == ast.Call:
@@ -771,11 +792,15 @@ def dump_py_messages_from_files(msgs, reports, files, settings):
                                 msgsrc = "{}:{}".format(fp_rel, sorted({nd.lineno for nd in nds})[0])
                             else:
                                 msgsrc = "{}:???".format(fp_rel)
-                            process_msg(msgs, msgctxt, estr, msgsrc, reports, check_ctxt_py, settings)
-                            reports["py_messages"].append((msgctxt, estr, msgsrc))
+                            entries.append((msgctxt, estr, msgsrc))
 
+        cache_files[fp] = (data_hash, entries)
+        for msgctxt, estr, msgsrc in entries:
+            process_msg(msgs, msgctxt, estr, msgsrc, reports, check_ctxt_py, settings)
+            reports["py_messages"].append((msgctxt, estr, msgsrc))
 
-def dump_py_messages(msgs, reports, addons, settings, addons_only=False):
+
+def dump_py_messages(msgs, reports, addons, settings, addons_only=False, cache=None):
     def _get_files(path):
         if not os.path.exists(path):
             return []
@@ -799,91 +824,37 @@ def dump_py_messages(msgs, reports, addons, settings, addons_only=False):
         else:
             files.append(fn)
 
-    dump_py_messages_from_files(msgs, reports, sorted(files), settings)
+    dump_py_messages_from_files(msgs, reports, sorted(files), settings, cache=cache)
 
 
 ##### C source code #####
-def dump_src_messages(msgs, reports, settings):
+def dump_src_messages(msgs, reports, settings, cache=None):
     def get_contexts():
         """Return a mapping {C_CTXT_NAME: ctxt_value}."""
         return {k: getattr(bpy.app.translations.contexts, n) for k, n in bpy.app.translations.contexts_C_to_py.items()}
 
     contexts = get_contexts()
 
-    # Build regexes to extract messages (with optional contexts) from C source.
-    pygettexts = tuple(re.compile(r).search for r in settings.PYGETTEXT_KEYWORDS)
-
-    _clean_str = re.compile(settings.str_clean_re).finditer
-
-    def clean_str(s):
-        # The encode/decode to/from 'raw_unicode_escape' allows to transform the C-type unicode hexadecimal escapes
-        # (like '\u00d7' for the '×' symbol) back into a proper unicode character.
-        return "".join(
-            m.group("clean") for m in _clean_str(s)
-        ).encode('raw_unicode_escape').decode('raw_unicode_escape')
-
-    def dump_src_file(path, rel_path, msgs, reports, settings):
-        def process_entry(_msgctxt, _msgid):
-            # Context.
-            msgctxt = settings.DEFAULT_CONTEXT
-            if _msgctxt:
-                if _msgctxt in contexts:
-                    msgctxt = contexts[_msgctxt]
-                elif '"' in _msgctxt or "'" in _msgctxt:
-                    msgctxt = clean_str(_msgctxt)
-                else:
-                    print("WARNING: raw context “{}” couldn’t be resolved!".format(_msgctxt))
-            # Message.
-            msgid = ""
-            if _msgid:
-                if '"' in _msgid or "'" in _msgid:
-                    msgid = clean_str(_msgid)
-                else:
-                    print("WARNING: raw message “{}” couldn’t be resolved!".format(_msgid))
-            return msgctxt, msgid
-
-        check_ctxt_src = None
-        if reports["check_ctxt"]:
-            check_ctxt = reports["check_ctxt"]
-            check_ctxt_src = {
-                "multi_lines": check_ctxt.get("multi_lines"),
-                "not_capitalized": check_ctxt.get("not_capitalized"),
-                "end_point": check_ctxt.get("end_point"),
-                "spell_checker": check_ctxt.get("spell_checker"),
-                "spell_errors": check_ctxt.get("spell_errors"),
-            }
-
-        data = ""
-        with open(path, encoding="utf8") as f:
-            data = f.read()
-        for srch in pygettexts:
-            m = srch(data)
-            line = pos = 0
-            while m:
-                d = m.groupdict()
-                # Line.
-                line += data[pos:m.start()].count('\n')
-                msgsrc = rel_path + ":" + str(line)
-                _msgid = d.get("msg_raw")
-                if _msgid not in {'""', "''"}:
-                    # First, try the "multi-contexts" stuff!
-                    _msgctxts = tuple(d.get("ctxt_raw{}".format(i)) for i in range(settings.PYGETTEXT_MAX_MULTI_CTXT))
-                    if _msgctxts[0]:
-                        for _msgctxt in _msgctxts:
-                            if not _msgctxt:
-                                break
-                            msgctxt, msgid = process_entry(_msgctxt, _msgid)
-                            process_msg(msgs, msgctxt, msgid, msgsrc, reports, check_ctxt_src, settings)
-                            reports["src_messages"].append((msgctxt, msgid, msgsrc))
-                    else:
-                        _msgctxt = d.get("ctxt_raw")
-                        msgctxt, msgid = process_entry(_msgctxt, _msgid)
-                        process_msg(msgs, msgctxt, msgid, msgsrc, reports, check_ctxt_src, settings)
-                        reports["src_messages"].append((msgctxt, msgid, msgsrc))
-
-                pos = m.end()
-                line += data[m.start():pos].count('\n')
-                m = srch(data, pos)
+    if cache is None:
+        cache = utils.I18nExtractCache(None, settings=settings)
+    cache_files = cache.files('SRC', (
+        tuple(settings.PYGETTEXT_KEYWORDS),
+        settings.str_clean_re,
+        settings.PYGETTEXT_MAX_MULTI_CTXT,
+        settings.DEFAULT_CONTEXT,
+        tuple(sorted(contexts.items())),
+    ))
+
+    check_ctxt_src = None
+    if reports["check_ctxt"]:
+        check_ctxt = reports["check_ctxt"]
+        check_ctxt_src = {
+            "multi_lines": check_ctxt.get("multi_lines"),
+            "not_capitalized": check_ctxt.get("not_capitalized"),
+            "end_point": check_ctxt.get("end_point"),
+            "spell_checker": check_ctxt.get("spell_checker"),
+            "spell_errors": check_ctxt.get("spell_errors"),
+        }
 
     forbidden = set()
     forced = set()
@@ -910,10 +881,42 @@ def dump_src_messages(msgs, reports, settings):
                 continue
             elif rel_path not in forced:
                 forced.add(rel_path)
+
+    # Only scan again files which content changed since last extraction.
+    src_files = []
+    todo = []
     for rel_path in sorted(forced):
         path = os.path.join(settings.SOURCE_DIR, rel_path)
-        if os.path.exists(path):
-            dump_src_file(path, rel_path, msgs, reports, settings)
+        if not os.path.exists(path):
+            continue
+        with open(path, 'rb') as f:
+            data_hash = cache.hash(f.read())
+        src_files.append(rel_path)
+        cached = cache_files.get(rel_path)
+        if cached is None or cached[0] != data_hash:
+            todo.append((path, rel_path, data_hash))
+
+    if todo:
+        print("Scanning {} modified C/C++ source files (out of {})...".format(len(todo), len(src_files)))
+        # NOTE: Worker processes are spawned, and `utils.extract_src_messages` does not rely on Blender modules.
+        import concurrent.futures
+        import itertools
+        import multiprocessing
+        mp_context = multiprocessing.get_context("spawn")
+        with concurrent.futures.ProcessPoolExecutor(mp_context=mp_context) as exctr:
+            for (_, rel_path, data_hash), entries in zip(todo, exctr.map(
+                    utils.extract_src_messages,
+                    [path for path, _, _ in todo],
+                    [rel_path for _, rel_path, _ in todo],
+                    itertools.repeat(contexts),
+                    itertools.repeat(settings),
+                    chunksize=16)):
+                cache_files[rel_path] = (data_hash, entries)
+
+    for rel_path in src_files:
+        for msgctxt, msgid, msgsrc in cache_files[rel_path][1]:
+            process_msg(msgs, msgctxt, msgid, msgsrc, reports, check_ctxt_src, settings)
+            reports["src_messages"].append((msgctxt, msgid, msgsrc))
 
 
 def dump_preset_messages(msgs, reports, settings):
@@ -1089,14 +1092,19 @@ def dump_messages(do_messages, do_checks, settings):
 
     reports = _gen_reports(_gen_check_ctxt(settings) if do_checks else None)
 
+    # Messages extracted from py and C source files, only modified files are parsed again.
+    cache = utils.I18nExtractCache(settings.EXTRACT_CACHE, settings=settings)
+
     # Get strings from RNA.
     dump_rna_messages(msgs, reports, settings)
 
     # Get strings from UI layout definitions text="..." args.
-    dump_py_messages(msgs, reports, addons, settings)
+    dump_py_messages(msgs, reports, addons, settings, cache=cache)
 
     # Get strings from C source code.
-    dump_src_messages(msgs, reports, settings)
+    dump_src_messages(msgs, reports, settings, cache=cache)
+
+    cache.save()
 
     # Get strings from presets.
     dump_preset_messages(msgs, reports, settings)
@@ -1224,7 +1232,9 @@ def dump_addon_messages(addon_module_name, do_checks, settings):
 
     # get strings from UI layout definitions text="..." args
     reports["check_ctxt"] = check_ctxt
-    dump_py_messages(msgs, reports, {addon}, settings, addons_only=True)
+    cache = utils.I18nExtractCache(settings.EXTRACT_CACHE, settings=settings)
+    dump_py_messages(msgs, reports, {addon}, settings, addons_only=True, cache=cache)
+    cache.save()
 
     # Get strings from the addon's bl_info
     dump_addon_bl_info(msgs, reports, addon, settings)
@@ -658,6 +658,9 @@ SRC_POTFILES = ""
 # A cache storing validated msgids, to avoid re-spellchecking them.
 SPELL_CACHE = os.path.join("/tmp", ".spell_cache")
 
+# A cache storing messages extracted from each source file, to only re-scan modified ones.
+EXTRACT_CACHE = os.path.join("/tmp", ".i18n_extract_cache")
+
 # Threshold defining whether a new msgid is similar enough with an old one to reuse its translation...
 SIMILAR_MSGID_THRESHOLD = 0.75
 
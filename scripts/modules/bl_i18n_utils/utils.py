@@ -15,11 +15,12 @@ __all__ = (
 )
 
 import collections
+import hashlib
 import os
+import pickle
 import platform
 import re
 import struct
-import tempfile
 import time
 
 from bl_i18n_utils import (
@@ -66,6 +67,52 @@ def get_best_similar(data):
     return key, tmp
 
 
+def _msgid_trigrams(msgid):
+    return {msgid[i:i + 3] for i in range(len(msgid) - 2)}
+
+
+class SimilarMsgidIndex:
+    """
+    Character trigram index over a pool of msgids, used to only run the (expensive) SequenceMatcher of
+    `get_best_similar` against existing messages sharing enough content with a new one.
+    """
+
+    # Msgids with less trigrams than this are checked against the whole pool (a single edit in the middle of a short
+    # string can remove all its trigrams while keeping a high similarity ratio).
+    MIN_TRIGRAMS = 8
+
+    def __init__(self, msgids):
+        self.msgids = tuple(msgids)
+        self.lengths = tuple(len(msgid) for msgid in self.msgids)
+        self.trigrams = {}
+        for idx, msgid in enumerate(self.msgids):
+            for tri in _msgid_trigrams(msgid):
+                self.trigrams.setdefault(tri, []).append(idx)
+
+    def candidates(self, msgid, use_similar):
+        """
+        Return the msgids of the pool which may reach the `use_similar` ratio with given one, in pool order.
+        """
+        trigrams = _msgid_trigrams(msgid)
+        if len(trigrams) < self.MIN_TRIGRAMS:
+            return self.msgids
+        # The ratio is `2 * matched / (len_msgid + len_other)`, so reaching `use_similar` leaves at most
+        # `len_msgid - use_similar * (len_msgid + len_other) / 2` characters of msgid unmatched, which depends on the
+        # length of the other string. Each unmatched character removes at most three of the trigrams of msgid.
+        # Trigrams split between matching blocks are only covered by a small slack, so this is a heuristic pruning.
+        len_msgid = len(msgid)
+        num_trigrams = len(trigrams)
+        shared = collections.Counter()
+        for tri in trigrams:
+            shared.update(self.trigrams.get(tri, ()))
+        candidates = []
+        for idx, nbr in shared.items():
+            max_unmatched = max(0.0, len_msgid - use_similar * (len_msgid + self.lengths[idx]) / 2.0)
+            if nbr >= max(1, num_trigrams - int(3.0 * max_unmatched + 2)):
+                candidates.append(idx)
+        return tuple(self.msgids[idx] for idx in sorted(candidates))
+
+
 _locale_explode_re = re.compile(r"^([a-z]{2,})(?:_([A-Za-z]{2,}))?(?:@([a-z]{2,}))?$")
 
 
@@ -265,6 +312,118 @@ def enable_addons(addons=None, support=None, disable=False, check_only=False):
     return ret
 
 
+##### Messages Extraction #####
+def extract_src_messages(path, rel_path, contexts, settings):
+    """
+    Extract all messages (with optional contexts) from the given C/C++ source file.
+    Returns a list of (msgctxt, msgid, msgsrc) tuples, in the order they appear in the file.
+
+    `contexts` is a mapping {C_CTXT_NAME: ctxt_value}.
+    Usable in a context where Blender specific modules (like ``bpy``) are not available.
+    """
+    pygettexts = tuple(re.compile(r).search for r in settings.PYGETTEXT_KEYWORDS)
+
+    _clean_str = re.compile(settings.str_clean_re).finditer
+
+    def clean_str(s):
+        # The encode/decode to/from 'raw_unicode_escape' allows to transform the C-type unicode hexadecimal escapes
+        # (like '\u00d7' for the '×' symbol) back into a proper unicode character.
+        return "".join(
+            m.group("clean") for m in _clean_str(s)
+        ).encode('raw_unicode_escape').decode('raw_unicode_escape')
+
+    def process_entry(_msgctxt, _msgid):
+        # Context.
+        msgctxt = settings.DEFAULT_CONTEXT
+        if _msgctxt:
+            if _msgctxt in contexts:
+                msgctxt = contexts[_msgctxt]
+            elif '"' in _msgctxt or "'" in _msgctxt:
+                msgctxt = clean_str(_msgctxt)
+            else:
+                print("WARNING: raw context “{}” couldn’t be resolved!".format(_msgctxt))
+        # Message.
+        msgid = ""
+        if _msgid:
+            if '"' in _msgid or "'" in _msgid:
+                msgid = clean_str(_msgid)
+            else:
+                print("WARNING: raw message “{}” couldn’t be resolved!".format(_msgid))
+        return msgctxt, msgid
+
+    ret = []
+    data = ""
+    with open(path, encoding="utf8") as f:
+        data = f.read()
+    for srch in pygettexts:
+        m = srch(data)
+        line = pos = 0
+        while m:
+            d = m.groupdict()
+            # Line.
+            line += data[pos:m.start()].count('\n')
+            msgsrc = rel_path + ":" + str(line)
+            _msgid = d.get("msg_raw")
+            if _msgid not in {'""', "''"}:
+                # First, try the "multi-contexts" stuff!
+                _msgctxts = tuple(d.get("ctxt_raw{}".format(i)) for i in range(settings.PYGETTEXT_MAX_MULTI_CTXT))
+                if _msgctxts[0]:
+                    for _msgctxt in _msgctxts:
+                        if not _msgctxt:
+                            break
+                        ret.append(process_entry(_msgctxt, _msgid) + (msgsrc,))
+                else:
+                    ret.append(process_entry(d.get("ctxt_raw"), _msgid) + (msgsrc,))
+
+            pos = m.end()
+            line += data[m.start():pos].count('\n')
+            m = srch(data, pos)
+    return ret
+
+
+class I18nExtractCache:
+    """
+    Persistent cache of the messages extracted from source files, keyed by the hash of their content, so that only
+    modified files have to be scanned again.
+
+    Files are stored by kind (e.g. 'PY' or 'SRC'). Each kind has a signature, a hashable value identifying everything
+    besides file content that affects extraction (keywords, known contexts...). A different signature invalidates
+    all files of that kind.
+    """
+
+    def __init__(self, path, settings=settings):
+        self.settings = settings
+        self.path = path
+        self.data = {}
+        if path and os.path.isfile(path):
+            try:
+                with open(path, 'rb') as f:
+                    self.data = pickle.load(f)
+            except Exception as ex:
+                print("WARNING: could not read messages extraction cache {} ({}), ignoring it.".format(path, ex))
+                self.data = {}
+
+    def hash(self, data):
+        return hashlib.new(self.settings.PARSER_CACHE_HASH, data).digest()
+
+    def files(self, kind, signature):
+        """
+        Return the mapping {path: (hash, [(msgctxt, msgid, msgsrc), ...])} of given kind of files.
+        It can be updated in place.
+        """
+        sig, files = self.data.get(kind, (None, None))
+        if files is None or sig != signature:
+            files = {}
+            self.data[kind] = (signature, files)
+        return files
+
+    def save(self):
+        if not self.path:
+            return
+        with open(self.path, 'wb') as f:
+            pickle.dump(self.data, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
 ##### Main Classes #####
 
 class I18nMessage:
@@ -473,8 +632,10 @@ class I18nMessages:
         self.nbr_trans_signs = 0
         self.parsing_errors = []
         if kind and src:
+            # Also updates info.
             self.parse(kind, key, src)
-        self.update_info()
+        else:
+            self.update_info()
 
         self._reverse_cache = None
 
@@ -631,8 +792,9 @@ class I18nMessages:
 
         # Next process new keys.
         if use_similar > 0.0:
+            similar_index = SimilarMsgidIndex(similar_pool.keys())
             for key, msgid in map(get_best_similar,
-                                  tuple((nk, use_similar, tuple(similar_pool.keys())) for nk in new_keys)):
+                                  ((nk, use_similar, similar_index.candidates(nk[1], use_similar)) for nk in new_keys)):
                 if msgid:
                     # Try to get the same context, else just get one...
                     skey = (key[0], msgid)
@@ -682,23 +844,26 @@ class I18nMessages:
         self.comm_msgs.clear()
         self.ttip_msgs.clear()
         self.contexts.clear()
-        self.nbr_signs = 0
-        self.nbr_trans_signs = 0
+        header_key = self.settings.PO_HEADER_KEY
+        nbr_signs = nbr_trans_signs = 0
         for key, msg in self.msgs.items():
-            if key == self.settings.PO_HEADER_KEY:
+            if key == header_key:
                 continue
             if msg.is_commented:
                 self.comm_msgs.add(key)
             else:
-                if msg.msgstr:
+                len_msgstr = sum(map(len, msg.msgstr_lines))
+                if len_msgstr:
                     self.trans_msgs.add(key)
                 if msg.is_fuzzy:
                     self.fuzzy_msgs.add(key)
                 if msg.is_tooltip:
                     self.ttip_msgs.add(key)
                 self.contexts.add(key[0])
-                self.nbr_signs += len(msg.msgid)
-                self.nbr_trans_signs += len(msg.msgstr)
+                nbr_signs += sum(map(len, msg.msgid_lines))
+                nbr_trans_signs += len_msgstr
+        self.nbr_signs = nbr_signs
+        self.nbr_trans_signs = nbr_trans_signs
         self.nbr_msgs = len(self.msgs)
         self.nbr_trans_msgs = len(self.trans_msgs - self.fuzzy_msgs)
         self.nbr_ttips = len(self.ttip_msgs)
@@ -908,6 +1073,114 @@ class I18nMessages:
         Note: This function will silently "arrange" mis-formatted entries, thus using afterward write_messages() should
               always produce a po-valid file, though not correct!
         """
+        # try to use src as file name...
+        if os.path.isfile(src):
+            if os.stat(src).st_size > self.settings.PARSER_MAX_FILE_SIZE:
+                # Security, else we could read arbitrary huge files!
+                print("WARNING: skipping file {}, too huge!".format(src))
+                return
+            if not key:
+                key = src
+            with open(src, 'r', encoding="utf-8") as f:
+                src = f.read()
+
+        # Well-formed po files are scanned by blocks, fall back to the line-by-line parser (which reports and
+        # "arranges" mis-formatted entries) for the others.
+        if not self._parse_messages_from_po_blocks(src):
+            self._parse_messages_from_po_lines(src)
+
+    def _parse_messages_from_po_blocks(self, src):
+        """
+        Parse po content made only of well-formed entries (separated by empty lines), using a regex over each whole
+        entry. Messages are stored as single (unescaped) strings.
+        Return False (leaving messages untouched) as soon as an entry is not well-formed.
+        """
+        if "\r" in src:
+            return False
+        if not src.endswith("\n"):
+            src += "\n"
+
+        default_context = self.settings.DEFAULT_CONTEXT
+        comm_fuzzy = self.settings.PO_COMMENT_FUZZY
+        unescape = I18nMessage.do_unescape
+        regular_entry, commented_entry, regular_cont, commented_cont = self._po_block_regexes(self.settings)
+
+        msgs = {}
+        src_len = len(src)
+        pos = src_len - len(src.lstrip("\n"))
+        while pos < src_len:
+            is_commented = False
+            m = regular_entry(src, pos)
+            if m is None:
+                is_commented = True
+                m = commented_entry(src, pos)
+                if m is None:
+                    return False
+            pos = m.end()
+            comments, msgctxt, msgid, msgid_more, msgstr, msgstr_more = m.groups()
+            cont = commented_cont if is_commented else regular_cont
+
+            if msgid_more:
+                msgid = "".join([msgid] + cont(msgid_more))
+            if msgstr_more:
+                msgstr = "".join([msgstr] + cont(msgstr_more))
+            # Only escaped chars start with a backslash, skip the (costly) unescaping when there are none.
+            if "\\" in msgid:
+                msgid = unescape(msgid)
+            if "\\" in msgstr:
+                msgstr = unescape(msgstr)
+            msgctxt_lines = []
+            if msgctxt is not None:
+                if "\\" in msgctxt:
+                    msgctxt = unescape(msgctxt)
+                msgctxt_lines.append(msgctxt)
+
+            msgkey = (msgctxt or default_context, msgid)
+            if msgkey in msgs or msgkey in self.msgs:
+                return False
+
+            is_fuzzy = False
+            comment_lines = comments.splitlines()
+            if comm_fuzzy in comments:
+                is_fuzzy = any(l.startswith(comm_fuzzy) for l in comment_lines)
+                comment_lines = [l for l in comment_lines if not l.startswith(comm_fuzzy)]
+            if "\\" in comments:
+                comment_lines = [unescape(l) for l in comment_lines]
+
+            msgs[msgkey] = I18nMessage(msgctxt_lines, [msgid], [msgstr], comment_lines,
+                                       is_commented, is_fuzzy, settings=self.settings)
+
+        self.msgs.update(msgs)
+        return True
+
+    # Compiled regexes of the po block parser, keyed by the settings' po keywords.
+    _po_block_regexes_cache = {}
+
+    @classmethod
+    def _po_block_regexes(cls, settings):
+        key = (settings.PO_MSGCTXT, settings.PO_MSGID, settings.PO_MSGSTR, settings.PO_COMMENT_PREFIX_MSG)
+        ret = cls._po_block_regexes_cache.get(key)
+        if ret is None:
+            msgctxt, msgid, msgstr, comm = (re.escape(k) for k in key)
+
+            def _entry(p):
+                return re.compile(
+                    r'((?:(?!' + comm + r')#.*\n)*)'
+                    r'(?:' + p + msgctxt + r'"(.*)"\n)?' +
+                    p + msgid + r'"(.*)"\n((?:' + p + r'".*"\n)*)' +
+                    p + msgstr + r'"(.*)"\n((?:' + p + r'".*"\n)*)'
+                    r'(?:\n+|\Z)'
+                ).match
+
+            ret = cls._po_block_regexes_cache[key] = (
+                _entry(""),
+                _entry(comm),
+                re.compile(r'"(.*)"\n').findall,
+                re.compile(comm + r'"(.*)"\n').findall,
+            )
+        return ret
+
+    def _parse_messages_from_po_lines(self, src):
         reading_msgid = False
         reading_msgstr = False
         reading_msgctxt = False
@@ -946,17 +1219,6 @@ class I18nMessages:
             msgstr_lines = []
             comment_lines = []
 
-        # try to use src as file name...
-        if os.path.isfile(src):
-            if os.stat(src).st_size > self.settings.PARSER_MAX_FILE_SIZE:
-                # Security, else we could read arbitrary huge files!
-                print("WARNING: skipping file {}, too huge!".format(src))
-                return
-            if not key:
-                key = src
-            with open(src, 'r', encoding="utf-8") as f:
-                src = f.read()
-
         _msgctxt = self.settings.PO_MSGCTXT
         _comm_msgctxt = self.settings.PO_COMMENT_PREFIX_MSG + _msgctxt
         _len_msgctxt = len(_msgctxt + '"')
@@ -1083,48 +1345,34 @@ class I18nMessages:
             _msgid = self.settings.PO_MSGID
             _msgstr = self.settings.PO_MSGSTR
             _comm = self.settings.PO_COMMENT_PREFIX_MSG
-
-            self.escape()
-
-            for num, msg in enumerate(self.msgs.values()):
+            _fuzzy = "\n" + self.settings.PO_COMMENT_FUZZY
+            _esc = I18nMessage.do_escape
+
+            # Escape on the fly rather than escaping/unescaping all messages in place, and build the whole content
+            # in a single string.
+            def _gen(_p, _kw, lines):
+                lines = [_esc(l) for l in lines]
+                if len(lines) > 1:
+                    return "\n" + _p + _kw + "\"\"\n" + _p + "\"" + ("\"\n" + _p + "\"").join(lines) + "\""
+                return "\n" + _p + _kw + "\"" + "".join(lines) + "\""
+
+            chunks = []
+            for msg in self.msgs.values():
                 if compact and (msg.is_commented or msg.is_fuzzy or not msg.msgstr_lines):
                     continue
                 if not compact:
-                    f.write("\n".join(msg.comment_lines))
+                    chunks.append("\n".join(msg.comment_lines))
                 # Only mark as fuzzy if msgstr is not empty!
                 if msg.is_fuzzy and msg.msgstr_lines:
-                    f.write("\n" + self.settings.PO_COMMENT_FUZZY)
+                    chunks.append(_fuzzy)
                 _p = _comm if msg.is_commented else ""
-                chunks = []
-                if msg.msgctxt and msg.msgctxt != default_context:
-                    if len(msg.msgctxt_lines) > 1:
-                        chunks += [
-                            "\n" + _p + _msgctxt + "\"\"\n" + _p + "\"",
-                            ("\"\n" + _p + "\"").join(msg.msgctxt_lines),
-                            "\"",
-                        ]
-                    else:
-                        chunks += ["\n" + _p + _msgctxt + "\"" + msg.msgctxt + "\""]
-                if len(msg.msgid_lines) > 1:
-                    chunks += [
-                        "\n" + _p + _msgid + "\"\"\n" + _p + "\"",
-                        ("\"\n" + _p + "\"").join(msg.msgid_lines),
-                        "\"",
-                    ]
-                else:
-                    chunks += ["\n" + _p + _msgid + "\"" + msg.msgid + "\""]
-                if len(msg.msgstr_lines) > 1:
-                    chunks += [
-                        "\n" + _p + _msgstr + "\"\"\n" + _p + "\"",
-                        ("\"\n" + _p + "\"").join(msg.msgstr_lines),
-                        "\"",
-                    ]
-                else:
-                    chunks += ["\n" + _p + _msgstr + "\"" + msg.msgstr + "\""]
-                chunks += ["\n\n"]
-                f.write("".join(chunks))
-
-            self.unescape()
+                msgctxt = "".join(msg.msgctxt_lines)
+                if msgctxt and msgctxt != default_context:
+                    chunks.append(_gen(_p, _msgctxt, msg.msgctxt_lines))
+                chunks.append(_gen(_p, _msgid, msg.msgid_lines))
+                chunks.append(_gen(_p, _msgstr, msg.msgstr_lines))
+                chunks.append("\n\n")
+            f.write("".join(chunks))
 
         self.normalize(max_len=0)  # No wrapping for now...
         if isinstance(fname, str):
@@ -1134,77 +1382,93 @@ class I18nMessages:
         else:
             _write(self, fname, compact)
 
+    @staticmethod
+    def _mo_hash(string):
+        """The 'hashpjw' function used by GNU gettext for the hash table of mo files."""
+        hval = 0
+        for c in string:
+            hval = ((hval << 4) + c) & 0xffffffff
+            g = hval & 0xf0000000
+            if g:
+                hval ^= g >> 24
+                hval ^= g
+        return hval
+
+    @staticmethod
+    def _mo_hash_size(nbr):
+        """Smallest prime number not below 4/3 of the given number of messages (and at least 3), as msgfmt does."""
+        size = max(3, (nbr * 4) // 3) | 1
+        while any(size % d == 0 for d in range(3, int(size ** 0.5) + 1, 2)):
+            size += 2
+        return size
+
     def write_messages_to_mo(self, fname):
         """
         Write messages in fname mo file.
+        Only translated, non-fuzzy messages are written (plus the header).
         """
-        # XXX Temp solution, until I can make own mo generator working...
-        import subprocess
-        with tempfile.NamedTemporaryFile(mode='w+', encoding="utf-8") as tmp_po_f:
-            os.makedirs(os.path.dirname(fname), exist_ok=True)
-            self.write_messages_to_po(tmp_po_f)
-            cmd = (
-                self.settings.GETTEXT_MSGFMT_EXECUTABLE,
-                "--statistics",  # show stats
-                tmp_po_f.name,
-                "-o",
-                fname,
-            )
-            ret = subprocess.run(cmd, capture_output=True)
-            return ret
-        # XXX Code below is currently broken (generates corrupted mo files it seems :( )!
         # Using http://www.gnu.org/software/gettext/manual/html_node/MO-Files.html notation.
-        # Not generating hash table!
-        # Only translated, unfuzzy messages are taken into account!
         default_context = self.settings.DEFAULT_CONTEXT
-        msgs = tuple(v for v in self.msgs.values() if not (v.is_fuzzy or v.is_commented) and v.msgstr and v.msgid)
-        msgs = sorted(msgs[:2],
-                      key=lambda e: (e.msgctxt + e.msgid) if (e.msgctxt and e.msgctxt != default_context) else e.msgid)
-        magic_nbr = 0x950412de
-        format_rev = 0
+        header_key = self.settings.PO_HEADER_KEY
+        EOT = b"\x04"  # Used to concatenate context and msgid.
+
+        msgs = []
+        for key, msg in self.msgs.items():
+            if msg.is_commented or (msg.is_fuzzy and key != header_key):
+                continue
+            msgstr = "".join(msg.msgstr_lines)
+            if not msgstr:
+                continue
+            msgid = "".join(msg.msgid_lines).encode("utf-8")
+            msgctxt = "".join(msg.msgctxt_lines)
+            if msgctxt and msgctxt != default_context:
+                msgid = msgctxt.encode("utf-8") + EOT + msgid
+            msgs.append((msgid, msgstr.encode("utf-8")))
+        # Keys must be sorted (as C strings), for binary search.
+        msgs.sort(key=lambda e: e[0])
+
         N = len(msgs)
-        O = 32
+        S = self._mo_hash_size(N)
+        O = 7 * 4
         T = O + N * 8
-        S = 0
         H = T + N * 8
-        # Prepare our data! we need key (optional context and msgid), translation, and offset and length of both.
-        # Offset are relative to start of their own list.
-        EOT = b"0x04"  # Used to concatenate context and msgid
-        _msgid_offset = 0
-        _msgstr_offset = 0
-
-        def _gen(v):
-            nonlocal _msgid_offset, _msgstr_offset
-            msgid = v.msgid.encode("utf-8")
-            msgstr = v.msgstr.encode("utf-8")
-            if v.msgctxt and v.msgctxt != default_context:
-                msgctxt = v.msgctxt.encode("utf-8")
-                msgid = msgctxt + EOT + msgid
-            # Don't forget the final NULL char!
-            _msgid_len = len(msgid) + 1
-            _msgstr_len = len(msgstr) + 1
-            ret = ((msgid, _msgid_len, _msgid_offset), (msgstr, _msgstr_len, _msgstr_offset))
-            _msgid_offset += _msgid_len
-            _msgstr_offset += _msgstr_len
-            return ret
-        msgs = tuple(_gen(v) for v in msgs)
-        msgid_start = H
-        msgstr_start = msgid_start + _msgid_offset
-        print(N, msgstr_start + _msgstr_offset)
-        print(msgs)
-
-        with open(fname, 'wb') as f:
-            # Header...
-            f.write(struct.pack("=8I", magic_nbr, format_rev, N, O, T, S, H, 0))
-            # Msgid's length and offset.
-            f.write(b"".join(struct.pack("=2I", length, msgid_start + offset) for (_1, length, offset), _2 in msgs))
-            # Msgstr's length and offset.
-            f.write(b"".join(struct.pack("=2I", length, msgstr_start + offset) for _1, (_2, length, offset) in msgs))
-            # No hash table!
-            # Msgid's.
-            f.write(b"\0".join(msgid for (msgid, _1, _2), _3 in msgs) + b"\0")
-            # Msgstr's.
-            f.write(b"\0".join(msgstr for _1, (msgstr, _2, _3) in msgs) + b"\0")
+        msgid_start = H + S * 4
+
+        # Offsets and lengths of all strings, each stored with a final NULL char.
+        table = []
+        offset = msgid_start
+        for msgid, _msgstr in msgs:
+            table += (len(msgid), offset)
+            offset += len(msgid) + 1
+        for _msgid, msgstr in msgs:
+            table += (len(msgstr), offset)
+            offset += len(msgstr) + 1
+
+        # Hash table, using open addressing with double hashing, entries are 1-based indices (0 meaning empty).
+        hash_table = [0] * S
+        for idx, (msgid, _msgstr) in enumerate(msgs):
+            hval = self._mo_hash(msgid)
+            hidx = hval % S
+            incr = 1 + (hval % (S - 2))
+            while hash_table[hidx]:
+                hidx = (hidx + incr) % S
+            hash_table[hidx] = idx + 1
+
+        buff = b"".join((
+            struct.pack("=7I", 0x950412de, 0, N, O, T, S, H),
+            struct.pack("={}I".format(len(table)), *table),
+            struct.pack("={}I".format(S), *hash_table),
+            b"".join(msgid + b"\0" for msgid, _msgstr in msgs),
+            b"".join(msgstr + b"\0" for _msgid, msgstr in msgs),
+        ))
+
+        if isinstance(fname, str):
+            os.makedirs(os.path.dirname(fname), exist_ok=True)
+            with open(fname, 'wb') as f:
+                f.write(buff)
+        # Else assume fname is already a binary file(like) object!
+        else:
+            fname.write(buff)
 
     parsers = {
         "PO": parse_messages_from_po,
@@ -1236,6 +1500,36 @@ class I18nMessages:
         po.write(kind="PO", dest=lng['po_path'])
         print("{} PO written!".format(lng['uid']))
 
+    @classmethod
+    def update_from_pot_parallel(cls, pot, langs, settings, max_workers=1):
+        """
+        Update or create the PO files of all given languages from the given POT `I18nMessages` data.
+        Yields the uid of each language once its PO file is written.
+
+        By default all languages are processed serially in the current process. With `max_workers` other than 1,
+        each language is processed in a worker process of a pool (`None` using as many workers as CPUs).
+        `pot` and `settings` are then pickled to be sent to the workers, so `settings` must be an `I18nSettings`
+        instance.
+        """
+        import concurrent.futures
+        import multiprocessing
+
+        if max_workers == 1:
+            for lng in langs:
+                cls.update_from_pot_callback(pot, lng, settings)
+                yield lng['uid']
+            return
+
+        # NOTE: Always spawn worker processes, forking a multi-threaded process (like Blender) can deadlock.
+        #       This also means that the callback must not rely on any Blender-specific module.
+        mp_context = multiprocessing.get_context("spawn")
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context) as exctr:
+            futures = {exctr.submit(cls.update_from_pot_callback, pot, lng, settings): lng['uid'] for lng in langs}
+            for future in concurrent.futures.as_completed(futures):
+                # Re-raise any error from the worker.
+                future.result()
+                yield futures[future]
+
     @classmethod
     def cleanup_callback(cls, lng, settings):
         """
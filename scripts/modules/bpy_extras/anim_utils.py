@@ -110,6 +110,46 @@ def _ensure_channelbag_exists(action: Action, slot: ActionSlot) -> ActionChannel
     return strip.channelbag(slot, ensure=True)
 
 
+def _animation_data_is_animated(id_data):
+    animation_data = getattr(id_data, "animation_data", None)
+    if animation_data is None:
+        return False
+    if animation_data.action is not None or animation_data.drivers:
+        return True
+    return any((not track.mute) and track.strips for track in animation_data.nla_tracks)
+
+
+def _object_is_animated(obj, *, use_evaluated):
+    """
+    Conservative check for whether the transforms baked from ``obj`` can change between frames.
+
+    :arg use_evaluated: When true, the evaluated transforms are baked, so constraints,
+       physics and the parent chain are taken into account as well.
+    :type use_evaluated: bool
+    """
+    if _animation_data_is_animated(obj):
+        return True
+    if obj.pose is not None and _animation_data_is_animated(obj.data):
+        return True
+
+    if not use_evaluated:
+        return False
+
+    if obj.rigid_body is not None:
+        return True
+    if any(not con.mute for con in obj.constraints):
+        return True
+    if obj.pose is not None:
+        for pbone in obj.pose.bones:
+            if any(not con.mute for con in pbone.constraints):
+                return True
+
+    parent = obj.parent
+    if parent is not None:
+        return _object_is_animated(parent, use_evaluated=True)
+    return False
+
+
 def bake_action(
         obj,
         *,
@@ -146,14 +186,20 @@ def bake_action_objects(
         *,
         frames,
         bake_options,
+        object_frames=None,
+        only_animated=False,
 ):
     """
     A version of :func:`bake_action_objects_iter` that takes frames and returns the output.
 
     :arg frames: Frames to bake.
-    :type frames: iterable of int
+    :type frames: iterable of int | float
     :arg bake_options: Options for baking.
     :type bake_options: :class:`anim_utils.BakeOptions`
+    :arg object_frames: See :func:`bake_action_objects_iter`.
+    :type object_frames: Sequence of (Container of int | float) | None
+    :arg only_animated: See :func:`bake_action_objects_iter`.
+    :type only_animated: bool
 
     :return: A sequence of Action or None types (aligned with ``object_action_pairs``)
     :rtype: Sequence[:class:`bpy.types.Action`]
@@ -161,7 +207,12 @@ def bake_action_objects(
     if not (bake_options.do_pose or bake_options.do_object):
         return []
 
-    iter = bake_action_objects_iter(object_action_pairs, bake_options=bake_options)
+    iter = bake_action_objects_iter(
+        object_action_pairs,
+        bake_options=bake_options,
+        object_frames=object_frames,
+        only_animated=only_animated,
+    )
     iter.send(None)
     for frame in frames:
         iter.send(frame)
@@ -171,32 +222,87 @@ def bake_action_objects(
 def bake_action_objects_iter(
         object_action_pairs,
         bake_options,
+        *,
+        object_frames=None,
+        only_animated=False,
 ):
     """
     An coroutine that bakes actions for multiple objects.
 
+    The scene is only evaluated on frames that at least one object needs to be sampled at.
+
     :arg object_action_pairs: Sequence of object action tuples,
        action is the destination for the baked data. When None a new action will be created.
     :type object_action_pairs: Sequence of (:class:`bpy.types.Object`, :class:`bpy.types.Action`)
     :arg bake_options: Options for baking.
     :type bake_options: :class:`anim_utils.BakeOptions`
+    :arg object_frames: Frames to sample each object at (aligned with ``object_action_pairs``),
+       frames sent to the coroutine that are not in an object's set are skipped for that object.
+       A None item (or passing None) samples the object on every frame, sub-frames are supported.
+    :type object_frames: Sequence of (Container of int | float) | None
+    :arg only_animated: Analyze which objects are animated (F-curves, drivers, NLA, constraints,
+       physics and the parent chain) before baking. Static objects are only sampled once and keyed
+       on the first and last frame, segments of animated channels that don't change are collapsed
+       to the keys at either end.
+    :type only_animated: bool
     """
     scene = bpy.context.scene
     frame_back = scene.frame_current
     iter_all = tuple(
-        bake_action_iter(obj, action=action, bake_options=bake_options)
+        bake_action_iter(obj, action=action, bake_options=bake_options, collapse_static=only_animated)
         for (obj, action) in object_action_pairs
     )
+    if object_frames is None:
+        object_frames = (None,) * len(iter_all)
+    elif len(object_frames) != len(iter_all):
+        raise ValueError("object_frames must be aligned with object_action_pairs")
+
+    if only_animated:
+        use_evaluated = bake_options.do_visual_keying or bake_options.do_parents_clear
+        is_animated_all = tuple(
+            _object_is_animated(obj, use_evaluated=use_evaluated)
+            for (obj, _action) in object_action_pairs
+        )
+    else:
+        is_animated_all = (True,) * len(iter_all)
+
+    # `[first, last]` frames a static object was requested at, it's only sampled on the first.
+    static_frame_range = [None] * len(iter_all)
+
     for iter in iter_all:
         iter.send(None)
     while True:
         frame = yield None
         if frame is None:
             break
-        scene.frame_set(frame)
+
+        iter_frame = []
+        for index, iter in enumerate(iter_all):
+            frames = object_frames[index]
+            if frames is not None and frame not in frames:
+                continue
+            if not is_animated_all[index]:
+                frame_range = static_frame_range[index]
+                if frame_range is not None:
+                    frame_range[1] = frame
+                    continue
+                static_frame_range[index] = [frame, frame]
+            iter_frame.append(iter)
+
+        if not iter_frame:
+            continue
+
+        frame_int = int(frame // 1)
+        scene.frame_set(frame_int, subframe=frame - frame_int)
         bpy.context.view_layer.update()
-        for iter in iter_all:
+        for iter in iter_frame:
             iter.send(frame)
+
+    # Static objects evaluate the same on any frame, close their range without updating the scene.
+    for iter, frame_range in zip(iter_all, static_frame_range):
+        if frame_range is not None and frame_range[0] != frame_range[1]:
+            iter.send(frame_range[1])
+
     scene.frame_set(frame_back)
     yield tuple(iter.send(None) for iter in iter_all)
 
@@ -207,6 +313,7 @@ def bake_action_iter(
         *,
         action,
         bake_options,
+        collapse_static=False,
 ):
     """
     An coroutine that bakes action for a single object.
@@ -218,6 +325,8 @@ def bake_action_iter(
     :type action: :class:`bpy.types.Action` | None
     :arg bake_options: Boolean options of what to include into the action bake.
     :type bake_options: :class:`anim_utils.BakeOptions`
+    :arg collapse_static: Only keep the first and last key of runs of keys that don't change value.
+    :type collapse_static: bool
 
     :return: an action or None
     :rtype: :class:`bpy.types.Action`
@@ -521,6 +630,9 @@ def bake_action_iter(
                 if bake_options.do_custom_props:
                     bake_custom_properties(pbone, custom_props=custom_props[name], frame=f, group_name=name)
 
+            if collapse_static:
+                keyframes.collapse_static_segments()
+
             if is_new_action:
                 keyframes.insert_keyframes_into_new_action(total_new_keys, action, name)
             else:
@@ -588,6 +700,9 @@ def bake_action_iter(
             if bake_options.do_custom_props:
                 bake_custom_properties(obj, custom_props=custom_props, frame=f, group_name=name)
 
+        if collapse_static:
+            keyframes.collapse_static_segments()
+
         if is_new_action:
             keyframes.insert_keyframes_into_new_action(total_new_keys, action, name)
         else:
@@ -670,6 +785,32 @@ class KeyframesCo:
     ) -> None:
         self.keyframes_from_fcurve[(rna_path, 0)].extend((frame, value))
 
+    def collapse_static_segments(
+        self,
+        threshold: float = 0.0001,
+    ) -> None:
+        """
+        Remove keys inside runs of keys that don't change value, keeping the keys at either end of each run.
+
+        Afterwards F-curves may hold different numbers of keys.
+        """
+        keyframes_from_fcurve = self.keyframes_from_fcurve
+        for fc_key, key_values in keyframes_from_fcurve.items():
+            total_keys = len(key_values) // 2
+            if total_keys < 3:
+                continue
+            values = key_values[1::2]
+            value_kept = values[0]
+            key_values_collapsed = key_values[0:2]
+            for i in range(1, total_keys - 1):
+                value = values[i]
+                if abs(value - value_kept) < threshold and abs(values[i + 1] - value) < threshold:
+                    continue
+                key_values_collapsed.extend(key_values[i * 2:i * 2 + 2])
+                value_kept = value
+            key_values_collapsed.extend(key_values[-2:])
+            keyframes_from_fcurve[fc_key] = key_values_collapsed
+
     def insert_keyframes_into_new_action(
         self,
         total_new_keys: int,
@@ -683,9 +824,8 @@ class KeyframesCo:
         :arg action_group_name: Name of Action Group that F-curves are added to.
         :type action_group_name: str
         """
-        linear_enum_values = [
-            bpy.types.Keyframe.bl_rna.properties["interpolation"].enum_items["LINEAR"].value
-        ] * total_new_keys
+        linear_enum_value = bpy.types.Keyframe.bl_rna.properties["interpolation"].enum_items["LINEAR"].value
+        linear_enum_values = [linear_enum_value] * total_new_keys
 
         for fc_key, key_values in self.keyframes_from_fcurve.items():
             if len(key_values) == 0:
@@ -696,9 +836,14 @@ class KeyframesCo:
                 data_path, index=array_index, action_group=action_group_name
             ).keyframe_points
 
-            keyframe_points.add(total_new_keys)
+            # Key counts only differ between F-curves after `collapse_static_segments()`.
+            total_keys = len(key_values) // 2
+            keyframe_points.add(total_keys)
             keyframe_points.foreach_set("co", key_values)
-            keyframe_points.foreach_set("interpolation", linear_enum_values)
+            keyframe_points.foreach_set(
+                "interpolation",
+                linear_enum_values if total_keys == total_new_keys else [linear_enum_value] * total_keys,
+            )
 
             # There's no need to do fcurve.update() because the keys are already ordered, have
             # no duplicates and all handles are Linear.
@@ -720,9 +865,8 @@ class KeyframesCo:
         :arg action_group_name: Name of Action Group that F-curves are added to.
         :type action_group_name: str
         """
-        linear_enum_values = [
-            bpy.types.Keyframe.bl_rna.properties["interpolation"].enum_items["LINEAR"].value
-        ] * total_new_keys
+        linear_enum_value = bpy.types.Keyframe.bl_rna.properties["interpolation"].enum_items["LINEAR"].value
+        linear_enum_values = [linear_enum_value] * total_new_keys
 
         for fc_key, key_values in self.keyframes_from_fcurve.items():
             if len(key_values) == 0:
@@ -741,14 +885,14 @@ class KeyframesCo:
             keyframe_points.foreach_get("co", co_buffer)
             co_buffer.extend(key_values)
 
+            # Key counts only differ between F-curves after `collapse_static_segments()`.
+            total_keys = len(key_values) // 2
+
             ipo_buffer = [None] * len(keyframe_points)
             keyframe_points.foreach_get("interpolation", ipo_buffer)
-            ipo_buffer.extend(linear_enum_values)
+            ipo_buffer.extend(linear_enum_values if total_keys == total_new_keys else [linear_enum_value] * total_keys)
 
-            # XXX: Currently baking inserts the same number of keys for all baked properties.
-            # This block of code breaks if that's no longer true since we then will not be properly
-            # initializing all the data.
-            keyframe_points.add(total_new_keys)
+            keyframe_points.add(total_keys)
             keyframe_points.foreach_set("co", co_buffer)
             keyframe_points.foreach_set("interpolation", ipo_buffer)
 
@@ -0,0 +1,83 @@
+# SPDX-FileCopyrightText: 2024 Blender Authors
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import api
+
+
+# Inputs of `io_curve_svg/svg_util_test.py`, repeated to get measurable timings.
+ARRAY_OF_FLOATS = (
+    "123", " \t  123    \t", "12e+3", "12e-3", "123 45 6 89", "    123,45,6,89 ",
+    "123,45 6,89", "1,,3", ",,3", "1-3", "1+3", ",,,", "3.5", "2.75,8.5",
+    ".92", ".92e+1", "-.92", "-.92e+1",
+)
+COORDS = ("", "    ", "1.2", "1.2cm", "1.2ex", "1.2%")
+PATH_DATA = (
+    "M10,20 L30 40z",
+    "l1-2.5.5e1+3",
+    "a25,25 -30 0,150-25",
+    "A1 1 0 00 1 1 2 2 0 11 3 3",
+    "M1.2e+3 1.2e3 C.92,-.92 -.92e+1,.92e+1 2.75,8.5 S3.5,1 2. 3",
+)
+
+
+def _run(args):
+    import bpy
+    import time
+    from io_curve_svg import svg_util, import_svg
+
+    scale = args['scale']
+
+    array_of_floats = " ".join(ARRAY_OF_FLOATS * scale)
+    path_data = " ".join(PATH_DATA * scale)
+
+    result = {}
+
+    start_time = time.time()
+    svg_util.parse_array_of_floats(array_of_floats)
+    result['parse_array_of_floats'] = time.time() - start_time
+
+    start_time = time.time()
+    for _ in range(scale):
+        for coord in COORDS:
+            svg_util.parse_coord(coord, 200)
+    result['parse_coord'] = time.time() - start_time
+
+    start_time = time.time()
+    svg_util.parse_path_data(path_data)
+    result['parse_path_data'] = time.time() - start_time
+
+    # Path parsing and curve creation, as done by the importer.
+    start_time = time.time()
+    parser = import_svg.SVGPathParser(path_data, False)
+    parser.parse()
+
+    cu = bpy.data.curves.new("Curve", 'CURVE')
+    for spline in parser.getSplines():
+        points = spline['points']
+        co = [(point['x'], point['y'], 0.0) for point in points]
+        import_svg.SVGCreateSpline(cu, co, co, co, 'VECTOR', 'VECTOR', spline['closed'])
+    result['path_to_curve'] = time.time() - start_time
+
+    result['time'] = sum(result.values())
+    return result
+
+
+class SVGUtilTest(api.Test):
+    def __init__(self, scale):
+        self.scale = scale
+
+    def name(self):
+        return f"svg_util_x{self.scale}"
+
+    def category(self):
+        return "io_curve_svg"
+
+    def run(self, env, device_id):
+        args = {'scale': self.scale}
+        result, _ = env.run_in_blender(_run, args)
+        return result
+
+
+def generate(env):
+    return [SVGUtilTest(scale) for scale in (1000, 10000, 100000)]
@@ -215,6 +215,53 @@ class ObjectBakeTest(unittest.TestCase):
                                        6, f"Unexpected key y position on {fcurve.data_path}")
                 self.assertEqual(len(fcurve.keyframe_points), 10, f"Unexpected key count on {fcurve.data_path}")
 
+    def test_bake_only_animated_static_object(self):
+        obj2 = bpy.data.objects.new("obj2", None)
+        bpy.context.scene.collection.objects.link(obj2)
+
+        bpy.context.scene.frame_set(0)
+        self.obj.keyframe_insert("location")
+        bpy.context.scene.frame_set(9)
+        self.obj.location = (1, 0, 0)
+        self.obj.keyframe_insert("location")
+
+        anim_utils.bake_action_objects(
+            [(self.obj, None), (obj2, None)],
+            frames=range(0, 10),
+            bake_options=OBJECT_BAKE_OPTIONS,
+            only_animated=True,
+        )
+
+        channelbag = anim_utils.action_get_channelbag_for_slot(
+            obj2.animation_data.action, obj2.animation_data.action_slot)
+        self.assertEqual(len(channelbag.fcurves), 9)
+        for fcurve in channelbag.fcurves:
+            self.assertEqual(len(fcurve.keyframe_points), 2, "Static objects are keyed on the first and last frame")
+            self.assertAlmostEqual(fcurve.keyframe_points[0].co.x, 0, 6)
+            self.assertAlmostEqual(fcurve.keyframe_points[1].co.x, 9, 6)
+
+        channelbag = anim_utils.action_get_channelbag_for_slot(
+            self.obj.animation_data.action, self.obj.animation_data.action_slot)
+        for fcurve in channelbag.fcurves:
+            if fcurve.data_path == "location" and fcurve.array_index == 0:
+                self.assertEqual(len(fcurve.keyframe_points), 10, "Animated channels are sampled on every frame")
+                self.assertAlmostEqual(fcurve.keyframe_points[-1].co.y, 1, 6)
+            else:
+                self.assertEqual(len(fcurve.keyframe_points), 2, f"Unchanging {fcurve.data_path} should be collapsed")
+
+    def test_bake_object_frames(self):
+        anim_utils.bake_action_objects(
+            [(self.obj, None)],
+            frames=(0, 0.5, 1, 1.5, 2),
+            bake_options=OBJECT_BAKE_OPTIONS,
+            object_frames=[{0, 1.5, 2}],
+        )
+
+        channelbag = anim_utils.action_get_channelbag_for_slot(
+            self.obj.animation_data.action, self.obj.animation_data.action_slot)
+        for fcurve in channelbag.fcurves:
+            self.assertEqual([key.co.x for key in fcurve.keyframe_points], [0, 1.5, 2])
+
 
 def main():
     global args
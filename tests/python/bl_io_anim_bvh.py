@@ -0,0 +1,171 @@
+# SPDX-FileCopyrightText: 2025 Blender Authors
+#
+# SPDX-License-Identifier: GPL-2.0-or-later
+
+import math
+import pathlib
+import sys
+import tempfile
+import unittest
+
+import bpy
+import addon_utils
+import numpy as np
+from bpy_extras import anim_utils
+from mathutils import Euler, Matrix
+
+"""
+blender -b --factory-startup --python tests/python/bl_io_anim_bvh.py
+"""
+
+EULER_ORDERS = ('XYZ', 'XZY', 'YXZ', 'YZX', 'ZXY', 'ZYX')
+
+
+def smooth_euler_clip(num_frames, seed):
+    """
+    A long, smooth clip with large rotations, sampled densely (like 120 FPS motion capture).
+    """
+    rng = np.random.default_rng(seed)
+    time = np.linspace(0.0, 10.0, num_frames)[:, np.newaxis]
+    return np.sin(time * rng.uniform(0.2, 2.0, 3) + rng.uniform(0.0, math.tau, 3)) * rng.uniform(1.0, 6.0, 3)
+
+
+def read_motion(filepath):
+    with open(filepath, "r", encoding="utf8") as fh:
+        lines = fh.read().split("MOTION\n", 1)[1].splitlines()
+    # Skip the "Frames:" and "Frame Time:" lines.
+    return np.array([[float(value) for value in line.split()] for line in lines[2:]])
+
+
+class CompatibleEulerArrayTest(unittest.TestCase):
+    def setUp(self):
+        addon_utils.enable("io_anim_bvh", default_set=False)
+
+    def test_matches_matrix_to_euler(self):
+        from io_anim_bvh.import_bvh import euler_to_matrix_array, matrix_to_compatible_euler_array
+
+        for seed, order in enumerate(EULER_ORDERS):
+            with self.subTest(order=order):
+                mats = euler_to_matrix_array(smooth_euler_clip(1200, seed), order)
+
+                eul_expect = []
+                eul_prev = Euler((0.0, 0.0, 0.0), order)
+                for mat in mats:
+                    # The arrays are indexed row first, `Matrix` takes rows too.
+                    eul_prev = Matrix(mat.tolist()).to_euler(order, eul_prev)
+                    eul_expect.append(eul_prev[:])
+
+                eul = matrix_to_compatible_euler_array(mats, order, np.zeros(3))
+                # `mathutils` works in single precision, a flip would be off by at least 180 degrees.
+                np.testing.assert_allclose(eul, eul_expect, rtol=0.0, atol=1e-2)
+
+
+class QuaternionArrayTest(unittest.TestCase):
+    def setUp(self):
+        addon_utils.enable("io_anim_bvh", default_set=False)
+
+    def test_matches_matrix_to_quaternion(self):
+        from io_anim_bvh.import_bvh import matrix_to_quaternion_array
+
+        rng = np.random.default_rng(0)
+        axes = rng.normal(size=(200, 3))
+        axes /= np.linalg.norm(axes, axis=1)[:, np.newaxis]
+        # Include rotations at and near 180 degrees, where W is (close to) zero.
+        angles = np.concatenate((
+            rng.uniform(0.0, math.tau, 100),
+            np.full(50, math.pi),
+            math.pi - rng.uniform(0.0, 1e-3, 50),
+        ))
+        mats = np.array([Matrix.Rotation(angle, 3, axis) for angle, axis in zip(angles, axes)])
+
+        quat = matrix_to_quaternion_array(mats)
+        self.assertTrue(np.all(quat[:, 0] >= 0.0))
+
+        for mat, quat_actual in zip(mats, quat):
+            quat_expect = np.array(Matrix(mat.tolist()).to_quaternion())
+            # With W at zero, the quaternion and its negation are both valid.
+            error = min(np.abs(quat_actual - quat_expect).max(), np.abs(quat_actual + quat_expect).max())
+            self.assertLess(error, 1e-5, msg="matrix: %r" % mat.tolist())
+
+
+class ExportBatchTest(unittest.TestCase):
+    num_frames = 120
+
+    def setUp(self):
+        bpy.ops.wm.read_homefile(use_factory_startup=True)
+        addon_utils.enable("io_anim_bvh", default_set=False)
+
+        arm = bpy.data.armatures.new("rig")
+        self.obj = bpy.data.objects.new("rig", arm)
+        bpy.context.scene.collection.objects.link(self.obj)
+        bpy.context.view_layer.objects.active = self.obj
+
+        bpy.ops.object.mode_set(mode='EDIT')
+        parent = None
+        for i in range(3):
+            edit_bone = arm.edit_bones.new("bone%d" % i)
+            edit_bone.head = (0.0, 0.1 * i, float(i))
+            edit_bone.tail = (0.0, 0.1 * i, float(i + 1))
+            edit_bone.parent = parent
+            edit_bone.use_connect = False
+            parent = edit_bone
+        bpy.ops.object.mode_set(mode='OBJECT')
+
+        rotation_modes = ('XYZ', 'ZXY', 'QUATERNION')
+        for i, pose_bone in enumerate(self.obj.pose.bones):
+            pose_bone.rotation_mode = rotation_modes[i]
+            eul_clip = smooth_euler_clip(self.num_frames, i)
+            for frame, eul in enumerate(eul_clip, start=1):
+                pose_bone.location = (0.1 * math.sin(frame * 0.1), 0.0, 0.05 * i)
+                if pose_bone.rotation_mode == 'QUATERNION':
+                    pose_bone.rotation_quaternion = Euler(eul).to_quaternion()
+                    pose_bone.keyframe_insert("rotation_quaternion", frame=frame)
+                else:
+                    pose_bone.rotation_euler = eul
+                    pose_bone.keyframe_insert("rotation_euler", frame=frame)
+                pose_bone.keyframe_insert("location", frame=frame)
+
+        # Linear keys use the array evaluation of the batch export, Bézier keys fall back to `FCurve.evaluate`.
+        adt = self.obj.animation_data
+        channelbag = anim_utils.action_get_channelbag_for_slot(adt.action, adt.action_slot)
+        for fcurve in channelbag.fcurves:
+            if fcurve.data_path.startswith('pose.bones["bone0"]'):
+                for key in fcurve.keyframe_points:
+                    key.interpolation = 'LINEAR'
+
+    def export(self, filepath, use_batch):
+        from io_anim_bvh import export_bvh
+        export_bvh.write_armature(
+            bpy.context, str(filepath),
+            frame_start=1,
+            frame_end=self.num_frames,
+            use_batch=use_batch,
+        )
+        return read_motion(filepath)
+
+    def test_batch_matches_per_frame(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            tempdir = pathlib.Path(tempdir)
+            motion = self.export(tempdir / "frames.bvh", use_batch=False)
+            motion_batch = self.export(tempdir / "batch.bvh", use_batch=True)
+
+            self.assertEqual(motion.shape, motion_batch.shape)
+            # Values are written in degrees, flipped eulers would differ by hundreds of degrees.
+            np.testing.assert_allclose(motion_batch, motion, rtol=0.0, atol=1e-2)
+
+            # Importing the batch export gives back the same motion.
+            from io_anim_bvh import import_bvh
+            import_bvh.load(bpy.context, str(tempdir / "batch.bvh"), rotate_mode='NATIVE')
+            motion_roundtrip = self.export(tempdir / "roundtrip.bvh", use_batch=True)
+            np.testing.assert_allclose(motion_roundtrip, motion, rtol=0.0, atol=1e-2)
+
+
+def main():
+    argv = [sys.argv[0]]
+    if '--' in sys.argv:
+        argv += sys.argv[sys.argv.index('--') + 1:]
+    unittest.main(argv=argv)
+
+
+if __name__ == "__main__":
+    main()